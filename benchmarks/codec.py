@@ -0,0 +1,96 @@
+"""
+Benchmark for the transport wire codecs.
+
+Times encode and decode for each available `MessageCodec` over a few representative
+messages. Transports use the codec in two ways, so both are measured separately:
+
+* bytes (`encode` / `decode(bytes)`): streamable HTTP (both ends), SSE client POSTs
+  and SSE server POST bodies.
+* text (`encode_text` / `decode(str)`): stdio (both ends), WebSocket (both ends),
+  SSE event data and streamable HTTP SSE event data.
+
+Usage:
+    uv run python benchmarks/codec.py [--number N]
+"""
+
+import argparse
+import json
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+import mcp.types as types
+from mcp.shared.codec import JSONLibraryCodec, MessageCodec, OrjsonMessageCodec, PydanticMessageCodec
+
+
+def _messages() -> dict[str, types.JSONRPCMessage]:
+    rows = [{"id": i, "name": f"row-{i}", "tags": ["a", "b"], "score": i / 7} for i in range(1_000)]
+    tools = [
+        types.Tool(
+            name=f"tool_{i}",
+            description="Looks something up. " * 5,
+            inputSchema={
+                "type": "object",
+                "properties": {f"arg_{j}": {"type": "string", "description": "An argument"} for j in range(10)},
+                "required": ["arg_0"],
+            },
+        ).model_dump(by_alias=True, mode="json", exclude_none=True)
+        for i in range(200)
+    ]
+    return {
+        "ping request": types.JSONRPCMessage(types.JSONRPCRequest(jsonrpc="2.0", id=1, method="ping")),
+        "tools/call request (1k rows)": types.JSONRPCMessage(
+            types.JSONRPCRequest(
+                jsonrpc="2.0", id=2, method="tools/call", params={"name": "load", "arguments": {"rows": rows}}
+            )
+        ),
+        "tools/list result (200 tools)": types.JSONRPCMessage(
+            types.JSONRPCResponse(jsonrpc="2.0", id=3, result={"tools": tools})
+        ),
+        "progress notification": types.JSONRPCMessage(
+            types.JSONRPCNotification(
+                jsonrpc="2.0", method="notifications/progress", params={"progressToken": 2, "progress": 0.5}
+            )
+        ),
+    }
+
+
+def _codecs() -> dict[str, MessageCodec]:
+    codecs: dict[str, MessageCodec] = {
+        "pydantic": PydanticMessageCodec(),
+        "stdlib json": JSONLibraryCodec(dumps=json.dumps, loads=json.loads),
+    }
+    try:
+        codecs["orjson"] = OrjsonMessageCodec()
+    except ImportError:
+        pass
+    return codecs
+
+
+def _us(fn: Callable[[], Any], number: int) -> float:
+    return timeit.timeit(fn, number=number) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=200, help="iterations per measurement")
+    args = parser.parse_args()
+
+    codecs = _codecs()
+    for name, message in _messages().items():
+        encoded = PydanticMessageCodec().encode(message)
+        text = encoded.decode("utf-8")
+        print(f"\n{name} ({len(encoded):,} bytes)")
+        print(f"  {'codec':<12} {'encode':>10} {'encode_text':>12} {'decode bytes':>13} {'decode str':>11}  (us)")
+        for codec_name, codec in codecs.items():
+            print(
+                f"  {codec_name:<12}"
+                f" {_us(lambda: codec.encode(message), args.number):>10.1f}"
+                f" {_us(lambda: codec.encode_text(message), args.number):>12.1f}"
+                f" {_us(lambda: codec.decode(encoded), args.number):>13.1f}"
+                f" {_us(lambda: codec.decode(text), args.number):>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark for write-behind event persistence.
+
+Calls a tool that reports progress several times, over a resumable streamable HTTP
+session (in-process, through httpx's ASGI transport), and reports the latency of the
+calls. Events go to a `SQLiteEventStore` on a deliberately slow disk: every write
+to the database takes `--write-delay` milliseconds. Without write-behind, every
+progress notification and the response wait for their write; with it, writes are
+batched in the background and only the response waits for the events before it.
+
+Usage:
+    uv run python benchmarks/event_store_write_behind.py [--calls N] [--progress N] [--write-delay MS]
+"""
+
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import anyio
+import httpx
+
+from mcp.server.event_store import SQLiteEventStore
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.types import LATEST_PROTOCOL_VERSION
+
+HEADERS = {
+    "accept": "application/json, text/event-stream",
+    "content-type": "application/json",
+    "mcp-protocol-version": LATEST_PROTOCOL_VERSION,
+}
+
+
+class SlowSQLiteEventStore(SQLiteEventStore):
+    """A SQLite event store whose every write takes `delay` seconds longer."""
+
+    def __init__(self, path: Path, delay: float, write_behind: bool):
+        super().__init__(path, write_behind=write_behind)
+        self.delay = delay
+
+    def _write(self, rows: list[Any]) -> None:
+        time.sleep(self.delay)
+        super()._write(rows)
+
+
+async def work(steps: int, ctx: Context) -> int:
+    for step in range(steps):
+        await ctx.report_progress(step, steps)
+    return steps
+
+
+async def run(store: SQLiteEventStore, calls: int, progress: int) -> list[float]:
+    app = FastMCP()
+    app.add_tool(work)
+    manager = StreamableHTTPSessionManager(app=app._mcp_server, event_store=store)
+
+    transport = httpx.ASGITransport(app=manager.handle_request)
+    latencies: list[float] = []
+    async with manager.run(), httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.post(
+            "/mcp",
+            json={
+                "jsonrpc": "2.0",
+                "id": 0,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": LATEST_PROTOCOL_VERSION,
+                    "capabilities": {},
+                    "clientInfo": {"name": "bench", "version": "1.0"},
+                },
+            },
+            headers=HEADERS,
+        )
+        response.raise_for_status()
+        headers = {**HEADERS, MCP_SESSION_ID_HEADER: response.headers[MCP_SESSION_ID_HEADER]}
+        await client.post("/mcp", json={"jsonrpc": "2.0", "method": "notifications/initialized"}, headers=headers)
+
+        for i in range(1, calls + 11):
+            call = {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "tools/call",
+                "params": {"name": "work", "arguments": {"steps": progress}, "_meta": {"progressToken": i}},
+            }
+            start = time.perf_counter()
+            response = await client.post("/mcp", json=call, headers=headers)
+            response.raise_for_status()
+            if i > 10:  # warm-up
+                latencies.append((time.perf_counter() - start) * 1000)
+    store.close()
+    return latencies
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=100, help="tool calls to send")
+    parser.add_argument("--progress", type=int, default=10, help="progress notifications per call")
+    parser.add_argument("--write-delay", type=float, default=2.0, help="added latency of every write, in ms")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(f"{args.calls} tool calls with {args.progress} progress notifications, {args.write_delay} ms per write")
+    for write_behind in [False, True]:
+        with tempfile.TemporaryDirectory() as directory:
+            store = SlowSQLiteEventStore(Path(directory) / "events.db", args.write_delay / 1000, write_behind)
+            latencies = await run(store, args.calls, args.progress)
+        quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        label = "write-behind" if write_behind else "synchronous"
+        print(f"  {label:<13} p50 {quantiles[49]:>7.1f}  p90 {quantiles[89]:>7.1f}  p99 {quantiles[98]:>7.1f}  (ms)")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
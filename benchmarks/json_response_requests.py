@@ -0,0 +1,112 @@
+"""
+Benchmark for tool calls on a stateful session in JSON-response mode.
+
+Initializes one session on a `StreamableHTTPSessionManager` with `json_response=True`,
+then sends `tools/call` requests from several concurrent callers and reports the
+throughput. Requests are handed to the ASGI app directly, without an HTTP client, so
+that the server's own per-request cost dominates.
+
+Usage:
+    uv run python benchmarks/json_response_requests.py [--requests N] [--concurrency N]
+"""
+
+import argparse
+import json
+import logging
+import time
+from typing import Any
+
+import anyio
+from starlette.types import Message
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.types import LATEST_PROTOCOL_VERSION
+
+HEADERS = [
+    (b"accept", b"application/json, text/event-stream"),
+    (b"content-type", b"application/json"),
+    (b"mcp-protocol-version", LATEST_PROTOCOL_VERSION.encode()),
+]
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 0,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": LATEST_PROTOCOL_VERSION,
+        "capabilities": {},
+        "clientInfo": {"name": "bench", "version": "1.0"},
+    },
+}
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+async def post(
+    manager: StreamableHTTPSessionManager, message: dict[str, Any], session_id: str | None = None
+) -> dict[str, Any]:
+    """Send one POST to the manager and return the response start message."""
+    headers = list(HEADERS)
+    if session_id is not None:
+        headers.append((MCP_SESSION_ID_HEADER.encode(), session_id.encode()))
+    scope = {"type": "http", "method": "POST", "path": "/mcp", "headers": headers}
+    body = json.dumps(message).encode()
+    start: dict[str, Any] = {}
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            start.update(message)
+
+    await manager.handle_request(scope, receive, send)
+    assert start["status"] < 300, start
+    return start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="requests to send")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent callers")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    app = FastMCP()
+    app.add_tool(add)
+    manager = StreamableHTTPSessionManager(app=app._mcp_server, json_response=True)
+
+    async with manager.run():
+        start = await post(manager, INITIALIZE)
+        session_id = dict(start["headers"])[MCP_SESSION_ID_HEADER.encode()].decode()
+        await post(manager, {"jsonrpc": "2.0", "method": "notifications/initialized"}, session_id)
+
+        async def caller(worker: int, count: int) -> None:
+            for i in range(count):
+                call = {
+                    "jsonrpc": "2.0",
+                    "id": f"{worker}-{i}",
+                    "method": "tools/call",
+                    "params": {"name": "add", "arguments": {"a": 1, "b": 2}},
+                }
+                await post(manager, call, session_id)
+
+        async def run(total: int) -> float:
+            start = time.perf_counter()
+            async with anyio.create_task_group() as tg:
+                for worker in range(args.concurrency):
+                    tg.start_soon(caller, worker, total // args.concurrency)
+            return time.perf_counter() - start
+
+        await run(200)  # warm-up
+        elapsed = await run(args.requests)
+
+    print(f"{args.requests} tool calls in JSON-response mode, {args.concurrency} concurrent callers")
+    print(f"  {args.requests / elapsed:>8.0f} requests/s")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
@@ -0,0 +1,111 @@
+"""
+Benchmark for `tools/list` with and without the shared list result cache.
+
+Registers `--tools` tools on a FastMCP server, initializes one session on a
+`StreamableHTTPSessionManager` in JSON-response mode, and reports the throughput of
+`tools/list` requests with `cache_list_results` off and on. Requests are handed to
+the ASGI app directly, without an HTTP client, so that the server's own cost dominates.
+
+Usage:
+    uv run python benchmarks/list_results_cache.py [--tools N] [--requests N]
+"""
+
+import argparse
+import json
+import logging
+import time
+from typing import Any
+
+import anyio
+from starlette.types import Message
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.types import LATEST_PROTOCOL_VERSION
+
+HEADERS = [
+    (b"accept", b"application/json, text/event-stream"),
+    (b"content-type", b"application/json"),
+    (b"mcp-protocol-version", LATEST_PROTOCOL_VERSION.encode()),
+]
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 0,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": LATEST_PROTOCOL_VERSION,
+        "capabilities": {},
+        "clientInfo": {"name": "bench", "version": "1.0"},
+    },
+}
+
+
+def make_tool(n: int) -> Any:
+    def tool(query: str, limit: int = 10, include_archived: bool = False) -> list[str]:
+        return []  # pragma: no cover
+
+    tool.__name__ = f"search_{n}"
+    tool.__doc__ = f"Search collection {n} for documents matching a query."
+    return tool
+
+
+async def post(
+    manager: StreamableHTTPSessionManager, message: dict[str, Any], session_id: str | None = None
+) -> dict[str, Any]:
+    """Send one POST to the manager and return the response start message."""
+    headers = list(HEADERS)
+    if session_id is not None:
+        headers.append((MCP_SESSION_ID_HEADER.encode(), session_id.encode()))
+    scope = {"type": "http", "method": "POST", "path": "/mcp", "headers": headers}
+    body = json.dumps(message).encode()
+    start: dict[str, Any] = {}
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            start.update(message)
+
+    await manager.handle_request(scope, receive, send)
+    assert start["status"] < 300, start
+    return start
+
+
+async def run(tools: int, requests: int, cache: bool) -> float:
+    app = FastMCP(cache_list_results=cache)
+    for n in range(tools):
+        app.add_tool(make_tool(n))
+    manager = StreamableHTTPSessionManager(app=app._mcp_server, json_response=True)
+
+    async with manager.run():
+        start = await post(manager, INITIALIZE)
+        session_id = dict(start["headers"])[MCP_SESSION_ID_HEADER.encode()].decode()
+        await post(manager, {"jsonrpc": "2.0", "method": "notifications/initialized"}, session_id)
+
+        async def list_tools(count: int) -> float:
+            started = time.perf_counter()
+            for i in range(count):
+                await post(manager, {"jsonrpc": "2.0", "id": i + 1, "method": "tools/list"}, session_id)
+            return time.perf_counter() - started
+
+        await list_tools(20)  # warm-up
+        return requests / await list_tools(requests)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tools", type=int, default=200, help="registered tools")
+    parser.add_argument("--requests", type=int, default=500, help="tools/list requests to send")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    print(f"{args.requests} tools/list requests, {args.tools} tools")
+    for cache in [False, True]:
+        throughput = await run(args.tools, args.requests, cache)
+        print(f"  {'cached' if cache else 'uncached':<9} {throughput:>8.0f} requests/s")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
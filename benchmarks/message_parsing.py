@@ -0,0 +1,112 @@
+"""
+Microbenchmark for inbound message validation.
+
+Compares the method-discriminated `ClientRequest`, `ServerRequest`,
+`ClientNotification` and `JSONRPCMessage` unions against the same unions
+validated left to right (the behaviour before they were discriminated).
+
+Usage:
+    uv run python benchmarks/message_parsing.py [--number N]
+"""
+
+import argparse
+import json
+import timeit
+from typing import Any
+
+from pydantic import TypeAdapter
+
+import mcp.types as types
+
+CLIENT_REQUESTS: dict[str, dict[str, Any]] = {
+    "ping": {"method": "ping"},
+    "initialize": {
+        "method": "initialize",
+        "params": {
+            "protocolVersion": types.LATEST_PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "bench", "version": "0.0.0"},
+        },
+    },
+    "tools/list": {"method": "tools/list", "params": {"cursor": "abc"}},
+    "tools/call": {
+        "method": "tools/call",
+        "params": {"name": "search", "arguments": {"query": "mcp", "limit": 10, "filters": {"lang": "en"}}},
+    },
+    "resources/read": {"method": "resources/read", "params": {"uri": "file:///tmp/a.txt"}},
+    "tasks/cancel": {"method": "tasks/cancel", "params": {"taskId": "task-1"}},
+}
+
+SERVER_REQUESTS: dict[str, dict[str, Any]] = {
+    "roots/list": {"method": "roots/list"},
+    "elicitation/create": {
+        "method": "elicitation/create",
+        "params": {"message": "Name?", "requestedSchema": {"type": "object", "properties": {}}},
+    },
+}
+
+CLIENT_NOTIFICATIONS: dict[str, dict[str, Any]] = {
+    "notifications/initialized": {"method": "notifications/initialized"},
+    "notifications/cancelled": {"method": "notifications/cancelled", "params": {"requestId": 1}},
+    "notifications/progress": {"method": "notifications/progress", "params": {"progressToken": 1, "progress": 0.5}},
+}
+
+ENVELOPES: dict[str, dict[str, Any]] = {
+    "request": {"jsonrpc": "2.0", "id": 1, **CLIENT_REQUESTS["tools/call"]},
+    "notification": {"jsonrpc": "2.0", **CLIENT_NOTIFICATIONS["notifications/progress"]},
+    "response": {"jsonrpc": "2.0", "id": 1, "result": {"content": [{"type": "text", "text": "ok"}]}},
+    "error": {"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": "Method not found"}},
+}
+
+
+def _per_call_us(fn: Any, payload: Any, number: int) -> float:
+    return timeit.timeit(lambda: fn(payload), number=number) / number * 1e6
+
+
+def _report(title: str, undiscriminated: TypeAdapter[Any], discriminated: Any, cases: dict[str, Any], number: int):
+    print(f"\n{title}")
+    print(f"  {'case':<28} {'before (us)':>12} {'after (us)':>12} {'speedup':>8}")
+    for name, payload in cases.items():
+        raw = json.dumps(payload)
+        before = _per_call_us(undiscriminated.validate_json, raw, number)
+        after = _per_call_us(discriminated.model_validate_json, raw, number)
+        print(f"  {name:<28} {before:>12.2f} {after:>12.2f} {before / after:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20_000, help="iterations per case")
+    args = parser.parse_args()
+
+    _report(
+        "ClientRequest",
+        TypeAdapter[Any](types.ClientRequestType),
+        types.ClientRequest,
+        CLIENT_REQUESTS,
+        args.number,
+    )
+    _report(
+        "ServerRequest",
+        TypeAdapter[Any](types.ServerRequestType),
+        types.ServerRequest,
+        SERVER_REQUESTS,
+        args.number,
+    )
+    _report(
+        "ClientNotification",
+        TypeAdapter[Any](types.ClientNotificationType),
+        types.ClientNotification,
+        CLIENT_NOTIFICATIONS,
+        args.number,
+    )
+    _report(
+        "JSONRPCMessage",
+        TypeAdapter[Any](types.JSONRPCRequest | types.JSONRPCNotification | types.JSONRPCResponse | types.JSONRPCError),
+        types.JSONRPCMessage,
+        ENVELOPES,
+        args.number,
+    )
+
+
+if __name__ == "__main__":
+    main()
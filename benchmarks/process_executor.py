@@ -0,0 +1,62 @@
+"""
+Benchmark for CPU-bound FastMCP tools run in threads versus worker processes.
+
+Calls a prime-counting tool concurrently through `ToolManager`, once with the default
+thread executor and once with `executor="process"`, and reports the wall time. Threads
+are serialized by the GIL, so only the process executor should scale with cores.
+
+Usage:
+    uv run python benchmarks/process_executor.py [--calls N] [--limit N] [--workers N]
+"""
+
+import argparse
+import os
+import time
+
+import anyio
+
+from mcp.server.fastmcp.tools import ToolManager
+from mcp.server.fastmcp.utilities.execution import ProcessExecutor, ThreadLimiter
+
+
+def count_primes(limit: int) -> int:
+    return sum(1 for n in range(2, limit) if all(n % d for d in range(2, int(n**0.5) + 1)))
+
+
+async def _time_calls(manager: ToolManager, calls: int, limit: int) -> float:
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for _ in range(calls):
+            tg.start_soon(manager.call_tool, "count_primes", {"limit": limit})
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=16, help="concurrent tool calls")
+    parser.add_argument("--limit", type=int, default=200_000, help="count primes below this number")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="threads / worker processes")
+    args = parser.parse_args()
+
+    threads = ToolManager(thread_limiter=ThreadLimiter(args.workers))
+    threads.add_tool(count_primes)
+
+    executor = ProcessExecutor(max_workers=args.workers)
+    processes = ToolManager(process_executor=executor)
+    processes.add_tool(count_primes, executor="process")
+    try:
+        # Start the worker processes before timing
+        await _time_calls(processes, args.workers, 10)
+
+        thread_time = await _time_calls(threads, args.calls, args.limit)
+        process_time = await _time_calls(processes, args.calls, args.limit)
+    finally:
+        executor.shutdown()
+
+    print(f"{args.calls} calls, {args.workers} workers")
+    print(f"  thread:  {thread_time:>7.2f} s")
+    print(f"  process: {process_time:>7.2f} s  ({thread_time / process_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
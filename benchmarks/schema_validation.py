@@ -0,0 +1,65 @@
+"""
+Benchmark for tool input schema validation.
+
+Compares `jsonschema.validate`, which checks the schema and builds a validator on
+every call (the previous behaviour of `Server.call_tool`), with the compiled
+validators cached by `ToolSchemaValidators`, across input schemas of growing size.
+
+Usage:
+    uv run python benchmarks/schema_validation.py [--number N]
+"""
+
+import argparse
+import timeit
+from typing import Any
+
+import jsonschema
+
+from mcp.shared.schema_validation import ToolSchemaValidators
+
+
+def _schema(properties: int) -> dict[str, Any]:
+    return {
+        "type": "object",
+        "properties": {
+            f"arg_{i}": {
+                "type": "object",
+                "description": "A nested argument",
+                "properties": {
+                    "value": {"type": "string", "maxLength": 256},
+                    "weight": {"type": "number", "minimum": 0},
+                    "tags": {"type": "array", "items": {"type": "string", "enum": ["a", "b", "c"]}},
+                },
+                "required": ["value"],
+            }
+            for i in range(properties)
+        },
+        "required": ["arg_0"],
+        "additionalProperties": False,
+    }
+
+
+def _arguments(properties: int) -> dict[str, Any]:
+    return {f"arg_{i}": {"value": "x" * 10, "weight": i, "tags": ["a", "b"]} for i in range(properties)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=200, help="validations per schema size")
+    args = parser.parse_args()
+
+    cache = ToolSchemaValidators()
+    print(f"  {'properties':>10} {'before (us)':>12} {'after (us)':>12} {'speedup':>8}")
+    for properties in (1, 10, 100, 1_000):
+        schema = _schema(properties)
+        arguments = _arguments(properties)
+        number = max(args.number * 10 // max(properties, 10), 5)
+
+        before = timeit.timeit(lambda: jsonschema.validate(instance=arguments, schema=schema), number=number)
+        after = timeit.timeit(lambda: cache.validate("tool", schema, arguments), number=number)
+        before_us, after_us = before / number * 1e6, after / number * 1e6
+        print(f"  {properties:>10} {before_us:>12.1f} {after_us:>12.1f} {before_us / after_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark for opening many streamable HTTP sessions in parallel.
+
+Opens N sessions at once against a `StreamableHTTPSessionManager` (in-process,
+through httpx's ASGI transport) and reports the latency of each session's
+initialize request. The server's lifespan sleeps for `--setup-ms` to stand in for
+per-session setup such as opening a database connection.
+
+For comparison, the same run is repeated with new-session requests serialized
+behind one lock, which is how sessions were created before they could be set up
+concurrently.
+
+Usage:
+    uv run python benchmarks/session_creation.py [--sessions N] [--setup-ms MS]
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import anyio
+import httpx
+from starlette.types import Receive, Scope, Send
+
+from mcp.server.lowlevel import Server
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.types import LATEST_PROTOCOL_VERSION
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": LATEST_PROTOCOL_VERSION,
+        "capabilities": {},
+        "clientInfo": {"name": "bench", "version": "0.0.0"},
+    },
+}
+HEADERS = {"accept": "application/json, text/event-stream", "content-type": "application/json"}
+
+
+class SerializedSessionManager(StreamableHTTPSessionManager):
+    """Creates one session at a time, holding a lock for the whole first request."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._creation_lock = anyio.Lock()
+
+    async def handle_request(self, scope: Scope, receive: Receive, send: Send) -> None:
+        headers = dict(scope.get("headers", []))
+        if MCP_SESSION_ID_HEADER.encode() in headers:
+            return await super().handle_request(scope, receive, send)
+        async with self._creation_lock:
+            await super().handle_request(scope, receive, send)
+
+
+def _build_server(setup_seconds: float) -> Server[Any, Any]:
+    @asynccontextmanager
+    async def lifespan(_: Server[Any, Any]) -> AsyncGenerator[dict[str, Any]]:
+        await anyio.sleep(setup_seconds)
+        yield {}
+
+    return Server("bench", lifespan=lifespan)
+
+
+async def _open_sessions(manager: StreamableHTTPSessionManager, sessions: int) -> list[float]:
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=manager.handle_request)
+    async with manager.run(), httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def open_session() -> None:
+            start = time.perf_counter()
+            response = await client.post("/mcp", json=INITIALIZE, headers=HEADERS)
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(sessions):
+                tg.start_soon(open_session)
+    return latencies
+
+
+def _report(name: str, latencies: list[float]) -> None:
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    print(
+        f"  {name:<12} p50 {quantiles[49]:>8.1f}  p90 {quantiles[89]:>8.1f}"
+        f"  p99 {quantiles[98]:>8.1f}  max {max(latencies):>8.1f}  (ms)"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=100, help="sessions opened in parallel")
+    parser.add_argument("--setup-ms", type=float, default=20.0, help="simulated per-session setup time")
+    parser.add_argument("--json-response", action="store_true", help="use JSON responses instead of SSE")
+    args = parser.parse_args()
+
+    print(f"{args.sessions} parallel sessions, {args.setup_ms:.0f} ms setup each")
+    for name, manager_cls in (("serialized", SerializedSessionManager), ("concurrent", StreamableHTTPSessionManager)):
+        manager = manager_cls(app=_build_server(args.setup_ms / 1000), json_response=args.json_response)
+        _report(name, await _open_sessions(manager, args.sessions))
+
+
+if __name__ == "__main__":
+    anyio.run(main)
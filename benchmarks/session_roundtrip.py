@@ -0,0 +1,97 @@
+"""
+Benchmark for `tools/call` round trips through a connected client/server session.
+
+Runs a lowlevel server over the in-memory transport from
+`create_connected_server_and_client_session` and times tool calls with
+increasingly large argument payloads. It also times the receive-side step that
+turns a `JSONRPCRequest` into a typed `ClientRequest`, comparing the previous
+dump-then-revalidate path with validating the envelope as-is.
+
+Usage:
+    uv run python benchmarks/session_roundtrip.py [--calls N]
+"""
+
+import argparse
+import time
+import timeit
+from typing import Any
+
+import anyio
+
+import mcp.types as types
+from mcp.server.lowlevel import Server
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.shared.session import _envelope_payload  # pyright: ignore[reportPrivateUsage]
+
+
+def _arguments(size: int) -> dict[str, Any]:
+    return {"rows": [{"id": i, "name": f"row-{i}", "tags": ["a", "b", "c"], "score": i / 3} for i in range(size)]}
+
+
+def _build_server() -> Server[Any]:
+    server = Server[Any]("bench")
+
+    @server.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        return [types.Tool(name="echo_size", inputSchema={"type": "object"})]
+
+    @server.call_tool(validate_input=False)
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.ContentBlock]:
+        return [types.TextContent(type="text", text=str(len(arguments["rows"])))]
+
+    return server
+
+
+async def _time_calls(size: int, calls: int) -> float:
+    arguments = _arguments(size)
+    async with create_connected_server_and_client_session(_build_server()) as client:
+        await client.call_tool("echo_size", arguments)
+        start = time.perf_counter()
+        for _ in range(calls):
+            await client.call_tool("echo_size", arguments)
+        return (time.perf_counter() - start) / calls * 1e6
+
+
+def _time_receive_path(size: int, number: int) -> tuple[float, float]:
+    envelope = types.JSONRPCRequest(
+        jsonrpc="2.0",
+        id=1,
+        method="tools/call",
+        params={"name": "echo_size", "arguments": _arguments(size)},
+    )
+
+    def before() -> None:
+        types.ClientRequest.model_validate(envelope.model_dump(by_alias=True, mode="json", exclude_none=True))
+
+    def after() -> None:
+        types.ClientRequest.model_validate(_envelope_payload(envelope))
+
+    return (
+        timeit.timeit(before, number=number) / number * 1e6,
+        timeit.timeit(after, number=number) / number * 1e6,
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500, help="tool calls per payload size")
+    args = parser.parse_args()
+
+    sizes = [1, 100, 1_000, 10_000]
+
+    print("tools/call round trip over create_connected_server_and_client_session")
+    print(f"  {'rows':>8} {'per call (us)':>14}")
+    for size in sizes:
+        calls = max(args.calls * 10 // max(size, 10), 5)
+        print(f"  {size:>8} {await _time_calls(size, calls):>14.1f}")
+
+    print("\nreceive path: JSONRPCRequest -> ClientRequest")
+    print(f"  {'rows':>8} {'before (us)':>12} {'after (us)':>12} {'speedup':>8}")
+    for size in sizes:
+        number = max(20_000 // max(size, 10), 5)
+        before, after = _time_receive_path(size, number)
+        print(f"  {size:>8} {before:>12.1f} {after:>12.1f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
@@ -0,0 +1,103 @@
+"""
+Benchmark for requests to a stateless streamable HTTP server.
+
+Sends tool calls one after another to a `StreamableHTTPSessionManager` in stateless
+mode (in-process, through httpx's ASGI transport) and reports their latency. Every
+stateless request sets up its own transport and server session, so this measures
+that per-request setup along with the call itself. With JSON responses, the request
+is dispatched in its own task rather than by a session task fed through streams.
+
+For comparison, it also reports the latency of the same requests to an ASGI app that
+answers with a fixed response, which is the cost of the HTTP round trip alone, and of
+the tool call made directly on the server. What the stateless requests take beyond
+both is the per-request transport and session.
+
+Usage:
+    uv run python benchmarks/stateless_requests.py [--requests N] [--json-response]
+"""
+
+import argparse
+import logging
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+import anyio
+import httpx
+from starlette.types import Receive, Scope, Send
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.types import LATEST_PROTOCOL_VERSION
+
+CALL_TOOL = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "tools/call",
+    "params": {"name": "add", "arguments": {"a": 1, "b": 2}},
+}
+BASE_URL = "http://bench"
+HEADERS = {
+    "accept": "application/json, text/event-stream",
+    "content-type": "application/json",
+    "mcp-protocol-version": LATEST_PROTOCOL_VERSION,
+}
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="requests to send")
+    parser.add_argument("--json-response", action="store_true", help="use JSON responses instead of SSE")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    app = FastMCP()
+    app.add_tool(add)
+    manager = StreamableHTTPSessionManager(app=app._mcp_server, json_response=args.json_response, stateless=True)
+
+    async def post(client: httpx.AsyncClient) -> None:
+        response = await client.post("/mcp", json=CALL_TOOL, headers=HEADERS)
+        response.raise_for_status()
+
+    async with manager.run():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=manager.handle_request), base_url=BASE_URL
+        ) as client:
+            stateless = await measure(lambda: post(client), args.requests)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=fixed_response), base_url=BASE_URL) as client:
+            http_only = await measure(lambda: post(client), args.requests)
+        direct = await measure(lambda: app.call_tool("add", {"a": 1, "b": 2}), args.requests)
+
+    print(f"{args.requests} tool calls")
+    report("stateless", stateless)
+    report("HTTP only", http_only)
+    report("direct", direct)
+
+
+async def fixed_response(scope: Scope, receive: Receive, send: Send) -> None:
+    await receive()
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b'{"jsonrpc":"2.0","id":1,"result":{}}'})
+
+
+async def measure(call: Callable[[], Awaitable[object]], requests: int) -> list[float]:
+    latencies: list[float] = []
+    for i in range(requests + 100):
+        start = time.perf_counter()
+        await call()
+        if i >= 100:  # warm-up
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    print(f"  {name:<10} p50 {quantiles[49]:>8.0f}  p90 {quantiles[89]:>8.0f}  p99 {quantiles[98]:>8.0f}  (us)")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
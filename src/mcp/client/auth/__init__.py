@@ -4,14 +4,19 @@ OAuth2 Authentication implementation for HTTPX.
 Implements authorization code flow with PKCE and automatic token refresh.
 """
 
+from mcp.client.auth.discovery import DiscoveredMetadata, DiscoveryCache
 from mcp.client.auth.exceptions import OAuthFlowError, OAuthRegistrationError, OAuthTokenError
 from mcp.client.auth.oauth2 import (
+    DiscoveryStorage,
     OAuthClientProvider,
     PKCEParameters,
     TokenStorage,
 )
 
 __all__ = [
+    "DiscoveredMetadata",
+    "DiscoveryCache",
+    "DiscoveryStorage",
     "OAuthClientProvider",
     "OAuthFlowError",
     "OAuthRegistrationError",
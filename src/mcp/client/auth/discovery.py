@@ -0,0 +1,72 @@
+"""
+Cache of OAuth metadata discovered for MCP servers.
+
+Before authorizing against a server, a client discovers its protected resource
+metadata (RFC 9728) and its authorization server's metadata (RFC 8414), which can
+take several sequential requests. A `DiscoveryCache` keeps the result per server URL
+for as long as the metadata responses allow, per their `Cache-Control` headers, so
+that providers for the same server can skip discovery. One cache can be shared by
+any number of providers.
+"""
+
+import time
+
+from pydantic import BaseModel
+
+from mcp.shared.auth import OAuthMetadata, ProtectedResourceMetadata
+
+DEFAULT_DISCOVERY_TTL = 3600.0
+"""Seconds discovered metadata is reused for when its responses have no `Cache-Control` lifetime."""
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class DiscoveredMetadata(BaseModel):
+    """The result of OAuth metadata discovery for one MCP server."""
+
+    protected_resource_metadata: ProtectedResourceMetadata | None = None
+    resource_metadata_url: str | None = None
+    """URL the protected resource metadata was discovered at, if any."""
+    oauth_metadata: OAuthMetadata | None = None
+    auth_server_url: str | None = None
+    expires_at: float
+    """Unix time after which the metadata must be discovered again."""
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+class DiscoveryCache:
+    """
+    Discovered OAuth metadata, keyed by MCP server URL.
+
+    Args:
+        default_ttl: Seconds metadata is reused for when its responses do not say.
+        max_entries: Maximum number of servers cached; the oldest is dropped to make room.
+    """
+
+    def __init__(self, default_ttl: float = DEFAULT_DISCOVERY_TTL, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._entries: dict[str, DiscoveredMetadata] = {}
+
+    def get(self, server_url: str) -> DiscoveredMetadata | None:
+        """Return the fresh metadata cached for `server_url`, if any."""
+        metadata = self._entries.get(server_url)
+        if metadata is not None and not metadata.is_fresh():
+            del self._entries[server_url]
+            return None
+        return metadata
+
+    def set(self, server_url: str, metadata: DiscoveredMetadata) -> None:
+        self._entries.pop(server_url, None)
+        if len(self._entries) >= self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[server_url] = metadata
+
+    def invalidate(self, server_url: str | None = None) -> None:
+        """Forget the metadata of `server_url`, or of every server."""
+        if server_url is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(server_url, None)
@@ -17,7 +17,7 @@ import httpx
 import jwt
 from pydantic import BaseModel, Field
 
-from mcp.client.auth import OAuthClientProvider, OAuthFlowError, OAuthTokenError, TokenStorage
+from mcp.client.auth import DiscoveryCache, OAuthClientProvider, OAuthFlowError, OAuthTokenError, TokenStorage
 from mcp.shared.auth import OAuthClientInformationFull, OAuthClientMetadata
 
 
@@ -46,6 +46,7 @@ class ClientCredentialsOAuthProvider(OAuthClientProvider):
         client_secret: str,
         token_endpoint_auth_method: Literal["client_secret_basic", "client_secret_post"] = "client_secret_basic",
         scopes: str | None = None,
+        discovery_cache: DiscoveryCache | None = None,
     ) -> None:
         """Initialize client_credentials OAuth provider.
 
@@ -57,6 +58,8 @@ class ClientCredentialsOAuthProvider(OAuthClientProvider):
             token_endpoint_auth_method: Authentication method for token endpoint.
                 Either "client_secret_basic" (default) or "client_secret_post".
             scopes: Optional space-separated list of scopes to request.
+            discovery_cache: Cache of discovered OAuth metadata, which can be shared
+                with other providers to skip discovery for servers they already know.
         """
         # Build minimal client_metadata for the base class
         client_metadata = OAuthClientMetadata(
@@ -65,7 +68,7 @@ class ClientCredentialsOAuthProvider(OAuthClientProvider):
             token_endpoint_auth_method=token_endpoint_auth_method,
             scope=scopes,
         )
-        super().__init__(server_url, client_metadata, storage, None, None, 300.0)
+        super().__init__(server_url, client_metadata, storage, None, None, 300.0, discovery_cache=discovery_cache)
         # Store client_info to be set during _initialize - no dynamic registration needed
         self._fixed_client_info = OAuthClientInformationFull(
             redirect_uris=None,
@@ -78,7 +81,7 @@ class ClientCredentialsOAuthProvider(OAuthClientProvider):
 
     async def _initialize(self) -> None:
         """Load stored tokens and set pre-configured client_info."""
-        self.context.current_tokens = await self.context.storage.get_tokens()
+        await self._load_tokens()
         self.context.client_info = self._fixed_client_info
         self._initialized = True
 
@@ -86,6 +89,10 @@ class ClientCredentialsOAuthProvider(OAuthClientProvider):
         """Perform client_credentials authorization."""
         return await self._exchange_token_client_credentials()
 
+    async def _background_refresh_request(self) -> httpx.Request | None:
+        """Renew tokens with the client credentials, which need no refresh token."""
+        return await self._exchange_token_client_credentials()
+
     async def _exchange_token_client_credentials(self) -> httpx.Request:
         """Build token exchange request for client_credentials grant."""
         token_data: dict[str, Any] = {
@@ -258,6 +265,7 @@ class PrivateKeyJWTOAuthProvider(OAuthClientProvider):
         client_id: str,
         assertion_provider: Callable[[str], Awaitable[str]],
         scopes: str | None = None,
+        discovery_cache: DiscoveryCache | None = None,
     ) -> None:
         """Initialize private_key_jwt OAuth provider.
 
@@ -271,6 +279,8 @@ class PrivateKeyJWTOAuthProvider(OAuthClientProvider):
                 `static_assertion_provider()` for pre-built JWTs, or provide your own
                 callback for workload identity federation.
             scopes: Optional space-separated list of scopes to request.
+            discovery_cache: Cache of discovered OAuth metadata, which can be shared
+                with other providers to skip discovery for servers they already know.
         """
         # Build minimal client_metadata for the base class
         client_metadata = OAuthClientMetadata(
@@ -279,7 +289,7 @@ class PrivateKeyJWTOAuthProvider(OAuthClientProvider):
             token_endpoint_auth_method="private_key_jwt",
             scope=scopes,
         )
-        super().__init__(server_url, client_metadata, storage, None, None, 300.0)
+        super().__init__(server_url, client_metadata, storage, None, None, 300.0, discovery_cache=discovery_cache)
         self._assertion_provider = assertion_provider
         # Store client_info to be set during _initialize - no dynamic registration needed
         self._fixed_client_info = OAuthClientInformationFull(
@@ -292,7 +302,7 @@ class PrivateKeyJWTOAuthProvider(OAuthClientProvider):
 
     async def _initialize(self) -> None:
         """Load stored tokens and set pre-configured client_info."""
-        self.context.current_tokens = await self.context.storage.get_tokens()
+        await self._load_tokens()
         self.context.client_info = self._fixed_client_info
         self._initialized = True
 
@@ -300,6 +310,12 @@ class PrivateKeyJWTOAuthProvider(OAuthClientProvider):
         """Perform client_credentials authorization with private_key_jwt."""
         return await self._exchange_token_client_credentials()
 
+    async def _background_refresh_request(self) -> httpx.Request | None:
+        """Renew tokens with a new JWT assertion, obtained off the request path."""
+        if not self.context.oauth_metadata:
+            return None  # the assertion's audience is not known until discovery
+        return await self._exchange_token_client_credentials()
+
     async def _add_client_authentication_jwt(self, *, token_data: dict[str, Any]) -> None:
         """Add JWT assertion for client authentication to token endpoint parameters."""
         if not self.context.oauth_metadata:
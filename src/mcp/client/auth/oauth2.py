@@ -7,18 +7,22 @@ Implements authorization code flow with PKCE and automatic token refresh.
 import base64
 import hashlib
 import logging
+import math
+import random
 import secrets
 import string
 import time
 from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import asynccontextmanager, nullcontext
 from dataclasses import dataclass, field
-from typing import Any, Protocol
+from typing import Any, Protocol, runtime_checkable
 from urllib.parse import quote, urlencode, urljoin, urlparse
 
 import anyio
 import httpx
 from pydantic import BaseModel, Field, ValidationError
 
+from mcp.client.auth.discovery import DEFAULT_DISCOVERY_TTL, DiscoveredMetadata, DiscoveryCache
 from mcp.client.auth.exceptions import OAuthFlowError, OAuthTokenError
 from mcp.client.auth.utils import (
     build_oauth_authorization_server_metadata_discovery_urls,
@@ -29,6 +33,7 @@ from mcp.client.auth.utils import (
     extract_field_from_www_auth,
     extract_resource_metadata_from_www_auth,
     extract_scope_from_www_auth,
+    get_cache_lifetime,
     get_client_metadata_scopes,
     handle_auth_metadata_response,
     handle_protected_resource_response,
@@ -38,6 +43,7 @@ from mcp.client.auth.utils import (
     should_use_client_metadata_url,
 )
 from mcp.client.streamable_http import MCP_PROTOCOL_VERSION
+from mcp.shared._httpx_utils import create_mcp_http_client
 from mcp.shared.auth import (
     OAuthClientInformationFull,
     OAuthClientMetadata,
@@ -53,6 +59,15 @@ from mcp.shared.auth_utils import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_REFRESH_FRACTION = 0.8
+"""Share of a token's lifetime after which background refresh renews it."""
+
+DEFAULT_REFRESH_JITTER = 0.1
+"""Largest share of that time by which background refresh renews tokens earlier, at random."""
+
+BACKGROUND_REFRESH_RETRY_INTERVAL = 10.0
+"""Seconds between attempts to renew tokens in the background after a failed one."""
+
 
 class PKCEParameters(BaseModel):
     """PKCE (Proof Key for Code Exchange) parameters."""
@@ -89,6 +104,23 @@ class TokenStorage(Protocol):
         ...
 
 
+@runtime_checkable
+class DiscoveryStorage(TokenStorage, Protocol):
+    """Token storage that also persists discovered OAuth metadata.
+
+    Providers whose storage implements this protocol reuse the metadata it holds,
+    while fresh, instead of discovering it again, e.g. after a restart.
+    """
+
+    async def get_discovery_metadata(self, server_url: str) -> DiscoveredMetadata | None:
+        """Get the metadata stored for a server."""
+        ...
+
+    async def set_discovery_metadata(self, server_url: str, metadata: DiscoveredMetadata) -> None:
+        """Store the metadata discovered for a server."""
+        ...
+
+
 @dataclass
 class OAuthContext:
     """OAuth flow context."""
@@ -100,6 +132,7 @@ class OAuthContext:
     callback_handler: Callable[[], Awaitable[tuple[str, str | None]]] | None
     timeout: float = 300.0
     client_metadata_url: str | None = None
+    discovery_cache: DiscoveryCache | None = None
 
     # Discovered metadata
     protected_resource_metadata: ProtectedResourceMetadata | None = None
@@ -231,6 +264,7 @@ class OAuthClientProvider(httpx.Auth):
         callback_handler: Callable[[], Awaitable[tuple[str, str | None]]] | None = None,
         timeout: float = 300.0,
         client_metadata_url: str | None = None,
+        discovery_cache: DiscoveryCache | None = None,
     ):
         """Initialize OAuth2 authentication.
 
@@ -245,6 +279,8 @@ class OAuthClientProvider(httpx.Auth):
                 advertises client_id_metadata_document_supported=true, this URL will be
                 used as the client_id instead of performing dynamic client registration.
                 Must be a valid HTTPS URL with a non-root pathname.
+            discovery_cache: Cache of discovered OAuth metadata, which can be shared
+                with other providers to skip discovery for servers they already know.
 
         Raises:
             ValueError: If client_metadata_url is provided but not a valid HTTPS URL
@@ -264,8 +300,11 @@ class OAuthClientProvider(httpx.Auth):
             callback_handler=callback_handler,
             timeout=timeout,
             client_metadata_url=client_metadata_url,
+            discovery_cache=discovery_cache,
         )
         self._initialized = False
+        self._skip_cached_discovery = False
+        self._tokens_updated: anyio.Event | None = None
 
     async def _handle_protected_resource_response(self, response: httpx.Response) -> bool:
         """
@@ -400,17 +439,15 @@ class OAuthClientProvider(httpx.Auth):
     async def _handle_token_response(self, response: httpx.Response) -> None:
         """Handle token exchange response."""
         if response.status_code != 200:
-            body = await response.aread()  # pragma: no cover
-            body_text = body.decode("utf-8")  # pragma: no cover
-            raise OAuthTokenError(f"Token exchange failed ({response.status_code}): {body_text}")  # pragma: no cover
+            body = await response.aread()
+            body_text = body.decode("utf-8")
+            raise OAuthTokenError(f"Token exchange failed ({response.status_code}): {body_text}")
 
         # Parse and validate response with scope validation
         token_response = await handle_token_response_scopes(response)
 
         # Store tokens in context
-        self.context.current_tokens = token_response
-        self.context.update_token_expiry(token_response)
-        await self.context.storage.set_tokens(token_response)
+        await self._update_tokens(token_response)
 
     async def _refresh_token(self) -> httpx.Request:
         """Build token refresh request."""
@@ -453,9 +490,7 @@ class OAuthClientProvider(httpx.Auth):
             content = await response.aread()
             token_response = OAuthToken.model_validate_json(content)
 
-            self.context.current_tokens = token_response
-            self.context.update_token_expiry(token_response)
-            await self.context.storage.set_tokens(token_response)
+            await self._update_tokens(token_response)
 
             return True
         except ValidationError:
@@ -463,154 +498,364 @@ class OAuthClientProvider(httpx.Auth):
             self.context.clear_tokens()
             return False
 
+    async def _update_tokens(self, tokens: OAuthToken) -> None:
+        """Replace the current tokens and their expiry at once, then store them."""
+        self.context.current_tokens = tokens
+        self.context.update_token_expiry(tokens)
+        if self._tokens_updated is not None:
+            self._tokens_updated.set()
+        await self.context.storage.set_tokens(tokens)
+
     async def _initialize(self) -> None:  # pragma: no cover
         """Load stored tokens and client info."""
-        self.context.current_tokens = await self.context.storage.get_tokens()
+        await self._load_tokens()
         self.context.client_info = await self.context.storage.get_client_info()
         self._initialized = True
 
+    async def _load_tokens(self) -> None:
+        """Load the stored tokens. Their age is unknown, so their lifetime counts from now."""
+        tokens = await self.context.storage.get_tokens()
+        self.context.current_tokens = tokens
+        self.context.token_expiry_time = calculate_token_expiry(tokens.expires_in) if tokens else None
+
     def _add_auth_header(self, request: httpx.Request) -> None:
         """Add authorization header to request if we have valid tokens."""
         if self.context.current_tokens and self.context.current_tokens.access_token:  # pragma: no branch
             request.headers["Authorization"] = f"Bearer {self.context.current_tokens.access_token}"
 
+    def _needs_refresh(self) -> bool:
+        return not self.context.is_token_valid() and self.context.can_refresh_token()
+
+    def _tokens_replaced(self, sent_tokens: OAuthToken | None) -> bool:
+        """Whether another request obtained new, valid tokens since `sent_tokens` were sent."""
+        return self.context.current_tokens is not sent_tokens and self.context.is_token_valid()
+
+    @asynccontextmanager
+    async def refresh_in_background(
+        self,
+        http_client: httpx.AsyncClient | None = None,
+        *,
+        fraction: float = DEFAULT_REFRESH_FRACTION,
+        jitter: float = DEFAULT_REFRESH_JITTER,
+    ) -> AsyncGenerator[None, None]:
+        """Renew the tokens in the background before they expire, while the context is open.
+
+        Tokens are renewed once `fraction` of their lifetime has passed, brought forward by
+        up to `jitter` of that time at random so that clients started together do not all
+        renew at once. Requests keep using the current tokens meanwhile and find the new
+        ones in place, so they only wait on a refresh if renewing in the background failed.
+
+        Example:
+            ```python
+            async with provider.refresh_in_background():
+                async with streamablehttp_client(url, auth=provider) as (read, write, _):
+                    ...
+            ```
+
+        Args:
+            http_client: Client to send token requests with. One is created if not given.
+            fraction: Share of the token lifetime after which tokens are renewed.
+            jitter: Largest share of that time by which renewal is brought forward.
+        """
+        if not 0 < fraction <= 1 or not 0 <= jitter < 1:
+            raise ValueError("fraction must be in (0, 1] and jitter in [0, 1)")
+
+        async with (
+            nullcontext(http_client) if http_client else create_mcp_http_client() as client,
+            anyio.create_task_group() as tg,
+        ):
+            tg.start_soon(self._refresh_tokens_in_background, client, fraction, jitter)
+            try:
+                yield
+            finally:
+                tg.cancel_scope.cancel()
+
+    async def _refresh_tokens_in_background(
+        self, http_client: httpx.AsyncClient, fraction: float, jitter: float
+    ) -> None:
+        async with self.context.lock:
+            if not self._initialized:
+                await self._initialize()  # pragma: no cover
+
+        retry = False
+        while True:
+            self._tokens_updated = tokens_updated = anyio.Event()
+            delay = self._background_refresh_delay(fraction, jitter, retry)
+            with anyio.move_on_after(math.inf if delay is None else delay):
+                await tokens_updated.wait()
+            if tokens_updated.is_set():
+                retry = False
+            else:
+                retry = not await self._renew_tokens(http_client)
+
+    def _background_refresh_delay(self, fraction: float, jitter: float, retry: bool) -> float | None:
+        """Seconds until the current tokens should be renewed, or None if they cannot be."""
+        tokens = self.context.current_tokens
+        if tokens is None or tokens.expires_in is None or self.context.token_expiry_time is None:
+            return None
+        remaining = self.context.token_expiry_time - time.time()
+        if retry:
+            return min(BACKGROUND_REFRESH_RETRY_INTERVAL, remaining / 2) if remaining > 1 else None
+        lifetime = int(tokens.expires_in)
+        renew_after = lifetime * fraction * (1 - jitter * random.random())
+        return max(renew_after - (lifetime - remaining), 0.0)
+
+    async def _background_refresh_request(self) -> httpx.Request | None:
+        """Build the request that renews the tokens off the request path, if they can be."""
+        if not self.context.can_refresh_token():
+            return None
+        return await self._refresh_token()
+
+    async def _renew_tokens(self, http_client: httpx.AsyncClient) -> bool:
+        """Renew the tokens off the request path. Returns whether they were renewed."""
+        tokens = self.context.current_tokens
+        async with self.context.lock:
+            if self.context.current_tokens is not tokens:
+                return True  # renewed by a request meanwhile
+
+            try:
+                request = await self._background_refresh_request()
+                if request is None:
+                    return False
+                response = await http_client.send(request)
+                if response.status_code != 200:
+                    await response.aread()
+                    logger.warning(f"Background token refresh failed ({response.status_code}): {response.text}")
+                    return False
+                new_tokens = await handle_token_response_scopes(response)
+            except (httpx.HTTPError, OAuthFlowError, OAuthTokenError):
+                logger.warning("Background token refresh failed", exc_info=True)
+                return False
+
+            # Servers may keep the refresh token as is, without sending it again (RFC 6749 section 6)
+            if new_tokens.refresh_token is None and tokens is not None and tokens.refresh_token:
+                new_tokens = new_tokens.model_copy(update={"refresh_token": tokens.refresh_token})
+            await self._update_tokens(new_tokens)
+            return True
+
     async def _handle_oauth_metadata_response(self, response: httpx.Response) -> None:
         content = await response.aread()
         metadata = OAuthMetadata.model_validate_json(content)
         self.context.oauth_metadata = metadata
 
+    async def _discover_metadata(
+        self, www_auth_resource_metadata_url: str | None
+    ) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        """Discover the protected resource and authorization server metadata.
+
+        Metadata cached or stored for the server is used instead while it is fresh, unless
+        it names another resource metadata URL than the 401 response. Discovered metadata
+        is cached and stored for as long as its responses allow.
+        """
+        cached = None if self._skip_cached_discovery else await self._load_discovered_metadata()
+        self._skip_cached_discovery = False
+        if cached is not None and www_auth_resource_metadata_url in (None, cached.resource_metadata_url):
+            self.context.protected_resource_metadata = cached.protected_resource_metadata
+            self.context.auth_server_url = cached.auth_server_url
+            self.context.oauth_metadata = cached.oauth_metadata
+            return
+
+        default_ttl = (
+            self.context.discovery_cache.default_ttl if self.context.discovery_cache else DEFAULT_DISCOVERY_TTL
+        )
+        lifetime = float("inf")
+        resource_metadata_url: str | None = None
+        oauth_metadata: OAuthMetadata | None = None
+
+        # Step 1: Discover protected resource metadata (SEP-985 with fallback support)
+        prm_discovery_urls = build_protected_resource_metadata_discovery_urls(
+            www_auth_resource_metadata_url, self.context.server_url
+        )
+
+        for url in prm_discovery_urls:  # pragma: no branch
+            discovery_request = create_oauth_metadata_request(url)
+
+            discovery_response = yield discovery_request  # sending request
+
+            prm = await handle_protected_resource_response(discovery_response)
+            if prm:
+                self.context.protected_resource_metadata = prm
+                resource_metadata_url = url
+                lifetime = min(lifetime, get_cache_lifetime(discovery_response, default_ttl))
+
+                # todo: try all authorization_servers to find the OASM
+                assert (
+                    len(prm.authorization_servers) > 0
+                )  # this is always true as authorization_servers has a min length of 1
+
+                self.context.auth_server_url = str(prm.authorization_servers[0])
+                break
+            else:
+                logger.debug(f"Protected resource metadata discovery failed: {url}")
+
+        asm_discovery_urls = build_oauth_authorization_server_metadata_discovery_urls(
+            self.context.auth_server_url, self.context.server_url
+        )
+
+        # Step 2: Discover OAuth Authorization Server Metadata (OASM) (with fallback for legacy servers)
+        for url in asm_discovery_urls:  # pragma: no cover
+            oauth_metadata_request = create_oauth_metadata_request(url)
+            oauth_metadata_response = yield oauth_metadata_request
+
+            ok, asm = await handle_auth_metadata_response(oauth_metadata_response)
+            if not ok:
+                break
+            if ok and asm:
+                self.context.oauth_metadata = asm
+                oauth_metadata = asm
+                lifetime = min(lifetime, get_cache_lifetime(oauth_metadata_response, default_ttl))
+                break
+            else:
+                logger.debug(f"OAuth metadata discovery failed: {url}")
+
+        if oauth_metadata is not None and lifetime > 0:
+            await self._store_discovered_metadata(
+                DiscoveredMetadata(
+                    protected_resource_metadata=self.context.protected_resource_metadata,
+                    resource_metadata_url=resource_metadata_url,
+                    oauth_metadata=oauth_metadata,
+                    auth_server_url=self.context.auth_server_url,
+                    expires_at=time.time() + lifetime,
+                )
+            )
+
+    async def _load_discovered_metadata(self) -> DiscoveredMetadata | None:
+        cache = self.context.discovery_cache
+        if cache is not None and (metadata := cache.get(self.context.server_url)) is not None:
+            return metadata
+        storage = self.context.storage
+        if isinstance(storage, DiscoveryStorage):
+            metadata = await storage.get_discovery_metadata(self.context.server_url)
+            if metadata is not None and metadata.is_fresh():
+                if cache is not None:
+                    cache.set(self.context.server_url, metadata)
+                return metadata
+        return None
+
+    async def _store_discovered_metadata(self, metadata: DiscoveredMetadata) -> None:
+        if self.context.discovery_cache is not None:
+            self.context.discovery_cache.set(self.context.server_url, metadata)
+        if isinstance(self.context.storage, DiscoveryStorage):
+            await self.context.storage.set_discovery_metadata(self.context.server_url, metadata)
+
     async def async_auth_flow(self, request: httpx.Request) -> AsyncGenerator[httpx.Request, httpx.Response]:
-        """HTTPX auth flow integration."""
-        async with self.context.lock:
-            if not self._initialized:
-                await self._initialize()  # pragma: no cover
+        """HTTPX auth flow integration.
 
-            # Capture protocol version from request headers
-            self.context.protocol_version = request.headers.get(MCP_PROTOCOL_VERSION)
-
-            if not self.context.is_token_valid() and self.context.can_refresh_token():
-                # Try to refresh token
-                refresh_request = await self._refresh_token()  # pragma: no cover
-                refresh_response = yield refresh_request  # pragma: no cover
-
-                if not await self._handle_refresh_response(refresh_response):  # pragma: no cover
-                    # Refresh failed, need full re-authentication
-                    self._initialized = False
-
-            if self.context.is_token_valid():
-                self._add_auth_header(request)
-
-            response = yield request
-
-            if response.status_code == 401:
-                # Perform full OAuth flow
-                try:
-                    # OAuth flow must be inline due to generator constraints
-                    www_auth_resource_metadata_url = extract_resource_metadata_from_www_auth(response)
-
-                    # Step 1: Discover protected resource metadata (SEP-985 with fallback support)
-                    prm_discovery_urls = build_protected_resource_metadata_discovery_urls(
-                        www_auth_resource_metadata_url, self.context.server_url
-                    )
-
-                    for url in prm_discovery_urls:  # pragma: no branch
-                        discovery_request = create_oauth_metadata_request(url)
-
-                        discovery_response = yield discovery_request  # sending request
-
-                        prm = await handle_protected_resource_response(discovery_response)
-                        if prm:
-                            self.context.protected_resource_metadata = prm
-
-                            # todo: try all authorization_servers to find the OASM
-                            assert (
-                                len(prm.authorization_servers) > 0
-                            )  # this is always true as authorization_servers has a min length of 1
-
-                            self.context.auth_server_url = str(prm.authorization_servers[0])
-                            break
-                        else:
-                            logger.debug(f"Protected resource metadata discovery failed: {url}")
-
-                    asm_discovery_urls = build_oauth_authorization_server_metadata_discovery_urls(
-                        self.context.auth_server_url, self.context.server_url
-                    )
-
-                    # Step 2: Discover OAuth Authorization Server Metadata (OASM) (with fallback for legacy servers)
-                    for url in asm_discovery_urls:  # pragma: no cover
-                        oauth_metadata_request = create_oauth_metadata_request(url)
-                        oauth_metadata_response = yield oauth_metadata_request
-
-                        ok, asm = await handle_auth_metadata_response(oauth_metadata_response)
-                        if not ok:
-                            break
-                        if ok and asm:
-                            self.context.oauth_metadata = asm
-                            break
-                        else:
-                            logger.debug(f"OAuth metadata discovery failed: {url}")
-
-                    # Step 3: Apply scope selection strategy
-                    self.context.client_metadata.scope = get_client_metadata_scopes(
-                        extract_scope_from_www_auth(response),
-                        self.context.protected_resource_metadata,
-                        self.context.oauth_metadata,
-                    )
-
-                    # Step 4: Register client or use URL-based client ID (CIMD)
-                    if not self.context.client_info:
-                        if should_use_client_metadata_url(
-                            self.context.oauth_metadata, self.context.client_metadata_url
-                        ):
-                            # Use URL-based client ID (CIMD)
-                            logger.debug(f"Using URL-based client ID (CIMD): {self.context.client_metadata_url}")
-                            client_information = create_client_info_from_metadata_url(
-                                self.context.client_metadata_url,  # type: ignore[arg-type]
-                                redirect_uris=self.context.client_metadata.redirect_uris,
-                            )
-                            self.context.client_info = client_information
-                            await self.context.storage.set_client_info(client_information)
-                        else:
-                            # Fallback to Dynamic Client Registration
-                            registration_request = create_client_registration_request(
-                                self.context.oauth_metadata,
-                                self.context.client_metadata,
-                                self.context.get_authorization_base_url(self.context.server_url),
-                            )
-                            registration_response = yield registration_request
-                            client_information = await handle_registration_response(registration_response)
-                            self.context.client_info = client_information
-                            await self.context.storage.set_client_info(client_information)
-
-                    # Step 5: Perform authorization and complete token exchange
-                    token_response = yield await self._perform_authorization()
-                    await self._handle_token_response(token_response)
-                except Exception:  # pragma: no cover
-                    logger.exception("OAuth flow error")
-                    raise
-
-                # Retry with new tokens
-                self._add_auth_header(request)
-                yield request
-            elif response.status_code == 403:
-                # Step 1: Extract error field from WWW-Authenticate header
-                error = extract_field_from_www_auth(response, "error")
-
-                # Step 2: Check if we need to step-up authorization
-                if error == "insufficient_scope":  # pragma: no branch
+        The context lock is only held while tokens are loaded, refreshed or obtained, so
+        requests with a valid token run concurrently. Requests that find the token being
+        refreshed, or that were rejected while another request re-authorizes, wait for the
+        lock and then use the token it produced instead of refreshing or re-authorizing again.
+        """
+        # Capture protocol version from request headers
+        self.context.protocol_version = request.headers.get(MCP_PROTOCOL_VERSION)
+
+        if not self._initialized or self._needs_refresh():
+            async with self.context.lock:
+                if not self._initialized:
+                    await self._initialize()  # pragma: no cover
+
+                if self._needs_refresh():
+                    # Try to refresh token
+                    refresh_request = await self._refresh_token()  # pragma: no cover
+                    refresh_response = yield refresh_request  # pragma: no cover
+
+                    if not await self._handle_refresh_response(refresh_response):  # pragma: no cover
+                        # Refresh failed, need full re-authentication
+                        self._initialized = False
+
+        if self.context.is_token_valid():
+            self._add_auth_header(request)
+        sent_tokens = self.context.current_tokens
+
+        response = yield request
+
+        if response.status_code == 401:
+            async with self.context.lock:
+                # Another request may have re-authorized while this one was in flight
+                if not self._tokens_replaced(sent_tokens):
+                    # Perform full OAuth flow
                     try:
-                        # Step 2a: Update the required scopes
+                        # OAuth flow must be inline due to generator constraints
+                        www_auth_resource_metadata_url = extract_resource_metadata_from_www_auth(response)
+
+                        # Steps 1-2: Discover protected resource and authorization server metadata
+                        discovery = self._discover_metadata(www_auth_resource_metadata_url)
+                        try:
+                            discovery_request = await discovery.__anext__()
+                            while True:
+                                discovery_response = yield discovery_request
+                                discovery_request = await discovery.asend(discovery_response)
+                        except StopAsyncIteration:
+                            pass
+                        finally:
+                            # Close discovery if this flow is closed or cancelled halfway through it
+                            await discovery.aclose()
+
+                        # Step 3: Apply scope selection strategy
                         self.context.client_metadata.scope = get_client_metadata_scopes(
-                            extract_scope_from_www_auth(response), self.context.protected_resource_metadata
+                            extract_scope_from_www_auth(response),
+                            self.context.protected_resource_metadata,
+                            self.context.oauth_metadata,
                         )
 
-                        # Step 2b: Perform (re-)authorization and token exchange
+                        # Step 4: Register client or use URL-based client ID (CIMD)
+                        if not self.context.client_info:
+                            if should_use_client_metadata_url(
+                                self.context.oauth_metadata, self.context.client_metadata_url
+                            ):
+                                # Use URL-based client ID (CIMD)
+                                logger.debug(f"Using URL-based client ID (CIMD): {self.context.client_metadata_url}")
+                                client_information = create_client_info_from_metadata_url(
+                                    self.context.client_metadata_url,  # type: ignore[arg-type]
+                                    redirect_uris=self.context.client_metadata.redirect_uris,
+                                )
+                                self.context.client_info = client_information
+                                await self.context.storage.set_client_info(client_information)
+                            else:
+                                # Fallback to Dynamic Client Registration
+                                registration_request = create_client_registration_request(
+                                    self.context.oauth_metadata,
+                                    self.context.client_metadata,
+                                    self.context.get_authorization_base_url(self.context.server_url),
+                                )
+                                registration_response = yield registration_request
+                                client_information = await handle_registration_response(registration_response)
+                                self.context.client_info = client_information
+                                await self.context.storage.set_client_info(client_information)
+
+                        # Step 5: Perform authorization and complete token exchange
                         token_response = yield await self._perform_authorization()
                         await self._handle_token_response(token_response)
-                    except Exception:  # pragma: no cover
+                    except Exception:
                         logger.exception("OAuth flow error")
+                        # The metadata may be stale: discover it afresh next time
+                        self._skip_cached_discovery = True
                         raise
 
-                # Retry with new tokens
-                self._add_auth_header(request)
-                yield request
+            # Retry with new tokens
+            self._add_auth_header(request)
+            yield request
+        elif response.status_code == 403:
+            # Step 1: Extract error field from WWW-Authenticate header
+            error = extract_field_from_www_auth(response, "error")
+
+            # Step 2: Check if we need to step-up authorization
+            if error == "insufficient_scope":  # pragma: no branch
+                async with self.context.lock:
+                    if not self._tokens_replaced(sent_tokens):
+                        try:
+                            # Step 2a: Update the required scopes
+                            self.context.client_metadata.scope = get_client_metadata_scopes(
+                                extract_scope_from_www_auth(response), self.context.protected_resource_metadata
+                            )
+
+                            # Step 2b: Perform (re-)authorization and token exchange
+                            token_response = yield await self._perform_authorization()
+                            await self._handle_token_response(token_response)
+                        except Exception:  # pragma: no cover
+                            logger.exception("OAuth flow error")
+                            raise
+
+            # Retry with new tokens
+            self._add_auth_header(request)
+            yield request
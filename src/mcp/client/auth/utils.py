@@ -208,6 +208,42 @@ async def handle_auth_metadata_response(response: Response) -> tuple[bool, OAuth
     return True, None
 
 
+def get_cache_lifetime(response: Response, default: float) -> float:
+    """
+    Get the number of seconds a metadata response may be reused for, per RFC 9111.
+
+    Uses the `max-age` directive of the Cache-Control header, less the response's
+    Age, and `default` when the response does not say.
+
+    Returns:
+        Remaining lifetime in seconds, 0 if the response must not be reused
+    """
+    cache_control = response.headers.get("Cache-Control")
+    if not cache_control:
+        return default
+
+    max_age: int | None = None
+    for directive in cache_control.split(","):
+        name, _, value = directive.partition("=")
+        name = name.strip().lower()
+        if name in ("no-store", "no-cache"):
+            return 0.0
+        if name == "max-age":
+            try:
+                max_age = int(value.strip().strip('"'))
+            except ValueError:
+                # An invalid max-age makes the response stale (RFC 9111 section 4.2.1)
+                return 0.0
+
+    if max_age is None:
+        return default
+    try:
+        age = int(response.headers.get("Age", "0"))
+    except ValueError:
+        age = 0
+    return float(max(max_age - age, 0))
+
+
 def create_oauth_metadata_request(url: str) -> Request:
     return Request("GET", url, headers={MCP_PROTOCOL_VERSION: LATEST_PROTOCOL_VERSION})
 
@@ -12,6 +12,7 @@ from mcp.client.experimental import ExperimentalClientFeatures
 from mcp.client.experimental.task_handlers import ExperimentalTaskHandlers
 from mcp.shared.context import RequestContext
 from mcp.shared.message import SessionMessage
+from mcp.shared.schema_validation import ToolSchemaValidators
 from mcp.shared.session import BaseSession, ProgressFnT, RequestResponder
 from mcp.shared.version import SUPPORTED_PROTOCOL_VERSIONS
 
@@ -137,6 +138,7 @@ class ClientSession(
         self._logging_callback = logging_callback or _default_logging_callback
         self._message_handler = message_handler or _default_message_handler
         self._tool_output_schemas: dict[str, dict[str, Any] | None] = {}
+        self._output_validators = ToolSchemaValidators()
         self._server_capabilities: types.ServerCapabilities | None = None
         self._experimental_features: ExperimentalClientFeatures | None = None
 
@@ -404,10 +406,10 @@ class ClientSession(
 
         # Only validate if structured content is actually provided
         if output_schema is not None and result.structuredContent is not None:
-            from jsonschema import SchemaError, ValidationError, validate
+            from jsonschema import SchemaError, ValidationError
 
             try:
-                validate(result.structuredContent, output_schema)
+                self._output_validators.validate(name, output_schema, result.structuredContent)
             except ValidationError as e:
                 raise RuntimeError(f"Invalid structured content returned by tool {name}: {e}")  # pragma: no cover
             except SchemaError as e:  # pragma: no cover
@@ -11,8 +11,8 @@ from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStre
 from httpx_sse import aconnect_sse
 from httpx_sse._exceptions import SSEError
 
-import mcp.types as types
 from mcp.shared._httpx_utils import McpHttpClientFactory, create_mcp_http_client
+from mcp.shared.codec import MessageCodec, get_default_codec
 from mcp.shared.logging_utils import redact_url_logs
 from mcp.shared.message import SessionMessage
 
@@ -40,6 +40,7 @@ async def sse_client(
     httpx_client_factory: McpHttpClientFactory = create_mcp_http_client,
     auth: httpx.Auth | None = None,
     on_session_created: Callable[[str], None] | None = None,
+    codec: MessageCodec | None = None,
 ):
     """
     Client transport for SSE.
@@ -54,7 +55,9 @@ async def sse_client(
         sse_read_timeout: Timeout for SSE read operations.
         auth: Optional HTTPX authentication handler.
         on_session_created: Optional callback invoked with the session ID when received.
+        codec: Wire codec for messages. Defaults to the process-wide default codec.
     """
+    codec = codec or get_default_codec()
     read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
     read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
 
@@ -110,9 +113,7 @@ async def sse_client(
 
                                     case "message":
                                         try:
-                                            message = types.JSONRPCMessage.model_validate_json(  # noqa: E501
-                                                sse.data
-                                            )
+                                            message = codec.decode(sse.data)
                                             logger.debug(f"Received server message: {message}")
                                         except Exception as exc:  # pragma: no cover
                                             logger.exception("Error parsing server message")  # pragma: no cover
@@ -139,11 +140,8 @@ async def sse_client(
                                     logger.debug(f"Sending client message: {session_message}")
                                     response = await client.post(
                                         endpoint_url,
-                                        json=session_message.message.model_dump(
-                                            by_alias=True,
-                                            mode="json",
-                                            exclude_none=True,
-                                        ),
+                                        content=codec.encode(session_message.message),
+                                        headers={"Content-Type": "application/json"},
                                     )
                                     response.raise_for_status()
                                     logger.debug(f"Client message sent successfully: {response.status_code}")
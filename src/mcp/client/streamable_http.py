@@ -19,6 +19,7 @@ from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStre
 from httpx_sse import EventSource, ServerSentEvent, aconnect_sse
 
 from mcp.shared._httpx_utils import McpHttpClientFactory, create_mcp_http_client
+from mcp.shared.codec import MessageCodec, get_default_codec, is_batch
 from mcp.shared.logging_utils import redact_url_logs
 from mcp.shared.message import ClientMessageMetadata, SessionMessage
 from mcp.types import (
@@ -50,6 +51,7 @@ LAST_EVENT_ID = "last-event-id"
 # Reconnection defaults
 DEFAULT_RECONNECTION_DELAY_MS = 1000  # 1 second fallback when server doesn't provide retry
 MAX_RECONNECTION_ATTEMPTS = 2  # Max retry attempts before giving up
+DEFAULT_MAX_BATCH_SIZE = 50
 CONTENT_TYPE = "content-type"
 ACCEPT = "accept"
 
@@ -89,6 +91,9 @@ class StreamableHTTPTransport:
         timeout: float | timedelta = 30,
         sse_read_timeout: float | timedelta = 60 * 5,
         auth: httpx.Auth | None = None,
+        codec: MessageCodec | None = None,
+        batch_window: float | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
     ) -> None:
         """Initialize the StreamableHTTP transport.
 
@@ -98,6 +103,12 @@ class StreamableHTTPTransport:
             timeout: HTTP timeout for regular operations.
             sse_read_timeout: Timeout for SSE read operations.
             auth: Optional HTTPX authentication handler.
+            codec: Wire codec for messages. Defaults to the process-wide default codec.
+            batch_window: Seconds to wait after a message for more messages to send
+                with it, in one POST as a JSON-RPC batch. 0 batches only messages
+                that are already queued. None, the default, sends every message in
+                its own POST.
+            max_batch_size: Maximum number of messages in a batch.
         """
         self.url = url
         self.headers = headers or {}
@@ -106,6 +117,9 @@ class StreamableHTTPTransport:
             sse_read_timeout.total_seconds() if isinstance(sse_read_timeout, timedelta) else sse_read_timeout
         )
         self.auth = auth
+        self.codec = codec or get_default_codec()
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
         self.session_id = None
         self.protocol_version = None
         self.request_headers = {
@@ -175,7 +189,7 @@ class StreamableHTTPTransport:
                     await resumption_callback(sse.id)
                 return False
             try:
-                message = JSONRPCMessage.model_validate_json(sse.data)
+                message = self.codec.decode(sse.data)
                 logger.debug(f"SSE message: {message}")
 
                 # Extract protocol version from initialization response
@@ -303,7 +317,7 @@ class StreamableHTTPTransport:
         async with ctx.client.stream(
             "POST",
             self.url,
-            json=message.model_dump(by_alias=True, mode="json", exclude_none=True),
+            content=self.codec.encode(message),
             headers=headers,
         ) as response:
             if response.status_code == 202:
@@ -345,7 +359,7 @@ class StreamableHTTPTransport:
         """Handle JSON response from the server."""
         try:
             content = await response.aread()
-            message = JSONRPCMessage.model_validate_json(content)
+            message = self.codec.decode(content)
 
             # Extract protocol version from initialization response
             if is_initialization:
@@ -495,46 +509,58 @@ class StreamableHTTPTransport:
         tg: TaskGroup,
     ) -> None:
         """Handle writing requests to the server."""
-        try:
-            async with write_stream_reader:
-                async for session_message in write_stream_reader:
-                    message = session_message.message
-                    metadata = (
-                        session_message.metadata
-                        if isinstance(session_message.metadata, ClientMessageMetadata)
-                        else None
-                    )
 
-                    # Check if this is a resumption request
-                    is_resumption = bool(metadata and metadata.resumption_token)
+        async def send_message(session_message: SessionMessage) -> None:
+            message = session_message.message
+            metadata = session_message.metadata if isinstance(session_message.metadata, ClientMessageMetadata) else None
 
-                    logger.debug(f"Sending client message: {message}")
+            # Check if this is a resumption request
+            is_resumption = bool(metadata and metadata.resumption_token)
 
-                    # Handle initialized notification
-                    if self._is_initialized_notification(message):
-                        start_get_stream()
+            logger.debug(f"Sending client message: {message}")
 
-                    ctx = RequestContext(
-                        client=client,
-                        headers=self.request_headers,
-                        session_id=self.session_id,
-                        session_message=session_message,
-                        metadata=metadata,
-                        read_stream_writer=read_stream_writer,
-                        sse_read_timeout=self.sse_read_timeout,
-                    )
+            # Handle initialized notification
+            if self._is_initialized_notification(message):
+                start_get_stream()
 
-                    async def handle_request_async():
-                        if is_resumption:
-                            await self._handle_resumption_request(ctx)
-                        else:
-                            await self._handle_post_request(ctx)
+            ctx = RequestContext(
+                client=client,
+                headers=self.request_headers,
+                session_id=self.session_id,
+                session_message=session_message,
+                metadata=metadata,
+                read_stream_writer=read_stream_writer,
+                sse_read_timeout=self.sse_read_timeout,
+            )
 
-                    # If this is a request, start a new task to handle it
-                    if isinstance(message.root, JSONRPCRequest):
-                        tg.start_soon(handle_request_async)
+            async def handle_request_async():
+                if is_resumption:
+                    await self._handle_resumption_request(ctx)
+                else:
+                    await self._handle_post_request(ctx)
+
+            # If this is a request, start a new task to handle it
+            if isinstance(message.root, JSONRPCRequest):
+                tg.start_soon(handle_request_async)
+            else:
+                await handle_request_async()
+
+        try:
+            async with write_stream_reader:
+                async for session_message in write_stream_reader:
+                    if self.batch_window is None or not self._is_batchable(session_message):
+                        await send_message(session_message)
+                        continue
+
+                    batch, next_message = await self._collect_batch(session_message, write_stream_reader)
+                    if len(batch) == 1:
+                        await send_message(batch[0])
+                    elif any(isinstance(message.message.root, JSONRPCRequest) for message in batch):
+                        tg.start_soon(self._handle_batch_post_request, client, batch, read_stream_writer)
                     else:
-                        await handle_request_async()
+                        await self._handle_batch_post_request(client, batch, read_stream_writer)
+                    if next_message is not None:
+                        await send_message(next_message)
 
         except Exception:
             logger.exception("Error in post_writer")  # pragma: no cover
@@ -542,6 +568,88 @@ class StreamableHTTPTransport:
             await read_stream_writer.aclose()
             await write_stream.aclose()
 
+    def _is_batchable(self, session_message: SessionMessage) -> bool:
+        """Whether a message may share a POST with others; initialization and resumption may not."""
+        metadata = session_message.metadata
+        if isinstance(metadata, ClientMessageMetadata) and metadata.resumption_token:
+            return False
+        message = session_message.message
+        return not (self._is_initialization_request(message) or self._is_initialized_notification(message))
+
+    async def _collect_batch(
+        self,
+        first: SessionMessage,
+        write_stream_reader: StreamReader,
+    ) -> tuple[list[SessionMessage], SessionMessage | None]:
+        """
+        Collect the messages queued within the batch window after `first`.
+
+        Returns the batch, and the message that ended it if that one cannot be batched.
+        """
+        # Wait, then take what is queued: cancelling a pending receive could lose a message
+        await anyio.sleep(self.batch_window or 0)
+        batch = [first]
+        while len(batch) < self.max_batch_size:
+            try:
+                session_message = write_stream_reader.receive_nowait()
+            except (anyio.WouldBlock, anyio.EndOfStream):
+                break
+            if not self._is_batchable(session_message):
+                return batch, session_message
+            batch.append(session_message)
+        return batch, None
+
+    async def _handle_batch_post_request(
+        self,
+        client: httpx.AsyncClient,
+        batch: list[SessionMessage],
+        read_stream_writer: StreamWriter,
+    ) -> None:
+        """Send messages in one POST, as a JSON-RPC batch, and read the responses to its requests."""
+        messages = [session_message.message for session_message in batch]
+        request_ids = [message.root.id for message in messages if isinstance(message.root, JSONRPCRequest)]
+        logger.debug(f"Sending a batch of {len(messages)} client messages")
+
+        async with client.stream(
+            "POST",
+            self.url,
+            content=self.codec.encode_batch(messages),
+            headers=self._prepare_request_headers(self.request_headers),
+        ) as response:
+            if response.status_code == 202:
+                return
+
+            if response.status_code == 404:
+                for request_id in request_ids:
+                    await self._send_session_terminated_error(read_stream_writer, request_id)
+                return
+
+            response.raise_for_status()
+            if not request_ids:  # pragma: no cover
+                return
+
+            content_type = response.headers.get(CONTENT_TYPE, "").lower()
+            if content_type.startswith(JSON):
+                try:
+                    content = await response.aread()
+                    responses = self.codec.decode_batch(content) if is_batch(content) else [self.codec.decode(content)]
+                except Exception as exc:  # pragma: no cover
+                    logger.exception("Error parsing JSON batch response")
+                    await read_stream_writer.send(exc)
+                    return
+                for message in responses:
+                    await read_stream_writer.send(SessionMessage(message))
+            elif content_type.startswith(SSE):
+                remaining = len(request_ids)
+                async for sse in EventSource(response).aiter_sse():  # pragma: no branch
+                    if await self._handle_sse_event(sse, read_stream_writer):
+                        remaining -= 1
+                        if not remaining:
+                            await response.aclose()
+                            return
+            else:
+                await self._handle_unexpected_content_type(content_type, read_stream_writer)  # pragma: no cover
+
     async def terminate_session(self, client: httpx.AsyncClient) -> None:  # pragma: no cover
         """Terminate the session by sending a DELETE request."""
         if not self.session_id:
@@ -572,6 +680,9 @@ async def streamablehttp_client(
     terminate_on_close: bool = True,
     httpx_client_factory: McpHttpClientFactory = create_mcp_http_client,
     auth: httpx.Auth | None = None,
+    codec: MessageCodec | None = None,
+    batch_window: float | None = None,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
 ) -> AsyncGenerator[
     tuple[
         MemoryObjectReceiveStream[SessionMessage | Exception],
@@ -585,6 +696,10 @@ async def streamablehttp_client(
 
     `sse_read_timeout` determines how long (in seconds) the client will wait for a new
     event before disconnecting. All other HTTP operations are controlled by `timeout`.
+    Messages are encoded and decoded with `codec`, or the default codec if not given.
+    With a `batch_window`, messages sent within that many seconds of each other are
+    coalesced into one POST as a JSON-RPC batch of at most `max_batch_size` messages,
+    so that many concurrent requests cost one round trip.
 
     Yields:
         Tuple containing:
@@ -592,7 +707,9 @@ async def streamablehttp_client(
             - write_stream: Stream for sending messages to the server
             - get_session_id_callback: Function to retrieve the current session ID
     """
-    transport = StreamableHTTPTransport(url, headers, timeout, sse_read_timeout, auth)
+    transport = StreamableHTTPTransport(
+        url, headers, timeout, sse_read_timeout, auth, codec, batch_window, max_batch_size
+    )
 
     read_stream_writer, read_stream = anyio.create_memory_object_stream[SessionMessage | Exception](0)
     write_stream, write_stream_reader = anyio.create_memory_object_stream[SessionMessage](0)
@@ -0,0 +1,189 @@
+"""
+Token verifier for JWT access tokens, verified locally against the issuer's JWKS.
+
+Authorization servers that issue signed JWT access tokens (RFC 9068) publish their
+signing keys as a JSON Web Key Set. `JWTTokenVerifier` fetches that set, keeps the
+parsed keys, and checks each token's signature and claims without calling the
+authorization server, so that verification costs no network round trip.
+
+Keys are fetched again when they are older than `jwks_ttl`, and when a token names a
+key id the set does not have, e.g. after the issuer rotated its keys. The latter is
+rate limited to one fetch per `min_refresh_interval`, so that tokens with made-up key
+ids cannot make the verifier hammer the JWKS endpoint.
+"""
+
+import logging
+import time
+from collections.abc import Sequence
+from typing import Any, cast
+
+import anyio
+import httpx
+import jwt
+
+from mcp.server.auth.provider import AccessToken, TokenVerifier
+from mcp.shared._httpx_utils import McpHttpClientFactory, create_mcp_http_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ALGORITHMS = ("RS256", "RS384", "RS512", "PS256", "PS384", "PS512", "ES256", "ES384", "ES512", "EdDSA")
+DEFAULT_JWKS_TTL = 3600.0
+DEFAULT_MIN_REFRESH_INTERVAL = 30.0
+
+# Algorithm families a key of each type can verify; keys of other types (EC, OKP) can
+# verify only the one algorithm their curve implies
+_KEY_TYPE_ALGORITHMS: dict[str | None, tuple[str, ...]] = {"RSA": ("RS", "PS"), "oct": ("HS",)}
+
+
+class JWTTokenVerifier(TokenVerifier):
+    """
+    Verifies signed JWT access tokens locally, with keys from a JWKS endpoint.
+
+    The token's `scope` (or `scp`) claim becomes the access token's scopes, `exp` its
+    expiry, `client_id` (or `azp`, or `sub`) its client id, and a single `aud` its
+    resource. Tokens without `exp` are rejected.
+
+    Args:
+        jwks_url: URL of the authorization server's JSON Web Key Set.
+        issuer: Required value of the `iss` claim; not checked when None.
+        audience: Accepted value(s) of the `aud` claim; not checked when None.
+        algorithms: Signature algorithms accepted. Symmetric algorithms cannot be
+            verified with a public key set and should not be listed.
+        leeway: Seconds of clock skew tolerated when checking `exp`, `nbf` and `iat`.
+        jwks_ttl: Seconds fetched keys are used for before they are fetched again.
+        min_refresh_interval: Minimum seconds between fetches caused by unknown key ids.
+        httpx_client_factory: Creates the client keys are fetched with.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        issuer: str | None = None,
+        audience: str | Sequence[str] | None = None,
+        algorithms: Sequence[str] = DEFAULT_ALGORITHMS,
+        leeway: float = 0.0,
+        jwks_ttl: float = DEFAULT_JWKS_TTL,
+        min_refresh_interval: float = DEFAULT_MIN_REFRESH_INTERVAL,
+        httpx_client_factory: McpHttpClientFactory = create_mcp_http_client,
+    ):
+        self.jwks_url = jwks_url
+        self.issuer = issuer
+        self.audience = audience
+        self.algorithms = list(algorithms)
+        self.leeway = leeway
+        self.jwks_ttl = jwks_ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._httpx_client_factory = httpx_client_factory
+        # Parsed keys by key id, with the algorithm each is declared for, if any
+        self._keys: dict[str | None, tuple[jwt.PyJWK, str | None]] = {}
+        self._fetched_at: float | None = None
+        self._last_attempt: float | None = None
+        self._refresh_lock = anyio.Lock()
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        """Verify the token's signature and claims, and return its access info if valid."""
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.PyJWTError:
+            return None
+        algorithm = header.get("alg")
+        if algorithm not in self.algorithms:
+            logger.debug(f"Rejecting token signed with algorithm {algorithm!r}")
+            return None
+
+        signing_key = await self._signing_key(header.get("kid"))
+        if signing_key is None:
+            return None
+        key, key_algorithm = signing_key
+        if not _key_can_verify(key, key_algorithm, algorithm):
+            logger.debug(f"Rejecting token signed with algorithm {algorithm!r} for a {key.key_type} key")
+            return None
+
+        required = ["exp"] + (["iss"] if self.issuer else []) + (["aud"] if self.audience else [])
+        try:
+            claims: dict[str, Any] = jwt.decode(
+                token,
+                key=key.key,
+                algorithms=[algorithm],
+                issuer=self.issuer,
+                audience=self.audience,
+                leeway=self.leeway,
+                options={"require": required, "verify_aud": self.audience is not None},
+            )
+        except (jwt.PyJWTError, TypeError, ValueError) as e:
+            # pyjwt raises TypeError/ValueError for keys that do not suit the algorithm
+            logger.debug(f"Rejecting token: {e}")
+            return None
+
+        return AccessToken(
+            token=token,
+            client_id=str(claims.get("client_id") or claims.get("azp") or claims.get("sub") or "unknown"),
+            scopes=_scopes(claims),
+            expires_at=int(claims["exp"]),
+            resource=claims["aud"] if isinstance(claims.get("aud"), str) else None,
+        )
+
+    async def _signing_key(self, kid: str | None) -> tuple[jwt.PyJWK, str | None] | None:
+        if self._fetched_at is None or time.monotonic() - self._fetched_at >= self.jwks_ttl:
+            await self._refresh_keys()
+        elif self._find_key(kid) is None:
+            # The issuer may have rotated its keys since they were fetched
+            await self._refresh_keys()
+        return self._find_key(kid)
+
+    def _find_key(self, kid: str | None) -> tuple[jwt.PyJWK, str | None] | None:
+        if kid is None and len(self._keys) == 1:
+            # A set of one key needs no key ids
+            return next(iter(self._keys.values()))
+        return self._keys.get(kid)
+
+    async def _refresh_keys(self) -> None:
+        """Fetch the keys, unless they were fetched less than `min_refresh_interval` ago."""
+        attempt = self._last_attempt
+        async with self._refresh_lock:
+            if self._last_attempt != attempt:
+                return  # fetched while this call waited for the lock
+            now = time.monotonic()
+            if attempt is not None and now - attempt < self.min_refresh_interval:
+                return
+            self._last_attempt = now
+
+            try:
+                async with self._httpx_client_factory() as client:
+                    response = await client.get(self.jwks_url)
+                    response.raise_for_status()
+                    jwks: list[dict[str, Any]] = response.json()["keys"]
+            except (httpx.HTTPError, ValueError, KeyError, TypeError) as e:
+                # Keep the keys we have; they are more useful than none
+                logger.warning(f"Failed to fetch JWKS from {self.jwks_url}: {e}")
+                return
+
+            self._keys = {}
+            for jwk in jwks:
+                try:
+                    if jwk.get("use", "sig") != "sig":
+                        continue
+                    key = jwt.PyJWK(jwk)
+                except (jwt.PyJWTError, AttributeError, TypeError) as e:
+                    logger.debug(f"Skipping unusable JWK: {e}")
+                    continue
+                self._keys[key.key_id] = (key, jwk.get("alg"))
+            self._fetched_at = now
+
+
+def _key_can_verify(key: jwt.PyJWK, key_algorithm: str | None, algorithm: str) -> bool:
+    if key_algorithm is not None:
+        return key_algorithm == algorithm
+    families = _KEY_TYPE_ALGORITHMS.get(key.key_type)
+    if families is not None:
+        return algorithm.startswith(families)
+    return algorithm == key.algorithm_name
+
+
+def _scopes(claims: dict[str, Any]) -> list[str]:
+    scopes = claims.get("scope", claims.get("scp"))
+    if isinstance(scopes, str):
+        return scopes.split()
+    if isinstance(scopes, list):
+        return [str(scope) for scope in cast(list[Any], scopes)]
+    return []
@@ -8,6 +8,7 @@ from starlette.requests import HTTPConnection
 from starlette.types import Receive, Scope, Send
 
 from mcp.server.auth.provider import AccessToken, TokenVerifier
+from mcp.server.auth.token_cache import TokenVerificationCache
 
 
 class AuthenticatedUser(SimpleUser):
@@ -22,23 +23,27 @@ class AuthenticatedUser(SimpleUser):
 class BearerAuthBackend(AuthenticationBackend):
     """
     Authentication backend that validates Bearer tokens using a TokenVerifier.
+
+    With a `cache`, the verifier is only consulted for tokens the cache has no
+    current result for.
     """
 
-    def __init__(self, token_verifier: TokenVerifier):
+    def __init__(self, token_verifier: TokenVerifier, cache: TokenVerificationCache | None = None):
         self.token_verifier = token_verifier
+        self.cache = cache
 
     async def authenticate(self, conn: HTTPConnection):
-        auth_header = next(
-            (conn.headers.get(key) for key in conn.headers if key.lower() == "authorization"),
-            None,
-        )
-        if not auth_header or not auth_header.lower().startswith("bearer "):
+        auth_header = _authorization_header(conn)
+        if not auth_header or auth_header[:7].lower() != "bearer ":
             return None
 
         token = auth_header[7:]  # Remove "Bearer " prefix
 
         # Validate the token with the verifier
-        auth_info = await self.token_verifier.verify_token(token)
+        if self.cache is not None:
+            auth_info = await self.cache.verify(token, self.token_verifier)
+        else:
+            auth_info = await self.token_verifier.verify_token(token)
 
         if not auth_info:
             return None
@@ -49,6 +54,14 @@ class BearerAuthBackend(AuthenticationBackend):
         return AuthCredentials(auth_info.scopes), AuthenticatedUser(auth_info)
 
 
+def _authorization_header(conn: HTTPConnection) -> str | None:
+    # Compare the raw header names, without building the decoded headers of the request
+    for name, value in conn.scope["headers"]:
+        if name == b"authorization" or name.lower() == b"authorization":
+            return value.decode("latin-1")
+    return None
+
+
 class RequireAuthMiddleware:
     """
     Middleware that requires a valid Bearer token in the Authorization header.
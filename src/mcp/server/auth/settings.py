@@ -21,6 +21,11 @@ class AuthSettings(BaseModel):
     client_registration_options: ClientRegistrationOptions | None = None
     revocation_options: RevocationOptions | None = None
     required_scopes: list[str] | None = None
+    token_cache_ttl: float | None = Field(
+        None,
+        description="Seconds a verified token is trusted without verifying it again, at most until it expires. "
+        "Verification results are not cached when None.",
+    )
 
     # Resource Server settings (when operating as RS only)
     resource_server_url: AnyHttpUrl | None = Field(
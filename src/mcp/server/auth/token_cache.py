@@ -0,0 +1,116 @@
+"""
+Cache of bearer token verification results.
+
+Verifying a token can cost a round trip to the authorization server, e.g. for token
+introspection, and clients send the same token with every request. A
+`TokenVerificationCache` remembers what the verifier said about each token:
+verified tokens until they expire or for `ttl` seconds, whichever comes first, and
+rejected tokens for `negative_ttl` seconds. Tokens are keyed by their SHA-256 hash.
+
+Cached results outlive revocations by up to `ttl` seconds; keep it short where
+revocation must take effect at once.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+import anyio
+
+from mcp.server.auth.provider import AccessToken, TokenVerifier
+
+DEFAULT_TTL = 60.0
+DEFAULT_NEGATIVE_TTL = 5.0
+DEFAULT_MAX_ENTRIES = 4096
+
+
+class TokenVerificationCache:
+    """
+    Verification results, keyed by token hash, with least recently used eviction.
+
+    Concurrent verifications of the same uncached token are coalesced: the first one
+    calls the verifier, and the others wait for its result.
+
+    Args:
+        ttl: Maximum number of seconds a verified token is trusted without verifying it again.
+        negative_ttl: Number of seconds a rejected token is rejected without verifying it
+            again; 0 to verify rejected tokens every time.
+        max_entries: Maximum number of cached results; the least recently used is dropped
+            to make room.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._max_entries = max_entries
+        self._results: OrderedDict[bytes, tuple[AccessToken | None, float]] = OrderedDict()
+        self._verifying: dict[bytes, anyio.Event] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def invalidate(self, token: str | None = None) -> None:
+        """Forget the result for `token`, or every result."""
+        if token is None:
+            self._results.clear()
+        else:
+            self._results.pop(_token_key(token), None)
+
+    async def verify(self, token: str, verifier: TokenVerifier) -> AccessToken | None:
+        """
+        Return the cached result for `token`, verifying it with `verifier` first if needed.
+
+        If the verifier raises, nothing is cached and the exception propagates to this
+        caller only, while coalesced callers verify the token themselves.
+        """
+        key = _token_key(token)
+        while True:
+            cached = self._results.get(key)
+            if cached is not None:
+                access_token, expires = cached
+                if time.time() < expires:
+                    self._results.move_to_end(key)
+                    self.hits += 1
+                    return access_token
+                del self._results[key]
+            verifying = self._verifying.get(key)
+            if verifying is None:
+                break
+            await verifying.wait()
+
+        self.misses += 1
+        verifying = self._verifying[key] = anyio.Event()
+        try:
+            access_token = await verifier.verify_token(token)
+            self._store(key, access_token)
+            return access_token
+        finally:
+            del self._verifying[key]
+            verifying.set()
+
+    def _store(self, key: bytes, access_token: AccessToken | None) -> None:
+        now = time.time()
+        if access_token is None:
+            expires = now + self.negative_ttl
+        else:
+            expires = now + self.ttl
+            if access_token.expires_at is not None:
+                expires = min(expires, access_token.expires_at)
+        if expires <= now:
+            return
+
+        self._results[key] = (access_token, expires)
+        self._results.move_to_end(key)
+        while len(self._results) > self._max_entries:
+            self._results.popitem(last=False)
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
@@ -0,0 +1,204 @@
+"""
+Response compression for the HTTP server transports.
+
+The transports negotiate a content encoding from the client's `Accept-Encoding`
+header and compress their responses on the way to the ASGI `send` callable:
+
+- JSON responses are compressed whole, when they are at least `minimum_size` bytes.
+- SSE streams are compressed as they are written, and the compressor is flushed
+  after every event, so each event reaches the client as soon as it is sent.
+
+gzip is always available. zstd and brotli are used when the `zstandard` or `brotli`
+package is installed, and preferred over gzip when the client accepts them. httpx
+decompresses all three transparently, for whichever of them it can decode.
+"""
+
+from __future__ import annotations
+
+import importlib
+import zlib
+from collections.abc import Callable
+from typing import Any, Protocol
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import Message, Send
+
+DEFAULT_MINIMUM_SIZE = 1024
+
+# gzip level 6 is zlib's default; brotli's default quality (11) is far too slow for responses
+_GZIP_LEVEL = 6
+_BROTLI_QUALITY = 5
+_ZSTD_LEVEL = 3
+
+_SSE_CONTENT_TYPE = "text/event-stream"
+
+
+class Compressor(Protocol):
+    """Streaming compressor for one response body."""
+
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes:
+        """Return everything compressed so far, so the client can decode it now."""
+        ...
+
+    def finish(self) -> bytes:
+        """End the compressed stream."""
+        ...
+
+
+class _GzipCompressor:
+    def __init__(self) -> None:
+        self._compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+    def __init__(self, brotli: Any) -> None:
+        self._compressor = brotli.Compressor(quality=_BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdCompressor:
+    def __init__(self, zstandard: Any) -> None:
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(self._flush_block)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def _available_encodings() -> dict[str, Callable[[], Compressor]]:
+    """Encodings this process can produce, most preferred first."""
+    encodings: dict[str, Callable[[], Compressor]] = {}
+    try:
+        zstandard = importlib.import_module("zstandard")
+        encodings["zstd"] = lambda: _ZstdCompressor(zstandard)
+    except ImportError:
+        pass
+    try:
+        brotli = importlib.import_module("brotli")
+        encodings["br"] = lambda: _BrotliCompressor(brotli)
+    except ImportError:
+        pass
+    encodings["gzip"] = _GzipCompressor
+    return encodings
+
+
+ENCODINGS = _available_encodings()
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """
+    Choose the content encoding for a response from an `Accept-Encoding` header.
+
+    Returns the available encoding the client weighs highest, preferring zstd, then
+    brotli, then gzip among equals, or None if the client accepts none of them.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        if name:
+            weights[name] = weight
+
+    best: tuple[float, str] | None = None
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > 0 and (best is None or weight > best[0]):
+            best = (weight, encoding)
+    return best[1] if best is not None else None
+
+
+def compress_send(send: Send, encoding: str, minimum_size: int = DEFAULT_MINIMUM_SIZE) -> Send:
+    """
+    Wrap an ASGI `send` callable so that the response it sends is compressed.
+
+    Responses that are already encoded, and complete responses smaller than
+    `minimum_size`, are sent unchanged.
+    """
+    make_compressor = ENCODINGS[encoding]
+    start: Message | None = None
+    compressor: Compressor | None = None
+
+    def begin(message: Message) -> Message:
+        nonlocal compressor
+        compressor = make_compressor()
+        headers = MutableHeaders(raw=list(message["headers"]))
+        headers["content-encoding"] = encoding
+        headers.add_vary_header("accept-encoding")
+        del headers["content-length"]
+        return {**message, "headers": headers.raw}
+
+    async def compressed_send(message: Message) -> None:
+        nonlocal start
+        if message["type"] == "http.response.start":
+            headers = MutableHeaders(raw=list(message.get("headers", [])))
+            if "content-encoding" in headers:
+                await send(message)
+            elif headers.get("content-type", "").startswith(_SSE_CONTENT_TYPE):
+                # Streams start right away: their headers tell the client the stream is open
+                await send(begin(message))
+            else:
+                # Wait for the body to decide whether it is worth compressing
+                start = message
+            return
+
+        if message["type"] != "http.response.body":  # pragma: no cover
+            await send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        if start is not None:
+            if more_body or len(body) < minimum_size:
+                await send(start)
+            else:
+                start = begin(start)
+                assert compressor is not None
+                body = compressor.compress(body) + compressor.finish()
+                headers = MutableHeaders(raw=start["headers"])
+                headers["content-length"] = str(len(body))
+                await send(start)
+                await send({"type": "http.response.body", "body": body})
+                start = None
+                return
+            start = None
+
+        if compressor is None:
+            await send(message)
+            return
+        data = compressor.compress(body) + (compressor.flush() if more_body else compressor.finish())
+        await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    return compressed_send
@@ -0,0 +1,11 @@
+"""
+Event stores for resumable streamable HTTP sessions.
+
+Pass one as `event_store` to `StreamableHTTPSessionManager` or `FastMCP` to let
+clients resume an interrupted SSE stream with the `Last-Event-ID` header.
+"""
+
+from .memory import InMemoryEventStore
+from .sqlite import SQLiteEventStore
+
+__all__ = ["InMemoryEventStore", "SQLiteEventStore"]
@@ -0,0 +1,178 @@
+"""
+In-memory event store for resumable streamable HTTP sessions.
+"""
+
+from __future__ import annotations
+
+import secrets
+from collections import deque
+
+from mcp.server.streamable_http import EventCallback, EventId, EventMessage, EventStore, StreamId
+from mcp.shared.codec import MessageCodec, get_default_codec
+from mcp.types import JSONRPCMessage
+
+DEFAULT_MAX_EVENTS_PER_STREAM = 1000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Rough per-event bookkeeping cost counted against `max_bytes`, so that many small
+# (or empty priming) events are bounded too
+_EVENT_OVERHEAD = 64
+
+
+class _Stream:
+    """The events kept for one stream, oldest first, addressed by sequence number."""
+
+    def __init__(self, stream_id: StreamId, token: str):
+        self.stream_id = stream_id
+        self.token = token
+        # events[head:] are kept; events[:head] were dropped and are trimmed in batches
+        self.events: list[bytes | None] = []
+        self.head = 0
+        self.base_seq = 0  # sequence number of events[0]
+
+    def __len__(self) -> int:
+        return len(self.events) - self.head
+
+    @property
+    def first_seq(self) -> int:
+        return self.base_seq + self.head
+
+    def append(self, data: bytes | None) -> int:
+        self.events.append(data)
+        return self.base_seq + len(self.events) - 1
+
+    def pop_oldest(self) -> bytes | None:
+        data = self.events[self.head]
+        self.events[self.head] = None
+        self.head += 1
+        if self.head * 2 > len(self.events):
+            del self.events[: self.head]
+            self.base_seq += self.head
+            self.head = 0
+        return data
+
+    def after(self, seq: int) -> list[bytes | None] | None:
+        """Return the events after `seq`, or None if `seq` is not kept."""
+        index = seq - self.base_seq
+        if index < self.head or index >= len(self.events):
+            return None
+        return self.events[index + 1 :]
+
+
+class InMemoryEventStore(EventStore):
+    """
+    Keeps the most recent events of every stream in memory.
+
+    Events are held as encoded JSON-RPC messages, so `max_bytes` bounds the memory they
+    use. When either limit is reached the oldest events are dropped, and a stream
+    whose events are all dropped is forgotten. A client resuming from a dropped event
+    cannot be replayed.
+
+    Event IDs have the form `<stream token>.<sequence number>`. The token is random
+    per stream, so the replay start is found without scanning, and one stream's event
+    IDs cannot be guessed from another's.
+
+    Events are lost when the process exits; use `SQLiteEventStore` to keep them.
+
+    Args:
+        max_events_per_stream: Maximum number of events kept for each stream.
+        max_bytes: Maximum total size of the events kept, across all streams.
+        codec: Codec used to encode stored messages. Defaults to the process-wide codec.
+    """
+
+    def __init__(
+        self,
+        max_events_per_stream: int = DEFAULT_MAX_EVENTS_PER_STREAM,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        codec: MessageCodec | None = None,
+    ):
+        if max_events_per_stream < 1:
+            raise ValueError("max_events_per_stream must be at least 1")
+        self.max_events_per_stream = max_events_per_stream
+        self.max_bytes = max_bytes
+        self._codec = codec or get_default_codec()
+        self._streams: dict[StreamId, _Stream] = {}
+        self._tokens: dict[str, _Stream] = {}
+        # Every stored event in insertion order, for dropping the oldest across streams.
+        # Events already dropped by their stream's limit are skipped and pruned lazily.
+        self._order: deque[tuple[_Stream, int]] = deque()
+        self._events = 0
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        """Number of events currently kept."""
+        return self._events
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate memory used by the events currently kept."""
+        return self._bytes
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage | None) -> EventId:
+        stream = self._streams.get(stream_id)
+        if stream is None:
+            stream = self._new_stream(stream_id)
+
+        data = self._codec.encode(message) if message is not None else None
+        seq = stream.append(data)
+        self._order.append((stream, seq))
+        self._events += 1
+        self._bytes += _size(data)
+
+        if len(stream) > self.max_events_per_stream:
+            self._drop_oldest(stream)
+        while self._bytes > self.max_bytes and self._events > 1:
+            self._drop_globally_oldest()
+        if len(self._order) > 2 * self._events:
+            self._order = deque(entry for entry in self._order if self._is_kept(*entry))
+
+        return f"{stream.token}.{seq}"
+
+    async def replay_events_after(
+        self,
+        last_event_id: EventId,
+        send_callback: EventCallback,
+    ) -> StreamId | None:
+        token, _, seq_text = last_event_id.rpartition(".")
+        stream = self._tokens.get(token)
+        if stream is None or not seq_text.isdigit():
+            return None
+        last_seq = int(seq_text)
+        events = stream.after(last_seq)
+        if events is None:
+            return None
+
+        for seq, data in enumerate(events, start=last_seq + 1):
+            # Priming events have no message and are not replayed
+            if data is not None:
+                await send_callback(EventMessage(self._codec.decode(data), f"{token}.{seq}"))
+        return stream.stream_id
+
+    def _new_stream(self, stream_id: StreamId) -> _Stream:
+        token = secrets.token_urlsafe(9)
+        while token in self._tokens:  # pragma: no cover
+            token = secrets.token_urlsafe(9)
+        stream = self._streams[stream_id] = self._tokens[token] = _Stream(stream_id, token)
+        return stream
+
+    def _is_kept(self, stream: _Stream, seq: int) -> bool:
+        return self._tokens.get(stream.token) is stream and seq >= stream.first_seq
+
+    def _drop_oldest(self, stream: _Stream) -> None:
+        self._events -= 1
+        self._bytes -= _size(stream.pop_oldest())
+        if not stream:
+            del self._streams[stream.stream_id]
+            del self._tokens[stream.token]
+
+    def _drop_globally_oldest(self) -> None:
+        while True:
+            stream, seq = self._order.popleft()
+            # A stream's oldest event is the oldest of its events in the global order
+            if self._is_kept(stream, seq):
+                self._drop_oldest(stream)
+                return
+
+
+def _size(data: bytes | None) -> int:
+    return _EVENT_OVERHEAD + (len(data) if data is not None else 0)
@@ -0,0 +1,305 @@
+"""
+SQLite-backed event store for resumable streamable HTTP sessions.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+import anyio.to_thread
+
+from mcp.server.streamable_http import EventCallback, EventId, EventMessage, EventStore, StreamId
+from mcp.shared.codec import MessageCodec, get_default_codec
+from mcp.types import JSONRPCMessage
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_EVENTS = 100_000
+DEFAULT_MAX_AGE = 60 * 60
+DEFAULT_COMPACT_EVERY = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL UNIQUE,
+    stream_id TEXT NOT NULL,
+    created REAL NOT NULL,
+    message BLOB
+);
+CREATE INDEX IF NOT EXISTS events_by_stream ON events (stream_id, seq);
+"""
+
+# Failed batches remembered for the next flush
+_MAX_FAILURES = 16
+
+# Longest a flush blocks a thread in one go, so a cancelled flush leaves no thread behind for long
+_WAIT_INTERVAL = 0.1
+
+# (event ID, stream ID, creation time, encoded message)
+_Row = tuple[EventId, StreamId, float, bytes | None]
+
+
+class _Writer:
+    """A background thread that writes queued events in batches."""
+
+    def __init__(self, write: Callable[[list[_Row]], None]):
+        self._write = write
+        self._condition = threading.Condition()
+        self._queue: list[_Row] = []
+        self._queued = 0
+        self._written = 0
+        # Batches that failed since the last wait, by position of their first event
+        self._failures: list[tuple[int, Exception]] = []
+        self._waiters = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="mcp-event-store-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def idle(self) -> bool:
+        """Whether every queued event is written, and no failure is left to report."""
+        return self._written == self._queued and not self._failures
+
+    def submit(self, row: _Row) -> None:
+        with self._condition:
+            self._queue.append(row)
+            self._queued += 1
+            self._condition.notify_all()
+
+    def enter(self) -> int:
+        """
+        Start waiting for every event queued so far, returning the count to `wait` for.
+
+        Failures are kept while anyone waits, so each waiter must `leave` again.
+        """
+        with self._condition:
+            self._waiters += 1
+            return self._queued
+
+    def wait(self, target: int, timeout: float) -> bool:
+        """Block up to `timeout` seconds until `target` events are written, returning whether they are."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._written >= target, timeout)
+
+    def leave(self, target: int, written: bool) -> Exception | None:
+        """
+        Stop waiting, returning the error of a batch that held any of the `target` events.
+
+        Only batches that failed since the last waiter left, or while this one waited,
+        are reported; their events are lost. A waiter that gave up before its events
+        were `written` leaves the failures for the next one.
+        """
+        with self._condition:
+            errors = [error for first, error in self._failures if first <= target]
+            self._waiters -= 1
+            if written and not self._waiters:
+                self._failures = [failure for failure in self._failures if failure[0] > target]
+        return errors[0] if errors else None
+
+    def close(self) -> None:
+        """Write the remaining events and stop the thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                # Events queued while the previous batch was written go out together
+                batch, self._queue = self._queue, []
+            error = None
+            try:
+                self._write(batch)
+            except Exception as e:
+                logger.exception(f"Failed to write {len(batch)} events")
+                error = e
+            with self._condition:
+                if error is not None:
+                    self._failures = [*self._failures[-(_MAX_FAILURES - 1) :], (self._written + 1, error)]
+                self._written += len(batch)
+                self._condition.notify_all()
+
+
+class SQLiteEventStore(EventStore):
+    """
+    Keeps events in a SQLite database on local disk.
+
+    Events survive a server restart, and server processes on the same host can share
+    one database, so a client can resume on any of them. Lookups of the replay start
+    and replays of one stream both go through an index.
+
+    The database runs in WAL mode with `synchronous=NORMAL`: appending an event does
+    not wait for the disk, and writes are flushed together at WAL checkpoints. A power
+    loss can drop the most recent events, but never corrupts the database.
+
+    Every `compact_every` events, events beyond the newest `max_events` or older than
+    `max_age` seconds are deleted and the freed pages are returned to the filesystem.
+
+    With `write_behind`, storing an event only queues it: a background thread writes
+    the queued events in batches, one transaction per batch, so a slow disk does not
+    delay the messages sent on a stream. `flush()` waits for the queue to drain, which
+    the transport does before a response ends its stream, and raises if any of the
+    events it waited for could not be written. Replays include every event stored
+    before them. Events still queued when the process dies are lost.
+
+    Event IDs have the form `<counter>.<nonce>`. The counter increases with every
+    event stored by this process and the nonce is random, so event IDs are unique
+    across processes sharing the database and cannot be guessed from one another.
+
+    Args:
+        path: Path of the database file, created if it does not exist.
+        max_events: Maximum number of events kept, across all streams.
+        max_age: Maximum age of kept events in seconds, or None to keep them regardless
+            of age.
+        compact_every: Number of stored events between compactions.
+        write_behind: Whether to write events in the background.
+        codec: Codec used to encode stored messages. Defaults to the process-wide codec.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_events: int = DEFAULT_MAX_EVENTS,
+        max_age: float | None = DEFAULT_MAX_AGE,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+        write_behind: bool = False,
+        codec: MessageCodec | None = None,
+    ):
+        if max_events < 1:
+            raise ValueError("max_events must be at least 1")
+        self.max_events = max_events
+        self.max_age = max_age
+        self.compact_every = compact_every
+        self._codec = codec or get_default_codec()
+        self._since_compaction = 0
+        self._counter = itertools.count(1)
+
+        # One connection, used from worker threads one call at a time
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        # auto_vacuum only takes effect if set before the first table is created
+        self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._writer = _Writer(self._write_locked) if write_behind else None
+
+    def close(self) -> None:
+        """Write any queued events and close the database connection."""
+        if self._writer is not None:
+            self._writer.close()
+        with self._lock:
+            self._conn.close()
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage | None) -> EventId:
+        data = self._codec.encode(message) if message is not None else None
+        event_id = f"{next(self._counter)}.{secrets.token_hex(8)}"
+        row = (event_id, stream_id, time.time(), data)
+        if self._writer is not None:
+            self._writer.submit(row)
+        else:
+            await self._run(lambda: self._write([row]))
+        return event_id
+
+    async def flush(self) -> None:
+        writer = self._writer
+        if writer is None or writer.idle:
+            return
+        # Waits in short slices, so a cancelled flush returns at once and its thread soon after
+        target = writer.enter()
+        written = False
+        try:
+            while not written:
+                written = await anyio.to_thread.run_sync(writer.wait, target, _WAIT_INTERVAL, abandon_on_cancel=True)
+        finally:
+            error = writer.leave(target, written)
+        if error is not None:
+            raise error
+
+    async def replay_events_after(
+        self,
+        last_event_id: EventId,
+        send_callback: EventCallback,
+    ) -> StreamId | None:
+        await self.flush()
+
+        def read() -> tuple[StreamId, list[tuple[EventId, bytes | None]]] | None:
+            row = self._conn.execute(
+                "SELECT seq, stream_id FROM events WHERE event_id = ?", (last_event_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            last_seq, stream_id = row
+            events = self._conn.execute(
+                "SELECT event_id, message FROM events WHERE stream_id = ? AND seq > ? ORDER BY seq",
+                (stream_id, last_seq),
+            ).fetchall()
+            return stream_id, events
+
+        result = await self._run(read)
+        if result is None:
+            return None
+
+        stream_id, events = result
+        for event_id, data in events:
+            # Priming events have no message and are not replayed
+            if data is not None:
+                await send_callback(EventMessage(self._codec.decode(data), event_id))
+        return stream_id
+
+    def compact(self) -> None:
+        """Delete events beyond the retention limits and release the space they used."""
+        with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        row = self._conn.execute("SELECT MAX(seq) FROM events").fetchone()
+        if row[0] is not None:
+            self._conn.execute("DELETE FROM events WHERE seq <= ?", (row[0] - self.max_events,))
+        if self.max_age is not None:
+            self._conn.execute("DELETE FROM events WHERE created < ?", (time.time() - self.max_age,))
+        self._conn.execute("PRAGMA incremental_vacuum")
+        self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def _write(self, rows: list[_Row]) -> None:
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(
+                "INSERT INTO events (event_id, stream_id, created, message) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+        self._since_compaction += len(rows)
+        if self._since_compaction >= self.compact_every:
+            self._since_compaction = 0
+            self._compact()
+
+    def _write_locked(self, rows: list[_Row]) -> None:
+        with self._lock:
+            self._write(rows)
+
+    async def _run(self, fn: Callable[[], T]) -> T:
+        def locked() -> T:
+            with self._lock:
+                return fn()
+
+        return await anyio.to_thread.run_sync(locked)
@@ -10,6 +10,7 @@ import pydantic_core
 from pydantic import BaseModel, Field, TypeAdapter, validate_call
 
 from mcp.server.fastmcp.utilities.context_injection import find_context_parameter, inject_context
+from mcp.server.fastmcp.utilities.execution import ThreadLimiter, call_sync, is_async_callable
 from mcp.server.fastmcp.utilities.func_metadata import func_metadata
 from mcp.types import ContentBlock, Icon, TextContent
 
@@ -73,6 +74,11 @@ class Prompt(BaseModel):
     fn: Callable[..., PromptResult | Awaitable[PromptResult]] = Field(exclude=True)
     icons: list[Icon] | None = Field(default=None, description="Optional list of icons for this prompt")
     context_kwarg: str | None = Field(None, description="Name of the kwarg that should receive context", exclude=True)
+    run_in_thread: bool = Field(
+        default=True,
+        description="Whether a synchronous prompt function runs in a worker thread instead of on the event loop",
+        exclude=True,
+    )
 
     @classmethod
     def from_function(
@@ -83,6 +89,7 @@ class Prompt(BaseModel):
         description: str | None = None,
         icons: list[Icon] | None = None,
         context_kwarg: str | None = None,
+        run_in_thread: bool = True,
     ) -> Prompt:
         """Create a Prompt from a function.
 
@@ -132,12 +139,14 @@ class Prompt(BaseModel):
             fn=fn,
             icons=icons,
             context_kwarg=context_kwarg,
+            run_in_thread=run_in_thread,
         )
 
     async def render(
         self,
         arguments: dict[str, Any] | None = None,
         context: Context[ServerSessionT, LifespanContextT, RequestT] | None = None,
+        thread_limiter: ThreadLimiter | None = None,
     ) -> list[Message]:
         """Render the prompt with arguments."""
         # Validate required arguments
@@ -153,7 +162,12 @@ class Prompt(BaseModel):
             call_args = inject_context(self.fn, arguments or {}, context, self.context_kwarg)
 
             # Call function and check if result is a coroutine
-            result = self.fn(**call_args)
+            if is_async_callable(self.fn):
+                result = self.fn(**call_args)
+            else:
+                result = await call_sync(
+                    self.fn, call_args, run_in_thread=self.run_in_thread, thread_limiter=thread_limiter
+                )
             if inspect.iscoroutine(result):
                 result = await result
 
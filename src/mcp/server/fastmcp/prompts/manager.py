@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from mcp.server.fastmcp.prompts.base import Message, Prompt
+from mcp.server.fastmcp.utilities.execution import ThreadLimiter
 from mcp.server.fastmcp.utilities.logging import get_logger
 
 if TYPE_CHECKING:
@@ -18,9 +19,12 @@ logger = get_logger(__name__)
 class PromptManager:
     """Manages FastMCP prompts."""
 
-    def __init__(self, warn_on_duplicate_prompts: bool = True):
+    def __init__(self, warn_on_duplicate_prompts: bool = True, thread_limiter: ThreadLimiter | None = None):
         self._prompts: dict[str, Prompt] = {}
+        # Incremented whenever a prompt is added
+        self.version = 0
         self.warn_on_duplicate_prompts = warn_on_duplicate_prompts
+        self.thread_limiter = thread_limiter
 
     def get_prompt(self, name: str) -> Prompt | None:
         """Get prompt by name."""
@@ -44,6 +48,7 @@ class PromptManager:
             return existing
 
         self._prompts[prompt.name] = prompt
+        self.version += 1
         return prompt
 
     async def render_prompt(
@@ -57,4 +62,4 @@ class PromptManager:
         if not prompt:
             raise ValueError(f"Unknown prompt: {name}")
 
-        return await prompt.render(arguments, context=context)
+        return await prompt.render(arguments, context=context, thread_limiter=self.thread_limiter)
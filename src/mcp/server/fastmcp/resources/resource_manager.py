@@ -9,6 +9,7 @@ from pydantic import AnyUrl
 
 from mcp.server.fastmcp.resources.base import Resource
 from mcp.server.fastmcp.resources.templates import ResourceTemplate
+from mcp.server.fastmcp.utilities.execution import ThreadLimiter
 from mcp.server.fastmcp.utilities.logging import get_logger
 from mcp.types import Annotations, Icon
 
@@ -23,10 +24,13 @@ logger = get_logger(__name__)
 class ResourceManager:
     """Manages FastMCP resources."""
 
-    def __init__(self, warn_on_duplicate_resources: bool = True):
+    def __init__(self, warn_on_duplicate_resources: bool = True, thread_limiter: ThreadLimiter | None = None):
         self._resources: dict[str, Resource] = {}
         self._templates: dict[str, ResourceTemplate] = {}
+        # Incremented whenever a resource or template is added
+        self.version = 0
         self.warn_on_duplicate_resources = warn_on_duplicate_resources
+        self.thread_limiter = thread_limiter
 
     def add_resource(self, resource: Resource) -> Resource:
         """Add a resource to the manager.
@@ -52,6 +56,7 @@ class ResourceManager:
                 logger.warning(f"Resource already exists: {resource.uri}")
             return existing
         self._resources[str(resource.uri)] = resource
+        self.version += 1
         return resource
 
     def add_template(
@@ -64,6 +69,7 @@ class ResourceManager:
         mime_type: str | None = None,
         icons: list[Icon] | None = None,
         annotations: Annotations | None = None,
+        run_in_thread: bool = True,
     ) -> ResourceTemplate:
         """Add a template from a function."""
         template = ResourceTemplate.from_function(
@@ -75,8 +81,10 @@ class ResourceManager:
             mime_type=mime_type,
             icons=icons,
             annotations=annotations,
+            run_in_thread=run_in_thread,
         )
         self._templates[template.uri_template] = template
+        self.version += 1
         return template
 
     async def get_resource(
@@ -96,7 +104,9 @@ class ResourceManager:
         for template in self._templates.values():
             if params := template.matches(uri_str):
                 try:
-                    return await template.create_resource(uri_str, params, context=context)
+                    return await template.create_resource(
+                        uri_str, params, context=context, thread_limiter=self.thread_limiter
+                    )
                 except Exception as e:  # pragma: no cover
                     raise ValueError(f"Error creating resource from template: {e}")
 
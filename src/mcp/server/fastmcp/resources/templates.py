@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field, validate_call
 
 from mcp.server.fastmcp.resources.types import FunctionResource, Resource
 from mcp.server.fastmcp.utilities.context_injection import find_context_parameter, inject_context
+from mcp.server.fastmcp.utilities.execution import ThreadLimiter, call_sync, is_async_callable
 from mcp.server.fastmcp.utilities.func_metadata import func_metadata
 from mcp.types import Annotations, Icon
 
@@ -33,6 +34,9 @@ class ResourceTemplate(BaseModel):
     fn: Callable[..., Any] = Field(exclude=True)
     parameters: dict[str, Any] = Field(description="JSON schema for function parameters")
     context_kwarg: str | None = Field(None, description="Name of the kwarg that should receive context")
+    run_in_thread: bool = Field(
+        default=True, description="Whether a synchronous function runs in a worker thread instead of on the event loop"
+    )
 
     @classmethod
     def from_function(
@@ -46,6 +50,7 @@ class ResourceTemplate(BaseModel):
         icons: list[Icon] | None = None,
         annotations: Annotations | None = None,
         context_kwarg: str | None = None,
+        run_in_thread: bool = True,
     ) -> ResourceTemplate:
         """Create a template from a function."""
         func_name = name or fn.__name__
@@ -77,6 +82,7 @@ class ResourceTemplate(BaseModel):
             fn=fn,
             parameters=parameters,
             context_kwarg=context_kwarg,
+            run_in_thread=run_in_thread,
         )
 
     def matches(self, uri: str) -> dict[str, Any] | None:
@@ -93,6 +99,7 @@ class ResourceTemplate(BaseModel):
         uri: str,
         params: dict[str, Any],
         context: Context[ServerSessionT, LifespanContextT, RequestT] | None = None,
+        thread_limiter: ThreadLimiter | None = None,
     ) -> Resource:
         """Create a resource from the template with the given parameters."""
         try:
@@ -100,7 +107,12 @@ class ResourceTemplate(BaseModel):
             params = inject_context(self.fn, params, context, self.context_kwarg)
 
             # Call function and check if result is a coroutine
-            result = self.fn(**params)
+            if is_async_callable(self.fn):
+                result = self.fn(**params)
+            else:
+                result = await call_sync(
+                    self.fn, params, run_in_thread=self.run_in_thread, thread_limiter=thread_limiter
+                )
             if inspect.iscoroutine(result):
                 result = await result
 
@@ -5,6 +5,7 @@ from __future__ import annotations as _annotations
 import inspect
 import re
 from collections.abc import (
+    AsyncGenerator,
     AsyncIterator,
     Awaitable,
     Callable,
@@ -39,6 +40,8 @@ from mcp.server.auth.provider import (
     TokenVerifier,
 )
 from mcp.server.auth.settings import AuthSettings
+from mcp.server.auth.token_cache import TokenVerificationCache
+from mcp.server.compression import DEFAULT_MINIMUM_SIZE as DEFAULT_COMPRESSION_MIN_SIZE
 from mcp.server.elicitation import (
     ElicitationResult,
     ElicitSchemaModelT,
@@ -50,22 +53,46 @@ from mcp.server.elicitation import (
 )
 from mcp.server.fastmcp.exceptions import ResourceError
 from mcp.server.fastmcp.prompts import Prompt, PromptManager
-from mcp.server.fastmcp.resources import FunctionResource, Resource, ResourceManager
+from mcp.server.fastmcp.resources import FunctionResource, Resource, ResourceManager, ResourceTemplate
 from mcp.server.fastmcp.tools import Tool, ToolManager
 from mcp.server.fastmcp.utilities.context_injection import find_context_parameter
+from mcp.server.fastmcp.utilities.execution import DEFAULT_MAX_SYNC_THREADS, Executor, ProcessExecutor, ThreadLimiter
 from mcp.server.fastmcp.utilities.logging import configure_logging, get_logger
+from mcp.server.fastmcp.utilities.pagination import Paginator
 from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.lowlevel.server import LifespanResultT
 from mcp.server.lowlevel.server import Server as MCPServer
 from mcp.server.lowlevel.server import lifespan as default_lifespan
+from mcp.server.response_cache import ResponseCache
 from mcp.server.session import ServerSession, ServerSessionT
 from mcp.server.sse import SseServerTransport
 from mcp.server.stdio import stdio_server
-from mcp.server.streamable_http import EventStore
+from mcp.server.streamable_http import (
+    DEFAULT_STREAM_BACKLOG_SIZE,
+    DEFAULT_STREAM_BUFFER_SIZE,
+    EventStore,
+    StreamOverflowPolicy,
+)
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from mcp.server.transport_security import TransportSecuritySettings
 from mcp.shared.context import LifespanContextT, RequestContext, RequestT
-from mcp.types import Annotations, AnyFunction, ContentBlock, GetPromptResult, Icon, ToolAnnotations
+from mcp.types import (
+    Annotations,
+    AnyFunction,
+    ContentBlock,
+    GetPromptResult,
+    Icon,
+    ListPromptsRequest,
+    ListPromptsResult,
+    ListResourcesRequest,
+    ListResourcesResult,
+    ListResourceTemplatesRequest,
+    ListResourceTemplatesResult,
+    ListToolsRequest,
+    ListToolsResult,
+    PaginatedRequest,
+    ToolAnnotations,
+)
 from mcp.types import Prompt as MCPPrompt
 from mcp.types import PromptArgument as MCPPromptArgument
 from mcp.types import Resource as MCPResource
@@ -106,6 +133,22 @@ class Settings(BaseSettings, Generic[LifespanResultT]):
     json_response: bool
     stateless_http: bool
     """Define if the server should create a new transport per request."""
+    session_idle_timeout: float | None
+    """Seconds after which an idle stateful session is closed (never, if None)."""
+    max_sessions: int | None
+    """Maximum number of stateful sessions; the least recently used idle one is closed to make room."""
+    session_ping_interval: float | None
+    """Seconds between liveness pings to sessions with an open GET stream (disabled if None)."""
+    stream_buffer_size: int
+    """Messages buffered for each SSE stream before `stream_overflow` applies."""
+    stream_overflow: StreamOverflowPolicy
+    """Drop progress notifications for a slow stream, or close it so the client replays from the event store."""
+    stream_backlog_size: int
+    """Messages queued behind a full SSE stream buffer before the stream is closed."""
+
+    # HTTP compression settings
+    compression_min_size: int | None
+    """Smallest JSON response compressed for clients that accept it; SSE streams always are (off if None)."""
 
     # resource settings
     warn_on_duplicate_resources: bool
@@ -116,6 +159,18 @@ class Settings(BaseSettings, Generic[LifespanResultT]):
     # prompt settings
     warn_on_duplicate_prompts: bool
 
+    # list settings
+    cache_list_results: bool
+    """Share encoded list results across sessions until the catalog changes; only if they never vary by request."""
+    list_page_size: int | None
+    """Maximum number of tools, resources, resource templates or prompts per list result (all at once if None)."""
+
+    # execution settings
+    max_sync_threads: int
+    """Maximum number of worker threads running synchronous tools, resource templates and prompts at once."""
+    max_process_workers: int | None
+    """Worker processes for tools with executor="process", started with the server (defaults to the CPU count)."""
+
     # TODO(Marcelo): Investigate if this is used. If it is, it's probably a good idea to remove it.
     dependencies: list[str]
     """A list of dependencies to install in the server environment."""
@@ -123,6 +178,9 @@ class Settings(BaseSettings, Generic[LifespanResultT]):
     lifespan: Callable[[FastMCP[LifespanResultT]], AbstractAsyncContextManager[LifespanResultT]] | None
     """A async context manager that will be called when the server is started."""
 
+    app_lifespan: Callable[[FastMCP[LifespanResultT]], AbstractAsyncContextManager[Any]] | None
+    """A async context manager entered once for all sessions, for state they share such as connection pools."""
+
     auth: AuthSettings | None
 
     # Transport security settings (DNS rebinding protection)
@@ -166,11 +224,23 @@ class FastMCP(Generic[LifespanResultT]):
         streamable_http_path: str = "/mcp",
         json_response: bool = False,
         stateless_http: bool = False,
+        session_idle_timeout: float | None = None,
+        max_sessions: int | None = None,
+        session_ping_interval: float | None = None,
+        stream_buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+        stream_overflow: StreamOverflowPolicy = "drop_progress",
+        stream_backlog_size: int = DEFAULT_STREAM_BACKLOG_SIZE,
+        compression_min_size: int | None = DEFAULT_COMPRESSION_MIN_SIZE,
         warn_on_duplicate_resources: bool = True,
         warn_on_duplicate_tools: bool = True,
         warn_on_duplicate_prompts: bool = True,
+        cache_list_results: bool = False,
+        list_page_size: int | None = None,
+        max_sync_threads: int = DEFAULT_MAX_SYNC_THREADS,
+        max_process_workers: int | None = None,
         dependencies: Collection[str] = (),
         lifespan: (Callable[[FastMCP[LifespanResultT]], AbstractAsyncContextManager[LifespanResultT]] | None) = None,
+        app_lifespan: Callable[[FastMCP[LifespanResultT]], AbstractAsyncContextManager[Any]] | None = None,
         auth: AuthSettings | None = None,
         transport_security: TransportSecuritySettings | None = None,
     ):
@@ -193,11 +263,23 @@ class FastMCP(Generic[LifespanResultT]):
             streamable_http_path=streamable_http_path,
             json_response=json_response,
             stateless_http=stateless_http,
+            session_idle_timeout=session_idle_timeout,
+            max_sessions=max_sessions,
+            session_ping_interval=session_ping_interval,
+            stream_buffer_size=stream_buffer_size,
+            stream_overflow=stream_overflow,
+            stream_backlog_size=stream_backlog_size,
+            compression_min_size=compression_min_size,
             warn_on_duplicate_resources=warn_on_duplicate_resources,
             warn_on_duplicate_tools=warn_on_duplicate_tools,
             warn_on_duplicate_prompts=warn_on_duplicate_prompts,
+            cache_list_results=cache_list_results,
+            list_page_size=list_page_size,
+            max_sync_threads=max_sync_threads,
+            max_process_workers=max_process_workers,
             dependencies=list(dependencies),
             lifespan=lifespan,
+            app_lifespan=app_lifespan,
             auth=auth,
             transport_security=transport_security,
         )
@@ -210,10 +292,31 @@ class FastMCP(Generic[LifespanResultT]):
             # TODO(Marcelo): It seems there's a type mismatch between the lifespan type from an FastMCP and Server.
             # We need to create a Lifespan type that is a generic on the server type, like Starlette does.
             lifespan=(lifespan_wrapper(self, self.settings.lifespan) if self.settings.lifespan else default_lifespan),  # type: ignore
+            app_lifespan=self._app_lifespan,
+        )
+        # Shared by every synchronous tool, resource template and prompt of this server
+        self._thread_limiter = ThreadLimiter(self.settings.max_sync_threads)
+        # Worker processes live as long as the app lifespan, see `_app_lifespan`
+        self._process_executor = ProcessExecutor(max_workers=self.settings.max_process_workers)
+        self._tool_manager = ToolManager(
+            tools=tools,
+            warn_on_duplicate_tools=self.settings.warn_on_duplicate_tools,
+            thread_limiter=self._thread_limiter,
+            process_executor=self._process_executor,
         )
-        self._tool_manager = ToolManager(tools=tools, warn_on_duplicate_tools=self.settings.warn_on_duplicate_tools)
-        self._resource_manager = ResourceManager(warn_on_duplicate_resources=self.settings.warn_on_duplicate_resources)
-        self._prompt_manager = PromptManager(warn_on_duplicate_prompts=self.settings.warn_on_duplicate_prompts)
+        self._resource_manager = ResourceManager(
+            warn_on_duplicate_resources=self.settings.warn_on_duplicate_resources,
+            thread_limiter=self._thread_limiter,
+        )
+        self._prompt_manager = PromptManager(
+            warn_on_duplicate_prompts=self.settings.warn_on_duplicate_prompts,
+            thread_limiter=self._thread_limiter,
+        )
+        # Calls are validated against the registry, which follows the tool manager from here on
+        for tool in self._tool_manager.list_tools():
+            self._mcp_server.tool_registry.add(tool.definition)
+        if self.settings.cache_list_results:
+            self._mcp_server.response_cache = ResponseCache(version=self._catalog_version)
         # Validate auth configuration
         if self.settings.auth is not None:
             if auth_server_provider and token_verifier:  # pragma: no cover
@@ -229,6 +332,10 @@ class FastMCP(Generic[LifespanResultT]):
         # Create token verifier from provider if needed (backwards compatibility)
         if auth_server_provider and not token_verifier:  # pragma: no cover
             self._token_verifier = ProviderTokenVerifier(auth_server_provider)
+        # Shared by the SSE and streamable HTTP apps
+        self._token_cache: TokenVerificationCache | None = None
+        if self.settings.auth is not None and self.settings.auth.token_cache_ttl is not None:
+            self._token_cache = TokenVerificationCache(ttl=self.settings.auth.token_cache_ttl)
         self._event_store = event_store
         self._retry_interval = retry_interval
         self._custom_starlette_routes: list[Route] = []
@@ -299,35 +406,74 @@ class FastMCP(Generic[LifespanResultT]):
             case "streamable-http":  # pragma: no cover
                 anyio.run(self.run_streamable_http_async)
 
+    def _catalog_version(self) -> tuple[int, int, int]:
+        """Changes whenever a tool, resource, resource template or prompt is added or removed."""
+        return self._tool_manager.version, self._resource_manager.version, self._prompt_manager.version
+
+    @asynccontextmanager
+    async def _app_lifespan(self, _: MCPServer[LifespanResultT, Request]) -> AsyncGenerator[Any]:
+        """Hold the worker processes, and enter the user's app lifespan, for as long as the app runs."""
+        process_tools = any(tool.executor == "process" for tool in self._tool_manager.list_tools())
+        async with self._process_executor.pool(prewarm=self._process_executor.max_workers if process_tools else 0):
+            if self.settings.app_lifespan is None:
+                yield None
+            else:
+                async with self.settings.app_lifespan(self) as context:
+                    yield context
+
     def _setup_handlers(self) -> None:
         """Set up core MCP protocol handlers."""
-        self._mcp_server.list_tools()(self.list_tools)
         # Note: we disable the lowlevel server's input validation.
         # FastMCP does ad hoc conversion of incoming data before validating -
         # for now we preserve this for backwards compatibility.
         self._mcp_server.call_tool(validate_input=False)(self.call_tool)
-        self._mcp_server.list_resources()(self.list_resources)
         self._mcp_server.read_resource()(self.read_resource)
-        self._mcp_server.list_prompts()(self.list_prompts)
         self._mcp_server.get_prompt()(self.get_prompt)
-        self._mcp_server.list_resource_templates()(self.list_resource_templates)
+        page_size = self.settings.list_page_size
+        if page_size is None:
+            self._mcp_server.list_tools()(self.list_tools)
+            self._mcp_server.list_resources()(self.list_resources)
+            self._mcp_server.list_prompts()(self.list_prompts)
+            self._mcp_server.list_resource_templates()(self.list_resource_templates)
+        else:
+            self._tool_pages = Paginator[Tool](page_size, key=lambda tool: tool.name)
+            self._resource_pages = Paginator[Resource](page_size, key=lambda resource: str(resource.uri))
+            self._template_pages = Paginator[ResourceTemplate](page_size, key=lambda template: template.uri_template)
+            self._prompt_pages = Paginator[Prompt](page_size, key=lambda prompt: prompt.name)
+            self._mcp_server.list_tools()(self._list_tools_page)
+            self._mcp_server.list_resources()(self._list_resources_page)
+            self._mcp_server.list_prompts()(self._list_prompts_page)
+            self._mcp_server.list_resource_templates()(self._list_resource_templates_page)
+
+    async def _list_tools_page(self, request: ListToolsRequest) -> ListToolsResult:
+        tools, next_cursor = self._tool_pages.page(
+            self._tool_manager.version, self._tool_manager.list_tools, _request_cursor(request)
+        )
+        return ListToolsResult(tools=[tool.definition for tool in tools], nextCursor=next_cursor)
+
+    async def _list_resources_page(self, request: ListResourcesRequest) -> ListResourcesResult:
+        resources, next_cursor = self._resource_pages.page(
+            self._resource_manager.version, self._resource_manager.list_resources, _request_cursor(request)
+        )
+        return ListResourcesResult(resources=[_resource_definition(r) for r in resources], nextCursor=next_cursor)
+
+    async def _list_resource_templates_page(self, request: ListResourceTemplatesRequest) -> ListResourceTemplatesResult:
+        templates, next_cursor = self._template_pages.page(
+            self._resource_manager.version, self._resource_manager.list_templates, _request_cursor(request)
+        )
+        return ListResourceTemplatesResult(
+            resourceTemplates=[_template_definition(template) for template in templates], nextCursor=next_cursor
+        )
+
+    async def _list_prompts_page(self, request: ListPromptsRequest) -> ListPromptsResult:
+        prompts, next_cursor = self._prompt_pages.page(
+            self._prompt_manager.version, self._prompt_manager.list_prompts, _request_cursor(request)
+        )
+        return ListPromptsResult(prompts=[_prompt_definition(prompt) for prompt in prompts], nextCursor=next_cursor)
 
     async def list_tools(self) -> list[MCPTool]:
         """List all available tools."""
-        tools = self._tool_manager.list_tools()
-        return [
-            MCPTool(
-                name=info.name,
-                title=info.title,
-                description=info.description,
-                inputSchema=info.parameters,
-                outputSchema=info.output_schema,
-                annotations=info.annotations,
-                icons=info.icons,
-                _meta=info.meta,
-            )
-            for info in tools
-        ]
+        return [info.definition for info in self._tool_manager.list_tools()]
 
     def get_context(self) -> Context[ServerSession, LifespanResultT, Request]:
         """
@@ -348,34 +494,10 @@ class FastMCP(Generic[LifespanResultT]):
     async def list_resources(self) -> list[MCPResource]:
         """List all available resources."""
 
-        resources = self._resource_manager.list_resources()
-        return [
-            MCPResource(
-                uri=resource.uri,
-                name=resource.name or "",
-                title=resource.title,
-                description=resource.description,
-                mimeType=resource.mime_type,
-                icons=resource.icons,
-                annotations=resource.annotations,
-            )
-            for resource in resources
-        ]
+        return [_resource_definition(resource) for resource in self._resource_manager.list_resources()]
 
     async def list_resource_templates(self) -> list[MCPResourceTemplate]:
-        templates = self._resource_manager.list_templates()
-        return [
-            MCPResourceTemplate(
-                uriTemplate=template.uri_template,
-                name=template.name,
-                title=template.title,
-                description=template.description,
-                mimeType=template.mime_type,
-                icons=template.icons,
-                annotations=template.annotations,
-            )
-            for template in templates
-        ]
+        return [_template_definition(template) for template in self._resource_manager.list_templates()]
 
     async def read_resource(self, uri: AnyUrl | str) -> Iterable[ReadResourceContents]:
         """Read a resource by URI."""
@@ -402,6 +524,9 @@ class FastMCP(Generic[LifespanResultT]):
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        run_in_thread: bool = True,
+        executor: Executor = "thread",
+        timeout: float | None = None,
     ) -> None:
         """Add a tool to the server.
 
@@ -418,8 +543,16 @@ class FastMCP(Generic[LifespanResultT]):
                 - If None, auto-detects based on the function's return type annotation
                 - If True, creates a structured tool (return type annotation permitting)
                 - If False, unconditionally creates an unstructured tool
+            run_in_thread: Whether a synchronous tool runs in a worker thread, so it cannot block
+                the event loop. Set to False for cheap functions to skip the thread hand-off.
+                Has no effect on async tools.
+            executor: "process" runs a synchronous, CPU-bound tool in the server's pool of worker
+                processes instead of a thread. The tool must be a picklable module-level function
+                without a Context parameter.
+            timeout: For executor="process", seconds after which the call fails and its worker
+                process is killed.
         """
-        self._tool_manager.add_tool(
+        tool = self._tool_manager.add_tool(
             fn,
             name=name,
             title=title,
@@ -428,7 +561,11 @@ class FastMCP(Generic[LifespanResultT]):
             icons=icons,
             meta=meta,
             structured_output=structured_output,
+            run_in_thread=run_in_thread,
+            executor=executor,
+            timeout=timeout,
         )
+        self._mcp_server.tool_registry.add(tool.definition)
 
     def remove_tool(self, name: str) -> None:
         """Remove a tool from the server by name.
@@ -440,6 +577,7 @@ class FastMCP(Generic[LifespanResultT]):
             ToolError: If the tool does not exist
         """
         self._tool_manager.remove_tool(name)
+        self._mcp_server.tool_registry.remove(name)
 
     def tool(
         self,
@@ -450,6 +588,9 @@ class FastMCP(Generic[LifespanResultT]):
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        run_in_thread: bool = True,
+        executor: Executor = "thread",
+        timeout: float | None = None,
     ) -> Callable[[AnyFunction], AnyFunction]:
         """Decorator to register a tool.
 
@@ -466,6 +607,14 @@ class FastMCP(Generic[LifespanResultT]):
                 - If None, auto-detects based on the function's return type annotation
                 - If True, creates a structured tool (return type annotation permitting)
                 - If False, unconditionally creates an unstructured tool
+            run_in_thread: Whether a synchronous tool runs in a worker thread, so it cannot block
+                the event loop. Set to False for cheap functions to skip the thread hand-off.
+                Has no effect on async tools.
+            executor: "process" runs a synchronous, CPU-bound tool in the server's pool of worker
+                processes instead of a thread. The tool must be a picklable module-level function
+                without a Context parameter.
+            timeout: For executor="process", seconds after which the call fails and its worker
+                process is killed.
 
         Example:
             @server.tool()
@@ -481,6 +630,10 @@ class FastMCP(Generic[LifespanResultT]):
             async def async_tool(x: int, context: Context) -> str:
                 await context.report_progress(50, 100)
                 return str(x)
+
+            @server.tool(executor="process", timeout=30)
+            def cpu_heavy_tool(text: str) -> int:
+                return count_matches(text)
         """
         # Check if user passed function directly instead of calling decorator
         if callable(name):
@@ -498,6 +651,9 @@ class FastMCP(Generic[LifespanResultT]):
                 icons=icons,
                 meta=meta,
                 structured_output=structured_output,
+                run_in_thread=run_in_thread,
+                executor=executor,
+                timeout=timeout,
             )
             return fn
 
@@ -539,6 +695,7 @@ class FastMCP(Generic[LifespanResultT]):
         mime_type: str | None = None,
         icons: list[Icon] | None = None,
         annotations: Annotations | None = None,
+        run_in_thread: bool = True,
     ) -> Callable[[AnyFunction], AnyFunction]:
         """Decorator to register a function as a resource.
 
@@ -557,6 +714,8 @@ class FastMCP(Generic[LifespanResultT]):
             title: Optional human-readable title for the resource
             description: Optional description of the resource
             mime_type: Optional MIME type for the resource
+            run_in_thread: Whether a synchronous template function runs in a worker thread
+                instead of on the event loop. Has no effect on async functions.
 
         Example:
             @server.resource("resource://my-resource")
@@ -615,6 +774,7 @@ class FastMCP(Generic[LifespanResultT]):
                     mime_type=mime_type,
                     icons=icons,
                     annotations=annotations,
+                    run_in_thread=run_in_thread,
                 )
             else:
                 # Register as regular resource
@@ -647,6 +807,7 @@ class FastMCP(Generic[LifespanResultT]):
         title: str | None = None,
         description: str | None = None,
         icons: list[Icon] | None = None,
+        run_in_thread: bool = True,
     ) -> Callable[[AnyFunction], AnyFunction]:
         """Decorator to register a prompt.
 
@@ -654,6 +815,8 @@ class FastMCP(Generic[LifespanResultT]):
             name: Optional name for the prompt (defaults to function name)
             title: Optional human-readable title for the prompt
             description: Optional description of what the prompt does
+            run_in_thread: Whether a synchronous prompt function runs in a worker thread
+                instead of on the event loop. Has no effect on async functions.
 
         Example:
             @server.prompt()
@@ -690,7 +853,9 @@ class FastMCP(Generic[LifespanResultT]):
             )
 
         def decorator(func: AnyFunction) -> AnyFunction:
-            prompt = Prompt.from_function(func, name=name, title=title, description=description, icons=icons)
+            prompt = Prompt.from_function(
+                func, name=name, title=title, description=description, icons=icons, run_in_thread=run_in_thread
+            )
             self.add_prompt(prompt)
             return func
 
@@ -826,6 +991,7 @@ class FastMCP(Generic[LifespanResultT]):
         sse = SseServerTransport(
             normalized_message_endpoint,
             security_settings=self.settings.transport_security,
+            compression_min_size=self.settings.compression_min_size,
         )
 
         async def handle_sse(scope: Scope, receive: Receive, send: Send):  # pragma: no cover
@@ -858,7 +1024,7 @@ class FastMCP(Generic[LifespanResultT]):
                     # extract auth info from request (but do not require it)
                     Middleware(
                         AuthenticationMiddleware,
-                        backend=BearerAuthBackend(self._token_verifier),
+                        backend=BearerAuthBackend(self._token_verifier, cache=self._token_cache),
                     ),
                     # Add the auth context middleware to store
                     # authenticated user in a contextvar
@@ -938,8 +1104,14 @@ class FastMCP(Generic[LifespanResultT]):
         # mount these routes last, so they have the lowest route matching precedence
         routes.extend(self._custom_starlette_routes)
 
+        @asynccontextmanager
+        async def lifespan(app: Starlette) -> AsyncGenerator[None]:
+            # Enter the app lifespan once for all SSE connections
+            async with self._mcp_server.app_lifespan_scope():
+                yield
+
         # Create Starlette app with routes and middleware
-        return Starlette(debug=self.settings.debug, routes=routes, middleware=middleware)
+        return Starlette(debug=self.settings.debug, routes=routes, middleware=middleware, lifespan=lifespan)
 
     def streamable_http_app(self) -> Starlette:
         """Return an instance of the StreamableHTTP server app."""
@@ -954,6 +1126,13 @@ class FastMCP(Generic[LifespanResultT]):
                 json_response=self.settings.json_response,
                 stateless=self.settings.stateless_http,  # Use the stateless setting
                 security_settings=self.settings.transport_security,
+                session_idle_timeout=self.settings.session_idle_timeout,
+                max_sessions=self.settings.max_sessions,
+                ping_interval=self.settings.session_ping_interval,
+                stream_buffer_size=self.settings.stream_buffer_size,
+                stream_overflow=self.settings.stream_overflow,
+                stream_backlog_size=self.settings.stream_backlog_size,
+                compression_min_size=self.settings.compression_min_size,
             )
 
         # Create the ASGI handler
@@ -973,7 +1152,7 @@ class FastMCP(Generic[LifespanResultT]):
                 middleware = [
                     Middleware(
                         AuthenticationMiddleware,
-                        backend=BearerAuthBackend(self._token_verifier),
+                        backend=BearerAuthBackend(self._token_verifier, cache=self._token_cache),
                     ),
                     Middleware(AuthContextMiddleware),
                 ]
@@ -1040,24 +1219,7 @@ class FastMCP(Generic[LifespanResultT]):
 
     async def list_prompts(self) -> list[MCPPrompt]:
         """List all available prompts."""
-        prompts = self._prompt_manager.list_prompts()
-        return [
-            MCPPrompt(
-                name=prompt.name,
-                title=prompt.title,
-                description=prompt.description,
-                arguments=[
-                    MCPPromptArgument(
-                        name=arg.name,
-                        description=arg.description,
-                        required=arg.required,
-                    )
-                    for arg in (prompt.arguments or [])
-                ],
-                icons=prompt.icons,
-            )
-            for prompt in prompts
-        ]
+        return [_prompt_definition(prompt) for prompt in self._prompt_manager.list_prompts()]
 
     async def get_prompt(self, name: str, arguments: dict[str, Any] | None = None) -> GetPromptResult:
         """Get a prompt by name with arguments."""
@@ -1077,6 +1239,51 @@ class FastMCP(Generic[LifespanResultT]):
             raise ValueError(str(e))
 
 
+def _request_cursor(request: PaginatedRequest[Any]) -> str | None:
+    return request.params.cursor if request.params is not None else None
+
+
+def _resource_definition(resource: Resource) -> MCPResource:
+    return MCPResource(
+        uri=resource.uri,
+        name=resource.name or "",
+        title=resource.title,
+        description=resource.description,
+        mimeType=resource.mime_type,
+        icons=resource.icons,
+        annotations=resource.annotations,
+    )
+
+
+def _template_definition(template: ResourceTemplate) -> MCPResourceTemplate:
+    return MCPResourceTemplate(
+        uriTemplate=template.uri_template,
+        name=template.name,
+        title=template.title,
+        description=template.description,
+        mimeType=template.mime_type,
+        icons=template.icons,
+        annotations=template.annotations,
+    )
+
+
+def _prompt_definition(prompt: Prompt) -> MCPPrompt:
+    return MCPPrompt(
+        name=prompt.name,
+        title=prompt.title,
+        description=prompt.description,
+        arguments=[
+            MCPPromptArgument(
+                name=arg.name,
+                description=arg.description,
+                required=arg.required,
+            )
+            for arg in (prompt.arguments or [])
+        ],
+        icons=prompt.icons,
+    )
+
+
 class StreamableHTTPASGIApp:
     """
     ASGI application for Streamable HTTP server transport.
@@ -1,7 +1,5 @@
 from __future__ import annotations as _annotations
 
-import functools
-import inspect
 from collections.abc import Callable
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
@@ -10,9 +8,11 @@ from pydantic import BaseModel, Field
 
 from mcp.server.fastmcp.exceptions import ToolError
 from mcp.server.fastmcp.utilities.context_injection import find_context_parameter
+from mcp.server.fastmcp.utilities.execution import Executor, ProcessExecutor, ThreadLimiter, is_async_callable
 from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata, func_metadata
 from mcp.shared.tool_name_validation import validate_and_warn_tool_name
 from mcp.types import Icon, ToolAnnotations
+from mcp.types import Tool as MCPTool
 
 if TYPE_CHECKING:
     from mcp.server.fastmcp.server import Context
@@ -32,6 +32,11 @@ class Tool(BaseModel):
         description="Metadata about the function including a pydantic model for tool arguments"
     )
     is_async: bool = Field(description="Whether the tool is async")
+    run_in_thread: bool = Field(
+        default=True, description="Whether a synchronous tool runs in a worker thread instead of on the event loop"
+    )
+    executor: Executor = Field(default="thread", description="Where a synchronous tool runs: thread or process")
+    timeout: float | None = Field(default=None, description="Seconds after which a process-executed call is killed")
     context_kwarg: str | None = Field(None, description="Name of the kwarg that should receive context")
     annotations: ToolAnnotations | None = Field(None, description="Optional annotations for the tool")
     icons: list[Icon] | None = Field(default=None, description="Optional list of icons for this tool")
@@ -41,6 +46,20 @@ class Tool(BaseModel):
     def output_schema(self) -> dict[str, Any] | None:
         return self.fn_metadata.output_schema
 
+    @cached_property
+    def definition(self) -> MCPTool:
+        """The tool as listed to clients, built once so that every listing reuses it."""
+        return MCPTool(
+            name=self.name,
+            title=self.title,
+            description=self.description,
+            inputSchema=self.parameters,
+            outputSchema=self.output_schema,
+            annotations=self.annotations,
+            icons=self.icons,
+            _meta=self.meta,
+        )
+
     @classmethod
     def from_function(
         cls,
@@ -53,6 +72,9 @@ class Tool(BaseModel):
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        run_in_thread: bool = True,
+        executor: Executor = "thread",
+        timeout: float | None = None,
     ) -> Tool:
         """Create a Tool from a function."""
         func_name = name or fn.__name__
@@ -63,11 +85,19 @@ class Tool(BaseModel):
             raise ValueError("You must provide a name for lambda functions")
 
         func_doc = description or fn.__doc__ or ""
-        is_async = _is_async_callable(fn)
+        is_async = is_async_callable(fn)
 
         if context_kwarg is None:  # pragma: no branch
             context_kwarg = find_context_parameter(fn)
 
+        if executor == "process":
+            if is_async:
+                raise ValueError(f"Tool {func_name} is async and cannot run in a process executor")
+            if context_kwarg is not None:
+                raise ValueError(f"Tool {func_name} takes a Context, which cannot be sent to a worker process")
+        elif timeout is not None:
+            raise ValueError("A timeout is only supported for tools with executor='process'")
+
         func_arg_metadata = func_metadata(
             fn,
             skip_names=[context_kwarg] if context_kwarg is not None else [],
@@ -83,6 +113,9 @@ class Tool(BaseModel):
             parameters=parameters,
             fn_metadata=func_arg_metadata,
             is_async=is_async,
+            run_in_thread=run_in_thread,
+            executor=executor,
+            timeout=timeout,
             context_kwarg=context_kwarg,
             annotations=annotations,
             icons=icons,
@@ -94,14 +127,26 @@ class Tool(BaseModel):
         arguments: dict[str, Any],
         context: Context[ServerSessionT, LifespanContextT, RequestT] | None = None,
         convert_result: bool = False,
+        thread_limiter: ThreadLimiter | None = None,
+        process_executor: ProcessExecutor | None = None,
     ) -> Any:
-        """Run the tool with arguments."""
+        """Run the tool with arguments.
+
+        Tools with `executor="process"` need a `process_executor` to run in.
+        """
         try:
+            if self.executor == "process" and process_executor is None:
+                raise RuntimeError("no process executor is available")
+
             result = await self.fn_metadata.call_fn_with_arg_validation(
                 self.fn,
                 self.is_async,
                 arguments,
                 {self.context_kwarg: context} if self.context_kwarg is not None else None,
+                run_in_thread=self.run_in_thread,
+                thread_limiter=thread_limiter,
+                process_executor=process_executor if self.executor == "process" else None,
+                timeout=self.timeout,
             )
 
             if convert_result:
@@ -110,12 +155,3 @@ class Tool(BaseModel):
             return result
         except Exception as e:
             raise ToolError(f"Error executing tool {self.name}: {e}") from e
-
-
-def _is_async_callable(obj: Any) -> bool:
-    while isinstance(obj, functools.partial):  # pragma: no cover
-        obj = obj.func
-
-    return inspect.iscoroutinefunction(obj) or (
-        callable(obj) and inspect.iscoroutinefunction(getattr(obj, "__call__", None))
-    )
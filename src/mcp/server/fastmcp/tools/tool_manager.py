@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any
 
 from mcp.server.fastmcp.exceptions import ToolError
 from mcp.server.fastmcp.tools.base import Tool
+from mcp.server.fastmcp.utilities.execution import Executor, ProcessExecutor, ThreadLimiter
 from mcp.server.fastmcp.utilities.logging import get_logger
 from mcp.shared.context import LifespanContextT, RequestT
 from mcp.types import Icon, ToolAnnotations
@@ -24,8 +25,12 @@ class ToolManager:
         warn_on_duplicate_tools: bool = True,
         *,
         tools: list[Tool] | None = None,
+        thread_limiter: ThreadLimiter | None = None,
+        process_executor: ProcessExecutor | None = None,
     ):
         self._tools: dict[str, Tool] = {}
+        # Incremented whenever a tool is added or removed
+        self.version = 0
         if tools is not None:
             for tool in tools:
                 if warn_on_duplicate_tools and tool.name in self._tools:
@@ -33,6 +38,8 @@ class ToolManager:
                 self._tools[tool.name] = tool
 
         self.warn_on_duplicate_tools = warn_on_duplicate_tools
+        self.thread_limiter = thread_limiter
+        self.process_executor = process_executor
 
     def get_tool(self, name: str) -> Tool | None:
         """Get tool by name."""
@@ -52,6 +59,9 @@ class ToolManager:
         icons: list[Icon] | None = None,
         meta: dict[str, Any] | None = None,
         structured_output: bool | None = None,
+        run_in_thread: bool = True,
+        executor: Executor = "thread",
+        timeout: float | None = None,
     ) -> Tool:
         """Add a tool to the server."""
         tool = Tool.from_function(
@@ -63,6 +73,9 @@ class ToolManager:
             icons=icons,
             meta=meta,
             structured_output=structured_output,
+            run_in_thread=run_in_thread,
+            executor=executor,
+            timeout=timeout,
         )
         existing = self._tools.get(tool.name)
         if existing:
@@ -70,6 +83,7 @@ class ToolManager:
                 logger.warning(f"Tool already exists: {tool.name}")
             return existing
         self._tools[tool.name] = tool
+        self.version += 1
         return tool
 
     def remove_tool(self, name: str) -> None:
@@ -77,6 +91,7 @@ class ToolManager:
         if name not in self._tools:
             raise ToolError(f"Unknown tool: {name}")
         del self._tools[name]
+        self.version += 1
 
     async def call_tool(
         self,
@@ -90,4 +105,10 @@ class ToolManager:
         if not tool:
             raise ToolError(f"Unknown tool: {name}")
 
-        return await tool.run(arguments, context=context, convert_result=convert_result)
+        return await tool.run(
+            arguments,
+            context=context,
+            convert_result=convert_result,
+            thread_limiter=self.thread_limiter,
+            process_executor=self.process_executor,
+        )
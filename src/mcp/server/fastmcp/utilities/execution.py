@@ -0,0 +1,295 @@
+"""Running synchronous FastMCP handlers without blocking the event loop."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import multiprocessing
+import os
+import threading
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from typing import Any, Literal, cast
+
+import anyio
+import anyio.to_thread
+from anyio import CapacityLimiter
+from anyio.lowlevel import RunVar
+
+Executor = Literal["thread", "process"]
+"""Where a synchronous tool runs: in a worker thread (the default) or in a worker process."""
+
+DEFAULT_MAX_SYNC_THREADS = 40
+"""Default number of worker threads a server uses for synchronous handlers (anyio's own default)."""
+
+
+class ThreadLimiter:
+    """Caps how many synchronous handlers of one server run in worker threads at once.
+
+    anyio limiters belong to the event loop they are first used in, so the underlying
+    `CapacityLimiter` is created lazily for each running event loop.
+    """
+
+    def __init__(self, total_tokens: int = DEFAULT_MAX_SYNC_THREADS):
+        if total_tokens < 1:
+            raise ValueError("total_tokens must be at least 1")
+        self.total_tokens = total_tokens
+        self._limiter: RunVar[CapacityLimiter] = RunVar(f"fastmcp_thread_limiter_{id(self)}")
+
+    @property
+    def limiter(self) -> CapacityLimiter:
+        """The limiter for the current event loop. Must be accessed from async code."""
+        try:
+            return self._limiter.get()
+        except LookupError:
+            limiter = CapacityLimiter(self.total_tokens)
+            self._limiter.set(limiter)
+            return limiter
+
+
+class _Worker:
+    """A worker process that runs one call at a time, sent over a pipe.
+
+    Replies are received in a thread, which may be abandoned when the call is
+    cancelled. Once the worker is killed, that thread's pending `recv()` fails, and
+    the thread closes the pipe itself, so the pipe is never closed under it.
+    """
+
+    def __init__(self, mp_context: BaseContext, generation: int = 0):
+        self.generation = generation
+        self._lock = threading.Lock()
+        self._receiving = False
+        self._killed = False
+        self.conn, child_conn = mp_context.Pipe()
+        self.process = cast(
+            BaseProcess,
+            mp_context.Process(target=_worker_main, args=(child_conn,), daemon=True),  # type: ignore[attr-defined]
+        )
+        self.process.start()
+        child_conn.close()
+
+    @classmethod
+    async def start(cls, mp_context: BaseContext, limiter: CapacityLimiter, generation: int = 0) -> _Worker:
+        """Start a worker and wait until it is ready, so startup never counts against a call's timeout."""
+        worker = cls(mp_context, generation)
+        try:
+            await worker.receive(limiter)
+        except BaseException:
+            await worker.stop()
+            raise
+        return worker
+
+    async def receive(self, limiter: CapacityLimiter) -> Any:
+        try:
+            # Abandoning the thread on cancellation is safe: killing the worker makes the
+            # pending recv() fail, and the thread exit.
+            return await anyio.to_thread.run_sync(self._recv, abandon_on_cancel=True, limiter=limiter)
+        except (EOFError, OSError):
+            await self.wait()
+            raise RuntimeError(f"Worker process exited unexpectedly (exit code {self.process.exitcode})") from None
+
+    def _recv(self) -> Any:
+        with self._lock:
+            if self._killed:
+                raise EOFError
+            self._receiving = True
+        try:
+            return self.conn.recv()
+        finally:
+            with self._lock:
+                self._receiving = False
+                if self._killed:
+                    self.conn.close()
+
+    async def call(self, fn: Callable[..., Any], kwargs: dict[str, Any], limiter: CapacityLimiter) -> tuple[bool, Any]:
+        self.conn.send((fn, kwargs))
+        return await self.receive(limiter)
+
+    def kill(self) -> None:
+        """Kill the process without waiting for it to exit, and close the pipe unless a thread is receiving."""
+        self.process.kill()
+        with self._lock:
+            self._killed = True
+            if not self._receiving:
+                self.conn.close()
+
+    async def wait(self) -> None:
+        """Wait, without blocking the event loop, up to a second for the process to exit, and reap it."""
+        with anyio.CancelScope(shield=True), anyio.move_on_after(1):
+            while self.process.is_alive():
+                await anyio.sleep(0.01)
+
+    async def stop(self) -> None:
+        """Kill the process and wait for it to exit."""
+        self.kill()
+        await self.wait()
+
+
+def _worker_main(conn: Connection) -> None:
+    conn.send(None)  # ready
+    while True:
+        try:
+            fn, kwargs = conn.recv()
+        except (EOFError, OSError):
+            return
+
+        try:
+            reply: tuple[bool, Any] = (True, fn(**kwargs))
+        except Exception as e:
+            reply = (False, e)
+
+        try:
+            conn.send(reply)
+        except Exception as e:
+            # The result or exception could not be pickled
+            conn.send((False, RuntimeError(f"Could not send result from worker process: {e!r}")))
+
+
+class ProcessExecutor:
+    """Runs synchronous functions in a pool of reusable worker processes.
+
+    Used for CPU-bound tools, which threads cannot speed up because of the GIL.
+    Workers are started on demand, up to `max_workers`, and kept for later calls;
+    within `pool()` they can be started up front and are killed when it exits.
+    A worker whose call times out or is cancelled is killed and replaced on the
+    next call, so a stuck function never holds a pool slot.
+
+    Each busy worker is waited on from a thread, taken from a limiter of its own
+    with `max_workers` threads, so that calls are not capped by, and do not use up,
+    anyio's default worker threads.
+
+    Functions and their arguments are pickled, so tools run this way must be
+    importable module-level functions taking picklable arguments.
+
+    Args:
+        max_workers: Maximum number of worker processes, defaulting to the number of CPUs.
+        mp_context: Multiprocessing context used to start workers, defaulting to "spawn",
+            which is safe to use from a process that is already running threads.
+    """
+
+    def __init__(self, max_workers: int | None = None, mp_context: BaseContext | None = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._mp_context = mp_context or multiprocessing.get_context("spawn")
+        self._slots = ThreadLimiter(self.max_workers)
+        self._receivers = ThreadLimiter(self.max_workers)
+        self._idle: list[_Worker] = []
+        # Workers of an earlier generation are killed instead of reused
+        self._generation = 0
+        # Number of `pool()` blocks currently entered
+        self._pools = 0
+        self._closed = False
+
+    async def run(self, fn: Callable[..., Any], kwargs: dict[str, Any], *, timeout: float | None = None) -> Any:
+        """Call `fn(**kwargs)` in a worker process and return its result.
+
+        Exceptions raised by the function are re-raised here.
+
+        Raises:
+            TimeoutError: If the call does not finish within `timeout` seconds.
+            RuntimeError: If the executor is shut down or the worker process dies.
+        """
+        if self._closed:
+            raise RuntimeError("ProcessExecutor has been shut down")
+
+        async with self._slots.limiter:
+            limiter = self._receivers.limiter
+            worker = self._idle.pop() if self._idle else await self._start_worker(limiter)
+            reusable = False
+            try:
+                with anyio.fail_after(timeout):
+                    ok, value = await worker.call(fn, kwargs, limiter)
+                reusable = True
+            except TimeoutError:
+                raise TimeoutError(f"Call did not finish within {timeout} seconds") from None
+            finally:
+                if reusable and not self._closed and worker.generation == self._generation:
+                    self._idle.append(worker)
+                else:
+                    await worker.stop()
+
+        if not ok:
+            raise value
+        return value
+
+    @asynccontextmanager
+    async def pool(self, prewarm: int = 0) -> AsyncGenerator[None]:
+        """
+        Keep worker processes for the duration of the block.
+
+        Up to `prewarm` workers are started on entry, side by side, so that the first
+        calls do not wait for a worker to start. Blocks may overlap; when the last one
+        exits, every worker is killed, busy ones when their call returns, and calls
+        after that start new workers on demand.
+        """
+        if self._closed:
+            raise RuntimeError("ProcessExecutor has been shut down")
+        self._pools += 1
+        try:
+            count = min(prewarm, self.max_workers) - len(self._idle)
+            if count > 0:
+                limiter = self._receivers.limiter
+
+                async def start() -> None:
+                    self._idle.append(await self._start_worker(limiter))
+
+                async with anyio.create_task_group() as tg:
+                    for _ in range(count):
+                        tg.start_soon(start)
+            yield
+        finally:
+            self._pools -= 1
+            if self._pools == 0:
+                self._generation += 1
+                workers = self._kill_idle()
+                for worker in workers:
+                    await worker.wait()
+
+    def shutdown(self) -> None:
+        """
+        Kill the idle workers and reject further calls. Busy workers are killed when their call returns.
+
+        This does not wait for the killed processes to exit; multiprocessing reaps them later.
+        """
+        self._closed = True
+        self._kill_idle()
+
+    async def _start_worker(self, limiter: CapacityLimiter) -> _Worker:
+        return await _Worker.start(self._mp_context, limiter, self._generation)
+
+    def _kill_idle(self) -> list[_Worker]:
+        workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.kill()
+        return workers
+
+
+async def call_sync(
+    fn: Callable[..., Any],
+    kwargs: dict[str, Any],
+    *,
+    run_in_thread: bool,
+    thread_limiter: ThreadLimiter | None = None,
+) -> Any:
+    """Call a synchronous function, in a worker thread if `run_in_thread` is set.
+
+    The thread inherits the caller's context variables, so request-scoped state is
+    still visible. Without a `thread_limiter`, anyio's default limiter applies.
+    """
+    if not run_in_thread:
+        return fn(**kwargs)
+
+    limiter = thread_limiter.limiter if thread_limiter is not None else None
+    return await anyio.to_thread.run_sync(functools.partial(fn, **kwargs), limiter=limiter)
+
+
+def is_async_callable(obj: Any) -> bool:
+    """Return whether calling `obj` produces an awaitable, looking through `functools.partial`."""
+    while isinstance(obj, functools.partial):  # pragma: no cover
+        obj = obj.func
+
+    return inspect.iscoroutinefunction(obj) or (
+        callable(obj) and inspect.iscoroutinefunction(getattr(obj, "__call__", None))
+    )
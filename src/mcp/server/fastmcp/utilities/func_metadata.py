@@ -26,6 +26,7 @@ from typing_inspection.introspection import (
 )
 
 from mcp.server.fastmcp.exceptions import InvalidSignature
+from mcp.server.fastmcp.utilities.execution import ProcessExecutor, ThreadLimiter, call_sync
 from mcp.server.fastmcp.utilities.logging import get_logger
 from mcp.server.fastmcp.utilities.types import Audio, Image
 from mcp.types import CallToolResult, ContentBlock, TextContent
@@ -77,11 +78,19 @@ class FuncMetadata(BaseModel):
         fn_is_async: bool,
         arguments_to_validate: dict[str, Any],
         arguments_to_pass_directly: dict[str, Any] | None,
+        *,
+        run_in_thread: bool = False,
+        thread_limiter: ThreadLimiter | None = None,
+        process_executor: ProcessExecutor | None = None,
+        timeout: float | None = None,
     ) -> Any:
         """Call the given function with arguments validated and injected.
 
         Arguments are first attempted to be parsed from JSON, then validated against
-        the argument model, before being passed to the function.
+        the argument model, before being passed to the function. A synchronous
+        function runs in `process_executor` when one is given (with an optional
+        `timeout`), otherwise in a worker thread when `run_in_thread` is set,
+        bounded by `thread_limiter`.
         """
         arguments_pre_parsed = self.pre_parse_json(arguments_to_validate)
         arguments_parsed_model = self.arg_model.model_validate(arguments_pre_parsed)
@@ -91,8 +100,12 @@ class FuncMetadata(BaseModel):
 
         if fn_is_async:
             return await fn(**arguments_parsed_dict)
+        elif process_executor is not None:
+            return await process_executor.run(fn, arguments_parsed_dict, timeout=timeout)
         else:
-            return fn(**arguments_parsed_dict)
+            return await call_sync(
+                fn, arguments_parsed_dict, run_in_thread=run_in_thread, thread_limiter=thread_limiter
+            )
 
     def convert_result(self, result: Any) -> Any:
         """
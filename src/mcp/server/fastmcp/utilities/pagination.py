@@ -0,0 +1,97 @@
+"""Cursor pagination over FastMCP's tools, resources, resource templates and prompts."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import bisect
+import json
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+from mcp.shared.exceptions import McpError
+from mcp.types import INVALID_PARAMS, ErrorData
+
+T = TypeVar("T")
+
+DEFAULT_MAX_SNAPSHOTS = 8
+"""Default number of catalog versions a paginator keeps snapshots of, for clients paging through them."""
+
+
+class _Snapshot(Generic[T]):
+    def __init__(self, snapshot_id: int, items: list[T], key: Callable[[T], str]):
+        self.id = snapshot_id
+        self.items = sorted(items, key=key)
+        self.keys = [key(item) for item in self.items]
+
+
+class Paginator(Generic[T]):
+    """Splits a catalog into pages, ordered by key, with opaque cursors.
+
+    Each version of the catalog is paged from a snapshot sorted by key, so that a
+    client paging through it sees every item exactly once even if the catalog changes
+    in the meantime. Cursors name the snapshot and the last key of the page; a cursor
+    whose snapshot is gone resumes after that key in the current catalog instead.
+    """
+
+    def __init__(
+        self,
+        page_size: int,
+        key: Callable[[T], str],
+        max_snapshots: int = DEFAULT_MAX_SNAPSHOTS,
+    ):
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        self.page_size = page_size
+        self._key = key
+        self._max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[int, _Snapshot[T]] = OrderedDict()
+        self._current: tuple[Hashable, _Snapshot[T]] | None = None
+        self._next_id = 0
+
+    def page(self, version: Hashable, items: Callable[[], list[T]], cursor: str | None) -> tuple[list[T], str | None]:
+        """Return the page of items after `cursor`, and the cursor of the next page (None on the last).
+
+        `items` returns the whole catalog, and is only called when `version` is new.
+
+        Raises:
+            McpError: If the cursor is not one this paginator issued.
+        """
+        snapshot = self._snapshot(version, items)
+        start = 0
+        if cursor is not None:
+            snapshot_id, last_key = _decode_cursor(cursor)
+            snapshot = self._snapshots.get(snapshot_id, snapshot)
+            start = bisect.bisect_right(snapshot.keys, last_key)
+
+        end = start + self.page_size
+        page = snapshot.items[start:end]
+        next_cursor = _encode_cursor(snapshot.id, snapshot.keys[end - 1]) if end < len(snapshot.items) else None
+        return page, next_cursor
+
+    def _snapshot(self, version: Hashable, items: Callable[[], list[T]]) -> _Snapshot[T]:
+        if self._current is not None and self._current[0] == version:
+            return self._current[1]
+
+        snapshot = _Snapshot(self._next_id, items(), self._key)
+        self._next_id += 1
+        self._current = (version, snapshot)
+        self._snapshots[snapshot.id] = snapshot
+        while len(self._snapshots) > self._max_snapshots:
+            self._snapshots.popitem(last=False)
+        return snapshot
+
+
+def _encode_cursor(snapshot_id: int, last_key: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([snapshot_id, last_key]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[int, str]:
+    try:
+        snapshot_id, last_key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeError, ValueError, TypeError):
+        raise McpError(ErrorData(code=INVALID_PARAMS, message="Invalid cursor")) from None
+    if not isinstance(snapshot_id, int) or not isinstance(last_key, str):
+        raise McpError(ErrorData(code=INVALID_PARAMS, message="Invalid cursor"))
+    return snapshot_id, last_key
@@ -69,11 +69,12 @@ from __future__ import annotations as _annotations
 
 import base64
 import contextvars
-import copy
+import functools
 import json
 import logging
+import math
 import warnings
-from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Hashable, Iterable
 from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
 from typing import Any, Generic, TypeAlias, cast
 
@@ -88,11 +89,15 @@ from mcp.server.experimental.request_context import Experimental
 from mcp.server.lowlevel.experimental import ExperimentalHandlers
 from mcp.server.lowlevel.func_inspection import create_call_wrapper
 from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.server.lowlevel.tool_registry import ToolRegistry, same_definition
 from mcp.server.models import InitializationOptions
-from mcp.server.session import ServerSession
+from mcp.server.response_cache import ResponseCache
+from mcp.server.session import ServerRequestResponder, ServerSession
+from mcp.shared.codec import EncodedResult
 from mcp.shared.context import RequestContext
 from mcp.shared.exceptions import AuthError, McpError
 from mcp.shared.message import ServerMessageMetadata, SessionMessage
+from mcp.shared.schema_validation import ToolSchemaValidators
 from mcp.shared.session import RequestResponder
 from mcp.shared.tool_name_validation import validate_and_warn_tool_name
 
@@ -106,20 +111,36 @@ StructuredContent: TypeAlias = dict[str, Any]
 UnstructuredContent: TypeAlias = Iterable[types.ContentBlock]
 CombinationContent: TypeAlias = tuple[UnstructuredContent, StructuredContent]
 
+# List requests whose results `Server.response_cache` can serve
+_CACHEABLE_REQUESTS = (
+    types.ListToolsRequest,
+    types.ListResourcesRequest,
+    types.ListResourceTemplatesRequest,
+    types.ListPromptsRequest,
+)
+
 # This will be properly typed in each Server instance's context
 request_ctx: contextvars.ContextVar[RequestContext[ServerSession, Any, Any]] = contextvars.ContextVar("request_ctx")
 
 
+@functools.cache
+def _package_version(package: str) -> str:
+    # Reading package metadata scans sys.path, so it is done once per process
+    try:
+        from importlib.metadata import version
+
+        return version(package)
+    except Exception:  # pragma: no cover
+        pass
+
+    return "unknown"  # pragma: no cover
+
+
 def filter_tool_definition_for_external_mcp(tool_def: types.Tool) -> types.Tool:
     """Remove custom guMCP extensions from tool definition for external MCP compatibility"""
-    filtered_tool = copy.deepcopy(tool_def)
     custom_fields = ["outputSchema", "requiredScopes", "creditCost"]
-
-    for field in custom_fields:
-        if hasattr(filtered_tool, field):
-            setattr(filtered_tool, field, None)
-
-    return filtered_tool
+    # A shallow copy: the fields are replaced, never modified, so nothing else needs copying
+    return tool_def.model_copy(update={field: None for field in custom_fields if hasattr(tool_def, field)})
 
 
 def filter_deprecated_properties_from_tool(tool_def: types.Tool) -> types.Tool:
@@ -132,12 +153,11 @@ def filter_deprecated_properties_from_tool(tool_def: types.Tool) -> types.Tool:
     if not deprecated_props:
         return tool_def
 
-    filtered_tool = copy.deepcopy(tool_def)
-    filtered_tool.inputSchema["properties"] = {
-        name: prop for name, prop in properties.items() if name not in deprecated_props
+    input_schema = {
+        **tool_def.inputSchema,
+        "properties": {name: prop for name, prop in properties.items() if name not in deprecated_props},
     }
-
-    return filtered_tool
+    return tool_def.model_copy(update={"inputSchema": input_schema})
 
 
 def filter_response_content_for_external_mcp(content_list: list[types.ContentBlock]) -> list[types.ContentBlock]:
@@ -155,6 +175,56 @@ def filter_response_content_for_external_mcp(content_list: list[types.ContentBlo
     return filtered_content
 
 
+class _ListedTool:
+    """A tool returned by the list_tools handler, with the definitions sent to clients built once."""
+
+    def __init__(self, tool: types.Tool):
+        self.tool = tool
+        self.deprecated = bool(getattr(tool, "is_deprecated", False))
+        self.listed = filter_deprecated_properties_from_tool(tool)
+        self._external: types.Tool | None = None
+
+    @property
+    def external(self) -> types.Tool:
+        """The listed definition without guMCP extensions, for external clients."""
+        if self._external is None:
+            self._external = filter_tool_definition_for_external_mcp(self.listed)
+        return self._external
+
+
+class _AppLifespan:
+    """An entered application lifespan, with the number of scopes and sessions using it."""
+
+    def __init__(self, context: Any):
+        self.context = context
+        self.users = 1
+        self.released = anyio.Event()
+        self.closed = anyio.Event()
+
+
+class _DispatchSession(ServerSession):
+    """A stateless session for one message, whose incoming messages `Server.dispatch` handles itself."""
+
+    def __init__(
+        self,
+        read_stream: MemoryObjectReceiveStream[SessionMessage | Exception],
+        write_stream: MemoryObjectSendStream[SessionMessage],
+        init_options: InitializationOptions,
+    ) -> None:
+        super().__init__(read_stream, write_stream, init_options, stateless=True)
+        self.incoming: list[ServerRequestResponder] = []
+
+    async def receive(self, message: SessionMessage) -> None:
+        await self._receive_message(message)
+
+    async def _handle_incoming(self, req: ServerRequestResponder) -> None:
+        self.incoming.append(req)
+
+    def close(self) -> None:
+        self._incoming_message_stream_writer.close()
+        self._incoming_message_stream_reader.close()
+
+
 class NotificationOptions:
     def __init__(
         self,
@@ -192,6 +262,7 @@ class Server(Generic[LifespanResultT, RequestT]):
             [Server[LifespanResultT, RequestT]],
             AbstractAsyncContextManager[LifespanResultT],
         ] = lifespan,
+        app_lifespan: Callable[[Server[LifespanResultT, RequestT]], AbstractAsyncContextManager[Any]] | None = None,
     ):
         self.name = name
         self.version = version
@@ -199,12 +270,26 @@ class Server(Generic[LifespanResultT, RequestT]):
         self.website_url = website_url
         self.icons = icons
         self.lifespan = lifespan
+        self.app_lifespan = app_lifespan
+        # The app lifespan entered by the outermost active scope, if any, and the
+        # event set once the last one entered has been exited
+        self._app_lifespan_active: _AppLifespan | None = None
+        self._app_lifespan_closed: anyio.Event | None = None
+        self._app_lifespan_lock = anyio.Lock()
         self.config: dict[str, Any] | None = None
         self.request_handlers: dict[type, Callable[..., Awaitable[types.ServerResult]]] = {
             types.PingRequest: _ping_handler,
         }
         self.notification_handlers: dict[type, Callable[..., Awaitable[None]]] = {}
-        self._tool_cache: dict[str, types.Tool] = {}
+        # The ORIGINAL tools, for server-side validation of tool calls
+        self.tool_registry = ToolRegistry()
+        self._listed_tools: dict[str, _ListedTool] = {}
+        self._tool_refresh: anyio.Event | None = None
+        # Set to cache the encoded results of list requests across sessions; whoever sets it
+        # must version it, or invalidate it, whenever the list handlers' results change.
+        self.response_cache: ResponseCache | None = None
+        self._input_validators = ToolSchemaValidators()
+        self._output_validators = ToolSchemaValidators()
         self._experimental_handlers: ExperimentalHandlers | None = None
         logger.debug("Initializing server %r", name)
 
@@ -214,20 +299,9 @@ class Server(Generic[LifespanResultT, RequestT]):
         experimental_capabilities: dict[str, dict[str, Any]] | None = None,
     ) -> InitializationOptions:
         """Create initialization options from this server instance."""
-
-        def pkg_version(package: str) -> str:
-            try:
-                from importlib.metadata import version
-
-                return version(package)
-            except Exception:  # pragma: no cover
-                pass
-
-            return "unknown"  # pragma: no cover
-
         return InitializationOptions(
             server_name=self.name,
-            server_version=self.version if self.version else pkg_version("gumloop-mcp"),
+            server_version=self.version if self.version else _package_version("gumloop-mcp"),
             capabilities=self.get_capabilities(
                 notification_options or NotificationOptions(),
                 experimental_capabilities or {},
@@ -283,6 +357,75 @@ class Server(Generic[LifespanResultT, RequestT]):
             self._experimental_handlers.update_capabilities(capabilities)
         return capabilities
 
+    @asynccontextmanager
+    async def app_lifespan_scope(self) -> AsyncGenerator[Any]:
+        """
+        Enter the application lifespan, yielding its result.
+
+        Unlike `lifespan`, which is entered for every session, the application lifespan
+        is meant to hold state shared by all sessions, such as connection pools.
+        Transports that serve many sessions enter it once around all of them, and every
+        `run` inside the scope reuses its result, available to handlers as
+        `request_context.app_lifespan_context`. A `run` outside any scope enters an
+        application lifespan of its own, for that session only.
+
+        Entering the scope while it is already active reuses the active one. The scope
+        that entered the lifespan exits it once every scope and `run` using it has
+        left, since the lifespan must be exited by the task that entered it. Another
+        lifespan is only entered after that one has been exited.
+        """
+        if self.app_lifespan is None:
+            yield None
+            return
+
+        stack: AsyncExitStack | None = None
+        async with self._app_lifespan_lock:
+            active = self._app_lifespan_active
+            if active is None:
+                if self._app_lifespan_closed is not None:
+                    await self._app_lifespan_closed.wait()
+                stack = AsyncExitStack()
+                active = _AppLifespan(await stack.enter_async_context(self.app_lifespan(self)))
+                self._app_lifespan_active = active
+                self._app_lifespan_closed = active.closed
+            else:
+                active.users += 1
+        try:
+            yield active.context
+        finally:
+            self._leave_app_lifespan(active)
+            if stack is not None:
+                with anyio.CancelScope(shield=True):
+                    await active.released.wait()
+                    try:
+                        await stack.aclose()
+                    finally:
+                        active.closed.set()
+
+    @asynccontextmanager
+    async def _session_app_lifespan(self) -> AsyncGenerator[Any]:
+        """Use the active application lifespan for one session, or enter one for it alone."""
+        active = self._app_lifespan_active
+        if self.app_lifespan is None:
+            yield None
+        elif active is None:
+            async with self.app_lifespan(self) as context:
+                yield context
+        else:
+            active.users += 1
+            try:
+                yield active.context
+            finally:
+                self._leave_app_lifespan(active)
+
+    def _leave_app_lifespan(self, active: _AppLifespan) -> None:
+        active.users -= 1
+        if active.users == 0:
+            # Later scopes enter a new lifespan, after this one has been exited
+            if self._app_lifespan_active is active:
+                self._app_lifespan_active = None
+            active.released.set()
+
     @property
     def request_context(
         self,
@@ -364,12 +507,22 @@ class Server(Generic[LifespanResultT, RequestT]):
         return decorator
 
     def list_resource_templates(self):
-        def decorator(func: Callable[[], Awaitable[list[types.ResourceTemplate]]]):
+        def decorator(
+            func: Callable[[], Awaitable[list[types.ResourceTemplate]]]
+            | Callable[[types.ListResourceTemplatesRequest], Awaitable[types.ListResourceTemplatesResult]],
+        ):
             logger.debug("Registering handler for ListResourceTemplatesRequest")
 
-            async def handler(_: Any):
-                templates = await func()
-                return types.ServerResult(types.ListResourceTemplatesResult(resourceTemplates=templates))
+            wrapper = create_call_wrapper(func, types.ListResourceTemplatesRequest)
+
+            async def handler(req: types.ListResourceTemplatesRequest):
+                result = await wrapper(req)
+                # Handle both old style (list[ResourceTemplate]) and new style (ListResourceTemplatesResult)
+                if isinstance(result, types.ListResourceTemplatesResult):
+                    return types.ServerResult(result)
+                else:
+                    # Old style returns list[ResourceTemplate]
+                    return types.ServerResult(types.ListResourceTemplatesResult(resourceTemplates=result))
 
             self.request_handlers[types.ListResourceTemplatesRequest] = handler
             return func
@@ -484,41 +637,63 @@ class Server(Generic[LifespanResultT, RequestT]):
                 result = await wrapper(req)
 
                 # Handle both old style (list[Tool]) and new style (ListToolsResult)
-                if isinstance(result, types.ListToolsResult):  # pragma: no cover
+                next_cursor = None
+                if isinstance(result, types.ListToolsResult):
                     tools = result.tools
+                    next_cursor = result.nextCursor
                 else:
                     # Old style returns list[Tool]
                     tools = list(result)
 
-                # Validate tool names and cache ORIGINAL tools for server-side validation
-                self._tool_cache.clear()
-                for tool in tools:
-                    validate_and_warn_tool_name(tool.name)
-                    self._tool_cache[tool.name] = tool
-
-                # Filter deprecated tools (for response only)
-                tools = [tool for tool in tools if not getattr(tool, "is_deprecated", False)]
-
-                # Filter deprecated properties from all tools
-                tools = [filter_deprecated_properties_from_tool(tool) for tool in tools]
-
-                # Filter restricted tools
-                if self.config is not None:
-                    restricted_tools = self.config.get("restricted_tools", [])
-                    if restricted_tools:
-                        tools = [tool for tool in tools if tool.name not in restricted_tools]
-
-                    # Filter for external clients
-                    if self.config.get("external_client", False):
-                        tools = [filter_tool_definition_for_external_mcp(tool) for tool in tools]
-
-                return types.ServerResult(types.ListToolsResult(tools=tools))
+                # A page of a paginated listing holds only some of the tools
+                complete = next_cursor is None and (req.params is None or req.params.cursor is None)
+                listed_tools = self._update_listed_tools(tools, complete)
+
+                config = self.config or {}
+                restricted_tools = config.get("restricted_tools") or ()
+                external_client = config.get("external_client", False)
+                # Deprecated and restricted tools are left out of the response only
+                tools = [
+                    listed.external if external_client else listed.listed
+                    for listed in listed_tools
+                    if not listed.deprecated and listed.tool.name not in restricted_tools
+                ]
+                return types.ServerResult(types.ListToolsResult(tools=tools, nextCursor=next_cursor))
 
             self.request_handlers[types.ListToolsRequest] = handler
             return func
 
         return decorator
 
+    def _update_listed_tools(self, tools: list[types.Tool], complete: bool = True) -> list[_ListedTool]:
+        """
+        Register the tools returned by the list_tools handler, and return their listed definitions.
+
+        Tools that were already listed, as the same object or with the same content,
+        keep their filtered definitions; only new or changed tools have their names
+        validated and their definitions filtered. Tools missing from an incomplete
+        listing, a page, are kept registered.
+        """
+        if not complete:
+            for tool in tools:
+                self.tool_registry.add(tool)
+        elif self.tool_registry.sync(tools):
+            self._listed_tools = {
+                name: listed for name, listed in self._listed_tools.items() if name in self.tool_registry
+            }
+            self._input_validators.retain(self.tool_registry.names())
+            self._output_validators.retain(self.tool_registry.names())
+
+        listed_tools: list[_ListedTool] = []
+        for tool in tools:
+            listed = self._listed_tools.get(tool.name)
+            # Handlers may build their tools afresh for every listing
+            if listed is None or not same_definition(listed.tool, tool):
+                validate_and_warn_tool_name(tool.name)
+                listed = self._listed_tools[tool.name] = _ListedTool(tool)
+            listed_tools.append(listed)
+        return listed_tools
+
     def _make_error_result(self, error_message: str) -> types.ServerResult:
         """Create a ServerResult with an error CallToolResult."""
         return types.ServerResult(
@@ -529,16 +704,30 @@ class Server(Generic[LifespanResultT, RequestT]):
         )
 
     async def _get_cached_tool_definition(self, tool_name: str) -> types.Tool | None:
-        """Get tool definition from cache, refreshing if necessary.
+        """Get tool definition from the registry, listing the tools again if it might be new.
 
         Returns the Tool object if found, None otherwise.
         """
-        if tool_name not in self._tool_cache:
-            if types.ListToolsRequest in self.request_handlers:
+        tool = self.tool_registry.get(tool_name)
+        if tool is None and types.ListToolsRequest in self.request_handlers:
+            refreshed = True
+            if self._tool_refresh is not None:
+                # Another call is already listing the tools
+                await self._tool_refresh.wait()
+            elif self.tool_registry.should_refresh(tool_name):
                 logger.debug("Tool cache miss for %s, refreshing cache", tool_name)
-                await self.request_handlers[types.ListToolsRequest](None)
+                self._tool_refresh = anyio.Event()
+                try:
+                    await self.request_handlers[types.ListToolsRequest](types.ListToolsRequest(method="tools/list"))
+                finally:
+                    self._tool_refresh.set()
+                    self._tool_refresh = None
+            else:
+                refreshed = False
+            tool = self.tool_registry.get(tool_name)
+            if tool is None and refreshed:
+                self.tool_registry.record_miss(tool_name)
 
-        tool = self._tool_cache.get(tool_name)
         if tool is None:
             logger.warning("Tool '%s' not listed, no validation will be performed", tool_name)
 
@@ -582,7 +771,7 @@ class Server(Generic[LifespanResultT, RequestT]):
                     # input validation
                     if validate_input and tool:
                         try:
-                            jsonschema.validate(instance=arguments, schema=tool.inputSchema)
+                            self._input_validators.validate(tool_name, tool.inputSchema, arguments)
                         except jsonschema.ValidationError as e:
                             return self._make_error_result(f"Input validation error: {e.message}")
 
@@ -616,10 +805,7 @@ class Server(Generic[LifespanResultT, RequestT]):
                     # output validation (only validate if structured content is provided)
                     if tool and tool.outputSchema is not None and maybe_structured_content is not None:
                         try:
-                            jsonschema.validate(
-                                instance=maybe_structured_content,
-                                schema=tool.outputSchema,
-                            )
+                            self._output_validators.validate(tool_name, tool.outputSchema, maybe_structured_content)
                         except jsonschema.ValidationError as e:
                             return self._make_error_result(f"Output validation error: {e.message}")
 
@@ -733,8 +919,12 @@ class Server(Generic[LifespanResultT, RequestT]):
         # the initialization lifecycle, but can do so with any available node
         # rather than requiring initialization for each connection.
         stateless: bool = False,
+        # Called with the ServerSession once it is set up, for callers that need to
+        # talk to the client outside of a request, e.g. to ping it.
+        on_session: Callable[[ServerSession], None] | None = None,
     ):
         async with AsyncExitStack() as stack:
+            app_lifespan_context = await stack.enter_async_context(self._session_app_lifespan())
             lifespan_context = await stack.enter_async_context(self.lifespan(self))
             session = await stack.enter_async_context(
                 ServerSession(
@@ -744,6 +934,8 @@ class Server(Generic[LifespanResultT, RequestT]):
                     stateless=stateless,
                 )
             )
+            if on_session is not None:
+                on_session(session)
 
             # Configure task support for this session if enabled
             task_support = self._experimental_handlers.task_support if self._experimental_handlers else None
@@ -761,20 +953,84 @@ class Server(Generic[LifespanResultT, RequestT]):
                         session,
                         lifespan_context,
                         raise_exceptions,
+                        app_lifespan_context,
                     )
 
+    @property
+    def can_dispatch(self) -> bool:
+        """Whether `dispatch` can handle messages, which it cannot with experimental task support enabled."""
+        return self._experimental_handlers is None or self._experimental_handlers.task_support is None
+
+    async def dispatch(
+        self,
+        message: SessionMessage,
+        initialization_options: InitializationOptions,
+        raise_exceptions: bool = False,
+    ) -> types.JSONRPCMessage | None:
+        """
+        Handle one message from a stateless client, returning the response to a request.
+
+        This does what `run(..., stateless=True)` does for a session that receives just
+        this message, in the calling task: the message gets a session of its own, and
+        the session lifespan is entered for it. No streams are read and no tasks are
+        started, so it costs far less than running a session per message.
+
+        Messages the handler sends to the client, other than the response, are dropped;
+        transports use this where they could not deliver them, e.g. for requests
+        answered with a JSON response. Requests to the client are never answered.
+        """
+        if not self.can_dispatch:
+            raise RuntimeError("Servers with experimental task support cannot dispatch messages")
+
+        # The buffer holds whatever the handler sends until it returns
+        write_stream, write_stream_reader = anyio.create_memory_object_stream[SessionMessage](math.inf)
+        read_stream_writer, read_stream = anyio.create_memory_object_stream[SessionMessage | Exception](0)
+        with write_stream, write_stream_reader, read_stream_writer, read_stream:
+            session = _DispatchSession(read_stream, write_stream, initialization_options)
+            try:
+                async with (
+                    self._session_app_lifespan() as app_lifespan_context,
+                    self.lifespan(self) as lifespan_context,
+                ):
+                    await session.receive(message)
+                    for incoming in session.incoming:
+                        await self._handle_message(
+                            incoming, session, lifespan_context, raise_exceptions, app_lifespan_context
+                        )
+            finally:
+                session.close()
+
+            if not isinstance(message.message.root, types.JSONRPCRequest):
+                return None
+            request_id = message.message.root.id
+            while True:
+                try:
+                    sent = write_stream_reader.receive_nowait().message
+                except anyio.WouldBlock:
+                    return None
+                if isinstance(sent.root, types.JSONRPCResponse | types.JSONRPCError) and sent.root.id == request_id:
+                    return sent
+
     async def _handle_message(
         self,
         message: (RequestResponder[types.ClientRequest, types.ServerResult] | types.ClientNotification | Exception),
         session: ServerSession,
         lifespan_context: LifespanResultT,
         raise_exceptions: bool = False,
+        app_lifespan_context: Any = None,
     ):
         with warnings.catch_warnings(record=True) as w:
             match message:
                 case RequestResponder(request=types.ClientRequest(root=req)) as responder:
                     with responder:
-                        await self._handle_request(message, req, session, lifespan_context, raise_exceptions)
+                        await self._handle_request(
+                            message,
+                            req,
+                            session,
+                            lifespan_context,
+                            raise_exceptions,
+                            app_lifespan_context=app_lifespan_context,
+                        )
                 case types.ClientNotification(root=notify):
                     await self._handle_notification(notify)
                 case Exception():  # pragma: no cover
@@ -797,6 +1053,8 @@ class Server(Generic[LifespanResultT, RequestT]):
         session: ServerSession,
         lifespan_context: LifespanResultT,
         raise_exceptions: bool,
+        *,
+        app_lifespan_context: Any = None,
     ):
         logger.info("Processing request of type %s", type(req).__name__)
 
@@ -839,9 +1097,14 @@ class Server(Generic[LifespanResultT, RequestT]):
                         request=request_data,
                         close_sse_stream=close_sse_stream_cb,
                         close_standalone_sse_stream=close_standalone_sse_stream_cb,
+                        app_lifespan_context=app_lifespan_context,
                     )
                 )
-                response = await handler(req)
+                response: types.ServerResult | EncodedResult | types.ErrorData
+                if self.response_cache is not None and (cache_key := self._response_cache_key(req)) is not None:
+                    response = await self.response_cache.get(cache_key, functools.partial(handler, req))
+                else:
+                    response = await handler(req)
             except McpError as err:  # pragma: no cover
                 response = err.error
             except anyio.get_cancelled_exc_class():
@@ -870,6 +1133,19 @@ class Server(Generic[LifespanResultT, RequestT]):
 
         logger.debug("Response sent")
 
+    def _response_cache_key(self, req: types.ClientRequestType) -> Hashable | None:
+        """Key of a request in `response_cache`, or None if its result is not cached."""
+        if not isinstance(req, _CACHEABLE_REQUESTS):
+            return None
+        # The tool list is filtered by the server's config, so the key includes its filters
+        config = self.config or {}
+        return (
+            type(req),
+            req.params.cursor if req.params is not None else None,
+            tuple(config.get("restricted_tools") or ()),
+            bool(config.get("external_client", False)),
+        )
+
     async def _handle_notification(self, notify: Any):
         if handler := self.notification_handlers.get(type(notify)):  # type: ignore
             logger.debug("Dispatching notification of type %s", type(notify).__name__)
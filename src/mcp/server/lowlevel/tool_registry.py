@@ -0,0 +1,120 @@
+"""
+Registry of the tools a lowlevel server knows, used to validate tool calls.
+
+The registry learns the tools from every `tools/list` the server answers, and can
+also be updated directly, one tool at a time, by servers that know when their tools
+change. Its `version` changes whenever the set of tools does, so that caches derived
+from the tools can tell when they are stale.
+
+Calls to tools the registry does not know make the server list its tools again, in
+case the tool was added since. To keep that from costing a full listing per request,
+names that are still unknown after a listing are remembered until the tools change,
+and refreshes for new unknown names happen at most once per `refresh_interval`.
+"""
+
+import time
+from collections.abc import Iterable
+
+import mcp.types as types
+
+DEFAULT_MAX_MISSES = 1024
+DEFAULT_REFRESH_INTERVAL = 1.0
+
+
+def same_definition(a: types.Tool, b: types.Tool) -> bool:
+    """Whether two tools have the same definition, compared field by field without dumping them."""
+    return a is b or (type(a) is type(b) and a.__dict__ == b.__dict__ and a.__pydantic_extra__ == b.__pydantic_extra__)
+
+
+class ToolRegistry:
+    """
+    Tools by name, with a version that changes whenever they do.
+
+    Args:
+        max_misses: Maximum number of unknown tool names remembered; the oldest is
+            forgotten to make room.
+        refresh_interval: Minimum number of seconds between refreshes caused by
+            calls to unknown tools.
+    """
+
+    def __init__(
+        self,
+        max_misses: int = DEFAULT_MAX_MISSES,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+    ) -> None:
+        self._tools: dict[str, types.Tool] = {}
+        self._misses: dict[str, None] = {}
+        self._max_misses = max_misses
+        self._refresh_interval = refresh_interval
+        self._last_refresh: float | None = None
+        self.version = 0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tools
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def get(self, name: str) -> types.Tool | None:
+        return self._tools.get(name)
+
+    def names(self) -> Iterable[str]:
+        return self._tools.keys()
+
+    def add(self, tool: types.Tool) -> None:
+        """Add a tool, or replace the tool of the same name if its definition differs."""
+        registered = self._tools.get(tool.name)
+        if registered is None or not same_definition(registered, tool):
+            self._tools[tool.name] = tool
+            self._changed()
+
+    def remove(self, name: str) -> None:
+        """Remove a tool, if it is registered."""
+        if self._tools.pop(name, None) is not None:
+            self._changed()
+
+    def sync(self, tools: Iterable[types.Tool]) -> bool:
+        """
+        Make the registry hold exactly `tools`, as returned by a listing.
+
+        Returns whether anything changed. Tools that are registered with the same
+        definition, as the same object or rebuilt by the handler, are kept as they are,
+        so an unchanged listing neither changes `version` nor forgets unknown names.
+        """
+        self._last_refresh = time.monotonic()
+        listed: dict[str, types.Tool] = {}
+        changed = False
+        for tool in tools:
+            registered = self._tools.get(tool.name)
+            if registered is not None and same_definition(registered, tool):
+                listed[tool.name] = registered
+            else:
+                listed[tool.name] = tool
+                changed = True
+        # Without new tools, the set of tools only changed if some were removed
+        if changed or len(listed) != len(self._tools):
+            self._tools = listed
+            self._changed()
+            return True
+        return False
+
+    def should_refresh(self, name: str) -> bool:
+        """
+        Whether a call to the unknown tool `name` should make the server list its tools.
+
+        False for names that were unknown after the last listing, while the tools have
+        not changed, and while a listing happened less than `refresh_interval` ago.
+        """
+        if name in self._misses:
+            return False
+        return self._last_refresh is None or time.monotonic() - self._last_refresh >= self._refresh_interval
+
+    def record_miss(self, name: str) -> None:
+        """Remember that `name` is unknown, until the tools change."""
+        if len(self._misses) >= self._max_misses:
+            del self._misses[next(iter(self._misses))]
+        self._misses[name] = None
+
+    def _changed(self) -> None:
+        self.version += 1
+        self._misses.clear()
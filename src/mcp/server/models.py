@@ -3,10 +3,13 @@ This module provides simpler types to use with the server for managing prompts
 and tools.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
+from mcp.shared.codec import EncodedResult
 from mcp.types import (
     Icon,
+    Implementation,
+    InitializeResult,
     ServerCapabilities,
 )
 
@@ -18,3 +21,26 @@ class InitializationOptions(BaseModel):
     instructions: str | None = None
     website_url: str | None = None
     icons: list[Icon] | None = None
+
+    # Encoded `initialize` results by protocol version, shared by the sessions using these options
+    _initialize_results: dict[str, EncodedResult] = PrivateAttr(default_factory=dict[str, EncodedResult])
+
+    def initialize_result(self, protocol_version: str) -> EncodedResult:
+        """The encoded result of an `initialize` request, built once per protocol version."""
+        result = self._initialize_results.get(protocol_version)
+        if result is None:
+            result = EncodedResult.from_result(
+                InitializeResult(
+                    protocolVersion=protocol_version,
+                    capabilities=self.capabilities,
+                    serverInfo=Implementation(
+                        name=self.server_name,
+                        version=self.server_version,
+                        websiteUrl=self.website_url,
+                        icons=self.icons,
+                    ),
+                    instructions=self.instructions,
+                )
+            )
+            self._initialize_results[protocol_version] = result
+        return result
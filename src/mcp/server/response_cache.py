@@ -0,0 +1,93 @@
+"""
+Cache of encoded results for requests whose answer only changes with the server's catalog.
+
+The results of `tools/list`, `resources/list`, `resources/templates/list` and
+`prompts/list` are the same for every session until a tool, resource or prompt is
+added or removed. A `ResponseCache` keeps them as `EncodedResult`s, already dumped
+and encoded, so repeated list requests skip building the result models and
+serializing them. It is shared by every session of a server.
+
+The cache is tied to a catalog version: a callable whose value changes whenever
+the catalog does. Results built for another version are never served. Without a
+version callable, call `invalidate` after changing the catalog instead.
+"""
+
+from collections.abc import Awaitable, Callable, Hashable
+
+import anyio
+from pydantic import BaseModel
+
+from mcp.shared.codec import EncodedResult
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+class ResponseCache:
+    """
+    Encoded request results, keyed by the request and the catalog version.
+
+    Concurrent requests for the same uncached result are coalesced: the first one
+    builds it, and the others wait for it instead of building it again.
+
+    Args:
+        version: Returns the current catalog version, which must change whenever the
+            cached results would.
+        max_entries: Maximum number of cached results; the oldest is dropped to make room.
+    """
+
+    def __init__(
+        self,
+        version: Callable[[], Hashable] | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._version = version
+        self._max_entries = max_entries
+        self._generation = 0
+        self._results: dict[Hashable, EncodedResult] = {}
+        self._results_version: Hashable = None
+        self._building: dict[tuple[Hashable, Hashable], anyio.Event] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> Hashable:
+        """The version results are currently cached for."""
+        return self._generation, self._version() if self._version is not None else None
+
+    def invalidate(self) -> None:
+        """Drop every cached result, for catalogs that have no version callable."""
+        self._generation += 1
+        self._results.clear()
+
+    async def get(self, key: Hashable, build: Callable[[], Awaitable[BaseModel]]) -> EncodedResult:
+        """
+        Return the cached result for `key`, building and caching it first if needed.
+
+        `build` returns the result model; if it raises, nothing is cached and the
+        exception propagates to this caller only, while coalesced callers retry.
+        """
+        while True:
+            version = self.version
+            if version != self._results_version:
+                self._results.clear()
+                self._results_version = version
+            if (result := self._results.get(key)) is not None:
+                self.hits += 1
+                return result
+            building = self._building.get((version, key))
+            if building is None:
+                break
+            await building.wait()
+
+        self.misses += 1
+        building = self._building[(version, key)] = anyio.Event()
+        try:
+            result = EncodedResult.from_result(await build())
+            if self.version == version:
+                if len(self._results) >= self._max_entries:
+                    del self._results[next(iter(self._results))]
+                self._results[key] = result
+            return result
+        finally:
+            del self._building[(version, key)]
+            building.set()
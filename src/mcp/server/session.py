@@ -168,20 +168,10 @@ class ServerSession(
                 self._client_params = params
                 with responder:
                     await responder.respond(
-                        types.ServerResult(
-                            types.InitializeResult(
-                                protocolVersion=requested_version
-                                if requested_version in SUPPORTED_PROTOCOL_VERSIONS
-                                else types.LATEST_PROTOCOL_VERSION,
-                                capabilities=self._init_options.capabilities,
-                                serverInfo=types.Implementation(
-                                    name=self._init_options.server_name,
-                                    version=self._init_options.server_version,
-                                    websiteUrl=self._init_options.website_url,
-                                    icons=self._init_options.icons,
-                                ),
-                                instructions=self._init_options.instructions,
-                            )
+                        self._init_options.initialize_result(
+                            requested_version
+                            if requested_version in SUPPORTED_PROTOCOL_VERSIONS
+                            else types.LATEST_PROTOCOL_VERSION
                         )
                     )
                 self._initialization_state = InitializationState.Initialized
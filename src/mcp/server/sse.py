@@ -51,11 +51,12 @@ from starlette.requests import Request
 from starlette.responses import Response
 from starlette.types import Receive, Scope, Send
 
-import mcp.types as types
+from mcp.server.compression import DEFAULT_MINIMUM_SIZE, compress_send, negotiate_encoding
 from mcp.server.transport_security import (
     TransportSecurityMiddleware,
     TransportSecuritySettings,
 )
+from mcp.shared.codec import MessageCodec, MessageParseError, get_default_codec
 from mcp.shared.message import ServerMessageMetadata, SessionMessage
 
 logger = logging.getLogger(__name__)
@@ -76,8 +77,15 @@ class SseServerTransport:
     _endpoint: str
     _read_stream_writers: dict[UUID, MemoryObjectSendStream[SessionMessage | Exception]]
     _security: TransportSecurityMiddleware
-
-    def __init__(self, endpoint: str, security_settings: TransportSecuritySettings | None = None) -> None:
+    _codec: MessageCodec
+
+    def __init__(
+        self,
+        endpoint: str,
+        security_settings: TransportSecuritySettings | None = None,
+        codec: MessageCodec | None = None,
+        compression_min_size: int | None = DEFAULT_MINIMUM_SIZE,
+    ) -> None:
         """
         Creates a new SSE server transport, which will direct the client to POST
         messages to the relative path given.
@@ -86,6 +94,9 @@ class SseServerTransport:
             endpoint: A relative path where messages should be posted
                     (e.g., "/messages/").
             security_settings: Optional security settings for DNS rebinding protection.
+            codec: Wire codec for messages. Defaults to the process-wide default codec.
+            compression_min_size: The SSE stream is compressed when the client
+                    accepts a supported encoding. None disables compression.
 
         Note:
             We use relative paths instead of full URLs for several reasons:
@@ -116,6 +127,8 @@ class SseServerTransport:
         self._endpoint = endpoint
         self._read_stream_writers = {}
         self._security = TransportSecurityMiddleware(security_settings)
+        self._codec = codec or get_default_codec()
+        self._compression_min_size = compression_min_size
         logger.debug(f"SseServerTransport initialized with endpoint: {endpoint}")
 
     @asynccontextmanager
@@ -126,6 +139,10 @@ class SseServerTransport:
 
         # Validate request headers for DNS rebinding protection
         request = Request(scope, receive)
+        if self._compression_min_size is not None and (
+            encoding := negotiate_encoding(request.headers.get("accept-encoding", ""))
+        ):
+            send = compress_send(send, encoding, self._compression_min_size)
         error_response = await self._security.validate_request(request, is_post=False)
         if error_response:
             await error_response(scope, receive, send)
@@ -173,7 +190,7 @@ class SseServerTransport:
                     await sse_stream_writer.send(
                         {
                             "event": "message",
-                            "data": session_message.message.model_dump_json(by_alias=True, exclude_none=True),
+                            "data": self._codec.encode_text(session_message.message),
                         }
                     )
 
@@ -231,9 +248,9 @@ class SseServerTransport:
         logger.debug(f"Received JSON: {body}")
 
         try:
-            message = types.JSONRPCMessage.model_validate_json(body)
+            message = self._codec.decode(body)
             logger.debug(f"Validated client message: {message}")
-        except ValidationError as err:
+        except (ValidationError, MessageParseError) as err:
             logger.exception("Failed to parse message")
             response = Response("Could not parse message", status_code=400)
             await response(scope, receive, send)
@@ -26,7 +26,7 @@ import anyio
 import anyio.lowlevel
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
-import mcp.types as types
+from mcp.shared.codec import MessageCodec, get_default_codec
 from mcp.shared.message import SessionMessage
 
 
@@ -34,10 +34,13 @@ from mcp.shared.message import SessionMessage
 async def stdio_server(
     stdin: anyio.AsyncFile[str] | None = None,
     stdout: anyio.AsyncFile[str] | None = None,
+    codec: MessageCodec | None = None,
 ):
     """
     Server transport for stdio: this communicates with an MCP client by reading
     from the current process' stdin and writing to stdout.
+
+    Messages are encoded and decoded with `codec`, or the default codec if not given.
     """
     # Purposely not using context managers for these, as we don't want to close
     # standard process handles. Encoding of stdin/stdout as text streams on
@@ -47,6 +50,7 @@ async def stdio_server(
         stdin = anyio.wrap_file(TextIOWrapper(sys.stdin.buffer, encoding="utf-8"))
     if not stdout:
         stdout = anyio.wrap_file(TextIOWrapper(sys.stdout.buffer, encoding="utf-8"))
+    codec = codec or get_default_codec()
 
     read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
     read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
@@ -62,7 +66,7 @@ async def stdio_server(
             async with read_stream_writer:
                 async for line in stdin:
                     try:
-                        message = types.JSONRPCMessage.model_validate_json(line)
+                        message = codec.decode(line)
                     except Exception as exc:  # pragma: no cover
                         await read_stream_writer.send(exc)
                         continue
@@ -76,7 +80,7 @@ async def stdio_server(
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    json = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                    json = codec.encode_text(session_message.message)
                     await stdout.write(json + "\n")
                     await stdout.flush()
         except anyio.ClosedResourceError:  # pragma: no cover
@@ -7,17 +7,18 @@ The transport handles bidirectional communication using HTTP requests and
 responses, with streaming support for long-running operations.
 """
 
-import json
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Literal
 
 import anyio
+from anyio.abc import TaskGroup
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from pydantic import ValidationError
 from sse_starlette import EventSourceResponse
@@ -25,10 +26,12 @@ from starlette.requests import Request
 from starlette.responses import Response
 from starlette.types import Receive, Scope, Send
 
+from mcp.server.compression import DEFAULT_MINIMUM_SIZE, compress_send, negotiate_encoding
 from mcp.server.transport_security import (
     TransportSecurityMiddleware,
     TransportSecuritySettings,
 )
+from mcp.shared.codec import MessageCodec, MessageParseError, get_default_codec, is_batch
 from mcp.shared.message import ServerMessageMetadata, SessionMessage
 from mcp.shared.version import SUPPORTED_PROTOCOL_VERSIONS
 from mcp.types import (
@@ -40,6 +43,7 @@ from mcp.types import (
     ErrorData,
     JSONRPCError,
     JSONRPCMessage,
+    JSONRPCNotification,
     JSONRPCRequest,
     JSONRPCResponse,
     RequestId,
@@ -64,9 +68,15 @@ GET_STREAM_KEY = "_GET_stream"
 # Pattern ensures entire string contains only valid characters by using ^ and $ anchors
 SESSION_ID_PATTERN = re.compile(r"^[\x21-\x7E]+$")
 
+# Messages buffered for each SSE stream before its overflow policy applies
+DEFAULT_STREAM_BUFFER_SIZE = 32
+# Messages queued behind a full stream buffer before the stream is closed
+DEFAULT_STREAM_BACKLOG_SIZE = 1024
+
 # Type aliases
 StreamId = str
 EventId = str
+StreamOverflowPolicy = Literal["drop_progress", "spill"]
 
 
 @dataclass
@@ -81,6 +91,26 @@ class EventMessage:
 
 EventCallback = Callable[[EventMessage], Awaitable[None]]
 
+MessageDispatcher = Callable[[SessionMessage], Awaitable[JSONRPCMessage | None]]
+"""Handles one message outside a session, returning the response to a request, see `Server.dispatch`."""
+
+
+class _PendingResponse:
+    """The response to a request answered with JSON, set by the message router."""
+
+    def __init__(self) -> None:
+        self._event = anyio.Event()
+        self._message: JSONRPCMessage | None = None
+
+    def resolve(self, message: JSONRPCMessage | None) -> None:
+        if not self._event.is_set():
+            self._message = message
+            self._event.set()
+
+    async def wait(self) -> JSONRPCMessage | None:
+        await self._event.wait()
+        return self._message
+
 
 class EventStore(ABC):
     """
@@ -119,6 +149,16 @@ class EventStore(ABC):
         """
         pass  # pragma: no cover
 
+    async def flush(self) -> None:
+        """
+        Waits until every event stored so far can be replayed.
+
+        Stores that persist events in the background (write-behind) override this,
+        and raise if some of the events could not be persisted. The transport calls it
+        before a response ends its stream, so a client that resumes after seeing the
+        response is replayed every event before it.
+        """
+
 
 class StreamableHTTPServerTransport:
     """
@@ -134,6 +174,7 @@ class StreamableHTTPServerTransport:
     _write_stream: MemoryObjectSendStream[SessionMessage] | None = None
     _write_stream_reader: MemoryObjectReceiveStream[SessionMessage] | None = None
     _security: TransportSecurityMiddleware
+    _codec: MessageCodec
 
     def __init__(
         self,
@@ -142,6 +183,12 @@ class StreamableHTTPServerTransport:
         event_store: EventStore | None = None,
         security_settings: TransportSecuritySettings | None = None,
         retry_interval: int | None = None,
+        codec: MessageCodec | None = None,
+        stream_buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+        stream_overflow: StreamOverflowPolicy = "drop_progress",
+        stream_backlog_size: int = DEFAULT_STREAM_BACKLOG_SIZE,
+        compression_min_size: int | None = DEFAULT_MINIMUM_SIZE,
+        dispatch: MessageDispatcher | None = None,
     ) -> None:
         """
         Initialize a new StreamableHTTP server transport.
@@ -159,18 +206,50 @@ class StreamableHTTPServerTransport:
                            retry field. When set, the server will send a retry field in
                            SSE priming events to control client reconnection timing for
                            polling behavior. Only used when event_store is provided.
+            codec: Wire codec for messages. Defaults to the process-wide default codec.
+            stream_buffer_size: Number of messages buffered for each open stream, so
+                               that a client reading one stream slowly does not hold
+                               up the others.
+            stream_overflow: What to do with a message for a stream whose buffer is
+                            full. "drop_progress" drops progress notifications, which
+                            later ones supersede, and queues other messages behind
+                            the buffer. "spill" closes the client's connection: the
+                            message stays in the event store, and the client replays
+                            it when it reconnects with Last-Event-ID. Only streams
+                            that began with a priming event can be resumed; others
+                            are handled as with "drop_progress". "spill" requires an
+                            event store and SSE responses.
+            stream_backlog_size: Number of messages queued behind a full buffer. A
+                                stream whose backlog is full is closed, and the
+                                client can only get the rest of it by resuming it.
+            compression_min_size: Responses are compressed when the client accepts a
+                                 supported encoding: JSON responses of at least this
+                                 many bytes, and SSE streams event by event. None
+                                 disables compression.
+            dispatch: Handles POSTed messages in the request's own task instead of
+                     sending them to a session through the streams of `connect()`,
+                     which is then not needed. Only GET and DELETE requests still
+                     need it. Requires JSON responses, as messages other than the
+                     response are not delivered.
 
         Raises:
-            ValueError: If the session ID contains invalid characters.
+            ValueError: If the session ID contains invalid characters, "spill" is used
+                        without an event store or with JSON responses, or `dispatch`
+                        is used without JSON responses.
         """
         if mcp_session_id is not None and not SESSION_ID_PATTERN.fullmatch(mcp_session_id):
             raise ValueError("Session ID must only contain visible ASCII characters (0x21-0x7E)")
+        if stream_overflow == "spill" and (event_store is None or is_json_response_enabled):
+            raise ValueError('stream_overflow="spill" requires an event store and SSE responses')
+        if dispatch is not None and not is_json_response_enabled:
+            raise ValueError("dispatch requires JSON responses")
 
         self.mcp_session_id = mcp_session_id
         self.is_json_response_enabled = is_json_response_enabled
         self._event_store = event_store
         self._security = TransportSecurityMiddleware(security_settings)
         self._retry_interval = retry_interval
+        self._codec = codec or get_default_codec()
         self._request_streams: dict[
             RequestId,
             tuple[
@@ -179,6 +258,20 @@ class StreamableHTTPServerTransport:
             ],
         ] = {}
         self._sse_stream_writers: dict[RequestId, MemoryObjectSendStream[dict[str, str]]] = {}
+        self._stream_buffer_size = stream_buffer_size
+        self._stream_overflow = stream_overflow
+        self._stream_backlog_size = stream_backlog_size
+        # Streams that began with a priming event, which the client can resume
+        self._resumable_streams: set[RequestId] = set()
+        self._compression_min_size = compression_min_size
+        self._dispatch = dispatch
+        # Messages waiting for space in a full stream buffer, in order
+        self._stream_backlogs: dict[RequestId, deque[EventMessage]] = {}
+        # Requests answered with JSON, waiting for their response
+        self._pending_responses: dict[RequestId, _PendingResponse] = {}
+        self._json_response_headers = [(b"content-type", CONTENT_TYPE_JSON.encode())]
+        if mcp_session_id:
+            self._json_response_headers.append((MCP_SESSION_ID_HEADER.encode(), mcp_session_id.encode()))
         self._terminated = False
 
     @property
@@ -186,6 +279,22 @@ class StreamableHTTPServerTransport:
         """Check if this transport has been explicitly terminated."""
         return self._terminated
 
+    @property
+    def has_standalone_stream(self) -> bool:
+        """Check if the client has a GET stream open, on which server-initiated requests are delivered."""
+        return GET_STREAM_KEY in self._request_streams
+
+    def _event_stream_id(self, stream_id: StreamId) -> StreamId:
+        """Scope a stream ID to this session, as request IDs repeat across the sessions sharing an event store."""
+        return f"{self.mcp_session_id}:{stream_id}" if self.mcp_session_id else stream_id
+
+    def _request_stream_id(self, event_stream_id: StreamId | None) -> StreamId | None:
+        """Map a stream ID returned by the event store back to this session's stream, if it is one."""
+        if event_stream_id is None or not self.mcp_session_id:
+            return event_stream_id
+        prefix = f"{self.mcp_session_id}:"
+        return event_stream_id.removeprefix(prefix) if event_stream_id.startswith(prefix) else None
+
     def close_sse_stream(self, request_id: RequestId) -> None:  # pragma: no cover
         """Close SSE connection for a specific request without terminating the stream.
 
@@ -204,6 +313,7 @@ class StreamableHTTPServerTransport:
             Requires event_store to be configured for events to be stored during
             the disconnect.
         """
+        self._resumable_streams.discard(request_id)
         writer = self._sse_stream_writers.pop(request_id, None)
         if writer:
             writer.close()
@@ -247,7 +357,7 @@ class StreamableHTTPServerTransport:
         the stream is closed early because they didn't receive a priming event.
         """
         # Only provide close callbacks when client supports resumability
-        if self._event_store and protocol_version >= "2025-11-25":
+        if self._event_store is not None and protocol_version >= "2025-11-25":
 
             async def close_stream_callback() -> None:
                 self.close_sse_stream(request_id)
@@ -277,19 +387,35 @@ class StreamableHTTPServerTransport:
         which includes the fix for handling empty SSE data. Older clients would
         crash trying to parse empty data as JSON.
         """
-        if not self._event_store:
+        if self._event_store is None:
             return
         # Priming events have empty data which older clients cannot handle.
         if protocol_version < "2025-11-25":
             return
         priming_event_id = await self._event_store.store_event(
-            str(request_id),  # Convert RequestId to StreamId (str)
+            self._event_stream_id(str(request_id)),  # Convert RequestId to StreamId (str)
             None,  # Priming event has no payload
         )
         priming_event: dict[str, str | int] = {"id": priming_event_id, "data": ""}
         if self._retry_interval is not None:
             priming_event["retry"] = self._retry_interval
         await sse_stream_writer.send(priming_event)
+        self._resumable_streams.add(request_id)
+
+    async def _flush_event_store(self) -> None:
+        """
+        Wait for a stream's events to be durable before its response ends it.
+
+        Runs in the stream's own writer, so a slow event store holds up that stream
+        only, not the routing of messages to the others.
+        """
+        if self._event_store is None:
+            return
+        try:
+            await self._event_store.flush()
+        except Exception:
+            # The client still receives the stream live, but cannot resume it
+            logger.exception("Failed to persist the events of a stream before its response")
 
     def _create_error_response(
         self,
@@ -317,14 +443,14 @@ class StreamableHTTPServerTransport:
         )
 
         return Response(
-            error_response.model_dump_json(by_alias=True, exclude_none=True),
+            self._codec.encode(JSONRPCMessage(error_response)),
             status_code=status_code,
             headers=response_headers,
         )
 
     def _create_json_response(  # pragma: no cover
         self,
-        response_message: JSONRPCMessage | None,
+        response_message: JSONRPCMessage | list[JSONRPCMessage] | None,
         status_code: HTTPStatus = HTTPStatus.OK,
         headers: dict[str, str] | None = None,
     ) -> Response:
@@ -336,8 +462,12 @@ class StreamableHTTPServerTransport:
         if self.mcp_session_id:
             response_headers[MCP_SESSION_ID_HEADER] = self.mcp_session_id
 
+        if isinstance(response_message, list):
+            content = self._codec.encode_batch(response_message)
+        else:
+            content = self._codec.encode(response_message) if response_message else None
         return Response(
-            response_message.model_dump_json(by_alias=True, exclude_none=True) if response_message else None,
+            content,
             status_code=status_code,
             headers=response_headers,
         )
@@ -350,7 +480,7 @@ class StreamableHTTPServerTransport:
         """Create event data dictionary from an EventMessage."""
         event_data = {
             "event": "message",
-            "data": event_message.message.model_dump_json(by_alias=True, exclude_none=True),
+            "data": self._codec.encode_text(event_message.message),
         }
 
         # If an event ID was provided, include it
@@ -359,8 +489,80 @@ class StreamableHTTPServerTransport:
 
         return event_data
 
+    def _create_request_stream(
+        self,
+    ) -> tuple[MemoryObjectSendStream[EventMessage], MemoryObjectReceiveStream[EventMessage]]:
+        return anyio.create_memory_object_stream[EventMessage](self._stream_buffer_size)
+
+    def _route_message(self, request_stream_id: RequestId, event_message: EventMessage, tg: TaskGroup) -> None:
+        """Hand a message to its stream without waiting for the client to read it."""
+        pending = self._pending_responses.get(request_stream_id)
+        if pending is not None:
+            if isinstance(event_message.message.root, JSONRPCResponse | JSONRPCError):
+                pending.resolve(event_message.message)
+            else:
+                logger.debug(f"Not delivering {event_message.message.root.method} in a JSON response")
+            return
+
+        streams = self._request_streams.get(request_stream_id)
+        if streams is None:
+            logger.debug(
+                f"Request stream {request_stream_id} not found for message. "
+                "Still processing message as the client might reconnect and replay."
+            )
+            return
+
+        send_stream = streams[0]
+        backlog = self._stream_backlogs.get(request_stream_id)
+        if backlog is None:
+            try:
+                send_stream.send_nowait(event_message)
+                return
+            except anyio.WouldBlock:
+                pass
+            except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                # Stream might be closed, remove from registry
+                self._request_streams.pop(request_stream_id, None)
+                return
+
+        # The client is not keeping up with this stream
+        if self._stream_overflow == "spill" and request_stream_id in self._resumable_streams:
+            logger.debug(f"Closing slow stream {request_stream_id}; the client will replay its events")
+            self.close_sse_stream(request_stream_id)
+        elif _is_progress_notification(event_message.message):
+            logger.debug(f"Dropping progress notification for slow stream {request_stream_id}")
+        elif (len(backlog) if backlog is not None else 0) >= self._stream_backlog_size:
+            logger.warning(
+                f"Closing stream {request_stream_id}: its client is not reading its messages"
+                + ("; the client will replay its events" if request_stream_id in self._resumable_streams else "")
+            )
+            self.close_sse_stream(request_stream_id)
+        else:
+            if backlog is None:
+                backlog = self._stream_backlogs[request_stream_id] = deque()
+                tg.start_soon(self._drain_backlog, request_stream_id, send_stream, backlog)
+            backlog.append(event_message)
+
+    async def _drain_backlog(
+        self,
+        request_stream_id: RequestId,
+        send_stream: MemoryObjectSendStream[EventMessage],
+        backlog: deque[EventMessage],
+    ) -> None:
+        """Send a stream's backlog as its client makes room, keeping the messages in order."""
+        try:
+            while backlog:
+                await send_stream.send(backlog[0])
+                backlog.popleft()
+        except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+            backlog.clear()
+        finally:
+            if self._stream_backlogs.get(request_stream_id) is backlog:
+                del self._stream_backlogs[request_stream_id]
+
     async def _clean_up_memory_streams(self, request_id: RequestId) -> None:  # pragma: no cover
         """Clean up memory streams for a given request ID."""
+        self._resumable_streams.discard(request_id)
         if request_id in self._request_streams:
             try:
                 # Close the request stream
@@ -376,6 +578,10 @@ class StreamableHTTPServerTransport:
     async def handle_request(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Application entry point that handles all HTTP requests"""
         request = Request(scope, receive)
+        if self._compression_min_size is not None and (
+            encoding := negotiate_encoding(request.headers.get("accept-encoding", ""))
+        ):
+            send = compress_send(send, encoding, self._compression_min_size)
 
         # Validate request headers for DNS rebinding protection
         is_post = request.method == "POST"
@@ -444,7 +650,7 @@ class StreamableHTTPServerTransport:
     async def _handle_post_request(self, scope: Scope, request: Request, receive: Receive, send: Send) -> None:
         """Handle POST requests containing JSON-RPC messages."""
         writer = self._read_stream_writer
-        if writer is None:  # pragma: no cover
+        if writer is None and self._dispatch is None:  # pragma: no cover
             raise ValueError("No read stream writer available. Ensure connect() is called first.")
         try:
             # Validate Accept header
@@ -461,24 +667,11 @@ class StreamableHTTPServerTransport:
                 return
 
             # Parse the body - only read it once
-            body = await request.body()
-
-            try:
-                raw_message = json.loads(body)
-            except json.JSONDecodeError as e:
-                response = self._create_error_response(f"Parse error: {str(e)}", HTTPStatus.BAD_REQUEST, PARSE_ERROR)
-                await response(scope, receive, send)
+            message = await self._parse_body(await request.body(), scope, receive, send)
+            if message is None:
                 return
-
-            try:  # pragma: no cover
-                message = JSONRPCMessage.model_validate(raw_message)
-            except ValidationError as e:  # pragma: no cover
-                response = self._create_error_response(
-                    f"Validation error: {str(e)}",
-                    HTTPStatus.BAD_REQUEST,
-                    INVALID_PARAMS,
-                )
-                await response(scope, receive, send)
+            if isinstance(message, list):
+                await self._handle_batch_post_request(scope, request, receive, send, message)
                 return
 
             # Check if this is an initialization request
@@ -514,8 +707,7 @@ class StreamableHTTPServerTransport:
 
                 # Process the message after sending the response
                 metadata = ServerMessageMetadata(request_context=request)
-                session_message = SessionMessage(message, metadata=metadata)
-                await writer.send(session_message)
+                await self._send_to_server(SessionMessage(message, metadata=metadata))
 
                 return
 
@@ -530,54 +722,15 @@ class StreamableHTTPServerTransport:
 
             # Extract the request ID outside the try block for proper scope
             request_id = str(message.root.id)  # pragma: no cover
-            # Register this stream for the request ID
-            self._request_streams[request_id] = anyio.create_memory_object_stream[EventMessage](0)  # pragma: no cover
-            request_stream_reader = self._request_streams[request_id][1]  # pragma: no cover
 
             if self.is_json_response_enabled:  # pragma: no cover
-                # Process the message
-                metadata = ServerMessageMetadata(request_context=request)
-                session_message = SessionMessage(message, metadata=metadata)
-                await writer.send(session_message)
-                try:
-                    # Process messages from the request-specific stream
-                    # We need to collect all messages until we get a response
-                    response_message = None
-
-                    # Use similar approach to SSE writer for consistency
-                    async for event_message in request_stream_reader:
-                        # If it's a response, this is what we're waiting for
-                        if isinstance(event_message.message.root, JSONRPCResponse | JSONRPCError):
-                            response_message = event_message.message
-                            break
-                        # For notifications and request, keep waiting
-                        else:
-                            logger.debug(f"received: {event_message.message.root.method}")
-
-                    # At this point we should have a response
-                    if response_message:
-                        # Create JSON response
-                        response = self._create_json_response(response_message)
-                        await response(scope, receive, send)
-                    else:
-                        # This shouldn't happen in normal operation
-                        logger.error("No response message received before stream closed")
-                        response = self._create_error_response(
-                            "Error processing request: No response received",
-                            HTTPStatus.INTERNAL_SERVER_ERROR,
-                        )
-                        await response(scope, receive, send)
-                except Exception:
-                    logger.exception("Error processing JSON response")
-                    response = self._create_error_response(
-                        "Error processing request",
-                        HTTPStatus.INTERNAL_SERVER_ERROR,
-                        INTERNAL_ERROR,
-                    )
-                    await response(scope, receive, send)
-                finally:
-                    await self._clean_up_memory_streams(request_id)
+                await self._handle_json_request(message, request_id, request, send)
             else:  # pragma: no cover
+                assert writer is not None
+                # Register this stream for the request ID
+                self._request_streams[request_id] = self._create_request_stream()
+                request_stream_reader = self._request_streams[request_id][1]
+
                 # Create SSE stream
                 sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[dict[str, str]](0)
 
@@ -593,15 +746,19 @@ class StreamableHTTPServerTransport:
 
                             # Process messages from the request-specific stream
                             async for event_message in request_stream_reader:
+                                is_response = isinstance(
+                                    event_message.message.root,
+                                    JSONRPCResponse | JSONRPCError,
+                                )
+                                if is_response:
+                                    await self._flush_event_store()
+
                                 # Build the event data
                                 event_data = self._create_event_data(event_message)
                                 await sse_stream_writer.send(event_data)
 
                                 # If response, remove from pending streams and close
-                                if isinstance(
-                                    event_message.message.root,
-                                    JSONRPCResponse | JSONRPCError,
-                                ):
+                                if is_response:
                                     break
                     except anyio.ClosedResourceError:
                         # Expected when close_sse_stream() is called
@@ -639,8 +796,10 @@ class StreamableHTTPServerTransport:
                 except Exception:
                     logger.exception("SSE response error")
                     await sse_stream_writer.aclose()
-                    await sse_stream_reader.aclose()
                     await self._clean_up_memory_streams(request_id)
+                finally:
+                    # EventSourceResponse does not close its content stream
+                    sse_stream_reader.close()
 
         except Exception as err:  # pragma: no cover
             logger.exception("Error handling POST request")
@@ -654,6 +813,244 @@ class StreamableHTTPServerTransport:
                 await writer.send(Exception(err))
             return
 
+    async def _handle_json_request(
+        self,
+        message: JSONRPCMessage,
+        request_id: RequestId,
+        request: Request,
+        send: Send,
+    ) -> None:
+        """
+        Process a request and answer it with a JSON response.
+
+        The message router resolves the request's pending response directly, and the
+        encoded response goes straight to `send`: no request stream is involved.
+        Other messages related to the request are not delivered, as a JSON response
+        can only carry the response itself.
+        """
+        response_message = await self._request_response(
+            SessionMessage(message, metadata=ServerMessageMetadata(request_context=request)), request_id
+        )
+
+        if response_message is None:
+            # This shouldn't happen in normal operation
+            logger.error("No response message received before the session closed")
+            response = self._create_error_response(
+                "Error processing request: No response received",
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+            )
+            await response(request.scope, request.receive, send)
+            return
+
+        body = self._codec.encode(response_message)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": HTTPStatus.OK,
+                "headers": [*self._json_response_headers, (b"content-length", str(len(body)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    async def _send_to_server(self, message: SessionMessage) -> None:
+        """Pass a message that gets no response on to the server."""
+        if self._dispatch is not None:
+            await self._dispatch(message)
+        else:
+            assert self._read_stream_writer is not None
+            await self._read_stream_writer.send(message)
+
+    async def _request_response(self, message: SessionMessage, request_id: RequestId) -> JSONRPCMessage | None:
+        """Pass a request on to the server and wait for its response, or None if the session closed first."""
+        if self._dispatch is not None:
+            return await self._dispatch(message)
+
+        assert self._read_stream_writer is not None
+        pending = self._pending_responses[request_id] = _PendingResponse()
+        try:
+            await self._read_stream_writer.send(message)
+            return await pending.wait()
+        finally:
+            if self._pending_responses.get(request_id) is pending:
+                del self._pending_responses[request_id]
+
+    def _resolve_pending_responses(self) -> None:
+        """Wake every request waiting for a JSON response, as none will come."""
+        for pending in self._pending_responses.values():
+            pending.resolve(None)
+
+    async def _parse_body(
+        self, body: bytes, scope: Scope, receive: Receive, send: Send
+    ) -> JSONRPCMessage | list[JSONRPCMessage] | None:
+        """Parse a POST body into a message or a batch, or send an error response and return None."""
+        try:
+            return self._codec.decode_batch(body) if is_batch(body) else self._codec.decode(body)
+        except MessageParseError as e:
+            response = self._create_error_response(f"Parse error: {str(e)}", HTTPStatus.BAD_REQUEST, PARSE_ERROR)
+        except ValidationError as e:
+            response = self._create_error_response(
+                f"Validation error: {str(e)}",
+                HTTPStatus.BAD_REQUEST,
+                INVALID_PARAMS,
+            )
+        await response(scope, receive, send)
+        return None
+
+    async def _handle_batch_post_request(
+        self,
+        scope: Scope,
+        request: Request,
+        receive: Receive,
+        send: Send,
+        messages: list[JSONRPCMessage],
+    ) -> None:
+        """
+        Handle a POST request carrying a JSON-RPC batch.
+
+        The responses to all requests of the batch are returned together: as a JSON
+        array, or on one SSE stream that ends after the last of them. Batched SSE
+        streams have no priming event, so the client cannot resume them.
+        """
+        requests = [message.root for message in messages if isinstance(message.root, JSONRPCRequest)]
+        request_ids = [str(request.id) for request in requests]
+        error = None
+        if not messages:
+            error = "Invalid Request: Empty batch"
+        elif any(request.method == "initialize" for request in requests):
+            error = "Invalid Request: Initialization requests cannot be batched"
+        elif len(set(request_ids)) != len(request_ids):
+            error = "Invalid Request: Request IDs in a batch must be unique"
+        if error is not None:
+            response = self._create_error_response(error, HTTPStatus.BAD_REQUEST)
+            await response(scope, receive, send)
+            return
+
+        if not await self._validate_request_headers(request, send):
+            return
+
+        metadata = ServerMessageMetadata(request_context=request)
+        if not requests:
+            # Only notifications and responses: nothing to wait for
+            response = self._create_json_response(None, HTTPStatus.ACCEPTED)
+            await response(scope, receive, send)
+            for message in messages:
+                await self._send_to_server(SessionMessage(message, metadata=metadata))
+            return
+
+        if self._dispatch is not None:
+            await self._dispatch_batch(scope, receive, send, messages, metadata)
+            return
+
+        writer = self._read_stream_writer
+        assert writer is not None
+
+        # All requests of the batch share one stream, which ends after the last response
+        request_stream = self._create_request_stream()
+        for request_id in request_ids:
+            self._request_streams[request_id] = request_stream
+        request_stream_reader = request_stream[1]
+
+        async def responses() -> AsyncGenerator[EventMessage, None]:
+            remaining = set(request_ids)
+            async for event_message in request_stream_reader:
+                yield event_message
+                root = event_message.message.root
+                if isinstance(root, JSONRPCResponse | JSONRPCError):
+                    remaining.discard(str(root.id))
+                    if not remaining:
+                        return
+
+        async def clean_up() -> None:
+            for request_id in request_ids:
+                await self._clean_up_memory_streams(request_id)
+
+        if self.is_json_response_enabled:
+            try:
+                for message in messages:
+                    await writer.send(SessionMessage(message, metadata=metadata))
+                by_id = {
+                    str(event_message.message.root.id): event_message.message
+                    async for event_message in responses()
+                    if isinstance(event_message.message.root, JSONRPCResponse | JSONRPCError)
+                }
+                if len(by_id) == len(request_ids):
+                    response = self._create_json_response([by_id[request_id] for request_id in request_ids])
+                else:
+                    logger.error("Not every response of the batch was received before the stream closed")
+                    response = self._create_error_response(
+                        "Error processing request: No response received",
+                        HTTPStatus.INTERNAL_SERVER_ERROR,
+                    )
+                await response(scope, receive, send)
+            finally:
+                await clean_up()
+            return
+
+        sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[dict[str, str]](0)
+
+        async def sse_writer():
+            try:
+                async with sse_stream_writer, request_stream_reader:
+                    async for event_message in responses():
+                        await sse_stream_writer.send(self._create_event_data(event_message))
+            except anyio.ClosedResourceError:
+                logger.debug("Batch SSE stream closed")
+            except Exception:
+                logger.exception("Error in batch SSE writer")
+            finally:
+                await clean_up()
+
+        response = EventSourceResponse(
+            content=sse_stream_reader,
+            data_sender_callable=sse_writer,
+            headers={
+                "Cache-Control": "no-cache, no-transform",
+                "Connection": "keep-alive",
+                "Content-Type": CONTENT_TYPE_SSE,
+                **({MCP_SESSION_ID_HEADER: self.mcp_session_id} if self.mcp_session_id else {}),
+            },
+        )
+        try:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(response, scope, receive, send)
+                for message in messages:
+                    await writer.send(SessionMessage(message, metadata=metadata))
+        finally:
+            sse_stream_reader.close()
+
+    async def _dispatch_batch(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        messages: list[JSONRPCMessage],
+        metadata: ServerMessageMetadata,
+    ) -> None:
+        """Dispatch the messages of a batch concurrently and answer with their responses as a JSON array."""
+        assert self._dispatch is not None
+        dispatch = self._dispatch
+        by_id: dict[str, JSONRPCMessage] = {}
+
+        async def dispatch_one(message: JSONRPCMessage) -> None:
+            response_message = await dispatch(SessionMessage(message, metadata=metadata))
+            if response_message is not None and isinstance(message.root, JSONRPCRequest):
+                by_id[str(message.root.id)] = response_message
+
+        async with anyio.create_task_group() as tg:
+            for message in messages:
+                tg.start_soon(dispatch_one, message)
+
+        request_ids = [str(message.root.id) for message in messages if isinstance(message.root, JSONRPCRequest)]
+        if len(by_id) == len(request_ids):
+            response = self._create_json_response([by_id[request_id] for request_id in request_ids])
+        else:
+            logger.error("Not every request of the batch was answered")
+            response = self._create_error_response(
+                "Error processing request: No response received",
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+            )
+        await response(scope, receive, send)
+
     async def _handle_get_request(self, request: Request, send: Send) -> None:  # pragma: no cover
         """
         Handle GET request to establish SSE.
@@ -710,7 +1107,7 @@ class StreamableHTTPServerTransport:
             try:
                 # Create a standalone message stream for server-initiated messages
 
-                self._request_streams[GET_STREAM_KEY] = anyio.create_memory_object_stream[EventMessage](0)
+                self._request_streams[GET_STREAM_KEY] = self._create_request_stream()
                 standalone_stream_reader = self._request_streams[GET_STREAM_KEY][1]
 
                 async with sse_stream_writer, standalone_stream_reader:
@@ -743,8 +1140,11 @@ class StreamableHTTPServerTransport:
         except Exception:
             logger.exception("Error in standalone SSE response")
             await sse_stream_writer.aclose()
-            await sse_stream_reader.aclose()
             await self._clean_up_memory_streams(GET_STREAM_KEY)
+        finally:
+            # EventSourceResponse does not close its content stream, even when the
+            # session is terminated or the request is cancelled
+            sse_stream_reader.close()
 
     async def _handle_delete_request(self, request: Request, send: Send) -> None:  # pragma: no cover
         """Handle DELETE requests for explicit session termination."""
@@ -787,6 +1187,7 @@ class StreamableHTTPServerTransport:
 
         # Clear the request streams dictionary immediately
         self._request_streams.clear()
+        self._resolve_pending_responses()
         try:
             if self._read_stream_writer is not None:  # pragma: no branch
                 await self._read_stream_writer.aclose()
@@ -880,7 +1281,7 @@ class StreamableHTTPServerTransport:
         Only used when resumability is enabled.
         """
         event_store = self._event_store
-        if not event_store:
+        if event_store is None:
             return
 
         try:
@@ -908,7 +1309,9 @@ class StreamableHTTPServerTransport:
                             await sse_stream_writer.send(event_data)
 
                         # Replay past events and get the stream ID
-                        stream_id = await event_store.replay_events_after(last_event_id, send_event)
+                        stream_id = self._request_stream_id(
+                            await event_store.replay_events_after(last_event_id, send_event)
+                        )
 
                         # If stream ID not in mapping, create it
                         if stream_id and stream_id not in self._request_streams:
@@ -919,12 +1322,14 @@ class StreamableHTTPServerTransport:
                             await self._maybe_send_priming_event(stream_id, sse_stream_writer, replay_protocol_version)
 
                             # Create new request streams for this connection
-                            self._request_streams[stream_id] = anyio.create_memory_object_stream[EventMessage](0)
+                            self._request_streams[stream_id] = self._create_request_stream()
                             msg_reader = self._request_streams[stream_id][1]
 
                             # Forward messages to SSE
                             async with msg_reader:
                                 async for event_message in msg_reader:
+                                    if isinstance(event_message.message.root, JSONRPCResponse | JSONRPCError):
+                                        await self._flush_event_store()
                                     event_data = self._create_event_data(event_message)
 
                                     await sse_stream_writer.send(event_data)
@@ -1017,26 +1422,13 @@ class StreamableHTTPServerTransport:
                         # regardless of whether a client is connected
                         # messages will be replayed on the re-connect
                         event_id = None
-                        if self._event_store:
-                            event_id = await self._event_store.store_event(request_stream_id, message)
+                        if self._event_store is not None:
+                            event_id = await self._event_store.store_event(
+                                self._event_stream_id(request_stream_id), message
+                            )
                             logger.debug(f"Stored {event_id} from {request_stream_id}")
 
-                        if request_stream_id in self._request_streams:
-                            try:
-                                # Send both the message and the event ID
-                                await self._request_streams[request_stream_id][0].send(EventMessage(message, event_id))
-                            except (
-                                anyio.BrokenResourceError,
-                                anyio.ClosedResourceError,
-                            ):
-                                # Stream might be closed, remove from registry
-                                self._request_streams.pop(request_stream_id, None)
-                        else:
-                            logger.debug(
-                                f"""Request stream {request_stream_id} not found 
-                                for message. Still processing message as the client
-                                might reconnect and replay."""
-                            )
+                        self._route_message(request_stream_id, EventMessage(message, event_id), tg)
                 except anyio.ClosedResourceError:
                     if self._terminated:
                         logger.debug("Read stream closed by client")
@@ -1054,6 +1446,7 @@ class StreamableHTTPServerTransport:
             finally:
                 for stream_id in list(self._request_streams.keys()):  # pragma: no cover
                     await self._clean_up_memory_streams(stream_id)
+                self._resolve_pending_responses()
                 self._request_streams.clear()
 
                 # Clean up the read and write streams
@@ -1065,3 +1458,7 @@ class StreamableHTTPServerTransport:
                 except Exception as e:  # pragma: no cover
                     # During cleanup, we catch all exceptions since streams might be in various states
                     logger.debug(f"Error closing streams: {e}")
+
+
+def _is_progress_notification(message: JSONRPCMessage) -> bool:
+    return isinstance(message.root, JSONRPCNotification) and message.root.method == "notifications/progress"
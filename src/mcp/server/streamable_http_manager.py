@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import contextlib
 import logging
-from collections.abc import AsyncIterator
+import sys
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Generator, Iterable
+from dataclasses import dataclass, field
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Literal, cast
 from uuid import uuid4
 
 import anyio
@@ -15,16 +19,107 @@ from starlette.requests import Request
 from starlette.responses import Response
 from starlette.types import Receive, Scope, Send
 
+from mcp.server.compression import DEFAULT_MINIMUM_SIZE
 from mcp.server.lowlevel.server import Server as MCPServer
+from mcp.server.models import InitializationOptions
+from mcp.server.session import ServerSession
 from mcp.server.streamable_http import (
+    DEFAULT_STREAM_BACKLOG_SIZE,
+    DEFAULT_STREAM_BUFFER_SIZE,
     MCP_SESSION_ID_HEADER,
     EventStore,
     StreamableHTTPServerTransport,
+    StreamOverflowPolicy,
 )
 from mcp.server.transport_security import TransportSecuritySettings
+from mcp.shared.message import SessionMessage
+from mcp.types import JSONRPCMessage
 
 logger = logging.getLogger(__name__)
 
+EvictionReason = Literal["idle", "capacity", "unresponsive"]
+"""Why a session was closed by the manager rather than by its client."""
+
+
+@dataclass
+class SessionInfo:
+    """A snapshot of one stateful session."""
+
+    session_id: str
+    idle_seconds: float
+    """Seconds since the session last started or finished a request (0 while one is in flight)."""
+    active_requests: int
+    """HTTP requests currently being handled, including an open GET stream."""
+    approximate_bytes: int
+    """Rough size of the session's transport, server session and buffered messages."""
+
+
+@dataclass
+class SessionStats:
+    """Session counts and approximate memory use of a `StreamableHTTPSessionManager`."""
+
+    sessions: list[SessionInfo]
+    evictions: dict[EvictionReason, int]
+    """Sessions closed by the manager so far, by reason."""
+
+    @property
+    def session_count(self) -> int:
+        return len(self.sessions)
+
+    @property
+    def approximate_bytes(self) -> int:
+        return sum(session.approximate_bytes for session in self.sessions)
+
+
+@dataclass
+class _ManagedSession:
+    transport: StreamableHTTPServerTransport
+    server_session: ServerSession | None = None
+    last_active: float = field(default_factory=time.monotonic)
+    active_requests: int = 0
+
+    @contextlib.contextmanager
+    def request(self) -> Generator[None]:
+        """Mark the session busy while one of its HTTP requests is being handled."""
+        self.active_requests += 1
+        try:
+            yield
+        finally:
+            self.active_requests -= 1
+            self.last_active = time.monotonic()
+
+    def idle_seconds(self, now: float) -> float:
+        return 0.0 if self.active_requests else now - self.last_active
+
+
+# Objects of these modules are followed when sizing a session. Anything else, such as
+# event loop internals, tasks and locks, is counted shallowly and not followed, so
+# runtime state that every session references is not attributed to each of them.
+_SIZED_MODULES = ("mcp.", "anyio.streams.memory")
+
+
+def _approximate_size(obj: object, seen: set[int]) -> int:
+    """Sum `sys.getsizeof` over `obj` and the objects it owns that are not in `seen`."""
+    size = 0
+    stack: list[object] = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, dict):
+            items = cast(dict[object, object], current)
+            stack.extend(items.keys())
+            stack.extend(items.values())
+        elif isinstance(current, list | tuple | set | frozenset | deque):
+            stack.extend(cast(Iterable[object], current))
+        elif type(current).__module__.startswith(_SIZED_MODULES):
+            attributes = getattr(current, "__dict__", None)
+            if attributes is not None:
+                stack.append(attributes)
+    return size
+
 
 class StreamableHTTPSessionManager:
     """
@@ -54,6 +149,37 @@ class StreamableHTTPSessionManager:
         security_settings: Optional transport security settings.
         retry_interval: Retry interval in milliseconds to suggest to clients in SSE
                        retry field. Used for SSE polling behavior.
+        session_idle_timeout: Seconds after which a session with no request in flight
+                              is closed. Clients that disappear without sending DELETE
+                              otherwise keep their session alive forever.
+        max_sessions: Maximum number of stateful sessions. When it is reached, the
+                      least recently used session with no request in flight is
+                      closed to make room; if every session is busy, new sessions
+                      are refused with 503 Service Unavailable.
+        ping_interval: Seconds between pings sent to each session that has a GET
+                       stream open. Sessions that do not answer within
+                       `ping_timeout` seconds are closed. Sessions without a GET
+                       stream cannot receive pings and are left to
+                       `session_idle_timeout`.
+        ping_timeout: Seconds to wait for the client to answer a ping.
+        stream_buffer_size: Number of messages buffered for each SSE stream, so that
+                            a client reading one stream slowly does not hold up the
+                            other requests of its session.
+        stream_overflow: What to do with messages for a stream whose buffer is full:
+                         "drop_progress" drops progress notifications and queues
+                         other messages; "spill" closes the stream so that the client
+                         replays the messages from the event store. Streams that
+                         cannot be resumed, and stateless requests, always use
+                         "drop_progress".
+        stream_backlog_size: Number of messages queued behind a full stream buffer;
+                             a stream whose backlog is full is closed.
+        compression_min_size: Responses are compressed when the client accepts a
+                              supported encoding: JSON responses of at least this
+                              many bytes, and SSE streams event by event. None
+                              disables compression.
+
+    Clients of a closed session get 404 Not Found and, as the specification requires,
+    start a new session.
     """
 
     def __init__(
@@ -64,17 +190,41 @@ class StreamableHTTPSessionManager:
         stateless: bool = False,
         security_settings: TransportSecuritySettings | None = None,
         retry_interval: int | None = None,
+        session_idle_timeout: float | None = None,
+        max_sessions: int | None = None,
+        ping_interval: float | None = None,
+        ping_timeout: float = 10.0,
+        stream_buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+        stream_overflow: StreamOverflowPolicy = "drop_progress",
+        stream_backlog_size: int = DEFAULT_STREAM_BACKLOG_SIZE,
+        compression_min_size: int | None = DEFAULT_MINIMUM_SIZE,
     ):
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        if stream_overflow == "spill" and not stateless and (event_store is None or json_response):
+            raise ValueError('stream_overflow="spill" requires an event store and SSE responses')
         self.app = app
         self.event_store = event_store
         self.json_response = json_response
         self.stateless = stateless
         self.security_settings = security_settings
         self.retry_interval = retry_interval
-
-        # Session tracking (only used if not stateless)
-        self._session_creation_lock = anyio.Lock()
-        self._server_instances: dict[str, StreamableHTTPServerTransport] = {}
+        self.session_idle_timeout = session_idle_timeout
+        self.max_sessions = max_sessions
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.stream_buffer_size = stream_buffer_size
+        self.stream_overflow: StreamOverflowPolicy = stream_overflow
+        self.stream_backlog_size = stream_backlog_size
+        self.compression_min_size = compression_min_size
+
+        # Session tracking (only used if not stateless), least recently used first
+        self._server_instances: OrderedDict[str, _ManagedSession] = OrderedDict()
+        self._evictions: dict[EvictionReason, int] = {"idle": 0, "capacity": 0, "unresponsive": 0}
+
+        # Initialization options shared by every session, and the server state they were built from
+        self._init_options: InitializationOptions | None = None
+        self._init_options_key: tuple[Any, ...] = ()
 
         # The task group will be set during lifespan
         self._task_group = None
@@ -87,7 +237,8 @@ class StreamableHTTPSessionManager:
         """
         Run the session manager with proper lifecycle management.
 
-        This creates and manages the task group for all session operations.
+        This creates and manages the task group for all session operations, and
+        enters the app's application lifespan once for all sessions.
 
         Important: This method can only be called once per instance. The same
         StreamableHTTPSessionManager instance cannot be reused after this
@@ -109,9 +260,12 @@ class StreamableHTTPSessionManager:
                 )
             self._has_started = True
 
-        async with anyio.create_task_group() as tg:
+        # The app lifespan is shared by every session, including each stateless request
+        async with self.app.app_lifespan_scope(), anyio.create_task_group() as tg:
             # Store the task group for later use
             self._task_group = tg
+            if not self.stateless and (self.session_idle_timeout is not None or self.ping_interval is not None):
+                tg.start_soon(self._reap_sessions)
             logger.info("StreamableHTTP session manager started")
             try:
                 yield  # Let the application run
@@ -157,11 +311,30 @@ class StreamableHTTPSessionManager:
         """
         Process request in stateless mode - creating a new transport for each request.
 
+        The transport and server session are not shared between requests: request ids
+        of different clients collide, and a session's client info, logging level and
+        lifespan belong to one client.
+
+        POSTed messages answered with JSON responses are dispatched in the request's
+        own task by `Server.dispatch`, rather than by a session run per request: a JSON
+        response cannot carry the other messages that session would send.
+
         Args:
             scope: ASGI scope
             receive: ASGI receive function
             send: ASGI send function
         """
+        if self.json_response and scope.get("method") == "POST" and self.app.can_dispatch:
+            http_transport = StreamableHTTPServerTransport(
+                mcp_session_id=None,
+                is_json_response_enabled=True,
+                security_settings=self.security_settings,
+                compression_min_size=self.compression_min_size,
+                dispatch=self._dispatch,
+            )
+            await http_transport.handle_request(scope, receive, send)
+            return
+
         logger.debug("Stateless mode: Creating new transport for this request")
         # No session ID needed in stateless mode
         http_transport = StreamableHTTPServerTransport(
@@ -169,6 +342,9 @@ class StreamableHTTPSessionManager:
             is_json_response_enabled=self.json_response,
             event_store=None,  # No event store in stateless mode
             security_settings=self.security_settings,
+            stream_buffer_size=self.stream_buffer_size,
+            stream_backlog_size=self.stream_backlog_size,
+            compression_min_size=self.compression_min_size,
         )
 
         # Start server in a new task
@@ -180,7 +356,7 @@ class StreamableHTTPSessionManager:
                     await self.app.run(
                         read_stream,
                         write_stream,
-                        self.app.create_initialization_options(),
+                        self._initialization_options(),
                         stateless=True,
                     )
                 except Exception:  # pragma: no cover
@@ -215,71 +391,200 @@ class StreamableHTTPSessionManager:
         request_mcp_session_id = request.headers.get(MCP_SESSION_ID_HEADER)
 
         # Existing session case
-        if request_mcp_session_id is not None and request_mcp_session_id in self._server_instances:  # pragma: no cover
-            transport = self._server_instances[request_mcp_session_id]
+        if request_mcp_session_id is not None and request_mcp_session_id in self._server_instances:
+            session = self._server_instances[request_mcp_session_id]
+            self._server_instances.move_to_end(request_mcp_session_id)
             logger.debug("Session already exists, handling request directly")
-            await transport.handle_request(scope, receive, send)
+            with session.request():
+                await session.transport.handle_request(scope, receive, send)
             return
 
         if request_mcp_session_id is None:
             # New session case
             logger.debug("Creating new transport")
-            async with self._session_creation_lock:
-                new_session_id = uuid4().hex
-                http_transport = StreamableHTTPServerTransport(
-                    mcp_session_id=new_session_id,
-                    is_json_response_enabled=self.json_response,
-                    event_store=self.event_store,  # May be None (no resumability)
-                    security_settings=self.security_settings,
-                    retry_interval=self.retry_interval,
+            http_transport = StreamableHTTPServerTransport(
+                mcp_session_id=uuid4().hex,
+                is_json_response_enabled=self.json_response,
+                event_store=self.event_store,  # May be None (no resumability)
+                security_settings=self.security_settings,
+                retry_interval=self.retry_interval,
+                stream_buffer_size=self.stream_buffer_size,
+                stream_overflow=self.stream_overflow,
+                stream_backlog_size=self.stream_backlog_size,
+                compression_min_size=self.compression_min_size,
+            )
+            session = self._register_session(http_transport)
+            if session is None:
+                response = Response(
+                    "Service Unavailable: Too many active sessions",
+                    status_code=HTTPStatus.SERVICE_UNAVAILABLE,
                 )
+                await response(scope, receive, send)
+                return
 
-                assert http_transport.mcp_session_id is not None
-                self._server_instances[http_transport.mcp_session_id] = http_transport
-                logger.info(f"Created new transport with session ID: {new_session_id}")
-
-                # Define the server runner
-                async def run_server(*, task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED) -> None:
-                    async with http_transport.connect() as streams:
-                        read_stream, write_stream = streams
-                        task_status.started()
-                        try:
-                            await self.app.run(
-                                read_stream,
-                                write_stream,
-                                self.app.create_initialization_options(),
-                                stateless=False,  # Stateful mode
-                            )
-                        except Exception as e:
-                            logger.error(
-                                f"Session {http_transport.mcp_session_id} crashed: {e}",
-                                exc_info=True,
-                            )
-                        finally:
-                            # Only remove from instances if not terminated
-                            if (  # pragma: no branch
-                                http_transport.mcp_session_id
-                                and http_transport.mcp_session_id in self._server_instances
-                                and not http_transport.is_terminated
-                            ):
-                                logger.info(
-                                    "Cleaning up crashed session "
-                                    f"{http_transport.mcp_session_id} from "
-                                    "active instances."
-                                )
-                                del self._server_instances[http_transport.mcp_session_id]
-
-                # Assert task group is not None for type checking
-                assert self._task_group is not None
-                # Start the server task
-                await self._task_group.start(run_server)
+            # Start the server and handle the first request outside any shared lock,
+            # so new sessions are set up concurrently
+            assert self._task_group is not None
+            with session.request():
+                await self._task_group.start(self._run_stateful_server, session)
 
                 # Handle the HTTP request and return the response
                 await http_transport.handle_request(scope, receive, send)
-        else:  # pragma: no cover
-            # Invalid session ID
+        else:
+            # Unknown, terminated or evicted session: the client should start a new one
             response = Response(
-                "Bad Request: No valid session ID provided",
-                status_code=HTTPStatus.BAD_REQUEST,
+                "Not Found: Session has been terminated or does not exist",
+                status_code=HTTPStatus.NOT_FOUND,
             )
             await response(scope, receive, send)
+
+    async def _dispatch(self, message: SessionMessage) -> JSONRPCMessage | None:
+        """Handle one message of a stateless request, see `_handle_stateless_request`."""
+        return await self.app.dispatch(message, self._initialization_options())
+
+    def _initialization_options(self) -> InitializationOptions:
+        """
+        Return the app's initialization options, built once rather than per session.
+
+        Stateless mode starts a session for every request, so rebuilding them each
+        time is a noticeable part of its cost. The options are rebuilt when anything
+        they are built from changes: the server's capabilities follow its request
+        handlers, and its name, version, instructions, website and icons are copied.
+        """
+        app = self.app
+        icons = None if app.icons is None else list(app.icons)
+        key = (frozenset(app.request_handlers), app.name, app.version, app.instructions, app.website_url, icons)
+        if self._init_options is None or key != self._init_options_key:
+            self._init_options = app.create_initialization_options()
+            self._init_options_key = key
+        return self._init_options
+
+    def _register_session(self, http_transport: StreamableHTTPServerTransport) -> _ManagedSession | None:
+        """
+        Make a new session visible to subsequent requests, or return None if the
+        manager is at `max_sessions` and no session can be evicted.
+
+        This is the only step of session creation that must be atomic. It contains no
+        await, so concurrent requests on the event loop cannot interleave with it.
+        """
+        session_id = http_transport.mcp_session_id
+        assert session_id is not None
+        if session_id in self._server_instances:  # pragma: no cover
+            raise RuntimeError(f"Session ID collision: {session_id}")
+
+        if self.max_sessions is not None and len(self._server_instances) >= self.max_sessions:
+            lru = next((s for s in self._server_instances.values() if not s.active_requests), None)
+            if lru is None:
+                logger.warning(f"Refusing new session: all {self.max_sessions} sessions are busy")
+                return None
+            self._evict(lru, "capacity")
+
+        session = _ManagedSession(http_transport)
+        self._server_instances[session_id] = session
+        logger.info(f"Created new transport with session ID: {session_id}")
+        return session
+
+    async def _run_stateful_server(
+        self,
+        session: _ManagedSession,
+        *,
+        task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED,
+    ) -> None:
+        """Run the MCP server for one stateful session until its transport closes."""
+        http_transport = session.transport
+
+        def on_session(server_session: ServerSession) -> None:
+            session.server_session = server_session
+
+        async with http_transport.connect() as streams:
+            read_stream, write_stream = streams
+            task_status.started()
+            try:
+                await self.app.run(
+                    read_stream,
+                    write_stream,
+                    self._initialization_options(),
+                    stateless=False,  # Stateful mode
+                    on_session=on_session,
+                )
+            except Exception as e:
+                logger.error(
+                    f"Session {http_transport.mcp_session_id} crashed: {e}",
+                    exc_info=True,
+                )
+            finally:
+                # The server has stopped, whether the session crashed, was terminated
+                # by the client or was evicted, so later requests get 404
+                session_id = http_transport.mcp_session_id
+                if session_id and self._server_instances.get(session_id) is session:
+                    logger.info(f"Removing session {session_id} from active instances.")
+                    del self._server_instances[session_id]
+
+    def _evict(self, session: _ManagedSession, reason: EvictionReason) -> None:
+        """Forget a session and terminate its transport, which stops its server."""
+        session_id = session.transport.mcp_session_id
+        assert session_id is not None
+        del self._server_instances[session_id]
+        self._evictions[reason] += 1
+        logger.info(f"Evicting session {session_id} ({reason})")
+        assert self._task_group is not None
+        self._task_group.start_soon(session.transport.terminate)
+
+    async def _reap_sessions(self) -> None:
+        """Periodically evict idle sessions and ping the ones with a GET stream open."""
+        intervals = [self.ping_interval]
+        if self.session_idle_timeout is not None:
+            # Checking twice per timeout closes an idle session within 1.5x the timeout
+            intervals.append(self.session_idle_timeout / 2)
+        interval = min(i for i in intervals if i is not None)
+        next_ping = time.monotonic() + self.ping_interval if self.ping_interval is not None else None
+
+        while True:
+            await anyio.sleep(interval)
+            now = time.monotonic()
+
+            if self.session_idle_timeout is not None:
+                for session in list(self._server_instances.values()):
+                    if session.idle_seconds(now) > self.session_idle_timeout:
+                        self._evict(session, "idle")
+
+            if next_ping is not None and now >= next_ping:
+                assert self.ping_interval is not None
+                next_ping = now + self.ping_interval
+                async with anyio.create_task_group() as tg:
+                    for session in list(self._server_instances.values()):
+                        if session.server_session is not None and session.transport.has_standalone_stream:
+                            tg.start_soon(self._ping_session, session)
+
+    async def _ping_session(self, session: _ManagedSession) -> None:
+        assert session.server_session is not None
+        try:
+            with anyio.fail_after(self.ping_timeout):
+                await session.server_session.send_ping()
+        except Exception as e:
+            session_id = session.transport.mcp_session_id
+            if session_id is not None and self._server_instances.get(session_id) is session:
+                logger.info(f"Session {session_id} did not answer ping: {e!r}")
+                self._evict(session, "unresponsive")
+
+    def session_stats(self) -> SessionStats:
+        """
+        Report the stateful sessions currently held and how often sessions were evicted.
+
+        Session sizes are estimated by following the objects each session owns and are
+        meant for spotting growth, not exact accounting. Objects shared between
+        sessions are counted once, for the first session that reaches them.
+        """
+        now = time.monotonic()
+        # Shared configuration is not part of any session
+        seen = {id(self.app), id(self.event_store), id(self.security_settings)}
+        sessions = [
+            SessionInfo(
+                session_id=session_id,
+                idle_seconds=session.idle_seconds(now),
+                active_requests=session.active_requests,
+                approximate_bytes=_approximate_size(session, seen),
+            )
+            for session_id, session in self._server_instances.items()
+        ]
+        return SessionStats(sessions=sessions, evictions=dict(self._evictions))
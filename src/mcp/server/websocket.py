@@ -7,18 +7,19 @@ from pydantic_core import ValidationError
 from starlette.types import Receive, Scope, Send
 from starlette.websockets import WebSocket
 
-import mcp.types as types
+from mcp.shared.codec import MessageCodec, MessageParseError, get_default_codec
 from mcp.shared.message import SessionMessage
 
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager  # pragma: no cover
-async def websocket_server(scope: Scope, receive: Receive, send: Send):
+async def websocket_server(scope: Scope, receive: Receive, send: Send, codec: MessageCodec | None = None):
     """
     WebSocket server transport for MCP. This is an ASGI application, suitable to be
     used with a framework like Starlette and a server like Hypercorn.
     """
+    codec = codec or get_default_codec()
 
     websocket = WebSocket(scope, receive, send)
     await websocket.accept(subprotocol="mcp")
@@ -37,8 +38,8 @@ async def websocket_server(scope: Scope, receive: Receive, send: Send):
             async with read_stream_writer:
                 async for msg in websocket.iter_text():
                     try:
-                        client_message = types.JSONRPCMessage.model_validate_json(msg)
-                    except ValidationError as exc:
+                        client_message = codec.decode(msg)
+                    except (ValidationError, MessageParseError) as exc:
                         await read_stream_writer.send(exc)
                         continue
 
@@ -51,7 +52,7 @@ async def websocket_server(scope: Scope, receive: Receive, send: Send):
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    obj = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                    obj = codec.encode_text(session_message.message)
                     await websocket.send_text(obj)
         except anyio.ClosedResourceError:
             await websocket.close()
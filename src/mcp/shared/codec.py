@@ -0,0 +1,220 @@
+"""
+Wire codec shared by all transports.
+
+Every transport turns JSON-RPC messages into bytes on the way out and bytes back
+into messages on the way in. Doing that through one `MessageCodec` keeps the
+serialization settings (aliases, `exclude_none`) identical across transports and
+lets the JSON backend be swapped in a single place.
+
+The default `PydanticMessageCodec` encodes and decodes with pydantic-core directly.
+`JSONLibraryCodec` plugs in any `dumps`/`loads` pair, and `OrjsonMessageCodec` is a
+ready-made instance of it for the optional `orjson` package:
+
+    from mcp.shared.codec import OrjsonMessageCodec, set_default_codec
+
+    set_default_codec(OrjsonMessageCodec())
+"""
+
+import importlib
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from mcp.types import JSONRPCMessage, JSONRPCResponse
+
+_batch_adapter = TypeAdapter(list[JSONRPCMessage])
+
+
+class EncodedResult(dict[str, Any]):
+    """
+    The result of a response, together with its JSON encoding.
+
+    Codecs write `encoded` into the response as it is instead of serializing the
+    result again, so a result that is sent many times is only encoded once. As a
+    dict it is the dumped result itself, for anything that reads the response
+    without encoding it. It is shared by every response that sends it, so it must
+    not be modified.
+    """
+
+    encoded: bytes
+
+    @classmethod
+    def from_result(cls, result: BaseModel) -> "EncodedResult":
+        encoded_result = cls(result.model_dump(by_alias=True, mode="json", exclude_none=True))
+        encoded_result.encoded = result.__pydantic_serializer__.to_json(result, by_alias=True, exclude_none=True)
+        return encoded_result
+
+
+def _encode_response(message: JSONRPCMessage) -> bytes | None:
+    """Encode a response around its `EncodedResult`, or return None if it has none."""
+    response = message.root
+    if not isinstance(response, JSONRPCResponse) or not isinstance(response.result, EncodedResult):
+        return None
+    if response.model_extra:  # pragma: no cover
+        return None
+    return b'{"jsonrpc":"2.0","id":%s,"result":%s}' % (json.dumps(response.id).encode(), response.result.encoded)
+
+
+class MessageParseError(ValueError):
+    """Raised by `MessageCodec.decode` when the payload is not well-formed JSON."""
+
+
+class MessageCodec(ABC):
+    """
+    Encodes JSON-RPC messages to bytes and decodes bytes back into messages.
+
+    Only the message of a `SessionMessage` goes on the wire; its metadata is
+    transport-local and never serialized.
+    """
+
+    @abstractmethod
+    def encode(self, message: JSONRPCMessage) -> bytes:
+        """Serialize a message to UTF-8 encoded JSON."""
+        ...
+
+    @abstractmethod
+    def decode(self, data: bytes | str) -> JSONRPCMessage:
+        """
+        Parse and validate a single JSON-RPC message.
+
+        Raises:
+            MessageParseError: If the payload is not well-formed JSON.
+            ValidationError: If the payload is JSON but not a valid JSON-RPC message.
+        """
+        ...
+
+    def decode_batch(self, data: bytes | str) -> list[JSONRPCMessage]:
+        """
+        Parse and validate a JSON-RPC batch: a JSON array of messages.
+
+        Raises:
+            MessageParseError: If the payload is not well-formed JSON.
+            ValidationError: If the payload is not an array of valid JSON-RPC messages.
+        """
+        try:
+            raw_messages = json.loads(data)
+        except ValueError as e:
+            raise MessageParseError(str(e)) from e
+        return _batch_adapter.validate_python(raw_messages)
+
+    def encode_text(self, message: JSONRPCMessage) -> str:
+        """Serialize a message to a JSON string, for text-based transports."""
+        return self.encode(message).decode("utf-8")
+
+    def encode_batch(self, messages: Sequence[JSONRPCMessage]) -> bytes:
+        """Serialize messages as a JSON-RPC batch."""
+        return b"[" + b",".join(self.encode(message) for message in messages) + b"]"
+
+
+def is_batch(data: bytes | str) -> bool:
+    """Whether a payload is a JSON array, that is a JSON-RPC batch rather than a single message."""
+    stripped = data.lstrip()
+    return stripped[:1] in (b"[", "[")
+
+
+class PydanticMessageCodec(MessageCodec):
+    """Codec that parses and serializes with pydantic-core, without an intermediate dict."""
+
+    def encode(self, message: JSONRPCMessage) -> bytes:
+        if (encoded := _encode_response(message)) is not None:
+            return encoded
+        return message.__pydantic_serializer__.to_json(message, by_alias=True, exclude_none=True)
+
+    def encode_text(self, message: JSONRPCMessage) -> str:
+        if (encoded := _encode_response(message)) is not None:
+            return encoded.decode("utf-8")
+        return message.model_dump_json(by_alias=True, exclude_none=True)
+
+    def decode(self, data: bytes | str) -> JSONRPCMessage:
+        try:
+            return JSONRPCMessage.model_validate_json(data)
+        except ValidationError as e:
+            _raise_parse_error(e)
+            raise
+
+    def decode_batch(self, data: bytes | str) -> list[JSONRPCMessage]:
+        try:
+            return _batch_adapter.validate_json(data)
+        except ValidationError as e:
+            _raise_parse_error(e)
+            raise
+
+
+def _raise_parse_error(error: ValidationError) -> None:
+    """Re-raise a validation error caused by malformed JSON as a MessageParseError."""
+    if all(detail["type"] == "json_invalid" for detail in error.errors()):
+        raise MessageParseError(error.errors()[0]["msg"]) from error
+
+
+class JSONLibraryCodec(MessageCodec):
+    """
+    Codec backed by a third-party JSON library.
+
+    Messages are dumped to JSON-compatible Python data and handed to `dumps`;
+    incoming payloads go through `loads` and are then validated as a JSONRPCMessage.
+
+    Args:
+        dumps: Serializes Python data to `bytes` or `str`.
+        loads: Parses `bytes` or `str` into Python data, raising `ValueError`
+            (as `json.JSONDecodeError` and most drop-in replacements do) on bad input.
+    """
+
+    def __init__(
+        self,
+        dumps: Callable[[Any], bytes | str],
+        loads: Callable[[bytes | str], Any],
+    ) -> None:
+        self._dumps = dumps
+        self._loads = loads
+
+    def encode(self, message: JSONRPCMessage) -> bytes:
+        if (encoded_response := _encode_response(message)) is not None:
+            return encoded_response
+        encoded = self._dumps(message.model_dump(by_alias=True, mode="json", exclude_none=True))
+        return encoded.encode("utf-8") if isinstance(encoded, str) else encoded
+
+    def decode(self, data: bytes | str) -> JSONRPCMessage:
+        return JSONRPCMessage.model_validate(self._load(data))
+
+    def decode_batch(self, data: bytes | str) -> list[JSONRPCMessage]:
+        return _batch_adapter.validate_python(self._load(data))
+
+    def _load(self, data: bytes | str) -> Any:
+        try:
+            return self._loads(data)
+        except ValueError as e:
+            raise MessageParseError(str(e)) from e
+
+
+class OrjsonMessageCodec(JSONLibraryCodec):
+    """`JSONLibraryCodec` using `orjson`, which must be installed separately."""
+
+    def __init__(self) -> None:
+        try:
+            orjson = importlib.import_module("orjson")
+        except ImportError as e:  # pragma: no cover
+            raise ImportError("OrjsonMessageCodec requires the orjson package: pip install orjson") from e
+
+        super().__init__(dumps=orjson.dumps, loads=orjson.loads)
+
+
+class _Defaults:
+    codec: MessageCodec = PydanticMessageCodec()
+
+
+def get_default_codec() -> MessageCodec:
+    """Return the codec used by transports that are not given one explicitly."""
+    return _Defaults.codec
+
+
+def set_default_codec(codec: MessageCodec) -> None:
+    """
+    Replace the process-wide default codec.
+
+    Transports resolve the default when they are created, so call this before
+    starting any server or client.
+    """
+    _Defaults.codec = codec
@@ -30,3 +30,5 @@ class RequestContext(Generic[SessionT, LifespanContextT, RequestT]):
     request: RequestT | None = None
     close_sse_stream: CloseSSEStreamCallback | None = None
     close_standalone_sse_stream: CloseSSEStreamCallback | None = None
+    # Result of the server's application lifespan, shared by all sessions
+    app_lifespan_context: Any = None
@@ -0,0 +1,120 @@
+"""
+Cached JSON Schema validators for tool input and output validation.
+
+`jsonschema.validate` checks the schema against its metaschema and builds a new
+validator on every call, which for large tool schemas can cost more than the tool
+itself. `ToolSchemaValidators` does that work once per tool and schema and keeps
+the compiled validator in a bounded LRU cache.
+
+Entries are keyed by tool name and a fingerprint of the schema's content, so a
+tool whose schema changes gets a fresh validator, while re-listing an unchanged
+catalog reuses the existing ones.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, cast
+
+from jsonschema import ValidationError, exceptions, validators
+from jsonschema.protocols import Validator
+
+DEFAULT_MAX_VALIDATORS = 1024
+
+
+def schema_fingerprint(schema: dict[str, Any]) -> str:
+    """Return a stable digest of a schema's content, independent of key order."""
+    encoded = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _Entry:
+    schema: dict[str, Any]
+    fingerprint: str
+    validator: Validator
+
+
+class ToolSchemaValidators:
+    """
+    LRU cache of compiled JSON Schema validators, keyed by tool name.
+
+    Validators are built with the draft the schema declares in `$schema`, falling
+    back to Draft 2020-12, exactly as `jsonschema.validate` would pick it.
+
+    Args:
+        maxsize: Maximum number of validators kept. The least recently used one is
+            dropped when the cache is full.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAX_VALIDATORS) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, tool_name: str, schema: dict[str, Any]) -> Validator:
+        """
+        Return the validator for a tool's schema, compiling it on first use.
+
+        Raises:
+            jsonschema.SchemaError: If the schema itself is invalid.
+        """
+        entry = self._entries.get(tool_name)
+        if entry is not None:
+            # The same schema object is the common case: it comes from the cached Tool.
+            # Holding a reference to it in the entry keeps its id from being reused.
+            if entry.schema is schema:
+                self._entries.move_to_end(tool_name)
+                return entry.validator
+
+            fingerprint = schema_fingerprint(schema)
+            if entry.fingerprint == fingerprint:
+                entry.schema = schema
+                self._entries.move_to_end(tool_name)
+                return entry.validator
+        else:
+            fingerprint = schema_fingerprint(schema)
+
+        cls = validators.validator_for(schema)
+        cls.check_schema(schema)
+        validator = cls(schema)
+
+        self._entries[tool_name] = _Entry(schema=schema, fingerprint=fingerprint, validator=validator)
+        self._entries.move_to_end(tool_name)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return validator
+
+    def validate(self, tool_name: str, schema: dict[str, Any], instance: Any) -> None:
+        """
+        Validate `instance` against a tool's schema.
+
+        Raises the same errors as `jsonschema.validate`, reporting the best-matching
+        error when there are several.
+
+        Raises:
+            jsonschema.ValidationError: If the instance does not match the schema.
+            jsonschema.SchemaError: If the schema itself is invalid.
+        """
+        errors = self.get(tool_name, schema).iter_errors(instance)
+        error = cast(ValidationError | None, exceptions.best_match(errors))  # pyright: ignore[reportUnknownMemberType]
+        if error is not None:
+            raise error
+
+    def retain(self, tool_names: Iterable[str]) -> None:
+        """Drop the validators of every tool not in `tool_names`, e.g. after the tool list changes."""
+        keep = set(tool_names)
+        for tool_name in [name for name in self._entries if name not in keep]:
+            del self._entries[tool_name]
+
+    def clear(self) -> None:
+        """Drop every cached validator."""
+        self._entries.clear()
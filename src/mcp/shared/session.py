@@ -11,6 +11,7 @@ from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStre
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from mcp.shared.codec import EncodedResult
 from mcp.shared.exceptions import McpError
 from mcp.shared.message import MessageMetadata, ServerMessageMetadata, SessionMessage
 from mcp.shared.response_router import ResponseRouter
@@ -44,6 +45,19 @@ ReceiveNotificationT = TypeVar("ReceiveNotificationT", ClientNotification, Serve
 RequestId = str | int
 
 
+def _envelope_payload(message: JSONRPCRequest | JSONRPCNotification) -> dict[str, Any]:
+    """
+    Shallow view of an inbound request or notification to validate into the typed
+    receive model.
+
+    The transport has already decoded the wire bytes and `params` holds plain JSON
+    data, so the typed model can be validated straight from it. This matches what
+    `model_dump(by_alias=True, mode="json", exclude_none=True)` used to produce
+    without walking and copying the whole payload first.
+    """
+    return {key: value for key, value in message if value is not None}
+
+
 class ProgressFnT(Protocol):
     """Protocol for progress notification callbacks."""
 
@@ -116,9 +130,11 @@ class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
                 raise RuntimeError("No active cancel scope")
             self._cancel_scope.__exit__(exc_type, exc_val, exc_tb)
 
-    async def respond(self, response: SendResultT | ErrorData) -> None:
+    async def respond(self, response: SendResultT | EncodedResult | ErrorData) -> None:
         """Send a response for this request.
 
+        The response may be an `EncodedResult`, to send a result that is already encoded.
+
         Must be called within a context manager block.
         Raises:
             RuntimeError: If not used within a context manager
@@ -131,9 +147,14 @@ class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
         if not self.cancelled:  # pragma: no branch
             self._completed = True
 
-            await self._session._send_response(  # type: ignore[reportPrivateUsage]
-                request_id=self.request_id, response=response
-            )
+            if isinstance(response, EncodedResult):
+                await self._session._send_encoded_response(  # type: ignore[reportPrivateUsage]
+                    request_id=self.request_id, result=response
+                )
+            else:
+                await self._session._send_response(  # type: ignore[reportPrivateUsage]
+                    request_id=self.request_id, response=response
+                )
 
     async def cancel(self) -> None:
         """Cancel this request and mark it as completed."""
@@ -348,6 +369,12 @@ class BaseSession(
             session_message = SessionMessage(message=JSONRPCMessage(jsonrpc_response))
             await self._write_stream.send(session_message)
 
+    async def _send_encoded_response(self, request_id: RequestId, result: EncodedResult) -> None:
+        """Send a result that is already encoded."""
+        # Constructed without validation, which would copy the result into a plain dict
+        jsonrpc_response = JSONRPCResponse.model_construct(jsonrpc="2.0", id=request_id, result=result)
+        await self._write_stream.send(SessionMessage(message=JSONRPCMessage(jsonrpc_response)))
+
     async def _receive_loop(self) -> None:
         async with (
             self._read_stream,
@@ -357,82 +384,8 @@ class BaseSession(
                 async for message in self._read_stream:
                     if isinstance(message, Exception):  # pragma: no cover
                         await self._handle_incoming(message)
-                    elif isinstance(message.message.root, JSONRPCRequest):
-                        try:
-                            validated_request = self._receive_request_type.model_validate(
-                                message.message.root.model_dump(by_alias=True, mode="json", exclude_none=True)
-                            )
-                            responder = RequestResponder(
-                                request_id=message.message.root.id,
-                                request_meta=validated_request.root.params.meta
-                                if validated_request.root.params
-                                else None,
-                                request=validated_request,
-                                session=self,
-                                on_complete=lambda r: self._in_flight.pop(r.request_id, None),
-                                message_metadata=message.metadata,
-                            )
-                            self._in_flight[responder.request_id] = responder
-                            await self._received_request(responder)
-
-                            if not responder._completed:  # type: ignore[reportPrivateUsage]
-                                await self._handle_incoming(responder)
-                        except Exception as e:
-                            # For request validation errors, send a proper JSON-RPC error
-                            # response instead of crashing the server
-                            logging.warning(f"Failed to validate request: {e}")
-                            logging.debug(f"Message that failed validation: {message.message.root}")
-                            error_response = JSONRPCError(
-                                jsonrpc="2.0",
-                                id=message.message.root.id,
-                                error=ErrorData(
-                                    code=INVALID_PARAMS,
-                                    message="Invalid request parameters",
-                                    data="",
-                                ),
-                            )
-                            session_message = SessionMessage(message=JSONRPCMessage(error_response))
-                            await self._write_stream.send(session_message)
-
-                    elif isinstance(message.message.root, JSONRPCNotification):
-                        try:
-                            notification = self._receive_notification_type.model_validate(
-                                message.message.root.model_dump(by_alias=True, mode="json", exclude_none=True)
-                            )
-                            # Handle cancellation notifications
-                            if isinstance(notification.root, CancelledNotification):
-                                cancelled_id = notification.root.params.requestId
-                                if cancelled_id in self._in_flight:  # pragma: no branch
-                                    await self._in_flight[cancelled_id].cancel()
-                            else:
-                                # Handle progress notifications callback
-                                if isinstance(notification.root, ProgressNotification):  # pragma: no cover
-                                    progress_token = notification.root.params.progressToken
-                                    # If there is a progress callback for this token,
-                                    # call it with the progress information
-                                    if progress_token in self._progress_callbacks:
-                                        callback = self._progress_callbacks[progress_token]
-                                        try:
-                                            await callback(
-                                                notification.root.params.progress,
-                                                notification.root.params.total,
-                                                notification.root.params.message,
-                                            )
-                                        except Exception as e:
-                                            logging.error(
-                                                "Progress callback raised an exception: %s",
-                                                e,
-                                            )
-                                await self._received_notification(notification)
-                                await self._handle_incoming(notification)
-                        except Exception as e:  # pragma: no cover
-                            # For other validation errors, log and continue
-                            logging.warning(
-                                f"Failed to validate notification: {e}. Message was: {message.message.root}"
-                            )
-                    else:  # Response or error
-                        await self._handle_response(message)
-
+                    else:
+                        await self._receive_message(message)
             except anyio.ClosedResourceError:
                 # This is expected when the client disconnects abruptly.
                 # Without this handler, the exception would propagate up and
@@ -455,6 +408,76 @@ class BaseSession(
                         pass
                 self._response_streams.clear()
 
+    async def _receive_message(self, message: SessionMessage) -> None:
+        """Validate a message read from the stream and pass it on to be handled."""
+        if isinstance(message.message.root, JSONRPCRequest):
+            try:
+                validated_request = self._receive_request_type.model_validate(_envelope_payload(message.message.root))
+                responder = RequestResponder(
+                    request_id=message.message.root.id,
+                    request_meta=validated_request.root.params.meta if validated_request.root.params else None,
+                    request=validated_request,
+                    session=self,
+                    on_complete=lambda r: self._in_flight.pop(r.request_id, None),
+                    message_metadata=message.metadata,
+                )
+                self._in_flight[responder.request_id] = responder
+                await self._received_request(responder)
+
+                if not responder._completed:  # type: ignore[reportPrivateUsage]
+                    await self._handle_incoming(responder)
+            except Exception as e:
+                # For request validation errors, send a proper JSON-RPC error
+                # response instead of crashing the server
+                logging.warning(f"Failed to validate request: {e}")
+                logging.debug(f"Message that failed validation: {message.message.root}")
+                error_response = JSONRPCError(
+                    jsonrpc="2.0",
+                    id=message.message.root.id,
+                    error=ErrorData(
+                        code=INVALID_PARAMS,
+                        message="Invalid request parameters",
+                        data="",
+                    ),
+                )
+                session_message = SessionMessage(message=JSONRPCMessage(error_response))
+                await self._write_stream.send(session_message)
+
+        elif isinstance(message.message.root, JSONRPCNotification):
+            try:
+                notification = self._receive_notification_type.model_validate(_envelope_payload(message.message.root))
+                # Handle cancellation notifications
+                if isinstance(notification.root, CancelledNotification):
+                    cancelled_id = notification.root.params.requestId
+                    if cancelled_id in self._in_flight:  # pragma: no branch
+                        await self._in_flight[cancelled_id].cancel()
+                else:
+                    # Handle progress notifications callback
+                    if isinstance(notification.root, ProgressNotification):  # pragma: no cover
+                        progress_token = notification.root.params.progressToken
+                        # If there is a progress callback for this token,
+                        # call it with the progress information
+                        if progress_token in self._progress_callbacks:
+                            callback = self._progress_callbacks[progress_token]
+                            try:
+                                await callback(
+                                    notification.root.params.progress,
+                                    notification.root.params.total,
+                                    notification.root.params.message,
+                                )
+                            except Exception as e:
+                                logging.error(
+                                    "Progress callback raised an exception: %s",
+                                    e,
+                                )
+                    await self._received_notification(notification)
+                    await self._handle_incoming(notification)
+            except Exception as e:  # pragma: no cover
+                # For other validation errors, log and continue
+                logging.warning(f"Failed to validate notification: {e}. Message was: {message.message.root}")
+        else:  # Response or error
+            await self._handle_response(message)
+
     async def _handle_response(self, message: SessionMessage) -> None:
         """
         Handle an incoming response or error message.
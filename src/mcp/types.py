@@ -1,8 +1,8 @@
 from collections.abc import Callable
 from datetime import datetime
-from typing import Annotated, Any, Final, Generic, Literal, TypeAlias, TypeVar
+from typing import Annotated, Any, Final, Generic, Literal, TypeAlias, TypeVar, cast
 
-from pydantic import BaseModel, ConfigDict, Field, FileUrl, RootModel
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, FileUrl, RootModel, Tag
 from pydantic.networks import AnyUrl, UrlConstraints
 from typing_extensions import deprecated
 
@@ -238,8 +238,47 @@ class JSONRPCError(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
-class JSONRPCMessage(RootModel[JSONRPCRequest | JSONRPCNotification | JSONRPCResponse | JSONRPCError]):
-    pass
+def _jsonrpc_message_kind(value: Any) -> str | None:
+    """
+    Resolve which JSON-RPC envelope a raw message or model instance is, so that
+    JSONRPCMessage validates against exactly one union member instead of trying
+    each of them in turn.
+
+    The keys checked mirror what the left-to-right union used to accept: a
+    `method` with a non-null `id` is a request, a `method` without one is a
+    notification, and otherwise `result` wins over `error`.
+    """
+    if isinstance(value, dict):
+        data = cast(dict[str, Any], value)
+        if "method" in data:
+            return "request" if data.get("id") is not None else "notification"
+        if "result" in data:
+            return "response"
+        if "error" in data:
+            return "error"
+        return None
+    if isinstance(value, JSONRPCRequest):
+        return "request"
+    if isinstance(value, JSONRPCNotification):
+        return "notification"
+    if isinstance(value, JSONRPCResponse):
+        return "response"
+    if isinstance(value, JSONRPCError):
+        return "error"
+    return None
+
+
+JSONRPCMessageType: TypeAlias = Annotated[
+    Annotated[JSONRPCRequest, Tag("request")]
+    | Annotated[JSONRPCNotification, Tag("notification")]
+    | Annotated[JSONRPCResponse, Tag("response")]
+    | Annotated[JSONRPCError, Tag("error")],
+    Discriminator(_jsonrpc_message_kind),
+]
+
+
+class JSONRPCMessage(RootModel[JSONRPCMessageType]):
+    root: JSONRPCMessageType
 
 
 class EmptyResult(Result):
@@ -1829,8 +1868,8 @@ ClientRequestType: TypeAlias = (
 )
 
 
-class ClientRequest(RootModel[ClientRequestType]):
-    pass
+class ClientRequest(RootModel[Annotated[ClientRequestType, Field(discriminator="method")]]):
+    root: Annotated[ClientRequestType, Field(discriminator="method")]
 
 
 ClientNotificationType: TypeAlias = (
@@ -1842,8 +1881,8 @@ ClientNotificationType: TypeAlias = (
 )
 
 
-class ClientNotification(RootModel[ClientNotificationType]):
-    pass
+class ClientNotification(RootModel[Annotated[ClientNotificationType, Field(discriminator="method")]]):
+    root: Annotated[ClientNotificationType, Field(discriminator="method")]
 
 
 # Type for elicitation schema - a JSON Schema dict
@@ -1972,8 +2011,8 @@ ServerRequestType: TypeAlias = (
 )
 
 
-class ServerRequest(RootModel[ServerRequestType]):
-    pass
+class ServerRequest(RootModel[Annotated[ServerRequestType, Field(discriminator="method")]]):
+    root: Annotated[ServerRequestType, Field(discriminator="method")]
 
 
 ServerNotificationType: TypeAlias = (
@@ -1989,8 +2028,8 @@ ServerNotificationType: TypeAlias = (
 )
 
 
-class ServerNotification(RootModel[ServerNotificationType]):
-    pass
+class ServerNotification(RootModel[Annotated[ServerNotificationType, Field(discriminator="method")]]):
+    root: Annotated[ServerNotificationType, Field(discriminator="method")]
 
 
 ServerResultType: TypeAlias = (
@@ -0,0 +1,219 @@
+"""Tests for renewing OAuth tokens in the background."""
+
+import time
+import urllib.parse
+
+import anyio
+import httpx
+import pytest
+from pydantic import AnyHttpUrl, AnyUrl
+
+from mcp.client.auth import OAuthClientProvider
+from mcp.client.auth.extensions.client_credentials import ClientCredentialsOAuthProvider, PrivateKeyJWTOAuthProvider
+from mcp.shared.auth import OAuthClientInformationFull, OAuthClientMetadata, OAuthMetadata, OAuthToken
+
+
+class MockTokenStorage:
+    def __init__(self):
+        self.tokens: OAuthToken | None = None
+        self.client_info: OAuthClientInformationFull | None = None
+
+    async def get_tokens(self) -> OAuthToken | None:
+        return self.tokens
+
+    async def set_tokens(self, tokens: OAuthToken) -> None:
+        self.tokens = tokens
+
+    async def get_client_info(self) -> OAuthClientInformationFull | None:
+        return self.client_info
+
+    async def set_client_info(self, client_info: OAuthClientInformationFull) -> None:
+        pass  # pragma: no cover
+
+
+class TokenEndpoint:
+    """Stand-in token endpoint, answering with the given statuses in turn, then 200."""
+
+    def __init__(self, *statuses: int):
+        self.statuses = list(statuses)
+        self.requests: list[dict[str, str]] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(dict(urllib.parse.parse_qsl(request.content.decode())))
+        if self.statuses:
+            return httpx.Response(self.statuses.pop(0), json={"error": "temporarily_unavailable"})
+        return httpx.Response(
+            200,
+            json={"access_token": f"access_token_{len(self.requests)}", "token_type": "Bearer", "expires_in": 3600},
+        )
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+
+def set_tokens(provider: OAuthClientProvider, expires_in: int, remaining: float, refresh_token: str | None = None):
+    provider.context.current_tokens = OAuthToken(
+        access_token="access_token_0", expires_in=expires_in, refresh_token=refresh_token
+    )
+    provider.context.token_expiry_time = time.time() + remaining
+    provider._initialized = True
+
+
+async def wait_for_token(provider: OAuthClientProvider, access_token: str) -> None:
+    with anyio.fail_after(5):
+        while provider.context.current_tokens is None or provider.context.current_tokens.access_token != access_token:
+            await anyio.sleep(0.01)
+
+
+@pytest.fixture
+def oauth_provider():
+    provider = OAuthClientProvider(
+        server_url="https://api.example.com/mcp",
+        client_metadata=OAuthClientMetadata(redirect_uris=[AnyUrl("http://localhost:3030/callback")]),
+        storage=MockTokenStorage(),
+    )
+    provider.context.client_info = OAuthClientInformationFull(
+        client_id="test_client_id", redirect_uris=[AnyUrl("http://localhost:3030/callback")]
+    )
+    return provider
+
+
+def test_refresh_delay(oauth_provider: OAuthClientProvider):
+    set_tokens(oauth_provider, expires_in=100, remaining=100, refresh_token="refresh_token")
+    delay = oauth_provider._background_refresh_delay(0.8, 0, retry=False)
+    assert delay is not None and 79 < delay <= 80
+    delays = [oauth_provider._background_refresh_delay(0.8, 0.5, retry=False) for _ in range(20)]
+    assert all(delay is not None and 39 < delay <= 80 for delay in delays)
+    assert oauth_provider._background_refresh_delay(0.8, 0, retry=True) == 10
+
+    # Tokens past their renewal time are renewed right away
+    set_tokens(oauth_provider, expires_in=100, remaining=10)
+    assert oauth_provider._background_refresh_delay(0.8, 0, retry=False) == 0
+    delay = oauth_provider._background_refresh_delay(0.8, 0, retry=True)
+    assert delay is not None and 4 < delay <= 5
+
+    oauth_provider.context.current_tokens = OAuthToken(access_token="access_token_0")
+    assert oauth_provider._background_refresh_delay(0.8, 0, retry=False) is None
+
+
+@pytest.mark.anyio
+async def test_tokens_are_refreshed_before_they_expire(oauth_provider: OAuthClientProvider):
+    endpoint = TokenEndpoint()
+    set_tokens(oauth_provider, expires_in=3600, remaining=60, refresh_token="refresh_token")
+
+    async with endpoint.client() as client, oauth_provider.refresh_in_background(client):
+        await wait_for_token(oauth_provider, "access_token_1")
+
+        # A request made now uses the new token without waiting on a refresh
+        auth_flow = oauth_provider.async_auth_flow(httpx.Request("GET", "https://api.example.com/mcp"))
+        request = await auth_flow.__anext__()
+        assert request.headers["Authorization"] == "Bearer access_token_1"
+
+    assert endpoint.requests == [
+        {"grant_type": "refresh_token", "refresh_token": "refresh_token", "client_id": "test_client_id"}
+    ]
+    tokens = oauth_provider.context.current_tokens
+    assert tokens is not None
+    # The refresh token was not sent again, so it is kept
+    assert tokens.refresh_token == "refresh_token"
+    assert oauth_provider.context.token_expiry_time is not None
+    assert oauth_provider.context.token_expiry_time > time.time() + 3500
+    assert oauth_provider.context.storage.tokens == tokens  # type: ignore[attr-defined]
+
+
+@pytest.mark.anyio
+async def test_stored_tokens_are_refreshed_after_a_restart():
+    endpoint = TokenEndpoint()
+    storage = MockTokenStorage()
+    storage.tokens = OAuthToken(access_token="access_token_0", expires_in=1, refresh_token="refresh_token")
+    storage.client_info = OAuthClientInformationFull(
+        client_id="test_client_id", redirect_uris=[AnyUrl("http://localhost:3030/callback")]
+    )
+    # A new provider only has the tokens its storage kept
+    provider = OAuthClientProvider(
+        server_url="https://api.example.com/mcp",
+        client_metadata=OAuthClientMetadata(redirect_uris=[AnyUrl("http://localhost:3030/callback")]),
+        storage=storage,
+    )
+
+    async with endpoint.client() as client, provider.refresh_in_background(client):
+        await wait_for_token(provider, "access_token_1")
+
+    assert endpoint.requests[0]["grant_type"] == "refresh_token"
+
+
+@pytest.mark.anyio
+async def test_failed_refresh_keeps_tokens_and_retries(
+    oauth_provider: OAuthClientProvider, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr("mcp.client.auth.oauth2.BACKGROUND_REFRESH_RETRY_INTERVAL", 0.01)
+    endpoint = TokenEndpoint(503)
+    set_tokens(oauth_provider, expires_in=3600, remaining=60, refresh_token="refresh_token")
+
+    async with endpoint.client() as client, oauth_provider.refresh_in_background(client):
+        with anyio.fail_after(5):
+            while not endpoint.requests:
+                await anyio.sleep(0.01)
+        # The current tokens are still valid, and still used
+        assert oauth_provider.context.current_tokens is not None
+        assert oauth_provider.context.current_tokens.access_token == "access_token_0"
+
+        await wait_for_token(oauth_provider, "access_token_2")
+
+
+@pytest.mark.anyio
+async def test_client_credentials_are_renewed_in_background():
+    endpoint = TokenEndpoint()
+    provider = ClientCredentialsOAuthProvider(
+        server_url="https://api.example.com/mcp",
+        storage=MockTokenStorage(),
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        token_endpoint_auth_method="client_secret_post",
+    )
+    provider.context.client_info = provider._fixed_client_info
+    set_tokens(provider, expires_in=3600, remaining=60)
+
+    async with endpoint.client() as client, provider.refresh_in_background(client):
+        await wait_for_token(provider, "access_token_1")
+
+    assert endpoint.requests == [
+        {"grant_type": "client_credentials", "client_secret": "test_client_secret"},
+    ]
+
+
+@pytest.mark.anyio
+async def test_private_key_jwt_assertions_are_made_in_background():
+    endpoint = TokenEndpoint()
+    audiences: list[str] = []
+
+    async def assertion_provider(audience: str) -> str:
+        audiences.append(audience)
+        return f"assertion_{len(audiences)}"
+
+    provider = PrivateKeyJWTOAuthProvider(
+        server_url="https://api.example.com/mcp",
+        storage=MockTokenStorage(),
+        client_id="test_client_id",
+        assertion_provider=assertion_provider,
+    )
+    provider.context.client_info = provider._fixed_client_info
+    provider.context.oauth_metadata = OAuthMetadata(
+        issuer=AnyHttpUrl("https://auth.example.com"),
+        authorization_endpoint=AnyHttpUrl("https://auth.example.com/authorize"),
+        token_endpoint=AnyHttpUrl("https://auth.example.com/token"),
+    )
+    set_tokens(provider, expires_in=3600, remaining=60)
+
+    async with endpoint.client() as client, provider.refresh_in_background(client):
+        await wait_for_token(provider, "access_token_1")
+
+    assert audiences == ["https://auth.example.com/"]
+    assert endpoint.requests[0]["client_assertion"] == "assertion_1"
+
+
+@pytest.mark.anyio
+async def test_refresh_in_background_rejects_invalid_fraction(oauth_provider: OAuthClientProvider):
+    with pytest.raises(ValueError):
+        async with oauth_provider.refresh_in_background(fraction=0):
+            pass  # pragma: no cover
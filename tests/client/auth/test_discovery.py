@@ -0,0 +1,217 @@
+"""Tests for caching and storing discovered OAuth metadata."""
+
+import time
+from collections.abc import AsyncGenerator
+
+import httpx
+import pytest
+
+from mcp.client.auth import DiscoveredMetadata, DiscoveryCache, OAuthTokenError
+from mcp.client.auth.extensions.client_credentials import ClientCredentialsOAuthProvider
+from mcp.client.auth.utils import get_cache_lifetime
+from mcp.shared.auth import OAuthClientInformationFull, OAuthToken
+
+SERVER_URL = "https://api.example.com/mcp"
+PRM_URL = "https://api.example.com/.well-known/oauth-protected-resource/mcp"
+ASM_URL = "https://auth.example.com/.well-known/oauth-authorization-server"
+
+
+class MockTokenStorage:
+    def __init__(self):
+        self._tokens: OAuthToken | None = None
+
+    async def get_tokens(self) -> OAuthToken | None:
+        return self._tokens
+
+    async def set_tokens(self, tokens: OAuthToken) -> None:
+        self._tokens = tokens
+
+    async def get_client_info(self) -> OAuthClientInformationFull | None:
+        return None  # pragma: no cover
+
+    async def set_client_info(self, client_info: OAuthClientInformationFull) -> None:
+        pass  # pragma: no cover
+
+
+class MockDiscoveryStorage(MockTokenStorage):
+    def __init__(self, discovered: dict[str, DiscoveredMetadata]):
+        super().__init__()
+        self.discovered = discovered
+
+    async def get_discovery_metadata(self, server_url: str) -> DiscoveredMetadata | None:
+        return self.discovered.get(server_url)
+
+    async def set_discovery_metadata(self, server_url: str, metadata: DiscoveredMetadata) -> None:
+        self.discovered[server_url] = metadata
+
+
+def make_provider(
+    storage: MockTokenStorage | None = None, discovery_cache: DiscoveryCache | None = None
+) -> ClientCredentialsOAuthProvider:
+    return ClientCredentialsOAuthProvider(
+        server_url=SERVER_URL,
+        storage=storage or MockTokenStorage(),
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        discovery_cache=discovery_cache,
+    )
+
+
+async def authorize(
+    provider: ClientCredentialsOAuthProvider, cache_control: str | None = None, token_status: int = 200
+) -> list[str]:
+    """Run the auth flow of one request that is rejected once, returning the URLs requested."""
+    headers = {"Cache-Control": cache_control} if cache_control else {}
+    responses = {
+        PRM_URL: httpx.Response(
+            200,
+            headers=headers,
+            json={"resource": SERVER_URL, "authorization_servers": ["https://auth.example.com"]},
+        ),
+        ASM_URL: httpx.Response(
+            200,
+            headers=headers,
+            json={
+                "issuer": "https://auth.example.com",
+                "authorization_endpoint": "https://auth.example.com/authorize",
+                "token_endpoint": "https://auth.example.com/token",
+            },
+        ),
+        "https://auth.example.com/token": httpx.Response(
+            token_status, json={"access_token": "test_access_token", "token_type": "Bearer", "expires_in": 3600}
+        ),
+    }
+    requested: list[str] = []
+    auth_flow = provider.async_auth_flow(httpx.Request("POST", SERVER_URL))
+    request = await auth_flow.__anext__()
+    response = httpx.Response(401, request=request)
+    while True:
+        requested.append(str(request.url))
+        try:
+            request = await auth_flow.asend(response)
+        except StopAsyncIteration:
+            return requested
+        response = responses.get(str(request.url), httpx.Response(200))
+        response.request = request
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({}, 60.0),
+        ({"Cache-Control": "public, max-age=600"}, 600.0),
+        ({"Cache-Control": "max-age=600", "Age": "100"}, 500.0),
+        ({"Cache-Control": "max-age=600", "Age": "900"}, 0.0),
+        ({"Cache-Control": 'max-age="30"'}, 30.0),
+        ({"Cache-Control": "max-age=soon"}, 0.0),
+        ({"Cache-Control": "No-Store"}, 0.0),
+        ({"Cache-Control": "max-age=600, no-cache"}, 0.0),
+        ({"Cache-Control": "public"}, 60.0),
+    ],
+)
+def test_get_cache_lifetime(headers: dict[str, str], expected: float):
+    assert get_cache_lifetime(httpx.Response(200, headers=headers), default=60.0) == expected
+
+
+def test_cache_drops_expired_metadata():
+    cache = DiscoveryCache(max_entries=2)
+    cache.set("https://a.example.com", DiscoveredMetadata(expires_at=time.time() + 60))
+    cache.set("https://b.example.com", DiscoveredMetadata(expires_at=time.time() - 1))
+    assert cache.get("https://a.example.com") is not None
+    assert cache.get("https://b.example.com") is None
+
+    cache.set("https://b.example.com", DiscoveredMetadata(expires_at=time.time() + 60))
+    cache.set("https://c.example.com", DiscoveredMetadata(expires_at=time.time() + 60))
+    assert cache.get("https://a.example.com") is None
+
+    cache.invalidate("https://b.example.com")
+    assert cache.get("https://b.example.com") is None
+    cache.invalidate()
+    assert cache.get("https://c.example.com") is None
+
+
+@pytest.mark.anyio
+async def test_providers_sharing_a_cache_discover_once():
+    cache = DiscoveryCache()
+
+    first = await authorize(make_provider(discovery_cache=cache), cache_control="max-age=600")
+    assert first == [SERVER_URL, PRM_URL, ASM_URL, "https://auth.example.com/token", SERVER_URL]
+
+    metadata = cache.get(SERVER_URL)
+    assert metadata is not None
+    assert metadata.resource_metadata_url == PRM_URL
+    assert time.time() + 590 < metadata.expires_at <= time.time() + 600
+
+    # Another provider for the same server goes straight to the token endpoint
+    second = await authorize(make_provider(discovery_cache=cache))
+    assert second == [SERVER_URL, "https://auth.example.com/token", SERVER_URL]
+
+
+@pytest.mark.anyio
+async def test_uncacheable_metadata_is_discovered_again():
+    cache = DiscoveryCache()
+
+    await authorize(make_provider(discovery_cache=cache), cache_control="no-store")
+    assert cache.get(SERVER_URL) is None
+
+    requested = await authorize(make_provider(discovery_cache=cache))
+    assert requested == [SERVER_URL, PRM_URL, ASM_URL, "https://auth.example.com/token", SERVER_URL]
+
+
+@pytest.mark.anyio
+async def test_discovered_metadata_is_persisted_through_storage():
+    discovered: dict[str, DiscoveredMetadata] = {}
+
+    await authorize(make_provider(MockDiscoveryStorage(discovered)))
+    assert discovered[SERVER_URL].oauth_metadata is not None
+
+    # A provider started later, e.g. after a restart, reuses the stored metadata
+    provider = make_provider(MockDiscoveryStorage(discovered))
+    requested = await authorize(provider)
+    assert requested == [SERVER_URL, "https://auth.example.com/token", SERVER_URL]
+    assert provider.context.auth_server_url == "https://auth.example.com/"
+
+    # Stale metadata is discovered again
+    discovered[SERVER_URL] = discovered[SERVER_URL].model_copy(update={"expires_at": time.time() - 1})
+    requested = await authorize(make_provider(MockDiscoveryStorage(discovered)))
+    assert requested == [SERVER_URL, PRM_URL, ASM_URL, "https://auth.example.com/token", SERVER_URL]
+
+
+@pytest.mark.anyio
+async def test_cached_metadata_is_bypassed_once_after_a_failed_authorization():
+    cache = DiscoveryCache()
+    await authorize(make_provider(discovery_cache=cache))
+
+    # The cached metadata leads to a token exchange that fails, e.g. after the server moved
+    provider = make_provider(discovery_cache=cache)
+    with pytest.raises(OAuthTokenError):
+        await authorize(provider, token_status=400)
+
+    # The next attempt discovers the metadata afresh, and later ones use the cache again
+    requested = await authorize(provider)
+    assert requested == [SERVER_URL, PRM_URL, ASM_URL, "https://auth.example.com/token", SERVER_URL]
+    requested = await authorize(make_provider(discovery_cache=cache))
+    assert requested == [SERVER_URL, "https://auth.example.com/token", SERVER_URL]
+
+
+@pytest.mark.anyio
+async def test_discovery_is_closed_with_the_auth_flow(monkeypatch: pytest.MonkeyPatch):
+    provider = make_provider()
+    discoveries: list[AsyncGenerator[httpx.Request, httpx.Response]] = []
+    discover_metadata = provider._discover_metadata  # pyright: ignore[reportPrivateUsage]
+
+    def record_discovery(url: str | None) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        discoveries.append(discover_metadata(url))
+        return discoveries[-1]
+
+    monkeypatch.setattr(provider, "_discover_metadata", record_discovery)
+    auth_flow = provider.async_auth_flow(httpx.Request("POST", SERVER_URL))
+    request = await auth_flow.__anext__()
+    request = await auth_flow.asend(httpx.Response(401, request=request))
+    assert str(request.url) == PRM_URL
+
+    # Closing the flow halfway through discovery closes discovery too
+    await auth_flow.aclose()
+    with pytest.raises(StopAsyncIteration):
+        await discoveries[0].__anext__()
+    assert not provider.context.lock.locked()
@@ -7,6 +7,7 @@ import time
 from unittest import mock
 from urllib.parse import unquote
 
+import anyio
 import httpx
 import pytest
 from inline_snapshot import Is, snapshot
@@ -1173,6 +1174,90 @@ class TestAuthFlow:
         except StopAsyncIteration:
             pass  # Expected
 
+    @pytest.mark.anyio
+    async def test_requests_with_valid_tokens_run_concurrently(
+        self, oauth_provider: OAuthClientProvider, valid_tokens: OAuthToken
+    ):
+        """Test that a request in flight does not hold up other requests."""
+        oauth_provider.context.current_tokens = valid_tokens
+        oauth_provider.context.token_expiry_time = time.time() + 1800
+        oauth_provider._initialized = True
+
+        first_flow = oauth_provider.async_auth_flow(httpx.Request("GET", "https://api.example.com/mcp"))
+        second_flow = oauth_provider.async_auth_flow(httpx.Request("POST", "https://api.example.com/mcp"))
+
+        with anyio.fail_after(5):
+            first_request = await first_flow.__anext__()
+            # The first request has not been answered yet, e.g. a long-lived SSE stream
+            second_request = await second_flow.__anext__()
+        assert first_request.headers["Authorization"] == "Bearer test_access_token"
+        assert second_request.headers["Authorization"] == "Bearer test_access_token"
+
+        for flow, request in [(second_flow, second_request), (first_flow, first_request)]:
+            with pytest.raises(StopAsyncIteration):
+                await flow.asend(httpx.Response(200, request=request))
+
+    @pytest.mark.anyio
+    async def test_concurrent_requests_share_one_token_refresh(
+        self, oauth_provider: OAuthClientProvider, valid_tokens: OAuthToken
+    ):
+        """Test that requests finding an expired token wait for a single refresh."""
+        oauth_provider.context.current_tokens = valid_tokens
+        oauth_provider.context.token_expiry_time = time.time() - 1
+        oauth_provider.context.client_info = OAuthClientInformationFull(
+            client_id="test_client_id", redirect_uris=[AnyUrl("http://localhost:3030/callback")]
+        )
+        oauth_provider._initialized = True
+
+        first_flow = oauth_provider.async_auth_flow(httpx.Request("GET", "https://api.example.com/mcp"))
+        second_flow = oauth_provider.async_auth_flow(httpx.Request("POST", "https://api.example.com/mcp"))
+        second_requests: list[httpx.Request] = []
+
+        async def start_second_flow() -> None:
+            second_requests.append(await second_flow.__anext__())
+
+        with anyio.fail_after(5):
+            refresh_request = await first_flow.__anext__()
+            assert "grant_type=refresh_token" in refresh_request.content.decode()
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(start_second_flow)
+                await anyio.wait_all_tasks_blocked()
+                # The second request waits for the refresh in progress
+                assert second_requests == []
+
+                refresh_response = httpx.Response(
+                    200,
+                    json={"access_token": "refreshed_access_token", "token_type": "Bearer", "expires_in": 3600},
+                    request=refresh_request,
+                )
+                first_request = await first_flow.asend(refresh_response)
+                assert first_request.headers["Authorization"] == "Bearer refreshed_access_token"
+
+        # The second request uses the refreshed token, without a refresh of its own
+        assert second_requests[0].method == "POST"
+        assert second_requests[0].headers["Authorization"] == "Bearer refreshed_access_token"
+
+    @pytest.mark.anyio
+    async def test_401_after_concurrent_reauthorization_retries_with_new_tokens(
+        self, oauth_provider: OAuthClientProvider, valid_tokens: OAuthToken
+    ):
+        """Test that a rejected request reuses tokens another request obtained meanwhile."""
+        oauth_provider.context.current_tokens = valid_tokens
+        oauth_provider.context.token_expiry_time = time.time() + 1800
+        oauth_provider._initialized = True
+
+        auth_flow = oauth_provider.async_auth_flow(httpx.Request("GET", "https://api.example.com/mcp"))
+        request = await auth_flow.__anext__()
+
+        # Another request re-authorizes while this one is in flight
+        oauth_provider.context.current_tokens = OAuthToken(access_token="new_access_token", expires_in=3600)
+
+        retry_request = await auth_flow.asend(httpx.Response(401, request=request))
+        assert retry_request.headers["Authorization"] == "Bearer new_access_token"
+        with pytest.raises(StopAsyncIteration):
+            await auth_flow.asend(httpx.Response(200, request=retry_request))
+
 
 @pytest.mark.parametrize(
     (
@@ -9,6 +9,7 @@ from mcp.server.lowlevel import Server
 from mcp.shared.memory import (
     create_connected_server_and_client_session as client_session,
 )
+from mcp.shared.schema_validation import ToolSchemaValidators
 from mcp.types import Tool
 
 
@@ -19,13 +20,11 @@ def bypass_server_output_validation():
     This simulates a malicious or non-compliant server that doesn't validate
     its outputs, allowing us to test client-side validation.
     """
-    import jsonschema
-
-    # Save the original validate function
-    original_validate = jsonschema.validate
+    # Save the original validate method
+    original_validate = ToolSchemaValidators.validate
 
     # Create a mock that tracks which module is calling it
-    def selective_mock(instance: Any = None, schema: Any = None, *args: Any, **kwargs: Any) -> None:
+    def selective_mock(self: ToolSchemaValidators, tool_name: str, schema: Any, instance: Any) -> None:
         import inspect
 
         # Check the call stack to see where this is being called from
@@ -37,9 +36,9 @@ def bypass_server_output_validation():
             if "mcp/server/lowlevel/server.py" in normalized_path:
                 return None
         # Otherwise, use the real validation (for client-side)
-        return original_validate(instance=instance, schema=schema, *args, **kwargs)
+        return original_validate(self, tool_name, schema, instance)
 
-    with patch("jsonschema.validate", selective_mock):
+    with patch.object(ToolSchemaValidators, "validate", selective_mock):
         yield
 
 
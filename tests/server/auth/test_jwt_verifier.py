@@ -0,0 +1,220 @@
+"""Tests for local JWT access token verification against a JWKS."""
+
+import time
+from typing import Any
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jwt.algorithms import ECAlgorithm, RSAAlgorithm
+
+from mcp.server.auth.jwt_verifier import JWTTokenVerifier
+
+ISSUER = "https://auth.example.com"
+AUDIENCE = "https://api.example.com/mcp"
+
+
+class JWKSEndpoint:
+    """Local stand-in for an authorization server's JWKS endpoint."""
+
+    def __init__(self):
+        self.keys: dict[str, ec.EllipticCurvePrivateKey | rsa.RSAPrivateKey] = {}
+        self.fetches = 0
+        self.status_code = 200
+        self.algorithm: str | None = "ES256"
+
+    def add_key(self, kid: str, key: ec.EllipticCurvePrivateKey | rsa.RSAPrivateKey | None = None) -> None:
+        self.keys[kid] = key or ec.generate_private_key(ec.SECP256R1())
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.fetches += 1
+        keys: list[dict[str, Any]] = []
+        for kid, key in self.keys.items():
+            if isinstance(key, rsa.RSAPrivateKey):
+                jwk = RSAAlgorithm.to_jwk(key.public_key(), as_dict=True)
+            else:
+                jwk = ECAlgorithm.to_jwk(key.public_key(), as_dict=True)
+            keys.append({**jwk, "kid": kid, "use": "sig"} | ({"alg": self.algorithm} if self.algorithm else {}))
+        return httpx.Response(self.status_code, json={"keys": keys})
+
+    def client_factory(
+        self,
+        headers: dict[str, str] | None = None,
+        timeout: httpx.Timeout | None = None,
+        auth: httpx.Auth | None = None,
+    ) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+    def sign(self, kid: str, algorithm: str = "ES256", **claims: Any) -> str:
+        payload = {
+            "iss": ISSUER,
+            "aud": AUDIENCE,
+            "sub": "user_1",
+            "client_id": "test_client",
+            "scope": "read write",
+            "exp": int(time.time()) + 3600,
+            **claims,
+        }
+        return jwt.encode(
+            {key: value for key, value in payload.items() if value is not None},
+            self.keys[kid],
+            algorithm=algorithm,
+            headers={"kid": kid},
+        )
+
+
+@pytest.fixture
+def endpoint() -> JWKSEndpoint:
+    endpoint = JWKSEndpoint()
+    endpoint.add_key("key_1")
+    return endpoint
+
+
+def make_verifier(endpoint: JWKSEndpoint, **kwargs: Any) -> JWTTokenVerifier:
+    return JWTTokenVerifier(
+        "https://auth.example.com/.well-known/jwks.json",
+        issuer=ISSUER,
+        audience=AUDIENCE,
+        httpx_client_factory=endpoint.client_factory,
+        **kwargs,
+    )
+
+
+@pytest.mark.anyio
+async def test_valid_token_is_mapped_onto_access_token(endpoint: JWKSEndpoint):
+    verifier = make_verifier(endpoint)
+    expires_at = int(time.time()) + 600
+    token = endpoint.sign("key_1", exp=expires_at)
+
+    access_token = await verifier.verify_token(token)
+
+    assert access_token is not None
+    assert access_token.token == token
+    assert access_token.client_id == "test_client"
+    assert access_token.scopes == ["read", "write"]
+    assert access_token.expires_at == expires_at
+    assert access_token.resource == AUDIENCE
+
+
+@pytest.mark.anyio
+async def test_scp_claim_and_client_fallbacks(endpoint: JWKSEndpoint):
+    verifier = make_verifier(endpoint)
+    token = endpoint.sign("key_1", scope=None, scp=["read"], client_id=None, azp="azp_client")
+
+    access_token = await verifier.verify_token(token)
+
+    assert access_token is not None
+    assert access_token.scopes == ["read"]
+    assert access_token.client_id == "azp_client"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {"exp": int(time.time()) - 60},
+        {"exp": None},
+        {"iss": "https://evil.example.com"},
+        {"aud": "https://other.example.com"},
+        {"aud": None},
+    ],
+)
+async def test_tokens_with_invalid_claims_are_rejected(endpoint: JWKSEndpoint, claims: dict[str, Any]):
+    verifier = make_verifier(endpoint)
+    assert await verifier.verify_token(endpoint.sign("key_1", **claims)) is None
+
+
+@pytest.mark.anyio
+async def test_forged_tokens_are_rejected(endpoint: JWKSEndpoint):
+    verifier = make_verifier(endpoint)
+    genuine = endpoint.sign("key_1")
+
+    # Signed with another key under the same key id
+    forger = JWKSEndpoint()
+    forger.add_key("key_1")
+    assert await verifier.verify_token(forger.sign("key_1")) is None
+
+    # Signed with a shared secret
+    claims = {"iss": ISSUER, "aud": AUDIENCE, "exp": time.time() + 60}
+    hs256 = jwt.encode(claims, "a shared secret of at least 32 bytes", headers={"kid": "key_1"})
+    assert await verifier.verify_token(hs256) is None
+
+    assert await verifier.verify_token("not.a.jwt") is None
+    assert await verifier.verify_token(genuine[:-4] + "AAAA") is None
+    assert await verifier.verify_token(genuine) is not None
+
+    # Signed with an algorithm the key is not declared for
+    endpoint.algorithm = "ES384"
+    assert await make_verifier(endpoint).verify_token(genuine) is None
+
+
+@pytest.mark.anyio
+async def test_algorithms_the_key_type_cannot_verify_are_rejected(endpoint: JWKSEndpoint):
+    # Keys published without "alg" are matched with algorithms by their key type
+    endpoint.algorithm = None
+    endpoint.add_key("rsa_key", rsa.generate_private_key(public_exponent=65537, key_size=2048))
+    verifier = make_verifier(endpoint)
+    assert await verifier.verify_token(endpoint.sign("rsa_key", algorithm="RS256")) is not None
+    assert await verifier.verify_token(endpoint.sign("rsa_key", algorithm="PS384")) is not None
+    assert await verifier.verify_token(endpoint.sign("key_1")) is not None
+
+    # A token claiming an EC algorithm for the RSA key, and the reverse
+    forger = JWKSEndpoint()
+    forger.add_key("rsa_key")
+    forger.add_key("key_1", rsa.generate_private_key(public_exponent=65537, key_size=2048))
+    assert await verifier.verify_token(forger.sign("rsa_key", algorithm="ES256")) is None
+    assert await verifier.verify_token(forger.sign("key_1", algorithm="RS256")) is None
+
+    # An EC algorithm for a curve other than the key's
+    forger.add_key("key_1", ec.generate_private_key(ec.SECP384R1()))
+    assert await verifier.verify_token(forger.sign("key_1", algorithm="ES384")) is None
+
+
+@pytest.mark.anyio
+async def test_keys_are_fetched_once(endpoint: JWKSEndpoint):
+    verifier = make_verifier(endpoint)
+
+    for _ in range(10):
+        assert await verifier.verify_token(endpoint.sign("key_1")) is not None
+    assert endpoint.fetches == 1
+
+
+@pytest.mark.anyio
+async def test_unknown_key_ids_refresh_keys_at_a_limited_rate(endpoint: JWKSEndpoint):
+    verifier = make_verifier(endpoint, min_refresh_interval=60)
+    assert await verifier.verify_token(endpoint.sign("key_1")) is not None
+    assert endpoint.fetches == 1
+
+    # The issuer rotates its keys; the first fetch was long enough ago
+    verifier._last_attempt = time.monotonic() - 61  # pyright: ignore[reportPrivateUsage]
+    endpoint.add_key("key_2")
+    assert await verifier.verify_token(endpoint.sign("key_2")) is not None
+    assert endpoint.fetches == 2
+
+    # Tokens with key ids that do not exist cannot make the verifier fetch keys again
+    forger = JWKSEndpoint()
+    forger.add_key("key_3")
+    for _ in range(5):
+        assert await verifier.verify_token(forger.sign("key_3")) is None
+    assert endpoint.fetches == 2
+
+
+@pytest.mark.anyio
+async def test_keys_are_kept_when_a_refresh_fails(endpoint: JWKSEndpoint):
+    verifier = make_verifier(endpoint, jwks_ttl=0, min_refresh_interval=0)
+    assert await verifier.verify_token(endpoint.sign("key_1")) is not None
+
+    endpoint.status_code = 503
+    assert await verifier.verify_token(endpoint.sign("key_1")) is not None
+    assert endpoint.fetches == 2
+
+
+@pytest.mark.anyio
+async def test_audience_is_not_checked_unless_configured(endpoint: JWKSEndpoint):
+    verifier = JWTTokenVerifier("https://auth.example.com/jwks", httpx_client_factory=endpoint.client_factory)
+
+    access_token = await verifier.verify_token(endpoint.sign("key_1", aud=["a", "b"], iss=None))
+
+    assert access_token is not None
+    assert access_token.resource is None
@@ -0,0 +1,133 @@
+"""Tests for the token verification cache."""
+
+import time
+
+import anyio
+import pytest
+from starlette.requests import Request
+
+from mcp.server.auth.middleware.bearer_auth import AuthenticatedUser, BearerAuthBackend
+from mcp.server.auth.provider import AccessToken
+from mcp.server.auth.token_cache import TokenVerificationCache
+
+
+class CountingVerifier:
+    """Token verifier that accepts tokens starting with "valid", counting its calls."""
+
+    def __init__(self, expires_in: int | None = 3600):
+        self.expires_in = expires_in
+        self.calls: list[str] = []
+        self.release: anyio.Event | None = None
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        self.calls.append(token)
+        if self.release is not None:
+            await self.release.wait()
+        if token == "broken":
+            raise RuntimeError("verifier unavailable")
+        if not token.startswith("valid"):
+            return None
+        expires_at = int(time.time()) + self.expires_in if self.expires_in is not None else None
+        return AccessToken(token=token, client_id="test_client", scopes=["read"], expires_at=expires_at)
+
+
+@pytest.mark.anyio
+async def test_verified_tokens_are_cached():
+    verifier = CountingVerifier()
+    cache = TokenVerificationCache()
+
+    first = await cache.verify("valid_token", verifier)
+    second = await cache.verify("valid_token", verifier)
+    assert first is not None and second is first
+    assert verifier.calls == ["valid_token"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.invalidate("valid_token")
+    await cache.verify("valid_token", verifier)
+    assert len(verifier.calls) == 2
+
+
+@pytest.mark.anyio
+async def test_results_expire_with_the_token_or_the_ttl(monkeypatch: pytest.MonkeyPatch):
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    verifier = CountingVerifier(expires_in=30)
+    cache = TokenVerificationCache(ttl=60, negative_ttl=5)
+
+    await cache.verify("valid_token", verifier)
+    await cache.verify("invalid_token", verifier)
+    monkeypatch.setattr(time, "time", lambda: now + 10)
+    await cache.verify("valid_token", verifier)
+    await cache.verify("invalid_token", verifier)
+    # Only the rejection is verified again, after its negative TTL
+    assert verifier.calls == ["valid_token", "invalid_token", "invalid_token"]
+
+    # The token expires before the TTL is up
+    monkeypatch.setattr(time, "time", lambda: now + 31)
+    await cache.verify("valid_token", verifier)
+    assert verifier.calls[-1] == "valid_token"
+
+
+@pytest.mark.anyio
+async def test_least_recently_used_results_are_evicted():
+    verifier = CountingVerifier()
+    cache = TokenVerificationCache(max_entries=2)
+
+    for token in ["valid_a", "valid_b", "valid_a", "valid_c"]:
+        await cache.verify(token, verifier)
+    assert len(cache) == 2
+
+    await cache.verify("valid_a", verifier)
+    await cache.verify("valid_b", verifier)
+    assert verifier.calls == ["valid_a", "valid_b", "valid_c", "valid_b"]
+
+
+@pytest.mark.anyio
+async def test_concurrent_verifications_are_coalesced():
+    verifier = CountingVerifier()
+    verifier.release = anyio.Event()
+    cache = TokenVerificationCache()
+    results: list[AccessToken | None] = []
+
+    async def verify() -> None:
+        results.append(await cache.verify("valid_token", verifier))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(verify)
+        await anyio.wait_all_tasks_blocked()
+        verifier.release.set()
+
+    assert verifier.calls == ["valid_token"]
+    assert len(results) == 5 and all(result is results[0] is not None for result in results)
+    assert (cache.hits, cache.misses) == (4, 1)
+
+
+@pytest.mark.anyio
+async def test_verifier_errors_are_not_cached():
+    verifier = CountingVerifier()
+    cache = TokenVerificationCache()
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await cache.verify("broken", verifier)
+    assert verifier.calls == ["broken", "broken"]
+    assert len(cache) == 0
+
+
+@pytest.mark.anyio
+async def test_bearer_auth_backend_uses_the_cache():
+    verifier = CountingVerifier()
+    backend = BearerAuthBackend(verifier, cache=TokenVerificationCache())
+    request = Request({"type": "http", "headers": [(b"accept", b"*/*"), (b"authorization", b"Bearer valid_token")]})
+
+    for _ in range(3):
+        result = await backend.authenticate(request)
+        assert result is not None
+        assert isinstance(result[1], AuthenticatedUser)
+    assert verifier.calls == ["valid_token"]
+
+    rejected = Request({"type": "http", "headers": [(b"authorization", b"Bearer invalid_token")]})
+    assert await backend.authenticate(rejected) is None
+    assert await backend.authenticate(rejected) is None
+    assert verifier.calls == ["valid_token", "invalid_token"]
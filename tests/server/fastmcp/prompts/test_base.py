@@ -1,9 +1,11 @@
+import threading
 from typing import Any
 
 import pytest
 from pydantic import FileUrl
 
 from mcp.server.fastmcp.prompts.base import AssistantMessage, Message, Prompt, TextContent, UserMessage
+from mcp.server.fastmcp.utilities.execution import ThreadLimiter
 from mcp.types import EmbeddedResource, TextResourceContents
 
 
@@ -182,3 +184,24 @@ class TestRenderPrompt:
                 )
             )
         ]
+
+
+class TestPromptExecution:
+    @pytest.mark.anyio
+    async def test_sync_fn_runs_in_worker_thread(self):
+        def fn() -> str:
+            return str(threading.get_ident())
+
+        prompt = Prompt.from_function(fn)
+        messages = await prompt.render(thread_limiter=ThreadLimiter(1))
+        assert isinstance(messages[0].content, TextContent)
+        assert messages[0].content.text != str(threading.get_ident())
+
+    @pytest.mark.anyio
+    async def test_sync_fn_opt_out_runs_on_event_loop(self):
+        def fn() -> str:
+            return str(threading.get_ident())
+
+        prompt = Prompt.from_function(fn, run_in_thread=False)
+        messages = await prompt.render()
+        assert messages == [UserMessage(content=TextContent(type="text", text=str(threading.get_ident())))]
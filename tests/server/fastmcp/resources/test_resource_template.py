@@ -1,4 +1,5 @@
 import json
+import threading
 from typing import Any
 
 import pytest
@@ -6,6 +7,7 @@ from pydantic import BaseModel
 
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.resources import FunctionResource, ResourceTemplate
+from mcp.server.fastmcp.utilities.execution import ThreadLimiter
 from mcp.types import Annotations
 
 
@@ -189,6 +191,23 @@ class TestResourceTemplate:
         content = await resource.read()
         assert content == '"hello"'
 
+    @pytest.mark.anyio
+    async def test_sync_fn_runs_in_worker_thread(self):
+        """Test that a synchronous template function runs off the event loop unless opted out."""
+
+        def where(key: str) -> str:
+            return str(threading.get_ident())
+
+        threaded = ResourceTemplate.from_function(fn=where, uri_template="test://{key}", name="threaded")
+        inline = ResourceTemplate.from_function(
+            fn=where, uri_template="test://{key}", name="inline", run_in_thread=False
+        )
+
+        threaded_resource = await threaded.create_resource("test://a", {"key": "a"}, thread_limiter=ThreadLimiter(1))
+        inline_resource = await inline.create_resource("test://a", {"key": "a"})
+        assert await threaded_resource.read() != str(threading.get_ident())
+        assert await inline_resource.read() == str(threading.get_ident())
+
 
 class TestResourceTemplateAnnotations:
     """Test annotations on resource templates."""
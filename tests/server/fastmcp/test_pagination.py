@@ -0,0 +1,118 @@
+"""Tests for cursor pagination of FastMCP's list results."""
+
+import base64
+
+import pytest
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.utilities.pagination import Paginator
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session as client_session
+from mcp.types import INVALID_PARAMS, PaginatedRequestParams
+
+
+def page_all(paginator: Paginator[str], version: int, items: list[str]) -> list[list[str]]:
+    pages: list[list[str]] = []
+    cursor = None
+    while True:
+        page, cursor = paginator.page(version, lambda: items, cursor)
+        pages.append(page)
+        if cursor is None:
+            return pages
+
+
+def test_pages_are_ordered_by_key():
+    paginator = Paginator[str](2, key=str)
+    assert page_all(paginator, 0, ["c", "a", "e", "b", "d"]) == [["a", "b"], ["c", "d"], ["e"]]
+    assert page_all(paginator, 1, []) == [[]]
+
+
+def test_paging_continues_through_the_snapshot_while_the_catalog_changes():
+    paginator = Paginator[str](2, key=str)
+    page, cursor = paginator.page(0, lambda: ["a", "b", "c", "d"], None)
+    assert page == ["a", "b"]
+
+    # "b" was removed and "a2" added: the cursor still pages the version it came from
+    page, cursor = paginator.page(1, lambda: ["a", "a2", "c", "d"], cursor)
+    assert (page, cursor) == (["c", "d"], None)
+
+
+def test_cursors_of_dropped_snapshots_resume_after_their_last_key():
+    paginator = Paginator[str](2, key=str, max_snapshots=1)
+    _, cursor = paginator.page(0, lambda: ["a", "b", "c", "d"], None)
+
+    page, _ = paginator.page(1, lambda: ["a", "a2", "b", "b2", "c"], cursor)
+    assert page == ["b2", "c"]
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", base64.urlsafe_b64encode(b"{}").decode(), "WzEsMl0="])
+def test_invalid_cursors_are_rejected(cursor: str):
+    paginator = Paginator[str](2, key=str)
+    with pytest.raises(McpError) as exc_info:
+        paginator.page(0, lambda: ["a"], cursor)
+    assert exc_info.value.error.code == INVALID_PARAMS
+
+
+def test_page_size_must_be_positive():
+    with pytest.raises(ValueError):
+        Paginator[str](0, key=str)
+
+
+@pytest.mark.anyio
+async def test_fastmcp_list_results_are_paginated():
+    mcp = FastMCP(list_page_size=2)
+    for n in range(5):
+        mcp.add_tool(lambda: None, name=f"tool_{n}")
+
+        @mcp.resource(f"resource://{n}")
+        def resource() -> str: ...  # pragma: no cover
+
+        @mcp.resource(f"resource://{n}/{{param}}")
+        def template(param: str) -> str: ...  # pragma: no cover
+
+        @mcp.prompt(name=f"prompt_{n}")
+        def prompt() -> str: ...  # pragma: no cover
+
+    async with client_session(mcp._mcp_server) as client:  # pyright: ignore[reportPrivateUsage]
+        first = await client.list_tools()
+        assert [tool.name for tool in first.tools] == ["tool_0", "tool_1"]
+        assert first.nextCursor is not None
+        tools = list(first.tools)
+        cursor = first.nextCursor
+        while cursor is not None:
+            result = await client.list_tools(params=PaginatedRequestParams(cursor=cursor))
+            tools.extend(result.tools)
+            cursor = result.nextCursor
+        assert [tool.name for tool in tools] == [f"tool_{n}" for n in range(5)]
+
+        resources = await client.list_resources()
+        assert [str(resource.uri) for resource in resources.resources] == ["resource://0", "resource://1"]
+        templates = await client.list_resource_templates()
+        assert [template.uriTemplate for template in templates.resourceTemplates] == [
+            "resource://0/{param}",
+            "resource://1/{param}",
+        ]
+        assert templates.nextCursor is not None
+        prompts = await client.list_prompts(
+            params=PaginatedRequestParams(cursor=(await client.list_prompts()).nextCursor)
+        )
+        assert [prompt.name for prompt in prompts.prompts] == ["prompt_2", "prompt_3"]
+
+        with pytest.raises(McpError, match="Invalid cursor"):
+            await client.list_tools(params=PaginatedRequestParams(cursor="nonsense"))
+
+        # The tools of the pages can still be called with validation
+        result = await client.call_tool("tool_4", {})
+        assert not result.isError
+
+
+@pytest.mark.anyio
+async def test_fastmcp_lists_everything_by_default():
+    mcp = FastMCP()
+    for n in range(5):
+        mcp.add_tool(lambda: None, name=f"tool_{n}")
+
+    async with client_session(mcp._mcp_server) as client:  # pyright: ignore[reportPrivateUsage]
+        result = await client.list_tools()
+    assert len(result.tools) == 5
+    assert result.nextCursor is None
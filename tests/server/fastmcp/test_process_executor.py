@@ -0,0 +1,208 @@
+"""Tests for running FastMCP tools in worker processes.
+
+Worker processes are spawned and unpickle tool functions by reference, so every
+tool used here is a module-level function.
+"""
+
+import os
+import time
+from collections.abc import Iterator
+
+import anyio
+import anyio.to_thread
+import pytest
+
+from mcp.server.fastmcp import Context, FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.server.fastmcp.tools import ToolManager
+from mcp.server.fastmcp.utilities.execution import ProcessExecutor
+from mcp.server.session import ServerSession
+
+
+def worker_pid() -> int:
+    return os.getpid()
+
+
+def count_primes(limit: int) -> int:
+    return sum(1 for n in range(2, limit) if all(n % d for d in range(2, int(n**0.5) + 1)))
+
+
+def fail(message: str) -> None:
+    raise ValueError(message)
+
+
+def sleep(seconds: float) -> int:
+    time.sleep(seconds)
+    return os.getpid()
+
+
+async def async_tool() -> None:  # pragma: no cover
+    pass
+
+
+def tool_with_context(ctx: Context[ServerSession, None]) -> None:  # pragma: no cover
+    pass
+
+
+@pytest.fixture(scope="module")
+def executor() -> Iterator[ProcessExecutor]:
+    executor = ProcessExecutor(max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def manager(executor: ProcessExecutor) -> ToolManager:
+    manager = ToolManager(process_executor=executor)
+    manager.add_tool(worker_pid, executor="process")
+    manager.add_tool(count_primes, executor="process")
+    manager.add_tool(fail, executor="process")
+    manager.add_tool(sleep, executor="process", timeout=1)
+    return manager
+
+
+@pytest.mark.anyio
+async def test_tool_runs_in_worker_process(manager: ToolManager):
+    assert await manager.call_tool("worker_pid", {}) != os.getpid()
+    assert await manager.call_tool("count_primes", {"limit": "100"}) == 25
+
+
+@pytest.mark.anyio
+async def test_workers_are_reused_and_bounded():
+    # An executor of its own, so workers killed by other tests' timeouts are not replaced here
+    executor = ProcessExecutor(max_workers=2)
+    pids: list[int] = []
+
+    async def call() -> None:
+        pids.append(await executor.run(sleep, {"seconds": 0.2}))
+
+    try:
+        async with anyio.create_task_group() as tg:
+            for _ in range(4):
+                tg.start_soon(call)
+    finally:
+        executor.shutdown()
+
+    assert len(pids) == 4
+    assert len(set(pids)) <= 2
+    assert os.getpid() not in pids
+
+
+@pytest.mark.anyio
+async def test_exception_is_reraised(manager: ToolManager):
+    with pytest.raises(ToolError, match="Error executing tool fail: boom"):
+        await manager.call_tool("fail", {"message": "boom"})
+
+
+@pytest.mark.anyio
+async def test_timeout_kills_worker(manager: ToolManager, executor: ProcessExecutor):
+    with pytest.raises(ToolError, match="did not finish within 1.0 seconds"):
+        await manager.call_tool("sleep", {"seconds": 30})
+
+    # The pool recovers with a fresh worker
+    assert await manager.call_tool("sleep", {"seconds": 0}) != os.getpid()
+
+
+@pytest.mark.anyio
+async def test_cancellation_kills_worker(manager: ToolManager, executor: ProcessExecutor):
+    await manager.call_tool("worker_pid", {})
+    idle = list(executor._idle)  # pyright: ignore[reportPrivateUsage]
+
+    with anyio.move_on_after(0.5):
+        await manager.call_tool("sleep", {"seconds": 30})
+
+    killed = [worker for worker in idle if not worker.process.is_alive()]
+    assert len(killed) == 1
+    assert killed[0] not in executor._idle  # pyright: ignore[reportPrivateUsage]
+
+    # The abandoned receiving thread closes the pipe once its recv() fails
+    with anyio.fail_after(5):
+        while not killed[0].conn.closed:
+            await anyio.sleep(0.01)
+
+
+@pytest.mark.anyio
+async def test_fastmcp_tool_with_process_executor():
+    app = FastMCP(max_process_workers=1)
+    app.add_tool(count_primes, executor="process", timeout=30)
+
+    try:
+        _, structured = await app.call_tool("count_primes", {"limit": 100})
+        assert structured == {"result": 25}
+        assert app._process_executor.max_workers == 1
+    finally:
+        app._process_executor.shutdown()
+
+
+@pytest.mark.anyio
+async def test_pool_prewarms_and_kills_workers():
+    executor = ProcessExecutor(max_workers=2)
+    async with executor.pool(prewarm=5):
+        workers = list(executor._idle)  # pyright: ignore[reportPrivateUsage]
+        assert len(workers) == 2
+        assert all(worker.process.is_alive() for worker in workers)
+
+        # Waiting on a busy worker takes none of anyio's default worker threads
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(executor.run, sleep, {"seconds": 0.5})
+            await anyio.sleep(0.2)
+            assert anyio.to_thread.current_default_thread_limiter().borrowed_tokens == 0
+            assert await executor.run(worker_pid, {}) in {worker.process.pid for worker in workers}
+
+    assert not executor._idle  # pyright: ignore[reportPrivateUsage]
+    assert not any(worker.process.is_alive() for worker in workers)
+
+    # The executor starts new workers on demand afterwards
+    assert await executor.run(worker_pid, {}) not in {worker.process.pid for worker in workers}
+    executor.shutdown()
+
+
+@pytest.mark.anyio
+async def test_overlapping_pools_keep_workers_until_the_last_exits():
+    executor = ProcessExecutor(max_workers=1)
+    async with executor.pool(prewarm=1):
+        async with executor.pool(prewarm=1):
+            (worker,) = executor._idle  # pyright: ignore[reportPrivateUsage]
+        assert worker.process.is_alive()
+        assert await executor.run(worker_pid, {}) == worker.process.pid
+    assert not worker.process.is_alive()
+    executor.shutdown()
+
+
+@pytest.mark.anyio
+async def test_fastmcp_holds_workers_for_its_app_lifespan():
+    app = FastMCP(max_process_workers=1)
+    app.add_tool(worker_pid, executor="process")
+
+    async with app._mcp_server.app_lifespan_scope():  # pyright: ignore[reportPrivateUsage]
+        (worker,) = app._process_executor._idle  # pyright: ignore[reportPrivateUsage]
+        _, structured = await app.call_tool("worker_pid", {})
+        assert structured == {"result": worker.process.pid}
+
+    assert not worker.process.is_alive()
+
+
+@pytest.mark.anyio
+async def test_shutdown_rejects_calls():
+    executor = ProcessExecutor(max_workers=1)
+    executor.shutdown()
+    with pytest.raises(RuntimeError, match="shut down"):
+        await executor.run(worker_pid, {})
+
+
+@pytest.mark.anyio
+async def test_process_tool_without_executor_fails():
+    manager = ToolManager()
+    manager.add_tool(worker_pid, executor="process")
+    with pytest.raises(ToolError, match="no process executor is available"):
+        await manager.call_tool("worker_pid", {})
+
+
+def test_invalid_process_tools_are_rejected():
+    manager = ToolManager()
+    with pytest.raises(ValueError, match="is async"):
+        manager.add_tool(async_tool, executor="process")
+    with pytest.raises(ValueError, match="takes a Context"):
+        manager.add_tool(tool_with_context, executor="process")
+    with pytest.raises(ValueError, match="only supported for tools with executor='process'"):
+        manager.add_tool(worker_pid, timeout=1)
@@ -1,14 +1,18 @@
 import json
 import logging
+import threading
+import time
 from dataclasses import dataclass
 from typing import Any, TypedDict
 
+import anyio
 import pytest
 from pydantic import BaseModel
 
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.fastmcp.exceptions import ToolError
 from mcp.server.fastmcp.tools import Tool, ToolManager
+from mcp.server.fastmcp.utilities.execution import ThreadLimiter
 from mcp.server.fastmcp.utilities.func_metadata import ArgModelBase, FuncMetadata
 from mcp.server.session import ServerSessionT
 from mcp.shared.context import LifespanContextT, RequestT
@@ -920,3 +924,95 @@ class TestRemoveTools:
         # Remove with correct case
         manager.remove_tool("test_func")
         assert manager.get_tool("test_func") is None
+
+
+class TestSyncToolExecution:
+    """Test that synchronous tools run off the event loop."""
+
+    @pytest.mark.anyio
+    async def test_sync_tool_runs_in_worker_thread(self):
+        def where() -> int:
+            return threading.get_ident()
+
+        manager = ToolManager()
+        manager.add_tool(where)
+        assert await manager.call_tool("where", {}) != threading.get_ident()
+
+    @pytest.mark.anyio
+    async def test_sync_tool_opt_out_runs_on_event_loop(self):
+        def where() -> int:
+            return threading.get_ident()
+
+        manager = ToolManager()
+        tool = manager.add_tool(where, run_in_thread=False)
+        assert tool.run_in_thread is False
+        assert await manager.call_tool("where", {}) == threading.get_ident()
+
+    @pytest.mark.anyio
+    async def test_blocking_tool_does_not_block_event_loop(self):
+        released = threading.Event()
+
+        def wait_for_release() -> bool:
+            return released.wait(timeout=5)
+
+        manager = ToolManager()
+        manager.add_tool(wait_for_release)
+
+        results: list[bool] = []
+
+        async def call() -> None:
+            results.append(await manager.call_tool("wait_for_release", {}))
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(call)
+            # Only reachable while the tool is blocked if it runs in a worker thread
+            await anyio.sleep(0.01)
+            released.set()
+
+        assert results == [True]
+
+    @pytest.mark.anyio
+    async def test_thread_limiter_bounds_concurrency(self):
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def work() -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        manager = ToolManager(thread_limiter=ThreadLimiter(2))
+        manager.add_tool(work)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(6):
+                tg.start_soon(manager.call_tool, "work", dict[str, Any]())
+
+        assert peak == 2
+
+    @pytest.mark.anyio
+    async def test_fastmcp_tool_decorator_opt_out(self):
+        app = FastMCP(max_sync_threads=3)
+
+        @app.tool(run_in_thread=False)
+        def inline() -> int:
+            return threading.get_ident()
+
+        @app.tool()
+        def threaded() -> int:
+            return threading.get_ident()
+
+        assert app.settings.max_sync_threads == 3
+        assert app._tool_manager.thread_limiter is not None
+        assert app._tool_manager.thread_limiter.total_tokens == 3
+        assert await app._tool_manager.call_tool("inline", {}) == threading.get_ident()
+        assert await app._tool_manager.call_tool("threaded", {}) != threading.get_ident()
+
+    def test_thread_limiter_requires_a_token(self):
+        with pytest.raises(ValueError):
+            ThreadLimiter(0)
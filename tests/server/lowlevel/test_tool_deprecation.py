@@ -4,7 +4,7 @@ import pytest
 
 from mcp.server import Server
 from mcp.shared.memory import create_connected_server_and_client_session
-from mcp.types import Tool
+from mcp.types import ListToolsRequest, ListToolsResult, Tool
 
 
 @pytest.mark.anyio
@@ -53,3 +53,87 @@ async def test_deprecated_properties_removed():
     assert len(result.tools) == 1
     assert "active_param" in result.tools[0].inputSchema["properties"]
     assert "old_param" not in result.tools[0].inputSchema["properties"]
+
+
+@pytest.mark.anyio
+async def test_filtered_definitions_are_built_once_per_tool(monkeypatch: pytest.MonkeyPatch):
+    """Listing the same tools again reuses their filtered definitions, and never modifies the originals."""
+    server = Server("test")
+    server.config = {"external_client": True}
+    tools = [
+        Tool(
+            name=f"tool_{n}",
+            inputSchema={"type": "object", "properties": {"a": {}, "old": {"is_deprecated": True}}},
+            outputSchema={"type": "object"},
+        )
+        for n in range(3)
+    ]
+    listed_tools = list(tools)
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return listed_tools
+
+    validated: list[str] = []
+    monkeypatch.setattr("mcp.server.lowlevel.server.validate_and_warn_tool_name", validated.append)
+
+    async def list_definitions() -> list[Tool]:
+        result = await server.request_handlers[ListToolsRequest](ListToolsRequest(method="tools/list"))
+        assert isinstance(result.root, ListToolsResult)
+        return result.root.tools
+
+    first = await list_definitions()
+    second = await list_definitions()
+    assert all(a is b for a, b in zip(first, second))
+    assert [tool.inputSchema["properties"] for tool in first] == [{"a": {}}] * 3
+    assert all(tool.outputSchema is None for tool in first)
+    assert tools[0].inputSchema["properties"].keys() == {"a", "old"}
+    assert tools[0].outputSchema == {"type": "object"}
+
+    # Only a replaced tool is validated and filtered again
+    listed_tools[1] = Tool(name="tool_1", inputSchema={"type": "object"})
+    third = await list_definitions()
+    assert third[0] is first[0] and third[1] is not first[1]
+    assert validated == ["tool_0", "tool_1", "tool_2", "tool_1"]
+
+    # Removed tools are no longer cached for validation
+    del listed_tools[2]
+    await list_definitions()
+    assert set(server.tool_registry.names()) == {"tool_0", "tool_1"}
+
+
+@pytest.mark.anyio
+async def test_filtered_definitions_are_reused_for_rebuilt_tools(monkeypatch: pytest.MonkeyPatch):
+    """Handlers that build their tools afresh for every listing still reuse the filtered definitions."""
+    server = Server("test")
+    description = "A tool"
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return [
+            Tool(
+                name=f"tool_{n}",
+                description=description,
+                inputSchema={"type": "object", "properties": {"a": {}, "old": {"is_deprecated": True}}},
+            )
+            for n in range(2)
+        ]
+
+    validated: list[str] = []
+    monkeypatch.setattr("mcp.server.lowlevel.server.validate_and_warn_tool_name", validated.append)
+
+    async def list_definitions() -> list[Tool]:
+        result = await server.request_handlers[ListToolsRequest](ListToolsRequest(method="tools/list"))
+        assert isinstance(result.root, ListToolsResult)
+        return result.root.tools
+
+    first = await list_definitions()
+    second = await list_definitions()
+    assert all(a is b for a, b in zip(first, second))
+    assert validated == ["tool_0", "tool_1"]
+
+    # A change to the content of the tools is picked up
+    description = "A changed tool"
+    third = await list_definitions()
+    assert [tool.description for tool in third] == ["A changed tool"] * 2
+    assert validated == ["tool_0", "tool_1", "tool_0", "tool_1"]
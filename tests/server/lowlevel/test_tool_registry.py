@@ -0,0 +1,168 @@
+"""Tests for the lowlevel server's tool registry."""
+
+from typing import Any
+
+import anyio
+import pytest
+
+from mcp.server import Server
+from mcp.server.fastmcp import FastMCP
+from mcp.server.lowlevel.tool_registry import ToolRegistry
+from mcp.types import CallToolRequest, CallToolRequestParams, TextContent, Tool
+
+
+def tool(name: str) -> Tool:
+    return Tool(name=name, inputSchema={"type": "object", "properties": {"x": {"type": "integer"}}})
+
+
+def test_version_changes_with_the_tools():
+    registry = ToolRegistry()
+    a, b = tool("a"), tool("b")
+
+    registry.add(a)
+    registry.add(a)
+    assert registry.version == 1
+    assert registry.get("a") is a
+
+    assert registry.sync([a, b])
+    assert not registry.sync([a, b])
+    assert registry.version == 2
+
+    # Replacing a tool with a different definition is a change
+    changed_b = Tool(name="b", inputSchema={"type": "object"})
+    assert registry.sync([a, changed_b])
+    assert registry.get("b") is changed_b
+    # Listing fewer tools is a change
+    assert registry.sync([a, a])
+    assert registry.version == 4
+    assert list(registry.names()) == ["a"]
+
+    registry.remove("a")
+    registry.remove("a")
+    assert registry.version == 5
+    assert len(registry) == 0
+
+
+def test_rebuilt_tools_with_the_same_definition_are_not_a_change():
+    registry = ToolRegistry(refresh_interval=0)
+    a = tool("a")
+    registry.sync([a, tool("b")])
+    registry.record_miss("unknown")
+    version = registry.version
+
+    assert not registry.sync([tool("a"), tool("b")])
+    registry.add(tool("a"))
+    assert registry.version == version
+    assert registry.get("a") is a
+    assert not registry.should_refresh("unknown")
+
+    # A rebuilt tool of another type is not the same definition
+    class OtherTool(Tool):
+        pass
+
+    assert registry.sync([OtherTool.model_validate(tool("a").model_dump()), tool("b")])
+    assert registry.version == version + 1
+
+
+def test_misses_are_remembered_until_the_tools_change():
+    registry = ToolRegistry(refresh_interval=0)
+    assert registry.should_refresh("unknown")
+
+    registry.record_miss("unknown")
+    assert not registry.should_refresh("unknown")
+    assert registry.should_refresh("other")
+
+    registry.add(tool("a"))
+    assert registry.should_refresh("unknown")
+
+
+def test_misses_are_bounded():
+    registry = ToolRegistry(max_misses=2, refresh_interval=0)
+    for name in ["a", "b", "c"]:
+        registry.record_miss(name)
+    assert registry.should_refresh("a")
+    assert not registry.should_refresh("c")
+
+
+def test_refreshes_are_rate_limited():
+    registry = ToolRegistry(refresh_interval=60)
+    assert registry.should_refresh("a")
+    registry.sync([])
+    assert not registry.should_refresh("b")
+
+
+def call_tool_server(listings: list[int]) -> Server:
+    server = Server("test")
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        listings.append(1)
+        await anyio.sleep(0)
+        return [tool("known")]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        return [TextContent(type="text", text=name)]
+
+    return server
+
+
+async def call(server: Server, name: str, arguments: dict[str, Any] | None = None) -> Any:
+    request = CallToolRequest(method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments))
+    return (await server.request_handlers[CallToolRequest](request)).root
+
+
+@pytest.mark.anyio
+async def test_calls_to_unknown_tools_do_not_list_the_tools_every_time():
+    listings: list[int] = []
+    server = call_tool_server(listings)
+    server.tool_registry = ToolRegistry(refresh_interval=0)
+
+    # The first call lists the tools to find the tool and validate its arguments
+    result = await call(server, "known", {"x": "not an integer"})
+    assert result.isError
+    assert len(listings) == 1
+
+    for _ in range(3):
+        await call(server, "unknown")
+    # The name was still unknown after one more listing, and is remembered as such
+    assert len(listings) == 2
+
+
+@pytest.mark.anyio
+async def test_calls_to_new_unknown_tools_wait_for_the_refresh_interval():
+    listings: list[int] = []
+    server = call_tool_server(listings)
+
+    await call(server, "known")
+    for n in range(3):
+        await call(server, f"unknown_{n}")
+    assert len(listings) == 1
+
+
+@pytest.mark.anyio
+async def test_concurrent_calls_to_unknown_tools_share_one_listing():
+    listings: list[int] = []
+    server = call_tool_server(listings)
+
+    async with anyio.create_task_group() as tg:
+        for n in range(5):
+            tg.start_soon(call, server, f"unknown_{n}")
+    assert len(listings) == 1
+
+
+@pytest.mark.anyio
+async def test_fastmcp_registers_tools_as_they_are_added():
+    mcp = FastMCP()
+
+    @mcp.tool()
+    def add(x: int) -> int:
+        return x
+
+    registry = mcp._mcp_server.tool_registry  # pyright: ignore[reportPrivateUsage]
+    assert registry.get("add") is not None
+    version = registry.version
+
+    mcp.remove_tool("add")
+    assert registry.get("add") is None
+    assert registry.version == version + 1
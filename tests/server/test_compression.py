@@ -0,0 +1,154 @@
+"""Tests for HTTP response compression in mcp.server.compression."""
+
+import gzip
+import json
+import zlib
+from typing import Any
+
+import httpx
+import pytest
+from starlette.types import Message
+
+from mcp.server import compression
+from mcp.server.compression import compress_send, negotiate_encoding
+from mcp.server.lowlevel import Server
+from mcp.server.streamable_http import MCP_SESSION_ID_HEADER
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.types import LATEST_PROTOCOL_VERSION, Tool
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip", "gzip"),
+        ("deflate, gzip;q=0.5", "gzip"),
+        ("gzip, br, zstd", "zstd"),
+        ("gzip, br;q=0.9", "gzip"),
+        ("*", "zstd"),
+        ("*, zstd;q=0", "br"),
+        ("GZIP ; q=0.8", "gzip"),
+        ("gzip;q=0", None),
+        ("gzip;q=oops", None),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_negotiate_encoding(monkeypatch: pytest.MonkeyPatch, accept_encoding: str, expected: str | None):
+    monkeypatch.setattr(compression, "ENCODINGS", dict.fromkeys(["zstd", "br", "gzip"], compression.ENCODINGS["gzip"]))
+    assert negotiate_encoding(accept_encoding) == expected
+
+
+async def _send_through(messages: list[Message], minimum_size: int = 100) -> list[Message]:
+    sent: list[Message] = []
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    compressed_send = compress_send(send, "gzip", minimum_size)
+    for message in messages:
+        await compressed_send(message)
+    return sent
+
+
+def _start(content_type: str, *extra: tuple[bytes, bytes]) -> Message:
+    return {"type": "http.response.start", "status": 200, "headers": [(b"content-type", content_type.encode()), *extra]}
+
+
+def _headers(message: Message) -> dict[bytes, bytes]:
+    return dict(message["headers"])
+
+
+@pytest.mark.anyio
+async def test_large_json_responses_are_compressed():
+    body = json.dumps({"data": "x" * 1000}).encode()
+    sent = await _send_through(
+        [
+            _start("application/json", (b"content-length", str(len(body)).encode())),
+            {"type": "http.response.body", "body": body},
+        ]
+    )
+
+    headers = _headers(sent[0])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert headers[b"vary"] == b"accept-encoding"
+    assert int(headers[b"content-length"]) == len(sent[1]["body"]) < len(body)
+    assert gzip.decompress(sent[1]["body"]) == body
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("extra_header", [(), ((b"content-encoding", b"br"),)])
+async def test_small_or_encoded_responses_are_unchanged(extra_header: tuple[tuple[bytes, bytes], ...]):
+    body = b"x" * (10 if not extra_header else 1000)
+    messages: list[Message] = [
+        _start("application/json", *extra_header),
+        {"type": "http.response.body", "body": body},
+    ]
+    assert await _send_through(messages) == messages
+
+
+@pytest.mark.anyio
+async def test_sse_streams_are_flushed_per_event():
+    events = [b"event: message\r\ndata: %d\r\n\r\n" % n for n in range(3)]
+    sent: list[Message] = []
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    compressed_send = compress_send(send, "gzip", minimum_size=10_000)
+    await compressed_send(_start("text/event-stream"))
+    # The headers go out before any event, and announce the encoding
+    assert _headers(sent[0])[b"content-encoding"] == b"gzip"
+
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for event in events:
+        await compressed_send({"type": "http.response.body", "body": event, "more_body": True})
+        # Every event can be decoded as soon as it is sent
+        assert decompressor.decompress(sent[-1]["body"]) == event
+    await compressed_send({"type": "http.response.body", "body": b"", "more_body": False})
+    decompressor.decompress(sent[-1]["body"])
+    assert decompressor.eof
+
+
+@pytest.mark.anyio
+async def test_streamable_http_responses_are_compressed_for_clients_that_accept_it():
+    server = Server("test")
+    tools = [Tool(name=f"tool_{n}", description="A tool. " * 20, inputSchema={"type": "object"}) for n in range(50)]
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return tools
+
+    manager = StreamableHTTPSessionManager(app=server, json_response=True)
+    headers = {
+        "accept": "application/json, text/event-stream",
+        "content-type": "application/json",
+        "mcp-protocol-version": LATEST_PROTOCOL_VERSION,
+    }
+    initialize: dict[str, Any] = {
+        "jsonrpc": "2.0",
+        "id": 0,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": LATEST_PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "test", "version": "1.0"},
+        },
+    }
+
+    transport = httpx.ASGITransport(app=manager.handle_request)
+    async with manager.run(), httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/mcp", json=initialize, headers=headers)
+        headers[MCP_SESSION_ID_HEADER] = response.headers[MCP_SESSION_ID_HEADER]
+
+        response = await client.post("/mcp", json={"jsonrpc": "2.0", "id": 1, "method": "tools/list"}, headers=headers)
+        assert response.headers["content-encoding"] == "gzip"
+        # httpx decodes the response transparently
+        assert len(response.json()["result"]["tools"]) == 50
+
+        response = await client.post(
+            "/mcp",
+            json={"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+            headers={**headers, "accept-encoding": "identity"},
+        )
+        assert "content-encoding" not in response.headers
+        assert len(response.json()["result"]["tools"]) == 50
@@ -0,0 +1,300 @@
+"""Tests for the event stores in mcp.server.event_store."""
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import anyio
+import pytest
+from starlette.types import Message
+
+from mcp.server.event_store import InMemoryEventStore, SQLiteEventStore
+from mcp.server.lowlevel import Server
+from mcp.server.streamable_http import EventMessage, EventStore, StreamableHTTPServerTransport
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.types import LATEST_PROTOCOL_VERSION, JSONRPCMessage, JSONRPCNotification
+
+
+def notification(n: int) -> JSONRPCMessage:
+    return JSONRPCMessage(JSONRPCNotification(jsonrpc="2.0", method="notifications/progress", params={"n": n}))
+
+
+async def replay(store: EventStore, last_event_id: str) -> tuple[str | None, list[EventMessage]]:
+    replayed: list[EventMessage] = []
+
+    async def send(event: EventMessage) -> None:
+        replayed.append(event)
+
+    stream_id = await store.replay_events_after(last_event_id, send)
+    return stream_id, replayed
+
+
+@pytest.fixture(params=["memory", "sqlite", "sqlite-write-behind"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[EventStore]:
+    if request.param == "memory":
+        yield InMemoryEventStore()
+    else:
+        store = SQLiteEventStore(tmp_path / "events.db", write_behind=request.param == "sqlite-write-behind")
+        yield store
+        store.close()
+
+
+@pytest.mark.anyio
+async def test_replays_events_of_the_same_stream(store: EventStore):
+    priming_id = await store.store_event("a", None)
+    first_id = await store.store_event("a", notification(1))
+    await store.store_event("b", notification(2))
+    third_id = await store.store_event("a", notification(3))
+
+    stream_id, replayed = await replay(store, priming_id)
+
+    assert stream_id == "a"
+    # Priming events are not replayed
+    assert [(event.message, event.event_id) for event in replayed] == [
+        (notification(1), first_id),
+        (notification(3), third_id),
+    ]
+
+    stream_id, replayed = await replay(store, third_id)
+    assert stream_id == "a"
+    assert replayed == []
+
+
+@pytest.mark.anyio
+async def test_unknown_event_ids_are_not_replayed(store: EventStore):
+    event_id = await store.store_event("a", notification(1))
+    await store.store_event("a", notification(2))
+
+    # Change the random part of the ID: the stream token, or the event's nonce
+    await store.flush()
+    if isinstance(store, InMemoryEventStore):
+        tampered = ("x" if event_id[0] != "x" else "y") + event_id[1:]
+    else:
+        tampered = event_id[:-1] + ("x" if event_id[-1] != "x" else "y")
+
+    for unknown in ["", "nonsense", "1.2.3", "abc.999", "999.abc", tampered]:
+        assert await replay(store, unknown) == (None, [])
+
+
+@pytest.mark.anyio
+async def test_memory_store_limits_events_per_stream():
+    store = InMemoryEventStore(max_events_per_stream=2)
+    ids = [await store.store_event("a", notification(n)) for n in range(4)]
+    await store.store_event("b", notification(10))
+
+    # The two oldest events of "a" were dropped
+    assert await replay(store, ids[1]) == (None, [])
+    stream_id, replayed = await replay(store, ids[2])
+    assert stream_id == "a"
+    assert [event.message for event in replayed] == [notification(3)]
+    assert len(store) == 3
+
+
+@pytest.mark.anyio
+async def test_memory_store_limits_total_size():
+    store = InMemoryEventStore(max_bytes=1000)
+    a_ids = [await store.store_event("a", notification(n)) for n in range(5)]
+    for n in range(100):
+        await store.store_event("b", notification(n))
+
+    assert store.size_bytes <= 1000
+    # "a" was the oldest stream, so all of its events were dropped and it is forgotten
+    assert await replay(store, a_ids[-1]) == (None, [])
+    assert set(store._streams) == {"b"}  # pyright: ignore[reportPrivateUsage]
+    # Bookkeeping of dropped events does not grow without bound
+    assert len(store._order) <= 2 * len(store)  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.anyio
+async def test_memory_store_replays_across_trimmed_events():
+    store = InMemoryEventStore(max_events_per_stream=3)
+    ids = [await store.store_event("a", notification(n)) for n in range(50)]
+
+    stream_id, replayed = await replay(store, ids[-3])
+    assert stream_id == "a"
+    assert [(event.message, event.event_id) for event in replayed] == [
+        (notification(48), ids[-2]),
+        (notification(49), ids[-1]),
+    ]
+
+
+@pytest.mark.anyio
+async def test_sqlite_store_compacts_old_events(tmp_path: Path):
+    store = SQLiteEventStore(tmp_path / "events.db", max_events=3, compact_every=5)
+    ids = [await store.store_event("a", notification(n)) for n in range(5)]
+
+    assert await replay(store, ids[1]) == (None, [])
+    stream_id, replayed = await replay(store, ids[2])
+    assert stream_id == "a"
+    assert [event.message for event in replayed] == [notification(3), notification(4)]
+    store.close()
+
+
+@pytest.mark.anyio
+async def test_sqlite_store_compacts_expired_events(tmp_path: Path):
+    store = SQLiteEventStore(tmp_path / "events.db", max_age=0)
+    event_id = await store.store_event("a", notification(1))
+    await store.store_event("a", notification(2))
+
+    store.compact()
+
+    assert await replay(store, event_id) == (None, [])
+    store.close()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("write_behind", [False, True])
+async def test_sqlite_store_persists_events(tmp_path: Path, write_behind: bool):
+    store = SQLiteEventStore(tmp_path / "events.db", write_behind=write_behind)
+    event_id = await store.store_event("a", None)
+    await store.store_event("a", notification(1))
+    store.close()
+
+    reopened = SQLiteEventStore(tmp_path / "events.db")
+    stream_id, replayed = await replay(reopened, event_id)
+    assert stream_id == "a"
+    assert [event.message for event in replayed] == [notification(1)]
+    reopened.close()
+
+
+def test_transport_scopes_event_streams_to_its_session():
+    """Request IDs repeat across sessions, so the streams of a shared store are per session."""
+    first = StreamableHTTPServerTransport(mcp_session_id="first")
+    second = StreamableHTTPServerTransport(mcp_session_id="second")
+
+    stream_id = first._event_stream_id("1")  # pyright: ignore[reportPrivateUsage]
+    assert stream_id != second._event_stream_id("1")  # pyright: ignore[reportPrivateUsage]
+    assert first._request_stream_id(stream_id) == "1"  # pyright: ignore[reportPrivateUsage]
+    assert second._request_stream_id(stream_id) is None  # pyright: ignore[reportPrivateUsage]
+
+
+class SlowSQLiteEventStore(SQLiteEventStore):
+    """Holds every write until `release` is set."""
+
+    def __init__(self, path: Path):
+        super().__init__(path, write_behind=True)
+        self.release = threading.Event()
+
+    def _write(self, rows: list[Any]) -> None:
+        self.release.wait()
+        super()._write(rows)
+
+
+@pytest.mark.anyio
+async def test_sqlite_write_behind_stores_without_waiting_for_the_disk(tmp_path: Path):
+    store = SlowSQLiteEventStore(tmp_path / "events.db")
+    ids = [await store.store_event("a", notification(n)) for n in range(3)]
+
+    # Event IDs increase, and are handed out before anything is written
+    assert [int(event_id.partition(".")[0]) for event_id in ids] == [1, 2, 3]
+
+    store.release.set()
+    await store.flush()
+    reader = SQLiteEventStore(tmp_path / "events.db")
+    stream_id, replayed = await replay(reader, ids[0])
+    assert stream_id == "a"
+    assert [event.event_id for event in replayed] == ids[1:]
+    reader.close()
+    store.close()
+
+
+@pytest.mark.anyio
+async def test_sqlite_write_behind_flush_can_be_cancelled(tmp_path: Path):
+    store = SlowSQLiteEventStore(tmp_path / "events.db")
+    await store.store_event("a", notification(1))
+
+    # The write is held, so the flush only returns because it is cancelled
+    with anyio.fail_after(5):
+        with anyio.move_on_after(0.2) as scope:
+            await store.flush()
+    assert scope.cancelled_caught
+
+    store.release.set()
+    await store.flush()
+    store.close()
+
+
+class FlushRecordingStore(InMemoryEventStore):
+    def __init__(self):
+        super().__init__()
+        self.flushed_at: list[int] = []
+
+    async def flush(self) -> None:
+        self.flushed_at.append(len(self))
+
+
+@pytest.mark.anyio
+async def test_transport_flushes_the_store_before_sending_a_response():
+    store = FlushRecordingStore()
+    manager = StreamableHTTPSessionManager(app=Server("test"), event_store=store)
+    body = json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": LATEST_PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "test", "version": "1.0"},
+            },
+        }
+    ).encode()
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/mcp",
+        "headers": [(b"content-type", b"application/json"), (b"accept", b"application/json, text/event-stream")],
+    }
+    sent: list[Message] = []
+    received = False
+
+    async def receive() -> Message:
+        nonlocal received
+        if received:
+            await anyio.sleep_forever()
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.body" and b'"result"' in message.get("body", b""):
+            # The priming event and the response were stored, then flushed before it was sent
+            assert store.flushed_at == [2]
+        sent.append(message)
+
+    async with manager.run():
+        await manager.handle_request(scope, receive, send)
+
+    assert sent[0]["status"] == 200
+    assert store.flushed_at == [2]
+
+
+class FailingSQLiteEventStore(SQLiteEventStore):
+    """Fails to write while `failing` is set."""
+
+    def __init__(self, path: Path):
+        super().__init__(path, write_behind=True)
+        self.failing = threading.Event()
+        self.failing.set()
+
+    def _write(self, rows: list[Any]) -> None:
+        if self.failing.is_set():
+            raise sqlite3.OperationalError("disk I/O error")
+        super()._write(rows)
+
+
+@pytest.mark.anyio
+async def test_sqlite_write_behind_flush_reports_lost_events(tmp_path: Path):
+    store = FailingSQLiteEventStore(tmp_path / "events.db")
+    event_id = await store.store_event("a", notification(1))
+    with pytest.raises(sqlite3.OperationalError):
+        await store.flush()
+
+    # The lost events are not reported again, and later events are written
+    store.failing.clear()
+    await store.store_event("a", notification(2))
+    await store.flush()
+    assert await replay(store, event_id) == (None, [])
+    store.close()
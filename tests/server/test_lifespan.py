@@ -1,6 +1,6 @@
 """Tests for lifespan functionality in both low-level and FastMCP servers."""
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
 
@@ -12,6 +12,7 @@ from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.lowlevel.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 from mcp.server.session import ServerSession
+from mcp.shared.memory import create_connected_server_and_client_session
 from mcp.shared.message import SessionMessage
 from mcp.types import (
     ClientCapabilities,
@@ -22,6 +23,7 @@ from mcp.types import (
     JSONRPCRequest,
     JSONRPCResponse,
     TextContent,
+    Tool,
 )
 
 
@@ -236,3 +238,204 @@ async def test_fastmcp_server_lifespan():
 
         # Cancel server task
         tg.cancel_scope.cancel()
+
+
+@pytest.mark.anyio
+async def test_app_lifespan_is_entered_per_run_outside_a_scope():
+    """Test that a session run on its own enters the app lifespan for that session."""
+    events: list[str] = []
+
+    @asynccontextmanager
+    async def app_lifespan(server: Server) -> AsyncGenerator[dict[str, str]]:
+        events.append("enter")
+        yield {"pool": "shared"}
+        events.append("exit")
+
+    server = Server("test", app_lifespan=app_lifespan)
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return [Tool(name="check", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def check(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        ctx = server.request_context
+        return [TextContent(type="text", text=f"{ctx.app_lifespan_context['pool']} {ctx.lifespan_context}")]
+
+    async with create_connected_server_and_client_session(server) as client:
+        result = await client.call_tool("check", {})
+        assert result.content == [TextContent(type="text", text="shared {}")]
+        assert events == ["enter"]
+
+
+@pytest.mark.anyio
+async def test_app_lifespan_is_shared_by_sessions_in_scope():
+    """Test that sessions run inside the app lifespan scope share one app lifespan."""
+    app_entered = 0
+    sessions_entered = 0
+
+    @asynccontextmanager
+    async def app_lifespan(server: Server) -> AsyncGenerator[object]:
+        nonlocal app_entered
+        app_entered += 1
+        yield object()
+
+    @asynccontextmanager
+    async def lifespan(server: Server) -> AsyncGenerator[int]:
+        nonlocal sessions_entered
+        sessions_entered += 1
+        yield sessions_entered
+
+    server = Server("test", lifespan=lifespan, app_lifespan=app_lifespan)
+    seen: list[tuple[object, int]] = []
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return [Tool(name="check", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def check(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        ctx = server.request_context
+        seen.append((ctx.app_lifespan_context, ctx.lifespan_context))
+        return []
+
+    async with server.app_lifespan_scope() as app_context:
+        # Nested scopes reuse the active one
+        async with server.app_lifespan_scope() as nested_context:
+            assert nested_context is app_context
+
+        for _ in range(2):
+            async with create_connected_server_and_client_session(server) as client:
+                await client.call_tool("check", {})
+
+    assert app_entered == 1
+    assert seen == [(app_context, 1), (app_context, 2)]
+
+
+@pytest.mark.anyio
+async def test_overlapping_runs_outside_a_scope_have_their_own_app_lifespan():
+    """Test that a run outside a scope neither waits for nor closes another run's app lifespan."""
+    events: list[str] = []
+
+    @asynccontextmanager
+    async def app_lifespan(server: Server) -> AsyncGenerator[dict[str, bool]]:
+        state = {"open": True}
+        events.append("enter")
+        yield state
+        state["open"] = False
+        events.append("exit")
+
+    server = Server("test", app_lifespan=app_lifespan)
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        return [Tool(name="check", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def check(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        return [TextContent(type="text", text=str(server.request_context.app_lifespan_context["open"]))]
+
+    first_started = anyio.Event()
+    first_closed = anyio.Event()
+    close_first = anyio.Event()
+
+    async def first_session() -> None:
+        async with create_connected_server_and_client_session(server) as client:
+            await client.call_tool("check", {})
+            first_started.set()
+            await close_first.wait()
+        first_closed.set()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(first_session)
+        await first_started.wait()
+        async with create_connected_server_and_client_session(server) as client:
+            # The first session ends while the second one is still connected
+            close_first.set()
+            await first_closed.wait()
+            assert events == ["enter", "enter", "exit"]
+            result = await client.call_tool("check", {})
+            assert result.content == [TextContent(type="text", text="True")]
+
+    assert events == ["enter", "enter", "exit", "exit"]
+
+
+@pytest.mark.anyio
+async def test_app_lifespan_is_exited_before_another_is_entered():
+    """Test that a scope entered while the last lifespan is being exited waits for it, and gets its own."""
+    events: list[str] = []
+    exiting = anyio.Event()
+    finish_exit = anyio.Event()
+
+    @asynccontextmanager
+    async def app_lifespan(server: Server) -> AsyncGenerator[int]:
+        generation = events.count("enter") + 1
+        events.append("enter")
+        yield generation
+        exiting.set()
+        await finish_exit.wait()
+        events.append("exit")
+
+    server = Server("test", app_lifespan=app_lifespan)
+    leave_owner = anyio.Event()
+    left_owner = anyio.Event()
+    leave_nested = anyio.Event()
+    contexts: list[int] = []
+
+    async def owner() -> None:
+        async with server.app_lifespan_scope() as context:
+            contexts.append(context)
+            await leave_owner.wait()
+        left_owner.set()
+
+    async def nested() -> None:
+        async with server.app_lifespan_scope() as context:
+            contexts.append(context)
+            await leave_nested.wait()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(owner)
+        await anyio.wait_all_tasks_blocked()
+        tg.start_soon(nested)
+        await anyio.wait_all_tasks_blocked()
+
+        # The scope that entered the lifespan waits for the nested one to leave
+        leave_owner.set()
+        await anyio.wait_all_tasks_blocked()
+        assert not left_owner.is_set() and events == ["enter"]
+        leave_nested.set()
+        await exiting.wait()
+
+        async with anyio.create_task_group() as later:
+
+            async def enter_again() -> None:
+                async with server.app_lifespan_scope() as context:
+                    async with server.app_lifespan_scope() as nested_context:
+                        contexts.extend([context, nested_context])
+
+            later.start_soon(enter_again)
+            await anyio.wait_all_tasks_blocked()
+            assert events == ["enter"]
+            finish_exit.set()
+
+    assert contexts == [1, 1, 2, 2]
+    assert events == ["enter", "exit", "enter", "exit"]
+
+
+@pytest.mark.anyio
+async def test_fastmcp_app_lifespan():
+    """Test that FastMCP passes its app lifespan the FastMCP instance and exposes the result."""
+
+    @asynccontextmanager
+    async def app_lifespan(app: FastMCP) -> AsyncGenerator[dict[str, str]]:
+        yield {"name": app.name}
+
+    mcp = FastMCP("shared", app_lifespan=app_lifespan)
+
+    @mcp.tool()
+    def check(ctx: Context[ServerSession, None]) -> str:
+        return ctx.request_context.app_lifespan_context["name"]
+
+    async with create_connected_server_and_client_session(mcp) as client:
+        result = await client.call_tool("check", {})
+        assert result.structuredContent == {"result": "shared"}
@@ -309,3 +309,28 @@ async def test_tool_not_in_list_logs_warning(caplog: pytest.LogCaptureFixture):
     assert any(
         "Tool 'unknown_tool' not listed, no validation will be performed" in record.message for record in caplog.records
     )
+
+
+@pytest.mark.anyio
+async def test_changed_schema_is_enforced_after_relisting():
+    """Test that cached validators follow schema changes when the tool list is refreshed."""
+    tools = [create_add_tool()]
+
+    async def call_tool_handler(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        return [TextContent(type="text", text=f"Result: {arguments['a'] + arguments['b']}")]
+
+    async def test_callback(client_session: ClientSession) -> CallToolResult:
+        first = await client_session.call_tool("add", {"a": 5, "b": 3})
+        assert not first.isError
+
+        tools[0] = create_add_tool()
+        tools[0].inputSchema["properties"]["a"] = {"type": "integer", "maximum": 4}
+        await client_session.list_tools()
+        return await client_session.call_tool("add", {"a": 5, "b": 3})
+
+    result = await run_tool_test(tools, call_tool_handler, test_callback)
+
+    assert result is not None
+    assert result.isError
+    assert isinstance(result.content[0], TextContent)
+    assert "Input validation error: 5 is greater than the maximum of 4" in result.content[0].text
@@ -0,0 +1,191 @@
+"""Tests for the shared cache of list results in mcp.server.response_cache."""
+
+import anyio
+import pytest
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.lowlevel import Server
+from mcp.server.response_cache import ResponseCache
+from mcp.shared.memory import create_connected_server_and_client_session as client_session
+from mcp.types import ListToolsResult, Tool
+
+
+def tools_result(*names: str) -> ListToolsResult:
+    return ListToolsResult(tools=[Tool(name=name, inputSchema={"type": "object"}) for name in names])
+
+
+@pytest.mark.anyio
+async def test_concurrent_requests_build_the_result_once():
+    cache = ResponseCache()
+    builds = 0
+    release = anyio.Event()
+
+    async def build() -> ListToolsResult:
+        nonlocal builds
+        builds += 1
+        await release.wait()
+        return tools_result("a")
+
+    results: list[object] = []
+
+    async def get() -> None:
+        results.append(await cache.get("tools", build))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(get)
+        await anyio.wait_all_tasks_blocked()
+        release.set()
+
+    assert builds == 1
+    assert all(result is results[0] for result in results)
+    assert (cache.hits, cache.misses) == (4, 1)
+
+
+@pytest.mark.anyio
+async def test_results_are_rebuilt_when_the_version_changes():
+    version = 0
+    cache = ResponseCache(version=lambda: version)
+    built: list[str] = []
+
+    async def build() -> ListToolsResult:
+        built.append(f"v{version}")
+        return tools_result(f"v{version}")
+
+    first = await cache.get("tools", build)
+    assert await cache.get("tools", build) is first
+
+    version = 1
+    assert (await cache.get("tools", build))["tools"][0]["name"] == "v1"
+
+    cache.invalidate()
+    await cache.get("tools", build)
+    assert built == ["v0", "v1", "v1"]
+
+
+@pytest.mark.anyio
+async def test_results_built_for_an_old_version_are_not_cached():
+    version = 0
+    cache = ResponseCache(version=lambda: version)
+
+    async def build() -> ListToolsResult:
+        nonlocal version
+        result = tools_result(f"v{version}")
+        version += 1  # The catalog changes while the result is built
+        return result
+
+    await cache.get("tools", build)
+    assert (await cache.get("tools", build))["tools"][0]["name"] == "v1"
+    assert cache.misses == 2
+
+
+@pytest.mark.anyio
+async def test_failed_builds_are_not_cached():
+    cache = ResponseCache()
+    release = anyio.Event()
+    calls = 0
+
+    async def build() -> ListToolsResult:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await release.wait()
+            raise RuntimeError("boom")
+        return tools_result("a")
+
+    async def failing_get() -> None:
+        with pytest.raises(RuntimeError):
+            await cache.get("tools", build)
+
+    results: list[object] = []
+
+    async def waiting_get() -> None:
+        results.append(await cache.get("tools", build))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(failing_get)
+        await anyio.wait_all_tasks_blocked()
+        tg.start_soon(waiting_get)
+        await anyio.wait_all_tasks_blocked()
+        release.set()
+
+    # The waiting request built the result itself once the first build failed
+    assert calls == 2
+    assert len(results) == 1
+
+
+@pytest.mark.anyio
+async def test_cache_is_bounded():
+    cache = ResponseCache(max_entries=2)
+
+    async def build() -> ListToolsResult:
+        return tools_result("a")
+
+    for cursor in ["1", "2", "3"]:
+        await cache.get(cursor, build)
+    await cache.get("1", build)
+    assert cache.misses == 4
+
+
+@pytest.mark.anyio
+async def test_lowlevel_server_serves_list_results_from_the_cache():
+    server = Server("test")
+    calls = 0
+
+    @server.list_tools()
+    async def list_tools() -> list[Tool]:
+        nonlocal calls
+        calls += 1
+        return tools_result("a").tools
+
+    server.response_cache = ResponseCache()
+    async with client_session(server) as client:
+        for _ in range(3):
+            assert [tool.name for tool in (await client.list_tools()).tools] == ["a"]
+
+        # The filters of the server's config are part of the key
+        server.config = {"restricted_tools": ["a"]}
+        assert (await client.list_tools()).tools == []
+
+    assert calls == 2
+
+
+@pytest.mark.anyio
+async def test_fastmcp_cache_follows_the_catalog():
+    mcp = FastMCP(cache_list_results=True)
+
+    @mcp.tool()
+    def first() -> None: ...  # pragma: no cover
+
+    cache = mcp._mcp_server.response_cache  # pyright: ignore[reportPrivateUsage]
+    assert cache is not None
+    async with client_session(mcp._mcp_server) as client:  # pyright: ignore[reportPrivateUsage]
+        assert [tool.name for tool in (await client.list_tools()).tools] == ["first"]
+        assert [tool.name for tool in (await client.list_tools()).tools] == ["first"]
+        assert cache.hits == 1
+
+        @mcp.tool()
+        def second() -> None: ...  # pragma: no cover
+
+        assert [tool.name for tool in (await client.list_tools()).tools] == ["first", "second"]
+
+        mcp.remove_tool("first")
+        assert [tool.name for tool in (await client.list_tools()).tools] == ["second"]
+
+        @mcp.prompt()
+        def prompt() -> str: ...  # pragma: no cover
+
+        assert [prompt.name for prompt in (await client.list_prompts()).prompts] == ["prompt"]
+
+
+def test_fastmcp_cache_is_opt_in():
+    mcp = FastMCP()
+    assert mcp._mcp_server.response_cache is None  # pyright: ignore[reportPrivateUsage]
+
+
+def test_initialize_results_are_shared_by_sessions():
+    options = Server("test").create_initialization_options()
+    result = options.initialize_result("2025-06-18")
+    assert options.initialize_result("2025-06-18") is result
+    assert result["protocolVersion"] == "2025-06-18"
+    assert result["serverInfo"]["name"] == "test"
@@ -1,9 +1,11 @@
 import io
+import json
 
 import anyio
 import pytest
 
 from mcp.server.stdio import stdio_server
+from mcp.shared.codec import JSONLibraryCodec
 from mcp.shared.message import SessionMessage
 from mcp.types import JSONRPCMessage, JSONRPCRequest, JSONRPCResponse
 
@@ -59,3 +61,27 @@ async def test_stdio_server():
     assert len(received_responses) == 2
     assert received_responses[0] == JSONRPCMessage(root=JSONRPCRequest(jsonrpc="2.0", id=3, method="ping"))
     assert received_responses[1] == JSONRPCMessage(root=JSONRPCResponse(jsonrpc="2.0", id=4, result={}))
+
+
+@pytest.mark.anyio
+async def test_stdio_server_uses_given_codec():
+    stdin = io.StringIO('{"jsonrpc": "2.0", "id": 1, "method": "ping"}\n')
+    stdout = io.StringIO()
+    codec = JSONLibraryCodec(dumps=json.dumps, loads=json.loads)
+
+    async with stdio_server(stdin=anyio.AsyncFile(stdin), stdout=anyio.AsyncFile(stdout), codec=codec) as (
+        read_stream,
+        write_stream,
+    ):
+        async with read_stream:
+            message = await read_stream.receive()
+            assert isinstance(message, SessionMessage)
+            assert message.message == JSONRPCMessage(root=JSONRPCRequest(jsonrpc="2.0", id=1, method="ping"))
+
+        async with write_stream:
+            await write_stream.send(
+                SessionMessage(JSONRPCMessage(root=JSONRPCResponse(jsonrpc="2.0", id=1, result={})))
+            )
+
+    # json.dumps separates keys with ", ", unlike the default pydantic codec
+    assert stdout.getvalue() == '{"jsonrpc": "2.0", "id": 1, "result": {}}\n'
@@ -1,5 +1,8 @@
 """Tests for StreamableHTTPSessionManager."""
 
+import json
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
@@ -11,6 +14,7 @@ from mcp.server import streamable_http_manager
 from mcp.server.lowlevel import Server
 from mcp.server.streamable_http import MCP_SESSION_ID_HEADER, StreamableHTTPServerTransport
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.types import LATEST_PROTOCOL_VERSION, JSONRPCRequest, TextContent, Tool
 
 
 @pytest.mark.anyio
@@ -262,3 +266,362 @@ async def test_stateless_requests_memory_cleanup():
 
             # Verify internal state is cleaned up
             assert len(transport._request_streams) == 0, "Transport should have no active request streams"
+
+
+@pytest.mark.anyio
+async def test_new_sessions_are_created_concurrently():
+    """Test that a new session's first request does not wait for other sessions to be set up."""
+    started = 0
+    all_started = anyio.Event()
+
+    @asynccontextmanager
+    async def lifespan(server: Server) -> AsyncGenerator[None]:
+        # Each session waits here until both have started, which deadlocks if session
+        # creation is serialized
+        nonlocal started
+        started += 1
+        if started == 2:
+            all_started.set()
+        await all_started.wait()
+        yield
+
+    app = Server("test-concurrent-sessions", lifespan=lifespan)
+    manager = StreamableHTTPSessionManager(app=app, json_response=True)
+
+    initialize = JSONRPCRequest(
+        jsonrpc="2.0",
+        id=1,
+        method="initialize",
+        params={
+            "protocolVersion": LATEST_PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "test", "version": "1.0"},
+        },
+    )
+    body = initialize.model_dump_json(by_alias=True, exclude_none=True).encode()
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/mcp",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"accept", b"application/json, text/event-stream"),
+        ],
+    }
+    statuses: list[int] = []
+
+    async def open_session() -> None:
+        async def receive() -> Message:
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+
+        await manager.handle_request(scope, receive, send)
+
+    async with manager.run():
+        with anyio.fail_after(5):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(open_session)
+                tg.start_soon(open_session)
+
+        assert statuses == [200, 200]
+        assert len(manager._server_instances) == 2
+
+
+INITIALIZE_BODY = (
+    JSONRPCRequest(
+        jsonrpc="2.0",
+        id=1,
+        method="initialize",
+        params={
+            "protocolVersion": LATEST_PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "test", "version": "1.0"},
+        },
+    )
+    .model_dump_json(by_alias=True, exclude_none=True)
+    .encode()
+)
+
+
+async def _request(
+    manager: StreamableHTTPSessionManager,
+    method: str = "POST",
+    body: bytes = INITIALIZE_BODY,
+    session_id: str | None = None,
+) -> tuple[int, dict[str, str]]:
+    """Send one request to the manager and return the response status and headers."""
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"accept", b"application/json, text/event-stream"),
+    ]
+    if session_id is not None:
+        headers.append((MCP_SESSION_ID_HEADER.encode(), session_id.encode()))
+        headers.append((b"mcp-protocol-version", LATEST_PROTOCOL_VERSION.encode()))
+    scope = {"type": "http", "method": method, "path": "/mcp", "headers": headers}
+    response: dict[str, Any] = {}
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {k.decode().lower(): v.decode() for k, v in message.get("headers", [])}
+
+    await manager.handle_request(scope, receive, send)
+    return response["status"], response["headers"]
+
+
+async def _open_session(manager: StreamableHTTPSessionManager) -> str:
+    status, headers = await _request(manager)
+    assert status == 200
+    return headers[MCP_SESSION_ID_HEADER.lower()]
+
+
+@pytest.mark.anyio
+async def test_idle_sessions_are_evicted():
+    manager = StreamableHTTPSessionManager(app=Server("test-idle"), json_response=True, session_idle_timeout=0.1)
+
+    async with manager.run():
+        session_id = await _open_session(manager)
+        assert session_id in manager._server_instances
+
+        with anyio.fail_after(5):
+            while session_id in manager._server_instances:
+                await anyio.sleep(0.05)
+
+        assert manager.session_stats().evictions["idle"] == 1
+        # The client is told to start a new session
+        status, _ = await _request(manager, body=b"{}", session_id=session_id)
+        assert status == 404
+
+
+@pytest.mark.anyio
+async def test_busy_sessions_are_not_idle():
+    manager = StreamableHTTPSessionManager(app=Server("test-busy"), json_response=True, session_idle_timeout=0.1)
+
+    async with manager.run():
+        session_id = await _open_session(manager)
+        with manager._server_instances[session_id].request():
+            await anyio.sleep(0.3)
+            assert session_id in manager._server_instances
+
+
+@pytest.mark.anyio
+async def test_least_recently_used_session_is_evicted_at_capacity():
+    manager = StreamableHTTPSessionManager(app=Server("test-capacity"), json_response=True, max_sessions=2)
+
+    async with manager.run():
+        first = await _open_session(manager)
+        await _open_session(manager)
+        # Using the first session makes the second one the least recently used
+        status, _ = await _request(manager, body=b'{"jsonrpc": "2.0", "method": "ping", "id": 2}', session_id=first)
+        assert status == 200
+
+        third = await _open_session(manager)
+
+        assert list(manager._server_instances) == [first, third]
+        assert manager.session_stats().evictions["capacity"] == 1
+
+
+@pytest.mark.anyio
+async def test_new_sessions_are_refused_when_all_sessions_are_busy():
+    manager = StreamableHTTPSessionManager(app=Server("test-full"), json_response=True, max_sessions=1)
+
+    async with manager.run():
+        session_id = await _open_session(manager)
+        with manager._server_instances[session_id].request():
+            status, _ = await _request(manager)
+
+        assert status == 503
+        assert list(manager._server_instances) == [session_id]
+
+
+@pytest.mark.anyio
+async def test_unresponsive_sessions_are_evicted_after_ping():
+    manager = StreamableHTTPSessionManager(
+        app=Server("test-ping"), json_response=True, ping_interval=0.1, ping_timeout=0.1
+    )
+
+    async with manager.run():
+        listening = await _open_session(manager)
+        # Without a GET stream the session cannot be pinged, so it is left alone
+        quiet = await _open_session(manager)
+
+        async def open_get_stream() -> None:
+            # The client never reads the stream nor answers the ping
+            scope = {
+                "type": "http",
+                "method": "GET",
+                "path": "/mcp",
+                "headers": [
+                    (b"accept", b"text/event-stream"),
+                    (MCP_SESSION_ID_HEADER.encode(), listening.encode()),
+                    (b"mcp-protocol-version", LATEST_PROTOCOL_VERSION.encode()),
+                ],
+            }
+
+            async def receive() -> Message:
+                await anyio.sleep_forever()
+                raise AssertionError  # pragma: no cover
+
+            async def send(message: Message) -> None:
+                pass
+
+            await manager.handle_request(scope, receive, send)
+
+        with anyio.fail_after(5):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(open_get_stream)
+                while listening in manager._server_instances:
+                    await anyio.sleep(0.05)
+                tg.cancel_scope.cancel()
+
+        assert list(manager._server_instances) == [quiet]
+        assert manager.session_stats().evictions["unresponsive"] == 1
+
+
+@pytest.mark.anyio
+async def test_session_stats():
+    manager = StreamableHTTPSessionManager(app=Server("test-stats"), json_response=True)
+
+    async with manager.run():
+        assert manager.session_stats().session_count == 0
+
+        session_ids = {await _open_session(manager), await _open_session(manager)}
+        stats = manager.session_stats()
+
+        assert stats.session_count == 2
+        assert {session.session_id for session in stats.sessions} == session_ids
+        assert all(session.approximate_bytes > 0 for session in stats.sessions)
+        assert stats.approximate_bytes == sum(session.approximate_bytes for session in stats.sessions)
+        assert all(session.active_requests == 0 for session in stats.sessions)
+        assert stats.evictions == {"idle": 0, "capacity": 0, "unresponsive": 0}
+
+
+@pytest.mark.anyio
+async def test_initialization_options_are_built_once():
+    app = Server("test-init-options")
+    manager = StreamableHTTPSessionManager(app=app, json_response=True, stateless=True)
+
+    with patch.object(app, "create_initialization_options", wraps=app.create_initialization_options) as create:
+        async with manager.run():
+            for _ in range(3):
+                status, _ = await _request(manager)
+                assert status == 200
+            assert create.call_count == 1
+
+            # Registering a handler changes the capabilities, so the options are rebuilt
+            @app.list_tools()
+            async def list_tools() -> list[Tool]:  # pragma: no cover
+                return []
+
+            status, _ = await _request(manager)
+            assert status == 200
+            assert create.call_count == 2
+            assert manager._initialization_options().capabilities.tools is not None
+
+
+@pytest.mark.anyio
+async def test_app_lifespan_is_entered_once_for_stateless_requests():
+    app_entered = 0
+    sessions_entered = 0
+
+    @asynccontextmanager
+    async def app_lifespan(server: Server) -> AsyncGenerator[None]:
+        nonlocal app_entered
+        app_entered += 1
+        yield
+
+    @asynccontextmanager
+    async def lifespan(server: Server) -> AsyncGenerator[None]:
+        nonlocal sessions_entered
+        sessions_entered += 1
+        yield
+
+    app = Server("test-app-lifespan", lifespan=lifespan, app_lifespan=app_lifespan)
+    manager = StreamableHTTPSessionManager(app=app, json_response=True, stateless=True)
+
+    async with manager.run():
+        assert app_entered == 1
+        for _ in range(3):
+            status, _ = await _request(manager)
+            assert status == 200
+
+    assert app_entered == 1
+    assert sessions_entered == 3
+
+
+async def _post(manager: StreamableHTTPSessionManager, body: bytes) -> tuple[int, bytes]:
+    """POST a body to the manager and return the response status and body."""
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/mcp",
+        "headers": [(b"content-type", b"application/json"), (b"accept", b"application/json, text/event-stream")],
+    }
+    status = 0
+    content = b""
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status, content
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        else:
+            content += message.get("body", b"")
+
+    await manager.handle_request(scope, receive, send)
+    return status, content
+
+
+@pytest.mark.anyio
+async def test_stateless_json_requests_are_dispatched_without_a_session():
+    app = Server("test-dispatch")
+
+    @app.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        return [TextContent(type="text", text=f"{name} {arguments['n']}")]
+
+    manager = StreamableHTTPSessionManager(app=app, json_response=True, stateless=True)
+
+    def call(request_id: int) -> dict[str, Any]:
+        params = {"name": "echo", "arguments": {"n": request_id}}
+        return {"jsonrpc": "2.0", "id": request_id, "method": "tools/call", "params": params}
+
+    with patch.object(app, "run", side_effect=AssertionError("no session should run")):
+        async with manager.run():
+            status, body = await _post(manager, json.dumps(call(1)).encode())
+            assert status == 200
+            assert json.loads(body)["result"]["content"][0]["text"] == "echo 1"
+
+            initialized = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+            status, body = await _post(manager, json.dumps(initialized).encode())
+            assert status == 202
+
+            status, body = await _post(manager, json.dumps([call(2), initialized, call(3)]).encode())
+            assert status == 200
+            responses = json.loads(body)
+            assert [response["id"] for response in responses] == [2, 3]
+            assert [response["result"]["content"][0]["text"] for response in responses] == ["echo 2", "echo 3"]
+
+
+@pytest.mark.anyio
+async def test_initialization_options_follow_server_metadata():
+    app = Server("test-init-metadata")
+    manager = StreamableHTTPSessionManager(app=app, json_response=True, stateless=True)
+
+    options = manager._initialization_options()
+    assert manager._initialization_options() is options
+
+    app.instructions = "Use the tools"
+    options = manager._initialization_options()
+    assert options.instructions == "Use the tools"
+
+    app.name = "renamed"
+    assert manager._initialization_options().server_name == "renamed"
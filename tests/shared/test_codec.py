@@ -0,0 +1,124 @@
+"""Tests for the transport wire codecs."""
+
+import json
+from collections.abc import Iterator
+
+import pytest
+from pydantic import ValidationError
+
+from mcp.shared.codec import (
+    EncodedResult,
+    JSONLibraryCodec,
+    MessageCodec,
+    MessageParseError,
+    OrjsonMessageCodec,
+    PydanticMessageCodec,
+    get_default_codec,
+    is_batch,
+    set_default_codec,
+)
+from mcp.types import JSONRPCMessage, JSONRPCNotification, JSONRPCRequest, JSONRPCResponse, ListToolsResult, Tool
+
+
+def _codecs() -> list[MessageCodec]:
+    codecs: list[MessageCodec] = [PydanticMessageCodec(), JSONLibraryCodec(dumps=json.dumps, loads=json.loads)]
+    try:
+        codecs.append(OrjsonMessageCodec())
+    except ImportError:  # pragma: no cover
+        pass
+    return codecs
+
+
+@pytest.fixture
+def restore_default_codec() -> Iterator[None]:
+    original = get_default_codec()
+    yield
+    set_default_codec(original)
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: type(codec).__name__)
+def test_round_trip(codec: MessageCodec):
+    message = JSONRPCMessage(
+        JSONRPCRequest(jsonrpc="2.0", id=3, method="tools/call", params={"name": "echo", "arguments": {"text": "é"}})
+    )
+
+    encoded = codec.encode(message)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == {
+        "jsonrpc": "2.0",
+        "id": 3,
+        "method": "tools/call",
+        "params": {"name": "echo", "arguments": {"text": "é"}},
+    }
+    assert codec.encode_text(message) == encoded.decode("utf-8")
+    assert codec.decode(encoded) == message
+    assert codec.decode(encoded.decode("utf-8")) == message
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: type(codec).__name__)
+def test_encode_omits_none_fields(codec: MessageCodec):
+    message = JSONRPCMessage(JSONRPCNotification(jsonrpc="2.0", method="notifications/initialized"))
+    assert json.loads(codec.encode(message)) == {"jsonrpc": "2.0", "method": "notifications/initialized"}
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: type(codec).__name__)
+def test_decode_malformed_json(codec: MessageCodec):
+    with pytest.raises(MessageParseError):
+        codec.decode(b"this is not valid json")
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: type(codec).__name__)
+def test_decode_invalid_message(codec: MessageCodec):
+    with pytest.raises(ValidationError):
+        codec.decode(b'{"foo": "bar"}')
+
+
+def test_json_library_codec_accepts_str_dumps():
+    codec = JSONLibraryCodec(dumps=json.dumps, loads=json.loads)
+    message = JSONRPCMessage(JSONRPCResponse(jsonrpc="2.0", id=1, result={}))
+    assert codec.encode(message) == b'{"jsonrpc": "2.0", "id": 1, "result": {}}'
+
+
+def test_set_default_codec(restore_default_codec: None):
+    assert isinstance(get_default_codec(), PydanticMessageCodec)
+
+    codec = JSONLibraryCodec(dumps=json.dumps, loads=json.loads)
+    set_default_codec(codec)
+    assert get_default_codec() is codec
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: type(codec).__name__)
+def test_batch_round_trip(codec: MessageCodec):
+    messages = [
+        JSONRPCMessage(JSONRPCRequest(jsonrpc="2.0", id=1, method="tools/list")),
+        JSONRPCMessage(JSONRPCNotification(jsonrpc="2.0", method="notifications/initialized")),
+    ]
+
+    encoded = codec.encode_batch(messages)
+    assert is_batch(encoded)
+    assert json.loads(encoded) == [
+        {"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+    ]
+    assert codec.decode_batch(encoded) == messages
+    assert not is_batch(codec.encode(messages[0]))
+
+    with pytest.raises(MessageParseError):
+        codec.decode_batch(b"[{")
+    with pytest.raises(ValidationError):
+        codec.decode_batch(b'[{"foo": "bar"}]')
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: type(codec).__name__)
+def test_encoded_result_is_sent_as_encoded(codec: MessageCodec):
+    result = ListToolsResult(tools=[Tool(name="tool", description="Ünïcode", inputSchema={"type": "object"})])
+    encoded_result = EncodedResult.from_result(result)
+    assert encoded_result == result.model_dump(by_alias=True, mode="json", exclude_none=True)
+
+    cached = JSONRPCMessage(JSONRPCResponse.model_construct(jsonrpc="2.0", id="a", result=encoded_result))
+    plain = JSONRPCMessage(JSONRPCResponse(jsonrpc="2.0", id="a", result=dict(encoded_result)))
+
+    assert encoded_result.encoded in codec.encode(cached)
+    assert json.loads(codec.encode(cached)) == json.loads(codec.encode(plain))
+    assert json.loads(codec.encode_text(cached)) == json.loads(codec.encode_text(plain))
+    assert codec.decode(codec.encode(cached)) == plain
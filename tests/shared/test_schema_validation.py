@@ -0,0 +1,90 @@
+"""Tests for the cached tool schema validators."""
+
+from typing import Any
+
+import jsonschema
+import pytest
+
+from mcp.shared.schema_validation import ToolSchemaValidators, schema_fingerprint
+
+SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {"a": {"type": "integer"}, "b": {"type": "string"}},
+    "required": ["a"],
+}
+
+
+def test_validate_matches_jsonschema_errors():
+    cache = ToolSchemaValidators()
+    cache.validate("tool", SCHEMA, {"a": 1, "b": "x"})
+
+    with pytest.raises(jsonschema.ValidationError) as expected:
+        jsonschema.validate(instance={"b": 2}, schema=SCHEMA)
+    with pytest.raises(jsonschema.ValidationError) as actual:
+        cache.validate("tool", SCHEMA, {"b": 2})
+    assert actual.value.message == expected.value.message
+
+
+def test_invalid_schema_raises_schema_error():
+    with pytest.raises(jsonschema.SchemaError):
+        ToolSchemaValidators().validate("tool", {"type": "not-a-type"}, {})
+
+
+def test_validator_compiled_once_per_schema():
+    cache = ToolSchemaValidators()
+    validator = cache.get("tool", SCHEMA)
+
+    assert cache.get("tool", SCHEMA) is validator
+    # An equal schema from a fresh tool listing reuses the compiled validator
+    assert cache.get("tool", {"required": ["a"], **SCHEMA}) is validator
+
+
+def test_changed_schema_gets_new_validator():
+    cache = ToolSchemaValidators()
+    cache.validate("tool", SCHEMA, {"a": 1})
+
+    changed = {**SCHEMA, "required": ["a", "b"]}
+    with pytest.raises(jsonschema.ValidationError, match="'b' is a required property"):
+        cache.validate("tool", changed, {"a": 1})
+    assert len(cache) == 1
+
+
+def test_declared_draft_is_honoured():
+    cache = ToolSchemaValidators()
+    schema = {"$schema": "http://json-schema.org/draft-07/schema#", "type": "object"}
+    assert isinstance(cache.get("tool", schema), jsonschema.Draft7Validator)
+    assert isinstance(cache.get("other", {"type": "object"}), jsonschema.Draft202012Validator)
+
+
+def test_least_recently_used_is_evicted():
+    cache = ToolSchemaValidators(maxsize=2)
+    first = cache.get("first", SCHEMA)
+    cache.get("second", SCHEMA)
+    cache.get("first", SCHEMA)
+    cache.get("third", SCHEMA)
+
+    assert len(cache) == 2
+    assert cache.get("first", SCHEMA) is first
+    cache.retain(["first"])
+    assert len(cache) == 1
+
+
+def test_retain_and_clear():
+    cache = ToolSchemaValidators()
+    for name in ("a", "b", "c"):
+        cache.get(name, SCHEMA)
+
+    cache.retain(["a", "c", "missing"])
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        ToolSchemaValidators(maxsize=0)
+
+
+def test_fingerprint_ignores_key_order():
+    assert schema_fingerprint({"a": 1, "b": [1, 2]}) == schema_fingerprint({"b": [1, 2], "a": 1})
+    assert schema_fingerprint({"a": 1}) != schema_fingerprint({"a": 2})
@@ -9,6 +9,7 @@ from mcp.client.session import ClientSession
 from mcp.server.lowlevel.server import Server
 from mcp.shared.exceptions import McpError
 from mcp.shared.memory import create_client_server_memory_streams, create_connected_server_and_client_session
+from mcp.shared.message import SessionMessage
 from mcp.types import (
     CancelledNotification,
     CancelledNotificationParams,
@@ -168,3 +169,49 @@ async def test_connection_closed():
                 await ev_closed.wait()
             with anyio.fail_after(1):
                 await ev_response.wait()
+
+
+@pytest.mark.anyio
+async def test_tool_arguments_reach_handler_unchanged():
+    """Inbound requests are validated straight from the transport's envelope."""
+    server = Server(name="test server")
+    received: dict[str, Any] = {}
+    arguments: dict[str, Any] = {"text": "hi", "missing": None, "nested": {"values": [1, None, {"k": None}]}}
+
+    @server.list_tools()
+    async def handle_list_tools() -> list[types.Tool]:
+        return [types.Tool(name="echo", inputSchema={"type": "object"})]
+
+    @server.call_tool(validate_input=False)
+    async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        received.update(arguments)
+        return [TextContent(type="text", text=name)]
+
+    async with create_connected_server_and_client_session(server) as client_session:
+        result = await client_session.call_tool("echo", arguments)
+
+    assert result.content == [TextContent(type="text", text="echo")]
+    assert received == arguments
+
+
+@pytest.mark.anyio
+async def test_invalid_request_params_get_error_response():
+    async with create_client_server_memory_streams() as (client_streams, server_streams):
+        client_read, client_write = client_streams
+        server_read, server_write = server_streams
+
+        async with anyio.create_task_group() as tg:
+            server = Server(name="test server")
+            tg.start_soon(lambda: server.run(server_read, server_write, server.create_initialization_options()))
+
+            # tools/call without the required `name` parameter
+            request = types.JSONRPCRequest(jsonrpc="2.0", id=7, method="tools/call", params={"arguments": {}})
+            await client_write.send(SessionMessage(types.JSONRPCMessage(request)))
+
+            response = await client_read.receive()
+            assert isinstance(response, SessionMessage)
+            assert isinstance(response.message.root, types.JSONRPCError)
+            assert response.message.root.id == 7
+            assert response.message.root.error.code == types.INVALID_PARAMS
+
+            tg.cancel_scope.cancel()
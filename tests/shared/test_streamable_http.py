@@ -22,6 +22,7 @@ from pydantic import AnyUrl
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.routing import Mount
+from starlette.types import Message
 
 import mcp.types as types
 from mcp.client.session import ClientSession
@@ -848,6 +849,76 @@ def test_json_response_incorrect_accept_header(json_response_server: None, json_
     assert "Not Acceptable" in response.text
 
 
+def _initialized_headers(mcp_url: str) -> dict[str, str]:
+    """Initialize a session and return the headers for requests within it."""
+    headers = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+    response = requests.post(mcp_url, headers=headers, json=INIT_REQUEST)
+    assert response.status_code == 200
+    if response.headers["Content-Type"] == "application/json":
+        negotiated_version = response.json()["result"]["protocolVersion"]
+    else:
+        negotiated_version = extract_protocol_version_from_sse(response)
+    return {
+        **headers,
+        MCP_SESSION_ID_HEADER: response.headers[MCP_SESSION_ID_HEADER],
+        MCP_PROTOCOL_VERSION_HEADER: negotiated_version,
+    }
+
+
+BATCH: list[dict[str, Any]] = [
+    {"jsonrpc": "2.0", "method": "notifications/initialized"},
+    {"jsonrpc": "2.0", "method": "tools/list", "id": "batch-1"},
+    {"jsonrpc": "2.0", "method": "tools/call", "id": "batch-2", "params": {"name": "test_tool", "arguments": {}}},
+]
+
+
+def test_batch_sse_response(basic_server: None, basic_server_url: str):
+    """All responses to a batch arrive on one SSE stream."""
+    mcp_url = f"{basic_server_url}/mcp"
+    response = requests.post(mcp_url, headers=_initialized_headers(mcp_url), json=BATCH)
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "text/event-stream"
+    responses = [json.loads(line[6:]) for line in response.text.splitlines() if line.startswith("data: ")]
+    assert sorted(message["id"] for message in responses) == ["batch-1", "batch-2"]
+
+
+def test_batch_json_response(json_response_server: None, json_server_url: str):
+    """A batch gets a JSON array holding the responses to its requests, in order."""
+    mcp_url = f"{json_server_url}/mcp"
+    response = requests.post(mcp_url, headers=_initialized_headers(mcp_url), json=BATCH)
+
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/json"
+    responses = response.json()
+    assert [message["id"] for message in responses] == ["batch-1", "batch-2"]
+    assert responses[1]["result"]["content"][0]["text"] == "Called test_tool"
+
+
+def test_batch_of_notifications_is_accepted(basic_server: None, basic_server_url: str):
+    mcp_url = f"{basic_server_url}/mcp"
+    response = requests.post(mcp_url, headers=_initialized_headers(mcp_url), json=BATCH[:1])
+    assert response.status_code == 202
+
+
+@pytest.mark.parametrize(
+    "batch, error",
+    [
+        ([], "Empty batch"),
+        ([INIT_REQUEST], "cannot be batched"),
+        ([BATCH[1], BATCH[1]], "must be unique"),
+        ([{"foo": "bar"}], "Validation error"),
+    ],
+)
+def test_invalid_batches_are_rejected(
+    basic_server: None, basic_server_url: str, batch: list[dict[str, Any]], error: str
+):
+    mcp_url = f"{basic_server_url}/mcp"
+    response = requests.post(mcp_url, headers=_initialized_headers(mcp_url), json=batch)
+    assert response.status_code == 400
+    assert error in response.text
+
+
 def test_get_sse_stream(basic_server: None, basic_server_url: str):
     """Test establishing an SSE stream via GET request."""
     # First, we need to initialize a session
@@ -1028,6 +1099,51 @@ async def test_streamablehttp_client_tool_invocation(initialized_client_session:
     assert result.content[0].text == "Called test_tool"
 
 
+@pytest.mark.anyio
+@pytest.mark.parametrize("server", ["basic_server", "json_response_server"])
+@pytest.mark.parametrize("max_batch_size", [50, 2])
+async def test_streamablehttp_client_batches_concurrent_requests(
+    server: str, max_batch_size: int, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+):
+    """Requests sent within the batch window share one POST, up to the maximum batch size."""
+    request.getfixturevalue(server)
+    port = request.getfixturevalue("basic_server_port" if server == "basic_server" else "json_server_port")
+    batch_sizes: list[int] = []
+    send_batch = StreamableHTTPTransport._handle_batch_post_request  # pyright: ignore[reportPrivateUsage]
+
+    async def record_batch(
+        self: StreamableHTTPTransport, client: httpx.AsyncClient, batch: list[SessionMessage], *args: Any
+    ):
+        batch_sizes.append(len(batch))
+        await send_batch(self, client, batch, *args)
+
+    monkeypatch.setattr(StreamableHTTPTransport, "_handle_batch_post_request", record_batch)
+
+    async with streamablehttp_client(
+        f"http://127.0.0.1:{port}/mcp", batch_window=0.05, max_batch_size=max_batch_size
+    ) as (
+        read_stream,
+        write_stream,
+        _,
+    ):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            results: list[str] = []
+
+            async def call_tool() -> None:
+                result = await session.call_tool("test_tool", {})
+                assert isinstance(result.content[0], TextContent)
+                results.append(result.content[0].text)
+
+            async with anyio.create_task_group() as tg:
+                for _ in range(5):
+                    tg.start_soon(call_tool)
+
+    assert results == ["Called test_tool"] * 5
+    assert min(5, max_batch_size) in batch_sizes
+    assert max(batch_sizes) <= max_batch_size
+
+
 @pytest.mark.anyio
 async def test_streamablehttp_client_error_handling(initialized_client_session: ClientSession):
     """Test error handling in client."""
@@ -2236,3 +2352,156 @@ async def test_standalone_get_stream_reconnection(
             assert "http://notification_2/" in received_notifications, (
                 f"Should receive notification 2 after reconnect, got: {received_notifications}"
             )
+
+
+def _notification(method: str, params: dict[str, Any]) -> EventMessage:
+    return EventMessage(JSONRPCMessage(types.JSONRPCNotification(jsonrpc="2.0", method=method, params=params)))
+
+
+@pytest.mark.anyio
+async def test_slow_stream_does_not_block_other_streams():
+    transport = StreamableHTTPServerTransport(mcp_session_id=None, stream_buffer_size=1)
+    _, slow_receive = transport._request_streams["1"] = transport._create_request_stream()  # pyright: ignore[reportPrivateUsage]
+    _, other_receive = transport._request_streams["2"] = transport._create_request_stream()  # pyright: ignore[reportPrivateUsage]
+    log = _notification("notifications/message", {"level": "info", "data": "started"})
+    progress = _notification("notifications/progress", {"progressToken": 1, "progress": 1})
+    response = EventMessage(JSONRPCMessage(types.JSONRPCResponse(jsonrpc="2.0", id=1, result={})))
+
+    async with anyio.create_task_group() as tg:
+        for event in [log, progress, response]:
+            transport._route_message("1", event, tg)  # pyright: ignore[reportPrivateUsage]
+        transport._route_message("2", log, tg)  # pyright: ignore[reportPrivateUsage]
+
+        # Stream 1's buffer is full, yet stream 2 got its message right away
+        assert other_receive.receive_nowait() == log
+        # The progress notification was dropped, the response waits for room in the buffer
+        assert await slow_receive.receive() == log
+        assert await slow_receive.receive() == response
+
+    assert not transport._stream_backlogs  # pyright: ignore[reportPrivateUsage]
+    for request_id in ["1", "2"]:
+        await transport._clean_up_memory_streams(request_id)  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.anyio
+async def test_slow_stream_spills_to_the_event_store():
+    transport = StreamableHTTPServerTransport(
+        mcp_session_id=None,
+        event_store=SimpleEventStore(),
+        stream_buffer_size=1,
+        stream_overflow="spill",
+    )
+    _, receive_stream = transport._request_streams["1"] = transport._create_request_stream()  # pyright: ignore[reportPrivateUsage]
+    _, unprimed_receive = transport._request_streams["2"] = transport._create_request_stream()  # pyright: ignore[reportPrivateUsage]
+    # Stream 1 began with a priming event, stream 2 did not
+    transport._resumable_streams.add("1")  # pyright: ignore[reportPrivateUsage]
+    progress = _notification("notifications/progress", {"progressToken": 1, "progress": 1})
+    log = _notification("notifications/message", {"level": "info", "data": "started"})
+
+    async with anyio.create_task_group() as tg:
+        transport._route_message("1", progress, tg)  # pyright: ignore[reportPrivateUsage]
+        transport._route_message("1", progress, tg)  # pyright: ignore[reportPrivateUsage]
+        for _ in range(2):
+            transport._route_message("2", log, tg)  # pyright: ignore[reportPrivateUsage]
+
+        # Stream 2 cannot be resumed, so its messages are queued instead
+        assert await unprimed_receive.receive() == log
+        assert await unprimed_receive.receive() == log
+
+    # The stream was closed, so that the client reconnects and replays from the event store
+    assert "1" not in transport._request_streams  # pyright: ignore[reportPrivateUsage]
+    with pytest.raises(anyio.ClosedResourceError):
+        await receive_stream.receive()
+    await transport._clean_up_memory_streams("2")  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.anyio
+async def test_slow_stream_is_closed_when_its_backlog_is_full():
+    transport = StreamableHTTPServerTransport(mcp_session_id=None, stream_buffer_size=1, stream_backlog_size=2)
+    _, receive_stream = transport._request_streams["1"] = transport._create_request_stream()  # pyright: ignore[reportPrivateUsage]
+    log = _notification("notifications/message", {"level": "info", "data": "started"})
+
+    async with anyio.create_task_group() as tg:
+        # One message fills the buffer, two the backlog; the fourth finds no room
+        for _ in range(3):
+            transport._route_message("1", log, tg)  # pyright: ignore[reportPrivateUsage]
+        assert len(transport._stream_backlogs["1"]) == 2  # pyright: ignore[reportPrivateUsage]
+        transport._route_message("1", log, tg)  # pyright: ignore[reportPrivateUsage]
+
+    assert "1" not in transport._request_streams  # pyright: ignore[reportPrivateUsage]
+    assert not transport._stream_backlogs  # pyright: ignore[reportPrivateUsage]
+    with pytest.raises(anyio.ClosedResourceError):
+        await receive_stream.receive()
+
+
+def test_spill_requires_an_event_store():
+    with pytest.raises(ValueError, match="spill"):
+        StreamableHTTPServerTransport(mcp_session_id=None, stream_overflow="spill")
+
+
+def _json_request_scope() -> dict[str, Any]:
+    return {"type": "http", "method": "POST", "path": "/mcp", "headers": []}
+
+
+@pytest.mark.anyio
+async def test_json_response_is_sent_without_a_request_stream():
+    transport = StreamableHTTPServerTransport(mcp_session_id="session", is_json_response_enabled=True)
+    sent: list[Message] = []
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    async with transport.connect() as (read_stream, write_stream):
+
+        async def server() -> None:
+            await read_stream.receive()
+            assert transport._pending_responses and not transport._request_streams  # pyright: ignore[reportPrivateUsage]
+            # Only the response can be carried by a JSON response
+            progress = types.JSONRPCNotification(jsonrpc="2.0", method="notifications/progress", params={})
+            await write_stream.send(
+                SessionMessage(JSONRPCMessage(progress), metadata=ServerMessageMetadata(related_request_id=1))
+            )
+            await write_stream.send(
+                SessionMessage(JSONRPCMessage(types.JSONRPCResponse(jsonrpc="2.0", id=1, result={})))
+            )
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(server)
+            await transport._handle_json_request(  # pyright: ignore[reportPrivateUsage]
+                JSONRPCMessage(JSONRPCRequest(jsonrpc="2.0", id=1, method="ping")),
+                "1",
+                Request(_json_request_scope()),
+                send,
+            )
+
+        assert not transport._pending_responses  # pyright: ignore[reportPrivateUsage]
+
+    assert sent[0]["status"] == 200
+    assert (MCP_SESSION_ID_HEADER.encode(), b"session") in sent[0]["headers"]
+    assert json.loads(sent[1]["body"]) == {"jsonrpc": "2.0", "id": 1, "result": {}}
+
+
+@pytest.mark.anyio
+async def test_pending_json_responses_fail_when_the_session_terminates():
+    transport = StreamableHTTPServerTransport(mcp_session_id=None, is_json_response_enabled=True)
+    sent: list[Message] = []
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    async with transport.connect() as (read_stream, _):
+
+        async def terminate() -> None:
+            await read_stream.receive()
+            await transport.terminate()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(terminate)
+            await transport._handle_json_request(  # pyright: ignore[reportPrivateUsage]
+                JSONRPCMessage(JSONRPCRequest(jsonrpc="2.0", id=1, method="ping")),
+                "1",
+                Request(_json_request_scope()),
+                send,
+            )
+
+    assert sent[0]["status"] == 500
@@ -1,22 +1,38 @@
+import json
 from typing import Any
 
 import pytest
+from pydantic import ValidationError
 
 from mcp.types import (
     LATEST_PROTOCOL_VERSION,
+    CallToolRequest,
+    CancelledNotification,
+    CancelTaskRequest,
     ClientCapabilities,
+    ClientNotification,
     ClientRequest,
     CreateMessageRequestParams,
     CreateMessageResult,
     CreateMessageResultWithTools,
+    ErrorData,
     Implementation,
     InitializeRequest,
     InitializeRequestParams,
+    JSONRPCError,
     JSONRPCMessage,
+    JSONRPCNotification,
     JSONRPCRequest,
+    JSONRPCResponse,
+    ListRootsRequest,
+    ListToolsRequest,
     ListToolsResult,
+    LoggingMessageNotification,
+    PingRequest,
     SamplingCapability,
     SamplingMessage,
+    ServerNotification,
+    ServerRequest,
     TextContent,
     Tool,
     ToolChoice,
@@ -361,3 +377,79 @@ def test_list_tools_result_preserves_json_schema_2020_12_fields():
     assert tool.inputSchema["$schema"] == "https://json-schema.org/draft/2020-12/schema"
     assert "$defs" in tool.inputSchema
     assert tool.inputSchema["additionalProperties"] is False
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ({"method": "ping"}, PingRequest),
+        ({"method": "tools/call", "params": {"name": "echo", "arguments": {"x": 1}}}, CallToolRequest),
+        ({"method": "tools/list", "params": {"cursor": "abc"}}, ListToolsRequest),
+        ({"method": "tasks/cancel", "params": {"taskId": "t-1"}}, CancelTaskRequest),
+    ],
+)
+def test_client_request_resolves_by_method(data: dict[str, Any], expected: type):
+    request = ClientRequest.model_validate(data)
+    assert type(request.root) is expected
+
+
+def test_client_request_rejects_unknown_method():
+    with pytest.raises(ValidationError):
+        ClientRequest.model_validate({"method": "tools/unknown"})
+
+
+def test_server_request_and_notifications_resolve_by_method():
+    server_request = ServerRequest.model_validate({"method": "roots/list"})
+    assert isinstance(server_request.root, ListRootsRequest)
+
+    client_notification = ClientNotification.model_validate(
+        {"method": "notifications/cancelled", "params": {"requestId": 1}}
+    )
+    assert isinstance(client_notification.root, CancelledNotification)
+
+    server_notification = ServerNotification.model_validate(
+        {"method": "notifications/message", "params": {"level": "info", "data": "hi"}}
+    )
+    assert isinstance(server_notification.root, LoggingMessageNotification)
+
+
+def test_discriminated_request_keeps_extra_fields():
+    request = ClientRequest.model_validate(
+        {"method": "tools/call", "params": {"name": "echo", "arguments": {}, "vendor": "x"}, "extra": True}
+    )
+    assert isinstance(request.root, CallToolRequest)
+    dumped = request.model_dump(by_alias=True, exclude_none=True)
+    assert dumped["extra"] is True
+    assert dumped["params"]["vendor"] == "x"
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ({"jsonrpc": "2.0", "id": 1, "method": "ping"}, JSONRPCRequest),
+        ({"jsonrpc": "2.0", "method": "notifications/initialized"}, JSONRPCNotification),
+        ({"jsonrpc": "2.0", "id": None, "method": "notifications/initialized"}, JSONRPCNotification),
+        ({"jsonrpc": "2.0", "id": "a", "result": {}}, JSONRPCResponse),
+        ({"jsonrpc": "2.0", "id": 2, "error": {"code": -32601, "message": "nope"}}, JSONRPCError),
+    ],
+)
+def test_jsonrpc_message_resolves_envelope(data: dict[str, Any], expected: type):
+    assert type(JSONRPCMessage.model_validate(data).root) is expected
+    assert type(JSONRPCMessage.model_validate_json(json.dumps(data)).root) is expected
+
+
+def test_jsonrpc_message_accepts_model_instances():
+    for message in [
+        JSONRPCRequest(jsonrpc="2.0", id=1, method="ping"),
+        JSONRPCNotification(jsonrpc="2.0", method="notifications/initialized"),
+        JSONRPCResponse(jsonrpc="2.0", id=1, result={}),
+        JSONRPCError(jsonrpc="2.0", id=1, error=ErrorData(code=-1, message="x")),
+    ]:
+        assert JSONRPCMessage(message).root is message
+
+
+def test_jsonrpc_message_rejects_unknown_envelope():
+    with pytest.raises(ValidationError):
+        JSONRPCMessage.model_validate({"jsonrpc": "2.0", "id": 1})
+    with pytest.raises(ValidationError):
+        JSONRPCMessage.model_validate(ErrorData(code=-1, message="x"))